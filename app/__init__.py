@@ -0,0 +1,4 @@
+import time
+
+# When the first application module started importing: the start of the cold start of a process.
+IMPORT_STARTED = time.perf_counter()
@@ -0,0 +1,33 @@
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+
+class CacheBackend(ABC):
+    """
+    Storage of a cache: byte values by key, with an optional time to live and tags. Invalidating a
+    tag deletes every key stored with it. Namespacing and serialization are done by `Cache`.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """The value of the key, or None when it is missing or expired."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl: float | None = None, tags: Sequence[str] = ()) -> None:
+        """Stores the value, for `ttl` seconds when given."""
+
+    @abstractmethod
+    async def delete(self, *keys: str) -> None:
+        pass
+
+    @abstractmethod
+    async def invalidate_tags(self, *tags: str) -> None:
+        """Deletes every key stored with any of the tags."""
+
+    @abstractmethod
+    async def incr(self, key: str) -> int:
+        """Atomically increments a counter that never expires, starting from 0, and returns it."""
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Releases the connections of the backend, on shutdown."""
@@ -0,0 +1,194 @@
+import asyncio
+import logging
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, Hashable, Sequence, TypeVar
+
+from app.cache.backend import CacheBackend
+from app.cache.codec import DECODE_ERRORS, JSON_CODEC, Codec
+from app.cache.memory import MemoryCacheBackend
+from app.cache.resp import RespCacheBackend, RespError
+from app.settings.settings import CacheSettings, get_settings
+from app.utils.metrics import CACHE_ERRORS, CACHE_LOAD_DURATION, CACHE_REQUESTS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Errors of an unreachable or failing backend. The cache then behaves as empty instead of failing the request.
+BACKEND_ERRORS = (OSError, TimeoutError, EOFError, RespError)
+
+
+class SingleFlight:
+    """
+    Runs one load per key at a time in this process: concurrent callers of the same key wait for
+    the running one. Other processes sharing the backend may run their own load of the key.
+    """
+
+    def __init__(self):
+        self._running: Dict[Hashable, asyncio.Future] = {}
+
+    async def run(self, key: Hashable, load: Callable[[], Awaitable[T]]) -> T:
+        running = self._running.get(key)
+        if running is not None:
+            return await asyncio.shield(running)
+        future = asyncio.get_running_loop().create_future()
+        self._running[key] = future
+        try:
+            result = await load()
+        except BaseException as error:
+            future.set_exception(error)
+            # Waiters get the error; retrieving it here avoids a warning when there are none.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._running[key]
+
+
+class Cache:
+    """
+    A namespace of a cache backend. Values are serialized by a codec, JSON unless another one is
+    given, whose version is part of the key. Keys and tags are prefixed with the namespace, and
+    lookups are counted by namespace in `cache_requests_total`. A value that can't be decoded is a miss.
+    """
+
+    def __init__(self, namespace: str, backend: CacheBackend | None = None, default_ttl: float | None = None):
+        self.namespace = namespace
+        self.default_ttl = default_ttl
+        self._backend = backend
+        self._loads = SingleFlight()
+
+    @property
+    def backend(self) -> CacheBackend:
+        return self._backend if self._backend is not None else get_cache_backend()
+
+    async def get(self, key: str, codec: Codec[T] = JSON_CODEC) -> T | None:
+        try:
+            data = await self.backend.get(self._key(key, codec))
+        except BACKEND_ERRORS as error:
+            self._failed("get", error)
+            return None
+        value = None
+        if data is not None:
+            try:
+                value = codec.decode(data)
+            except DECODE_ERRORS as error:
+                self._failed("decode", error)
+        CACHE_REQUESTS.inc(namespace=self.namespace, result="hit" if value is not None else "miss")
+        return value
+
+    async def set(
+        self, key: str, value: T, ttl: float | None = None, tags: Sequence[str] = (), codec: Codec[T] = JSON_CODEC
+    ) -> None:
+        ttl = ttl if ttl is not None else self.default_ttl
+        try:
+            await self.backend.set(self._key(key, codec), codec.encode(value), ttl, [self._tag(tag) for tag in tags])
+        except BACKEND_ERRORS as error:
+            self._failed("set", error)
+
+    async def delete(self, *keys: str, codec: Codec = JSON_CODEC) -> None:
+        try:
+            await self.backend.delete(*(self._key(key, codec) for key in keys))
+        except BACKEND_ERRORS as error:
+            self._failed("delete", error)
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        try:
+            await self.backend.invalidate_tags(*(self._tag(tag) for tag in tags))
+        except BACKEND_ERRORS as error:
+            self._failed("invalidate", error)
+
+    async def get_or_load(
+        self,
+        key: str,
+        load: Callable[[], Awaitable[T]],
+        ttl: float | None = None,
+        tags: Sequence[str] = (),
+        codec: Codec[T] = JSON_CODEC,
+    ) -> T:
+        """
+        The cached value of the key, or the result of `load`, which is cached. Concurrent misses
+        of the same key in this process wait for a single load; other processes don't wait for
+        it. Loads of None are not cached.
+        """
+        value = await self.get(key, codec)
+        if value is not None:
+            return value
+        return await self._loads.run(key, lambda: self._load(key, load, ttl, tags, codec))
+
+    async def counter(self, key: str) -> int | None:
+        """The value of a counter kept with `incr`, or None when it can't be read."""
+        try:
+            value = await self.backend.get(self._counter_key(key))
+        except BACKEND_ERRORS as error:
+            self._failed("get", error)
+            return None
+        try:
+            return int(value) if value is not None else 0
+        except ValueError as error:
+            self._failed("decode", error)
+            return None
+
+    async def incr(self, key: str) -> int | None:
+        """Increments a counter shared by every worker, returning None when the backend fails."""
+        try:
+            return await self.backend.incr(self._counter_key(key))
+        except BACKEND_ERRORS as error:
+            self._failed("incr", error)
+            return None
+
+    async def _load(
+        self, key: str, load: Callable[[], Awaitable[T]], ttl: float | None, tags: Sequence[str], codec: Codec[T]
+    ) -> T:
+        with CACHE_LOAD_DURATION.time(namespace=self.namespace):
+            value = await load()
+        if value is not None:
+            await self.set(key, value, ttl, tags, codec)
+        return value
+
+    def _key(self, key: str, codec: Codec) -> str:
+        return f"{self.namespace}:{codec.version}:{key}"
+
+    def _counter_key(self, key: str) -> str:
+        return f"{self.namespace}:counter:{key}"
+
+    def _tag(self, tag: str) -> str:
+        return f"{self.namespace}:tag:{tag}"
+
+    def _failed(self, operation: str, error: BaseException) -> None:
+        CACHE_ERRORS.inc(namespace=self.namespace, operation=operation)
+        logger.warning(f"Cache {operation} failed in namespace {self.namespace}: {error!r}")
+
+
+BACKENDS: Dict[str, Callable[[CacheSettings], CacheBackend]] = {
+    "memory": lambda settings: MemoryCacheBackend(settings.MAX_ENTRIES),
+    "resp": lambda settings: RespCacheBackend(settings.URL, settings.POOL_SIZE, settings.TIMEOUT_SECONDS),
+}
+
+
+@lru_cache(maxsize=1)
+def get_cache_backend() -> CacheBackend:
+    """The backend shared by every namespace of the process, built on first use."""
+    settings = get_settings(CacheSettings)
+    return BACKENDS[settings.BACKEND](settings)
+
+
+async def close_cache_backend() -> None:
+    if get_cache_backend.cache_info().currsize:
+        await get_cache_backend().close()
+
+
+@lru_cache(maxsize=None)
+def namespace_cache(namespace: str) -> Cache:
+    return Cache(namespace, default_ttl=get_settings(CacheSettings).DEFAULT_TTL_SECONDS)
+
+
+# One provider per namespace, like `get_repository`, so FastAPI resolves it once per request.
+@lru_cache(maxsize=None)
+def get_cache(namespace: str) -> Any:
+    async def _get_cache() -> Cache:
+        return namespace_cache(namespace)
+
+    return _get_cache
@@ -0,0 +1,40 @@
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Generic, TypeVar
+
+T = TypeVar("T")
+
+# Errors of a value that can't be decoded: written by another version or not by the cache at all.
+DECODE_ERRORS = (ValueError, TypeError, KeyError)
+
+
+class Codec(ABC, Generic[T]):
+    """
+    Serializes the values of a cache. The version is part of the keys, so changing the format of
+    the values only needs a new version: the values of the previous one are never read.
+    """
+
+    version: str
+
+    @abstractmethod
+    def encode(self, value: T) -> bytes:
+        pass
+
+    @abstractmethod
+    def decode(self, data: bytes) -> T:
+        """The value, raising one of DECODE_ERRORS when the data is not a value of this codec."""
+
+
+class JsonCodec(Codec[Any]):
+    """Dicts, lists, strings, numbers, booleans and None."""
+
+    version = "json1"
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value, separators=(",", ":")).encode()
+
+    def decode(self, data: bytes) -> Any:
+        return json.loads(data)
+
+
+JSON_CODEC = JsonCodec()
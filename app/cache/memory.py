@@ -0,0 +1,80 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Sequence, Set, Tuple
+
+from app.cache.backend import CacheBackend
+
+DEFAULT_MAX_ENTRIES = 10_000
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    In-process LRU cache. It is only shared by the requests of one worker: deployments with more
+    workers or instances need a shared backend, like `RespCacheBackend`.
+
+    Counters are kept apart from the LRU and never evicted: a counter that restarted from 1 would
+    repeat values already handed out.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        # key -> (expires at, value, tags)
+        self._entries: OrderedDict[str, Tuple[float | None, bytes, Tuple[str, ...]]] = OrderedDict()
+        self._keys_by_tag: Dict[str, Set[str]] = {}
+        self._counters: Dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        if key in self._counters:
+            return str(self._counters[key]).encode()
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value, _ = entry
+        if expires_at is not None and time.monotonic() >= expires_at:
+            self._remove(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None, tags: Sequence[str] = ()) -> None:
+        if key in self._entries:
+            self._remove(key)
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._entries[key] = (expires_at, value, tuple(tags))
+        for tag in tags:
+            self._keys_by_tag.setdefault(tag, set()).add(key)
+        while len(self._entries) > self.max_entries:
+            self._remove(next(iter(self._entries)))
+
+    async def delete(self, *keys: str) -> None:
+        for key in keys:
+            self._counters.pop(key, None)
+            if key in self._entries:
+                self._remove(key)
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        for tag in tags:
+            for key in list(self._keys_by_tag.get(tag, ())):
+                self._remove(key)
+
+    async def incr(self, key: str) -> int:
+        counter = self._counters.get(key, 0) + 1
+        self._counters[key] = counter
+        return counter
+
+    async def close(self) -> None:
+        self._entries.clear()
+        self._keys_by_tag.clear()
+        self._counters.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        _, _, tags = self._entries.pop(key)
+        for tag in tags:
+            keys = self._keys_by_tag.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self._keys_by_tag[tag]
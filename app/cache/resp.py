@@ -0,0 +1,162 @@
+"""
+Cache backend for servers speaking the Redis protocol (RESP2): Redis, Valkey, KeyDB, Dragonfly.
+
+A small pool of connections sends the commands of every operation as one pipeline. Tags are sets
+holding the keys stored with them; invalidating a tag deletes its keys and the set, in one script.
+"""
+
+import asyncio
+from typing import List, Sequence
+from urllib.parse import urlparse
+
+from app.cache.backend import CacheBackend
+
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT_SECONDS = 1.0
+
+Reply = bytes | int | str | list | None
+
+# Reads the keys of the tags and deletes them with the tags atomically: a key stored and tagged by
+# another worker in between would otherwise survive, with no tag left to reach it. The keys of a tag
+# can't be declared up front; the first line lets Dragonfly run the script anyway.
+INVALIDATE_TAGS_SCRIPT = """--!df flags=allow-undeclared-keys
+local keys = {}
+for _, tag in ipairs(KEYS) do
+    for _, key in ipairs(redis.call('SMEMBERS', tag)) do
+        keys[#keys + 1] = key
+    end
+    keys[#keys + 1] = tag
+end
+for first = 1, #keys, 1000 do
+    redis.call('DEL', unpack(keys, first, math.min(first + 999, #keys)))
+end
+return #keys
+"""
+
+
+class RespError(Exception):
+    """The server answered a command with an error."""
+
+
+def encode_command(*arguments: bytes | str | int | float) -> bytes:
+    parts = [b"*%d\r\n" % len(arguments)]
+    for argument in arguments:
+        value = argument if isinstance(argument, bytes) else str(argument).encode()
+        parts.append(b"$%d\r\n%s\r\n" % (len(value), value))
+    return b"".join(parts)
+
+
+async def read_reply(reader: asyncio.StreamReader) -> Reply | RespError:
+    line = await reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise ConnectionError("The cache server closed the connection")
+    kind, content = line[:1], line[1:-2]
+    if kind == b"+":
+        return content.decode()
+    if kind == b"-":
+        return RespError(content.decode())
+    if kind == b":":
+        return int(content)
+    if kind == b"$":
+        length = int(content)
+        if length < 0:
+            return None
+        return (await reader.readexactly(length + 2))[:-2]
+    if kind == b"*":
+        length = int(content)
+        if length < 0:
+            return None
+        return [await read_reply(reader) for _ in range(length)]
+    raise ConnectionError(f"Unexpected reply from the cache server: {line!r}")
+
+
+class RespConnection:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    async def execute(self, *commands: Sequence) -> List[Reply]:
+        """Sends the commands as one pipeline and returns their replies, raising the first error."""
+        self.writer.write(b"".join(encode_command(*command) for command in commands))
+        await self.writer.drain()
+        replies = [await read_reply(self.reader) for _ in commands]
+        for reply in replies:
+            if isinstance(reply, RespError):
+                raise reply
+        return replies
+
+    async def close(self) -> None:
+        self.writer.close()
+        try:
+            await self.writer.wait_closed()
+        except OSError:
+            pass
+
+
+class RespCacheBackend(CacheBackend):
+    def __init__(self, url: str, pool_size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT_SECONDS):
+        parsed = urlparse(url)
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.password = parsed.password
+        self.database = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+        self._idle: List[RespConnection] = []
+        self._slots = asyncio.Semaphore(pool_size)
+
+    async def get(self, key: str) -> bytes | None:
+        [value] = await self.execute(("GET", key))
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: float | None = None, tags: Sequence[str] = ()) -> None:
+        command = ("SET", key, value, "PX", max(1, round(ttl * 1000))) if ttl is not None else ("SET", key, value)
+        # Tag sets don't expire: entries stored later may outlive the first ones, and a set of
+        # expired keys only costs their names until the tag is invalidated.
+        await self.execute(command, *(("SADD", tag, key) for tag in tags))
+
+    async def delete(self, *keys: str) -> None:
+        if keys:
+            await self.execute(("DEL", *keys))
+
+    async def invalidate_tags(self, *tags: str) -> None:
+        if not tags:
+            return
+        await self.execute(("EVAL", INVALIDATE_TAGS_SCRIPT, len(tags), *tags))
+
+    async def incr(self, key: str) -> int:
+        [counter] = await self.execute(("INCR", key))
+        return counter
+
+    async def execute(self, *commands: Sequence) -> List[Reply]:
+        async with self._slots:
+            connection = self._idle.pop() if self._idle else await self._connect()
+            try:
+                async with asyncio.timeout(self.timeout):
+                    replies = await connection.execute(*commands)
+            except RespError:
+                self._idle.append(connection)
+                raise
+            except BaseException:
+                # The connection may be halfway through a reply: it can't be reused.
+                await connection.close()
+                raise
+            self._idle.append(connection)
+            return replies
+
+    async def close(self) -> None:
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            await connection.close()
+
+    async def _connect(self) -> RespConnection:
+        async with asyncio.timeout(self.timeout):
+            reader, writer = await asyncio.open_connection(self.host, self.port)
+            connection = RespConnection(reader, writer)
+            setup = []
+            if self.password:
+                setup.append(("AUTH", self.password))
+            if self.database:
+                setup.append(("SELECT", self.database))
+            if setup:
+                await connection.execute(*setup)
+        return connection
@@ -1,8 +1,8 @@
 from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
-from sqlalchemy.pool import NullPool
 
-from app.settings.settings import DatabaseSettings
+from app.database.instrumentation import TimedNullPool, instrument_engine
+from app.settings.settings import DatabaseSettings, get_settings
 
-settings = DatabaseSettings()
-engine = create_async_engine(settings.DATABASE_URL, poolclass=NullPool)
+settings = get_settings(DatabaseSettings)
+engine = instrument_engine(create_async_engine(settings.DATABASE_URL, poolclass=TimedNullPool))
 SessionLocal = async_sessionmaker(bind=engine, expire_on_commit=False, autocommit=False)
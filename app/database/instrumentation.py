@@ -0,0 +1,128 @@
+import re
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Iterator, List, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.exc import InvalidRequestError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import ORMExecuteState, RelationshipProperty, Session
+from sqlalchemy.pool import NullPool
+
+from app.utils.metrics import DB_POOL_CHECKOUT_DURATION, DB_STATEMENT_DURATION
+from app.utils.tracing import start_span
+
+_BIND_PARAMETER = re.compile(r"\$\d+(?:::[A-Z]+(?:\[\])?)?|%\(\w+\)s|\?")
+_LITERAL = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_VALUES_LIST = re.compile(r"\(\?(?:, \?)+\)")
+
+
+@lru_cache(maxsize=2048)
+def fingerprint(statement: str) -> str:
+    """
+    The shape of a statement: parameters, literals and IN/VALUES lists of any length become `?`,
+    so the same query for different rows (the N in an N+1) has the same fingerprint.
+    """
+    shape = _BIND_PARAMETER.sub("?", " ".join(statement.split()))
+    shape = _LITERAL.sub("?", shape)
+    return _VALUES_LIST.sub("(?)", shape)
+
+
+@dataclass
+class StatementStats:
+    """SQL statements executed while answering a request."""
+
+    statements: int = 0
+    duration: float = 0.0
+    fingerprints: Counter = field(default_factory=Counter)
+
+    def record(self, statement: str, duration: float) -> None:
+        self.statements += 1
+        self.duration += duration
+        self.fingerprints[fingerprint(statement)] += 1
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Fingerprints executed at least `threshold` times, most repeated first."""
+        return [(shape, count) for shape, count in self.fingerprints.most_common() if count >= threshold]
+
+
+_active_stats: ContextVar[Tuple[StatementStats, ...]] = ContextVar("statement_stats", default=())
+
+
+@contextmanager
+def track_statements() -> Iterator[StatementStats]:
+    """
+    Collects the statements executed in the current context (and the tasks it starts).
+    Trackers nest: a statement counts for every tracker that is active.
+    """
+    stats = StatementStats()
+    token = _active_stats.set(_active_stats.get() + (stats,))
+    try:
+        yield stats
+    finally:
+        _active_stats.reset(token)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Spans carry the statement shape only: parameters may hold personal data.
+    context._statement_span = start_span("sql", "sql", statement=fingerprint(statement))
+    context._statement_started = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    duration = time.perf_counter() - context._statement_started
+    DB_STATEMENT_DURATION.observe(duration)
+    for stats in _active_stats.get():
+        stats.record(statement, duration)
+    if context._statement_span is not None:
+        context._statement_span.end()
+
+
+def _handle_error(exception_context):
+    statement_span = getattr(exception_context.execution_context, "_statement_span", None)
+    if statement_span is not None:
+        statement_span.end(exception_context.original_exception)
+
+
+def instrument_engine(engine: AsyncEngine) -> AsyncEngine:
+    event.listen(engine.sync_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine.sync_engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine.sync_engine, "handle_error", _handle_error)
+    return engine
+
+
+class TimedCheckoutMixin:
+    """Observes how long checking out a connection takes, waiting for or opening it."""
+
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            DB_POOL_CHECKOUT_DURATION.observe(time.perf_counter() - started)
+
+
+class TimedNullPool(TimedCheckoutMixin, NullPool):
+    pass
+
+
+def raise_on_lazy_loads(session: Session) -> None:
+    """
+    Makes every lazy load of a relationship in `session` fail, so code that touches a relationship
+    it didn't load fails loudly instead of issuing one query per object. Meant for tests and debugging.
+    """
+    event.listen(session, "do_orm_execute", _raise_on_lazy_load)
+
+
+def _raise_on_lazy_load(orm_execute_state: ORMExecuteState) -> None:
+    # Only lazy loads come from an instance: eager loads (selectin, joined) are part of their query. Eager
+    # relationships also load from an instance once expired (e.g. after a commit), which is allowed.
+    if not orm_execute_state.is_select or orm_execute_state.lazy_loaded_from is None:
+        return
+    relationship = orm_execute_state.loader_strategy_path[-1]
+    if isinstance(relationship, RelationshipProperty) and relationship.lazy in ("select", True):
+        raise InvalidRequestError(f"{relationship} was lazy loaded: load it with the query that reads the object")
@@ -1,7 +1,7 @@
 from enum import Enum
 from typing import List
 
-from sqlalchemy import ARRAY, JSON, UUID, Column, ForeignKey, String
+from sqlalchemy import ARRAY, JSON, UUID, Column, ForeignKey, Integer, String
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database.models.base import Base
@@ -44,6 +44,8 @@ class EventModel(ModelTemplate, Base):
     organized_by = Column(String, nullable=True)
     media: Mapped[List[JSON]] = mapped_column(ARRAY(JSON), default=None, nullable=True)
     mdata = Column(JSON, default=None)
+    # Last number given to a work of the event when its reviews were published.
+    last_work_number = Column(Integer, nullable=False, default=0, server_default="0")
 
     organizers = relationship("OrganizerModel", back_populates="event")
     creator = relationship("UserModel", back_populates="events", lazy=False)
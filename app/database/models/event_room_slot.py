@@ -7,7 +7,6 @@ from .base import Base
 
 class EventRoomSlotModel(Base):
     __tablename__ = "event_room_slots"
-    available_space = 0  # se usa en el algoritmo de busqueda de solucion
 
     id = Column(Integer, primary_key=True)
     event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False)
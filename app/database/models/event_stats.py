@@ -0,0 +1,180 @@
+from enum import Enum
+
+from sqlalchemy import DDL, UUID, BigInteger, Column, ForeignKey, Index, Integer, Numeric, String, event
+
+from app.database.models.base import Base
+
+
+class EventStat(str, Enum):
+    INSCRIPTIONS_BY_STATUS = "inscriptions_by_status"
+    INSCRIPTIONS_BY_ROLE = "inscriptions_by_role"
+    PAYMENTS_BY_STATUS = "payments_by_status"
+    WORKS_BY_STATE = "works_by_state"
+    WORKS_BY_TRACK = "works_by_track"
+    # By work id: the dashboard adds them up by the current track of the work, so they don't move
+    # when a work changes track, and the ones of a deleted work are left out.
+    REVIEWERS_BY_WORK = "reviewers_by_work"
+    REVIEWS_BY_WORK = "reviews_by_work"
+    SHARED_REVIEWS_BY_WORK = "shared_reviews_by_work"
+
+
+class EventStatsModel(Base):
+    """
+    Counters of the dashboard of an event (e.g. works_by_state / APPROVED), as of the last
+    compaction: the deltas appended since are added on read.
+    """
+
+    __tablename__ = "event_stats"
+
+    event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), primary_key=True)
+    metric = Column(String, primary_key=True)
+    key = Column(String, primary_key=True)
+    # Currency of the amount, for payments_by_status; empty for the other metrics.
+    currency = Column(String, primary_key=True, default="")
+    count = Column(Integer, nullable=False, default=0)
+    # Sum of the payment amounts, for payments_by_status.
+    amount = Column(Numeric, nullable=False, default=0)
+
+
+class EventStatsDeltaModel(Base):
+    """
+    Changes to the counters, appended by the triggers below on every write of inscriptions,
+    payments, works, reviewers and reviews, until a compaction folds them into event_stats.
+    """
+
+    __tablename__ = "event_stats_deltas"
+
+    id = Column(BigInteger, primary_key=True, autoincrement=True)
+    event_id = Column(UUID(as_uuid=True), nullable=False)
+    metric = Column(String, nullable=False)
+    key = Column(String, nullable=False)
+    currency = Column(String, nullable=False, default="")
+    count = Column(Integer, nullable=False)
+    amount = Column(Numeric, nullable=False)
+
+    __table_args__ = (Index("ix_event_stats_deltas_event_id", "event_id"),)
+
+
+# The triggers see every write path, including set-based updates and bulk loads, and record the
+# changes in the transaction of the write. They only append rows: updating a counter row in place
+# would make every write of an event wait for the others to commit, and writes locking the rows of
+# two counters in opposite orders would deadlock. Migrations install the same functions and triggers.
+EVENT_STATS_FUNCTIONS = [
+    """
+CREATE OR REPLACE FUNCTION event_stats_add(
+    stats_event_id uuid,
+    stats_metric varchar,
+    stats_key varchar,
+    delta integer,
+    amount_delta numeric = 0,
+    stats_currency varchar = ''
+) RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    IF stats_event_id IS NULL OR stats_key IS NULL OR (delta = 0 AND amount_delta = 0) THEN
+        RETURN;
+    END IF;
+    INSERT INTO event_stats_deltas (event_id, metric, key, currency, count, amount)
+    VALUES (stats_event_id, stats_metric, stats_key, stats_currency, delta, amount_delta);
+END $$
+""",
+    """
+CREATE OR REPLACE FUNCTION event_stats_inscriptions() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM event_stats_add(OLD.event_id, 'inscriptions_by_status', OLD.status, -1);
+        PERFORM event_stats_add(OLD.event_id, 'inscriptions_by_role', role, -1) FROM unnest(OLD.roles) AS role;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        PERFORM event_stats_add(NEW.event_id, 'inscriptions_by_status', NEW.status, 1);
+        PERFORM event_stats_add(NEW.event_id, 'inscriptions_by_role', role, 1) FROM unnest(NEW.roles) AS role;
+    END IF;
+    RETURN NULL;
+END $$
+""",
+    """
+CREATE OR REPLACE FUNCTION event_stats_payments() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM event_stats_add(
+            OLD.event_id, 'payments_by_status', OLD.status, -1, -coalesce(OLD.amount, 0)::numeric, coalesce(OLD.currency, '')
+        );
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        PERFORM event_stats_add(
+            NEW.event_id, 'payments_by_status', NEW.status, 1, coalesce(NEW.amount, 0)::numeric, coalesce(NEW.currency, '')
+        );
+    END IF;
+    RETURN NULL;
+END $$
+""",
+    """
+CREATE OR REPLACE FUNCTION event_stats_works() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM event_stats_add(OLD.event_id, 'works_by_state', OLD.state, -1);
+        PERFORM event_stats_add(OLD.event_id, 'works_by_track', OLD.track, -1);
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        PERFORM event_stats_add(NEW.event_id, 'works_by_state', NEW.state, 1);
+        PERFORM event_stats_add(NEW.event_id, 'works_by_track', NEW.track, 1);
+    END IF;
+    RETURN NULL;
+END $$
+""",
+    """
+CREATE OR REPLACE FUNCTION event_stats_reviewers() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM event_stats_add(OLD.event_id, 'reviewers_by_work', OLD.work_id::varchar, -1);
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        PERFORM event_stats_add(NEW.event_id, 'reviewers_by_work', NEW.work_id::varchar, 1);
+    END IF;
+    RETURN NULL;
+END $$
+""",
+    """
+CREATE OR REPLACE FUNCTION event_stats_reviews() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM event_stats_add(OLD.event_id, 'reviews_by_work', OLD.work_id::varchar, -1);
+        PERFORM event_stats_add(OLD.event_id, 'shared_reviews_by_work', OLD.work_id::varchar, CASE WHEN OLD.shared THEN -1 ELSE 0 END);
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        PERFORM event_stats_add(NEW.event_id, 'reviews_by_work', NEW.work_id::varchar, 1);
+        PERFORM event_stats_add(NEW.event_id, 'shared_reviews_by_work', NEW.work_id::varchar, CASE WHEN NEW.shared THEN 1 ELSE 0 END);
+    END IF;
+    RETURN NULL;
+END $$
+""",
+]
+
+# Table, and the columns whose updates change its counters.
+EVENT_STATS_SOURCES = {
+    "inscriptions": ("event_id", "status", "roles"),
+    "payments": ("event_id", "status", "amount", "currency"),
+    "works": ("event_id", "state", "track"),
+    "reviewers": ("event_id", "work_id"),
+    "reviews": ("event_id", "work_id", "shared"),
+}
+
+
+def event_stats_triggers(table: str, columns: tuple) -> list[str]:
+    changed = " OR ".join(f"OLD.{column} IS DISTINCT FROM NEW.{column}" for column in columns)
+    return [
+        f"DROP TRIGGER IF EXISTS event_stats ON {table}",
+        f"CREATE TRIGGER event_stats AFTER INSERT OR DELETE ON {table} "
+        f"FOR EACH ROW EXECUTE FUNCTION event_stats_{table}()",
+        f"DROP TRIGGER IF EXISTS event_stats_update ON {table}",
+        f"CREATE TRIGGER event_stats_update AFTER UPDATE ON {table} "
+        f"FOR EACH ROW WHEN ({changed}) EXECUTE FUNCTION event_stats_{table}()",
+    ]
+
+
+EVENT_STATS_DDL = EVENT_STATS_FUNCTIONS + [
+    statement for table, columns in EVENT_STATS_SOURCES.items() for statement in event_stats_triggers(table, columns)
+]
+
+# After every table exists: the triggers are on the tables the counters come from.
+for _statement in EVENT_STATS_DDL:
+    event.listen(Base.metadata, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
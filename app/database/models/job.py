@@ -0,0 +1,46 @@
+from enum import Enum
+
+from sqlalchemy import JSON, UUID, Boolean, Column, DateTime, Float, ForeignKey, Index, Integer, String, func
+
+from app.database.models.base import Base
+from app.database.models.utils import ModelTemplate, UIDType
+
+
+class JobStatus(str, Enum):
+    QUEUED = "QUEUED"
+    RUNNING = "RUNNING"
+    SUCCEEDED = "SUCCEEDED"
+    FAILED = "FAILED"
+    CANCELLED = "CANCELLED"
+
+
+FINISHED_JOB_STATUSES = (JobStatus.SUCCEEDED, JobStatus.FAILED, JobStatus.CANCELLED)
+
+
+class JobModel(ModelTemplate, Base):
+    __tablename__ = "jobs"
+
+    event_id = Column(UUID(as_uuid=True), ForeignKey("events.id"), nullable=False)
+    job_type = Column(String, nullable=False)
+    status = Column(String, nullable=False, default=JobStatus.QUEUED)
+    parameters = Column(JSON, nullable=False, default=dict)
+    result = Column(JSON, nullable=True)
+    error = Column(String, nullable=True)
+    progress = Column(Float, nullable=False, default=0.0)
+    progress_message = Column(String, nullable=True)
+    created_by = Column(UIDType, ForeignKey("users.id"), nullable=True)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=1)
+    # A queued job is not claimed before run_after: retries wait for their backoff there.
+    run_after = Column(DateTime, server_default=func.now(), nullable=False)
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    # The worker running the job, and when it last reported being alive.
+    worker_id = Column(String, nullable=True)
+    heartbeat_at = Column(DateTime, nullable=True)
+
+    __table_args__ = (
+        Index("ix_jobs_event_id", "event_id"),
+        Index("ix_jobs_status_run_after", "status", "run_after"),
+    )
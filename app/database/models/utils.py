@@ -8,7 +8,9 @@ from sqlalchemy.orm import declarative_mixin
 @declarative_mixin
 class DateTemplate:
     creation_date = Column(DateTime, server_default=func.now(), nullable=False)
-    last_update = Column(DateTime, server_default=func.now(), onupdate=func.now())
+    # clock_timestamp() instead of now() (the transaction start), so every update moves
+    # last_update even within one transaction: it backs the ETag / Last-Modified validators.
+    last_update = Column(DateTime, server_default=func.now(), onupdate=func.clock_timestamp())
 
 
 # func.now() documentation: https://docs.sqlalchemy.org/en/14/core/defaults.html#client-invoked-sql-expressions
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, ForeignKey, Integer, UniqueConstraint
+from sqlalchemy import Column, ForeignKey, Index, Integer, UniqueConstraint
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 
@@ -15,4 +15,7 @@ class WorkSlotModel(DateTemplate, Base):
     slot = relationship("EventRoomSlotModel", back_populates="work_links")
     work = relationship("WorkModel", back_populates="slot_links", lazy="selectin")
 
-    __table_args__ = (UniqueConstraint("slot_id", "work_id", name="_slot_work_uc"),)
+    __table_args__ = (
+        UniqueConstraint("slot_id", "work_id", name="_slot_work_uc"),
+        Index("ix_work_slots_work_id", "work_id"),
+    )
@@ -4,10 +4,14 @@ from fastapi import Depends
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.database import SessionLocal
+from app.database.instrumentation import raise_on_lazy_loads
+from app.settings.settings import DiagnosticsSettings, get_settings
 
 
 async def get_db():
     session = SessionLocal()
+    if get_settings(DiagnosticsSettings).LAZY_LOADS_RAISE:
+        raise_on_lazy_loads(session.sync_session)
     try:
         yield session
     finally:
@@ -0,0 +1,43 @@
+from fastapi import status
+
+from app.exceptions.base_exception import BaseHTTPException
+
+
+class JobNotFound(BaseHTTPException):
+    def __init__(self, event_id, job_id):
+        super().__init__(
+            status.HTTP_404_NOT_FOUND,
+            "JOB_NOT_FOUND",
+            f"Job {job_id} not found for event {event_id}",
+            {"event_id": event_id, "job_id": job_id},
+        )
+
+
+class UnknownJobType(BaseHTTPException):
+    def __init__(self, job_type, job_types):
+        super().__init__(
+            status.HTTP_400_BAD_REQUEST,
+            "UNKNOWN_JOB_TYPE",
+            f"Unknown job type {job_type}",
+            {"job_type": job_type, "job_types": job_types},
+        )
+
+
+class InvalidJobParameters(BaseHTTPException):
+    def __init__(self, job_type, errors):
+        super().__init__(
+            status.HTTP_422_UNPROCESSABLE_ENTITY,
+            "INVALID_JOB_PARAMETERS",
+            f"Invalid parameters for a {job_type} job",
+            {"job_type": job_type, "errors": errors},
+        )
+
+
+class JobAlreadyFinished(BaseHTTPException):
+    def __init__(self, job_id, job_status):
+        super().__init__(
+            status.HTTP_409_CONFLICT,
+            "JOB_ALREADY_FINISHED",
+            f"Job {job_id} already finished with status {job_status}",
+            {"job_id": job_id, "status": job_status},
+        )
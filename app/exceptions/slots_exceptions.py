@@ -0,0 +1,23 @@
+from fastapi import status
+
+from app.exceptions.base_exception import BaseHTTPException
+
+
+class AssignmentSolutionNotFound(BaseHTTPException):
+    def __init__(self, event_id, solution_id):
+        super().__init__(
+            status.HTTP_404_NOT_FOUND,
+            "ASSIGNMENT_SOLUTION_NOT_FOUND",
+            f"Assignment solution {solution_id} not found for event {event_id}",
+            {"event_id": event_id, "solution_id": solution_id},
+        )
+
+
+class StaleAssignmentSolution(BaseHTTPException):
+    def __init__(self, event_id, solution_id):
+        super().__init__(
+            status.HTTP_409_CONFLICT,
+            "STALE_ASSIGNMENT_SOLUTION",
+            f"The slots or works of event {event_id} changed since solution {solution_id} was computed",
+            {"event_id": event_id, "solution_id": solution_id},
+        )
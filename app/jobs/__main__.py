@@ -0,0 +1,25 @@
+"""
+Background job worker process: runs the jobs submitted through /events/{event_id}/jobs until it
+gets SIGINT or SIGTERM, then queues its running jobs again for another worker.
+
+    python -m app.jobs
+"""
+
+import asyncio
+import logging
+import signal
+
+from app.jobs.worker import JobWorker
+
+
+async def main() -> None:
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for signal_number in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(signal_number, stop.set)
+    await JobWorker().run(stop)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    asyncio.run(main())
@@ -0,0 +1,28 @@
+"""Jobs folding the deltas of the dashboard counters, so reading a dashboard stays short."""
+
+from typing import List
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.jobs.job_types import JobContext, JobType, PeriodicJob
+from app.repository.event_stats_repository import EventStatsRepository
+from app.schemas.events.dashboard import CompactEventStatsParametersSchema
+from app.settings.settings import JobsSettings, get_settings
+
+
+async def compact_event_stats(context: JobContext) -> dict | None:
+    return {"counters": await EventStatsRepository(context.session).compact(context.event_id)}
+
+
+async def events_with_deltas(session: AsyncSession) -> List[UUID]:
+    return await EventStatsRepository(session).get_events_with_deltas()
+
+
+EVENT_STATS_COMPACT = JobType(
+    "event_stats_compact", compact_event_stats, CompactEventStatsParametersSchema, max_concurrency=2, max_attempts=3
+)
+# A dashboard read adds up at most the deltas written since the last interval.
+EVENT_STATS_COMPACTION = PeriodicJob(
+    EVENT_STATS_COMPACT, events_with_deltas, get_settings(JobsSettings).EVENT_STATS_COMPACT_INTERVAL_SECONDS
+)
@@ -0,0 +1,46 @@
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Type
+from uuid import UUID
+
+from pydantic import BaseModel
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+class JobCancelled(Exception):
+    """Raised in a job that was asked to stop."""
+
+
+@dataclass
+class JobContext:
+    """What a running job gets: its parameters, a session of its own and a way to report progress."""
+
+    job_id: UUID
+    event_id: UUID
+    parameters: BaseModel
+    attempt: int
+    session: AsyncSession
+    report_progress: Callable[[float, str | None], Awaitable[bool]]
+
+    async def progress(self, fraction: float, message: str | None = None) -> None:
+        """Records how far the job got, from 0 to 1. Raises JobCancelled if it was cancelled meanwhile."""
+        if await self.report_progress(fraction, message):
+            raise JobCancelled()
+
+
+@dataclass(frozen=True)
+class JobType:
+    name: str
+    run: Callable[[JobContext], Awaitable[dict | None]]
+    parameters: Type[BaseModel]
+    # Jobs of the type running at once across every worker.
+    max_concurrency: int = 1
+    max_attempts: int = 1
+
+
+@dataclass(frozen=True)
+class PeriodicJob:
+    """A job the workers queue on their own every `interval_seconds`, for each event `events` gives."""
+
+    job_type: JobType
+    events: Callable[[AsyncSession], Awaitable[List[UUID]]]
+    interval_seconds: float
@@ -0,0 +1,13 @@
+from typing import Dict, List
+
+from app.jobs.event_stats_jobs import EVENT_STATS_COMPACT, EVENT_STATS_COMPACTION
+from app.jobs.job_types import JobType, PeriodicJob
+from app.jobs.slots_jobs import SLOTS_ASSIGN, SLOTS_PREVIEW, SLOTS_REPAIR
+
+# Every job that can be submitted, by name. New kinds of jobs are added here.
+JOB_TYPES: Dict[str, JobType] = {
+    job_type.name: job_type for job_type in (SLOTS_ASSIGN, SLOTS_REPAIR, SLOTS_PREVIEW, EVENT_STATS_COMPACT)
+}
+
+# Jobs the workers queue on their own, for the events that need them.
+PERIODIC_JOBS: List[PeriodicJob] = [EVENT_STATS_COMPACTION]
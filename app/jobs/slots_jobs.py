@@ -0,0 +1,65 @@
+"""Jobs solving the assignment of works to slots, which can take minutes on large events."""
+
+from app.cache.cache import namespace_cache
+from app.jobs.job_types import JobContext, JobType
+from app.repository.events_repository import EventsRepository
+from app.repository.slots_repository import SlotsRepository
+from app.repository.work_slot_repository import WorkSlotRepository
+from app.repository.works_repository import WorksRepository
+from app.schemas.events.assing_works_parameters import AssignWorksParametersSchema, RepairWorksParametersSchema
+from app.services.slots.slots_configuration_service import SlotsConfigurationService, SolveProgress
+from app.services.slots.solution_cache import SolutionCache
+
+
+def _slots_service(context: JobContext) -> SlotsConfigurationService:
+    return SlotsConfigurationService(
+        context.event_id,
+        EventsRepository(context.session),
+        SlotsRepository(context.session),
+        WorksRepository(context.session),
+        WorkSlotRepository(context.session),
+        SolutionCache(namespace_cache("solutions")),
+    )
+
+
+def _solve_progress(context: JobContext, message: str) -> SolveProgress:
+    # The solve takes the job from 10% to 90%; reporting raises JobCancelled when it was cancelled.
+    async def on_progress(fraction: float) -> None:
+        await context.progress(0.1 + 0.8 * fraction, message)
+
+    return on_progress
+
+
+def _as_result(outcome) -> dict | None:
+    if outcome is None or isinstance(outcome, dict):
+        return outcome
+    return outcome.model_dump(mode="json")
+
+
+async def assign_works(context: JobContext) -> dict | None:
+    await context.progress(0.1, "Solving the assignment")
+    progress = _solve_progress(context, "Solving the assignment")
+    return _as_result(await _slots_service(context).assign_works_to_slots(context.parameters, progress))
+
+
+async def repair_assignments(context: JobContext) -> dict | None:
+    await context.progress(0.1, "Placing the unassigned works")
+    progress = _solve_progress(context, "Placing the unassigned works")
+    return _as_result(await _slots_service(context).repair_assignments(context.parameters, progress))
+
+
+async def preview_assignment(context: JobContext) -> dict | None:
+    await context.progress(0.1, "Solving the assignment")
+    progress = _solve_progress(context, "Solving the assignment")
+    preview = await _slots_service(context).preview_assignment(context.parameters, progress)
+    return _as_result(preview) or {"message": "No works or slots to assign."}
+
+
+# Solving is CPU bound: a couple at a time keep the workers responsive.
+SLOTS_ASSIGN = JobType("slots_assign", assign_works, AssignWorksParametersSchema, max_concurrency=2, max_attempts=3)
+SLOTS_REPAIR = JobType(
+    "slots_repair", repair_assignments, RepairWorksParametersSchema, max_concurrency=2, max_attempts=3
+)
+SLOTS_PREVIEW = JobType(
+    "slots_preview", preview_assignment, AssignWorksParametersSchema, max_concurrency=2, max_attempts=3
+)
@@ -0,0 +1,179 @@
+"""
+Background job worker.
+
+Claims queued jobs from the jobs table and runs them, up to its concurrency, while the limits of
+running jobs per type and per event hold across every worker. A heartbeat keeps the claim of a
+running job and notices cancellations; jobs of a worker that stopped beating are retried by the
+others. A failed job is retried with exponential backoff until it runs out of attempts, except
+for HTTP errors of the services, which would fail again. The workers also queue the periodic jobs
+of the registry, like the compaction of the dashboard counters.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+import time
+from typing import Callable, Dict, List, Set
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.database import SessionLocal
+from app.database.models.job import JobModel, JobStatus
+from app.jobs.job_types import JobCancelled, JobContext, JobType, PeriodicJob
+from app.jobs.registry import JOB_TYPES, PERIODIC_JOBS
+from app.repository.jobs_repository import JobsRepository
+from app.settings.settings import JobsSettings, get_settings
+from app.utils.metrics import JOB_DURATION, JOBS_FINISHED, JOBS_RUNNING
+
+logger = logging.getLogger(__name__)
+
+
+def _describe(error: BaseException) -> str:
+    if isinstance(error, HTTPException):
+        return f"{error.status_code}: {error.detail}"
+    return f"{type(error).__name__}: {error}"
+
+
+class JobWorker:
+    def __init__(
+        self,
+        session_factory: Callable[[], AsyncSession] = SessionLocal,
+        job_types: Dict[str, JobType] = JOB_TYPES,
+        settings: JobsSettings | None = None,
+        periodic_jobs: List[PeriodicJob] = PERIODIC_JOBS,
+    ):
+        self.session_factory = session_factory
+        self.job_types = job_types
+        self.periodic_jobs = periodic_jobs
+        # When each periodic job is due next, by job type, on the monotonic clock.
+        self._periodic_due: Dict[str, float] = {}
+        self.settings = settings if settings is not None else get_settings(JobsSettings)
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._running: Set[asyncio.Task] = set()
+
+    async def run(self, stop: asyncio.Event) -> None:
+        """Runs jobs until `stop` is set, then stops the running ones and queues them again."""
+        logger.info(f"Job worker {self.worker_id} started")
+        try:
+            while not stop.is_set():
+                await self._jobs(JobsRepository.requeue_stale, self.settings.LEASE_SECONDS)
+                await self.queue_periodic()
+                while len(self._running) < self.settings.WORKER_CONCURRENCY:
+                    job = await self._claim()
+                    if job is None:
+                        break
+                    task = asyncio.create_task(self._run(job))
+                    self._running.add(task)
+                    task.add_done_callback(self._running.discard)
+                waits = [asyncio.create_task(stop.wait()), *self._running]
+                await asyncio.wait(
+                    waits, timeout=self.settings.POLL_INTERVAL_SECONDS, return_when=asyncio.FIRST_COMPLETED
+                )
+                waits[0].cancel()
+        finally:
+            for task in list(self._running):
+                task.cancel()
+            await asyncio.gather(*self._running, return_exceptions=True)
+            logger.info(f"Job worker {self.worker_id} stopped")
+
+    async def run_next(self) -> JobModel | None:
+        """Claims and runs one job to its end, if there is one to run. Returns the claimed job."""
+        job = await self._claim()
+        if job is not None:
+            await self._run(job)
+        return job
+
+    async def queue_periodic(self) -> int:
+        """Queues the periodic jobs that are due, for the events that need them. Returns the jobs queued."""
+        queued = 0
+        for periodic in self.periodic_jobs:
+            now = time.monotonic()
+            if now < self._periodic_due.get(periodic.job_type.name, now):
+                continue
+            self._periodic_due[periodic.job_type.name] = now + periodic.interval_seconds
+            async with self.session_factory() as session:
+                event_ids = await periodic.events(session)
+                queued += await JobsRepository(session).queue_for_events(
+                    periodic.job_type.name, event_ids, periodic.job_type.max_attempts
+                )
+        return queued
+
+    async def _claim(self) -> JobModel | None:
+        limits = {name: job_type.max_concurrency for name, job_type in self.job_types.items()}
+        return await self._jobs(JobsRepository.claim, self.worker_id, limits, self.settings.PER_EVENT_CONCURRENCY)
+
+    async def _jobs(self, operation, *args):
+        async with self.session_factory() as session:
+            return await operation(JobsRepository(session), *args)
+
+    async def _run(self, job: JobModel) -> None:
+        job_type = self.job_types[job.job_type]
+        logger.info(f"Running job {job.id} ({job.job_type}) of event {job.event_id}, attempt {job.attempts}")
+        cancel_requested = asyncio.Event()
+
+        async def report_progress(progress: float, message: str | None) -> bool:
+            cancelled = await self._jobs(JobsRepository.set_progress, job.id, self.worker_id, progress, message)
+            if cancelled:
+                cancel_requested.set()
+            return cancelled
+
+        with JOBS_RUNNING.track_in_progress(job_type=job.job_type), JOB_DURATION.time(job_type=job.job_type):
+            async with self.session_factory() as session:
+                heartbeat = None
+                try:
+                    context = JobContext(
+                        job_id=job.id,
+                        event_id=job.event_id,
+                        parameters=job_type.parameters.model_validate(job.parameters),
+                        attempt=job.attempts,
+                        session=session,
+                        report_progress=report_progress,
+                    )
+                    handler = asyncio.create_task(job_type.run(context))
+                    heartbeat = asyncio.create_task(self._heartbeat(job, handler, cancel_requested))
+                    result = await handler
+                except asyncio.CancelledError:
+                    if not cancel_requested.is_set():
+                        # The worker is stopping: another one runs the job again.
+                        await self._jobs(JobsRepository.release, job.id, self.worker_id)
+                        raise
+                    await self._finished(job, JobStatus.CANCELLED)
+                except JobCancelled:
+                    await self._finished(job, JobStatus.CANCELLED)
+                except Exception as error:
+                    await session.rollback()
+                    await self._failed(job, error)
+                else:
+                    await self._finished(job, JobStatus.SUCCEEDED, result=result)
+                finally:
+                    if heartbeat is not None:
+                        heartbeat.cancel()
+
+    async def _heartbeat(self, job: JobModel, handler: asyncio.Task, cancel_requested: asyncio.Event) -> None:
+        while True:
+            await asyncio.sleep(self.settings.HEARTBEAT_SECONDS)
+            if await self._jobs(JobsRepository.heartbeat, job.id, self.worker_id):
+                logger.info(f"Cancelling job {job.id}")
+                cancel_requested.set()
+                handler.cancel()
+                return
+
+    async def _finished(self, job: JobModel, status: JobStatus, result: dict | None = None) -> None:
+        JOBS_FINISHED.inc(job_type=job.job_type, outcome=status.value.lower())
+        logger.info(f"Job {job.id} ({job.job_type}) finished: {status.value}")
+        await self._jobs(JobsRepository.finish, job.id, self.worker_id, status, result)
+
+    async def _failed(self, job: JobModel, error: Exception) -> None:
+        description = _describe(error)
+        if isinstance(error, HTTPException) or job.attempts >= job.max_attempts:
+            JOBS_FINISHED.inc(job_type=job.job_type, outcome="failed")
+            logger.exception(f"Job {job.id} ({job.job_type}) failed: {description}")
+            await self._jobs(JobsRepository.finish, job.id, self.worker_id, JobStatus.FAILED, None, description)
+            return
+        delay = self.settings.RETRY_BACKOFF_SECONDS * 2 ** (job.attempts - 1)
+        JOBS_FINISHED.inc(job_type=job.job_type, outcome="retried")
+        logger.warning(f"Job {job.id} ({job.job_type}) failed, retrying in {delay:.0f} s: {description}")
+        await self._jobs(JobsRepository.retry, job.id, self.worker_id, description, delay)
@@ -1,17 +1,130 @@
+import asyncio
 import logging
+import time
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from app.cache.cache import close_cache_backend
+from app.jobs.worker import JobWorker
+from app.middlewares.compression import CompressionMiddleware
+from app.middlewares.metrics import MetricsMiddleware
+from app.middlewares.profiling import ProfilingMiddleware
+from app.middlewares.sql_diagnostics import SqlDiagnosticsMiddleware
+from app.middlewares.tracing import TracingMiddleware
 from app.routers.events.events import events_router, global_provider_router
+from app.routers.metrics import metrics_router
 from app.routers.users.users import users_router
+from app.settings.settings import (
+    CacheSettings,
+    DatabaseSettings,
+    DiagnosticsSettings,
+    JobsSettings,
+    MercadoPagoSettings,
+    NotificationsSettings,
+    StorageSettings,
+    TracingSettings,
+    get_settings,
+)
+from app.utils.loop_monitor import LoopLagMonitor
+from app.utils.startup import run_startup
+from app.utils.tracing import EXPORTERS, Tracer
+
+diagnostics = get_settings(DiagnosticsSettings)
+tracing = get_settings(TracingSettings)
+tracer = Tracer(EXPORTERS[tracing.EXPORTER](tracing.FILE), tracing.SAMPLE_RATE) if tracing.SAMPLE_RATE > 0 else None
 
 logging.basicConfig(
     level=logging.INFO,  # Set the minimum level to log
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 
+
+@asynccontextmanager
+async def validate_settings():
+    """Reads every settings class, so a misconfigured instance fails before serving instead of on a request."""
+    for settings_type in (
+        DatabaseSettings,
+        StorageSettings,
+        MercadoPagoSettings,
+        NotificationsSettings,
+        CacheSettings,
+        JobsSettings,
+    ):
+        get_settings(settings_type)
+    yield
+
+
+@asynccontextmanager
+async def loop_monitor():
+    if not diagnostics.LOOP_MONITOR_ENABLED:
+        yield
+        return
+    monitor = LoopLagMonitor(
+        interval=diagnostics.LOOP_MONITOR_INTERVAL_MS / 1000, threshold=diagnostics.LOOP_BLOCK_THRESHOLD_MS / 1000
+    )
+    await monitor.start()
+    try:
+        yield
+    finally:
+        await monitor.stop()
+
+
+@asynccontextmanager
+async def tracing_exporter():
+    # The exporter writes from a thread; on shutdown the traces still queued are written.
+    try:
+        yield
+    finally:
+        if tracer is not None:
+            await asyncio.to_thread(tracer.exporter.shutdown)
+
+
+@asynccontextmanager
+async def cache():
+    # The backend connects on first use; on shutdown its connections are closed.
+    try:
+        yield
+    finally:
+        await close_cache_backend()
+
+
+@asynccontextmanager
+async def jobs_worker():
+    # Single process deployments can run background jobs in the API process; the others run `python -m app.jobs`.
+    if not get_settings(JobsSettings).RUN_IN_APP:
+        yield
+        return
+    stop = asyncio.Event()
+    worker = asyncio.create_task(JobWorker().run(stop))
+    try:
+        yield
+    finally:
+        stop.set()
+        await worker
+
+
+# Entered in order on startup and exited in reverse on shutdown. Email templates, the storage client and
+# the payment and HTTP clients are not started here: they are built on their first use.
+STARTUP_STEPS = [
+    ("settings", validate_settings),
+    ("loop_monitor", loop_monitor),
+    ("tracing", tracing_exporter),
+    ("cache", cache),
+    ("jobs_worker", jobs_worker),
+]
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    async with run_startup(STARTUP_STEPS, imported=IMPORTED) as report:
+        app.state.startup = report
+        yield
+
+
 app = FastAPI(
+    lifespan=lifespan,
     title="Backend API",
     description="Backend for EvenTITO",
     version="0.0.1",
@@ -42,7 +155,26 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if diagnostics.PROFILING_ENABLED:
+    app.add_middleware(
+        ProfilingMiddleware,
+        directory=diagnostics.PROFILES_DIRECTORY,
+        sampling_interval=diagnostics.PROFILING_SAMPLING_INTERVAL_MS / 1000,
+    )
+app.add_middleware(CompressionMiddleware)
+app.add_middleware(
+    SqlDiagnosticsMiddleware,
+    max_statements=diagnostics.MAX_STATEMENTS_PER_REQUEST,
+    repeated_threshold=diagnostics.REPEATED_STATEMENT_THRESHOLD,
+    debug=diagnostics.DEBUG,
+)
+if tracer is not None:
+    app.add_middleware(TracingMiddleware, tracer=tracer)
+app.add_middleware(MetricsMiddleware)
 
 app.include_router(users_router)
 app.include_router(events_router)
 app.include_router(global_provider_router)
+app.include_router(metrics_router)
+
+IMPORTED = time.perf_counter()
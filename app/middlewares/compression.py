@@ -0,0 +1,79 @@
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipResponder, IdentityResponder
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional, gzip is always available
+    brotli = None
+
+DEFAULT_MINIMUM_SIZE = 1024
+# Levels where compressing a 1 MB list of works takes ~20 ms and shrinks it ~7x. gzip's default (9)
+# and brotli's (11) compress little more for several times the CPU (see `python -m benchmarks.http`).
+DEFAULT_GZIP_LEVEL = 4
+DEFAULT_BROTLI_QUALITY = 4
+
+
+class BrotliResponder(IdentityResponder):
+    content_encoding = "br"
+
+    def __init__(self, app: ASGIApp, minimum_size: int, quality: int):
+        super().__init__(app, minimum_size)
+        self.compressor = brotli.Compressor(quality=quality)
+
+    async def apply_compression(self, body: bytes, *, more_body: bool) -> bytes:
+        if more_body:
+            return self.compressor.process(body) + self.compressor.flush()
+        return self.compressor.process(body) + self.compressor.finish()
+
+
+def accepted_encodings(accept_encoding: str) -> set[str]:
+    """Codings of an Accept-Encoding header, leaving out the ones refused with q=0."""
+    encodings = set()
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            refused = params and float(quality) == 0
+        except ValueError:
+            refused = False
+        if coding and not refused:
+            encodings.add(coding.strip().lower())
+    return encodings
+
+
+class CompressionMiddleware:
+    """
+    Compresses responses of at least `minimum_size` bytes with brotli when the client
+    accepts it and the module is installed, or else with gzip. Smaller responses and
+    responses that already have a Content-Encoding go out untouched.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = DEFAULT_MINIMUM_SIZE,
+        gzip_level: int = DEFAULT_GZIP_LEVEL,
+        brotli_quality: int = DEFAULT_BROTLI_QUALITY,
+        use_brotli: bool = True,
+    ):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.use_brotli = use_brotli and brotli is not None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        encodings = accepted_encodings(Headers(scope=scope).get("Accept-Encoding", ""))
+        responder: ASGIApp
+        if self.use_brotli and "br" in encodings:
+            responder = BrotliResponder(self.app, self.minimum_size, self.brotli_quality)
+        elif "gzip" in encodings:
+            responder = GZipResponder(self.app, self.minimum_size, compresslevel=self.gzip_level)
+        else:
+            responder = IdentityResponder(self.app, self.minimum_size)
+        await responder(scope, receive, send)
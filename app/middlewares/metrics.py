@@ -0,0 +1,96 @@
+import re
+import time
+from typing import Dict, List, Tuple
+
+from starlette.concurrency import run_in_threadpool
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.database.instrumentation import track_statements
+from app.utils.metrics import (
+    DB_STATEMENTS_PER_REQUEST,
+    DB_TIME_PER_REQUEST,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_PROGRESS,
+)
+
+# Label of requests that matched no route, so unknown paths don't create new series.
+UNMATCHED_ROUTE = "unmatched"
+
+
+class RouteTemplates:
+    """
+    Maps request paths back to the path templates of the app (/events/{event_id}/works),
+    which keep the number of metric series bounded.
+
+    Routes of included routers only know the path relative to their router, so the
+    templates are taken from the OpenAPI paths, which have the full prefix. Building the
+    OpenAPI schema takes a few hundred milliseconds, so it runs in a thread, not the event loop.
+    """
+
+    def __init__(self):
+        self._by_segments: Dict[int, List[Tuple[re.Pattern, str]]] | None = None
+
+    async def template(self, app, path: str) -> str | None:
+        if self._by_segments is None:
+            self._by_segments = await run_in_threadpool(lambda: self._compile(app.openapi()["paths"]))
+        for pattern, template in self._by_segments.get(path.count("/"), ()):
+            if pattern.fullmatch(path):
+                return template
+        return None
+
+    @staticmethod
+    def _compile(paths) -> Dict[int, List[Tuple[re.Pattern, str]]]:
+        by_segments: Dict[int, List[Tuple[re.Pattern, str]]] = {}
+        # Static segments win over parameters, as /events/my-events over /events/{event_id}.
+        for template in sorted(paths, key=lambda template: template.count("{")):
+            pattern = re.compile(re.sub(r"\\\{[^/]+?\\\}", "[^/]+", re.escape(template)))
+            by_segments.setdefault(template.count("/"), []).append((pattern, template))
+        return by_segments
+
+
+class MetricsMiddleware:
+    """
+    Observes the latency of every request by route template, the requests in progress and
+    the SQL statements each request executes.
+
+    Latency stops at the last body message: background tasks that run after the response
+    (e.g. emails) count for the statements of the request, not for its latency.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.route_templates = RouteTemplates()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        started = time.perf_counter()
+        response = {"status": 500, "duration": None}
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                response["status"] = message["status"]
+            elif message["type"] == "http.response.body" and not message.get("more_body", False):
+                response["duration"] = time.perf_counter() - started
+            await send(message)
+
+        with HTTP_REQUESTS_IN_PROGRESS.track_in_progress(method=method), track_statements() as statements:
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                route = await self._route_label(scope)
+                duration = response["duration"] or time.perf_counter() - started
+                HTTP_REQUEST_DURATION.observe(duration, method=method, route=route, status=str(response["status"]))
+                DB_STATEMENTS_PER_REQUEST.observe(statements.statements, route=route)
+                DB_TIME_PER_REQUEST.observe(statements.duration, route=route)
+
+    async def _route_label(self, scope: Scope) -> str:
+        route = scope.get("route")
+        if route is None:
+            return UNMATCHED_ROUTE
+        return await self.route_templates.template(scope["app"], scope["path"]) or getattr(
+            route, "path", UNMATCHED_ROUTE
+        )
@@ -0,0 +1,169 @@
+import asyncio
+import re
+from contextlib import AsyncExitStack
+from datetime import datetime, timezone
+from logging import getLogger
+from pathlib import Path
+from urllib.parse import parse_qs
+
+from fastapi import HTTPException
+from fastapi.dependencies.utils import get_dependant, solve_dependencies
+from fastapi.exception_handlers import http_exception_handler, request_validation_exception_handler
+from fastapi.exceptions import RequestValidationError
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.requests import Request
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.authorization.admin_user_dep import AdminUsrDep
+from app.utils.profiling import DeterministicProfiler, ProfilerMode, SamplingProfiler
+
+logger = getLogger(__name__)
+
+PROFILE_HEADER = "X-Profile"
+PROFILE_QUERY_PARAMETER = "profile"
+# With `response`, the profile is sent instead of the response body, which is discarded.
+PROFILE_OUTPUT_HEADER = "X-Profile-Output"
+PROFILE_FILE_HEADER = "X-Profile-File"
+PROFILED_STATUS_HEADER = "X-Profiled-Status"
+
+_UNSAFE_FILENAME_CHARACTERS = re.compile(r"[^A-Za-z0-9_.-]+")
+
+
+async def _authorize_profiling(_: AdminUsrDep) -> None:
+    """Only admins can profile."""
+
+
+_ADMIN_DEPENDANT = get_dependant(path="", call=_authorize_profiling)
+
+
+class ProfilingMiddleware:
+    """
+    Profiles single requests that ask for it with the X-Profile header or the `profile` query
+    parameter (`sampling` or `deterministic`), when the caller is an admin.
+
+    The profile is written to `directory` and its name returned in the X-Profile-File header.
+    The middleware is only installed when profiling is enabled, and requests that don't ask for
+    a profile only pay for looking at a header. The profilers see the whole process, so one
+    request is profiled at a time: the others are rejected while it runs.
+    """
+
+    def __init__(self, app: ASGIApp, directory: str | Path, sampling_interval: float = 0.001):
+        self.app = app
+        self.directory = Path(directory)
+        self.sampling_interval = sampling_interval
+        self._profiling = asyncio.Lock()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        mode = self._requested_mode(scope)
+        if mode is None:
+            await self.app(scope, receive, send)
+            return
+
+        denied = await self._denied_response(scope)
+        if denied is not None:
+            await denied(scope, receive, send)
+            return
+
+        if self._profiling.locked():
+            busy = Response("Another request is being profiled", status_code=429, headers={"Retry-After": "1"})
+            await busy(scope, receive, send)
+            return
+        async with self._profiling:
+            await self._profile(self._profiler(mode), scope, receive, send)
+
+    async def _profile(
+        self, profiler: SamplingProfiler | DeterministicProfiler, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        if Headers(scope=scope).get(PROFILE_OUTPUT_HEADER) == "response":
+            await self._profile_as_response(profiler, scope, receive, send)
+            return
+
+        filename = self._filename(scope, profiler.extension)
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message).append(PROFILE_FILE_HEADER, filename)
+            await send(message)
+
+        profiler.start()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.stop()
+            await asyncio.to_thread(self._write, filename, profiler)
+            logger.info(f"Profile of {scope['method']} {scope['path']} written to {self.directory / filename}")
+
+    def _write(self, filename: str, profiler: SamplingProfiler | DeterministicProfiler) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / filename).write_bytes(profiler.dump())
+
+    async def _profile_as_response(
+        self, profiler: SamplingProfiler | DeterministicProfiler, scope: Scope, receive: Receive, send: Send
+    ) -> None:
+        status = 500
+
+        async def discard(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+
+        profiler.start()
+        try:
+            await self.app(scope, receive, discard)
+        finally:
+            profiler.stop()
+        response = Response(
+            content=await asyncio.to_thread(profiler.dump),
+            media_type=profiler.media_type,
+            headers={PROFILED_STATUS_HEADER: str(status)},
+        )
+        await response(scope, receive, send)
+
+    def _requested_mode(self, scope: Scope) -> ProfilerMode | None:
+        requested = Headers(scope=scope).get(PROFILE_HEADER)
+        if requested is None and scope["query_string"]:
+            requested = parse_qs(scope["query_string"].decode("latin-1")).get(PROFILE_QUERY_PARAMETER, [None])[0]
+        if requested is None:
+            return None
+        try:
+            return ProfilerMode(requested)
+        except ValueError:
+            return None
+
+    async def _denied_response(self, scope: Scope) -> Response | None:
+        """
+        Solves the admin dependency of the routes with the caller's headers, honouring the
+        dependency overrides of the app, and answers like the routes when the caller isn't one.
+        """
+        async with AsyncExitStack() as stack:
+            # The stacks FastAPI's request handler provides: they close the session of the dependencies.
+            request = Request({**scope, "fastapi_inner_astack": stack, "fastapi_function_astack": stack})
+            try:
+                solved = await solve_dependencies(
+                    request=request,
+                    dependant=_ADMIN_DEPENDANT,
+                    dependency_overrides_provider=scope.get("app", self.app),
+                    async_exit_stack=stack,
+                    embed_body_fields=False,
+                )
+            except HTTPException as exc:
+                return await http_exception_handler(request, exc)
+        if solved.errors:
+            return await request_validation_exception_handler(request, RequestValidationError(solved.errors))
+        return None
+
+    def _profiler(self, mode: ProfilerMode) -> SamplingProfiler | DeterministicProfiler:
+        if mode == ProfilerMode.SAMPLING:
+            return SamplingProfiler(self.sampling_interval)
+        return DeterministicProfiler()
+
+    @staticmethod
+    def _filename(scope: Scope, extension: str) -> str:
+        timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%f")
+        path = _UNSAFE_FILENAME_CHARACTERS.sub("_", scope["path"].strip("/")) or "root"
+        return f"{timestamp}-{scope['method'].lower()}-{path}.{extension}"
@@ -0,0 +1,55 @@
+from logging import getLogger
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.database.instrumentation import StatementStats, track_statements
+
+logger = getLogger(__name__)
+
+SQL_STATS_HEADER = "X-SQL-Stats"
+
+
+class SqlDiagnosticsMiddleware:
+    """
+    Warns about requests that run too many SQL statements, or the same statement shape over and
+    over (an N+1). In debug mode every response also carries a summary in the X-SQL-Stats header,
+    with the statements run until the response started.
+    """
+
+    def __init__(self, app: ASGIApp, max_statements: int, repeated_threshold: int, debug: bool = False):
+        self.app = app
+        self.max_statements = max_statements
+        self.repeated_threshold = repeated_threshold
+        self.debug = debug
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with track_statements() as stats:
+
+            async def send_wrapper(message: Message) -> None:
+                if self.debug and message["type"] == "http.response.start":
+                    MutableHeaders(scope=message).append(SQL_STATS_HEADER, self._summary(stats))
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                self._warn(scope, stats)
+
+    def _summary(self, stats: StatementStats) -> str:
+        most_repeated = max(stats.fingerprints.values(), default=0)
+        return f"statements={stats.statements}; time_ms={stats.duration * 1000:.1f}; max_repeats={most_repeated}"
+
+    def _warn(self, scope: Scope, stats: StatementStats) -> None:
+        repeated = stats.repeated(self.repeated_threshold)
+        if stats.statements <= self.max_statements and not repeated:
+            return
+        details = "".join(f"\n  {count}x {shape}" for shape, count in repeated)
+        logger.warning(
+            f"{scope['method']} {scope['path']} ran {stats.statements} SQL statements "
+            f"in {stats.duration * 1000:.1f} ms{details}"
+        )
@@ -0,0 +1,42 @@
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.middlewares.metrics import RouteTemplates
+from app.utils.tracing import Tracer
+
+TRACE_ID_HEADER = "X-Trace-Id"
+
+
+class TracingMiddleware:
+    """
+    Opens the root span of sampled requests, named after the route template once routing is done,
+    and returns the trace id in the X-Trace-Id header.
+    """
+
+    def __init__(self, app: ASGIApp, tracer: Tracer):
+        self.app = app
+        self.tracer = tracer
+        self.route_templates = RouteTemplates()
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        with self.tracer.trace(f"{scope['method']} {scope['path']}", "server", method=scope["method"]) as root:
+            if root is None:
+                await self.app(scope, receive, send)
+                return
+
+            async def send_wrapper(message: Message) -> None:
+                if message["type"] == "http.response.start":
+                    root.attributes["status"] = message["status"]
+                    MutableHeaders(scope=message).append(TRACE_ID_HEADER, root.trace_id)
+                await send(message)
+
+            try:
+                await self.app(scope, receive, send_wrapper)
+            finally:
+                if scope.get("route") is not None:
+                    template = await self.route_templates.template(scope["app"], scope["path"])
+                    root.name = f"{scope['method']} {template or scope['route'].path}"
@@ -1,10 +1,15 @@
 from typing import Union
 
 from pydantic import BaseModel
-from sqlalchemy import and_, exists, func, update
+from sqlalchemy import Select, and_, exists, func, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 
+from app.utils.tracing import trace_methods
+
+# Separates the levels of a projected column label: "user__email" -> {"user": {"email": ...}}.
+NESTED_LABEL_SEPARATOR = "__"
+
 
 class Repository:
     """
@@ -15,6 +20,10 @@ class Repository:
         self.session = session
         self.model = model
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        trace_methods(cls, "repository")
+
     def _primary_key_conditions(self, id):
         return [self.model.id == id]
 
@@ -63,6 +72,11 @@ class Repository:
         await self.session.commit()
         return True
 
+    async def get_last_update(self, id):
+        """Cheap version query: the last_update of a row, or None if it doesn't exist."""
+        conditions = self._primary_key_conditions(id)
+        return await self._get_with_values(conditions, self.model.last_update)
+
     async def _get_many_with_conditions(self, conditions, offset: int, limit: int, options=None):
         query = select(self.model).where(and_(*conditions)).offset(offset).limit(limit)
         if options:
@@ -76,6 +90,23 @@ class Repository:
         result = await self.session.execute(query)
         return result.scalars().all()
 
+    def _columns_of(self, schema: type[BaseModel], exclude: tuple[str, ...] = ()) -> list:
+        """The model columns behind the fields of a response schema."""
+        table_columns = self.model.__table__.columns
+        return [table_columns[name] for name in schema.model_fields if name in table_columns and name not in exclude]
+
+    async def _project(self, query: Select) -> list[dict]:
+        """
+        Runs a query over (labelled) columns and builds the response dicts straight from the
+        rows, skipping ORM hydration. Labels joined by NESTED_LABEL_SEPARATOR become nested dicts.
+        """
+        result = await self.session.execute(query)
+        paths = [tuple(key.split(NESTED_LABEL_SEPARATOR)) for key in result.keys()]
+        if all(len(path) == 1 for path in paths):
+            keys = [path[0] for path in paths]
+            return [dict(zip(keys, row, strict=True)) for row in result]
+        return [_nest(paths, row) for row in result]
+
     async def get_many(self, offset: int, limit: int):
         query = select(self.model).offset(offset).limit(limit)
         result = await self.session.execute(query)
@@ -101,3 +132,16 @@ class Repository:
         await self.session.delete(obj)
         await self.session.commit()
         return obj
+
+
+trace_methods(Repository, "repository")
+
+
+def _nest(paths: list[tuple[str, ...]], row) -> dict:
+    projected: dict = {}
+    for path, value in zip(paths, row, strict=True):
+        target = projected
+        for parent in path[:-1]:
+            target = target.setdefault(parent, {})
+        target[path[-1]] = value
+    return projected
@@ -0,0 +1,193 @@
+from typing import List, Sequence
+from uuid import UUID
+
+from sqlalchemy import Integer, Numeric, Row, Select, String, delete, func, insert, literal, select, text, union_all
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database.models.event_stats import EventStat, EventStatsDeltaModel, EventStatsModel
+from app.database.models.inscription import InscriptionModel
+from app.database.models.payment import PaymentModel
+from app.database.models.review import ReviewModel
+from app.database.models.reviewer import ReviewerModel
+from app.database.models.work import WorkModel
+from app.repository.crud_repository import Repository
+
+# With the hash of an event id, serializes the compactions and rebuilds of the event.
+EVENT_STATS_LOCK_KEY = 0x45565354
+
+BY_WORK_STATS = [EventStat.REVIEWERS_BY_WORK, EventStat.REVIEWS_BY_WORK, EventStat.SHARED_REVIEWS_BY_WORK]
+
+
+class EventStatsRepository(Repository):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, EventStatsModel)
+
+    async def get_event_stats(self, event_id: UUID) -> Sequence[Row]:
+        """
+        Every counter of the event, as (metric, key, currency, count, amount) rows: the compacted
+        counters plus the deltas appended since, two range reads by event. The counters by work
+        are added up by the current track of the work, leaving out the deleted works.
+        """
+        columns = ("metric", "key", "currency", "count", "amount")
+        counters = union_all(
+            select(*(getattr(EventStatsModel, column) for column in columns)).where(
+                EventStatsModel.event_id == event_id
+            ),
+            select(*(getattr(EventStatsDeltaModel, column) for column in columns)).where(
+                EventStatsDeltaModel.event_id == event_id
+            ),
+        ).subquery()
+        by_work = [stat.value for stat in BY_WORK_STATS]
+        by_key = select(
+            counters.c.metric,
+            counters.c.key,
+            counters.c.currency,
+            func.sum(counters.c.count).cast(Integer).label("count"),
+            func.sum(counters.c.amount).label("amount"),
+        ).where(counters.c.metric.not_in(by_work))
+        by_track = (
+            select(
+                counters.c.metric,
+                WorkModel.track,
+                counters.c.currency,
+                func.sum(counters.c.count).cast(Integer),
+                func.sum(counters.c.amount),
+            )
+            .join(WorkModel, WorkModel.id.cast(String) == counters.c.key)
+            .where(counters.c.metric.in_(by_work), WorkModel.event_id == event_id)
+        )
+        query = union_all(
+            by_key.group_by(counters.c.metric, counters.c.key, counters.c.currency),
+            by_track.group_by(counters.c.metric, WorkModel.track, counters.c.currency),
+        )
+        return (await self.session.execute(query)).all()
+
+    async def get_events_with_deltas(self) -> List[UUID]:
+        query = select(EventStatsDeltaModel.event_id).distinct()
+        return list((await self.session.scalars(query)).all())
+
+    async def compact(self, event_id: UUID | None = None) -> int:
+        """
+        Folds the deltas of the event, or of every event, into its counters, one event per
+        transaction. Drops the counters left at zero. Returns the number of counters written.
+        """
+        if event_id is None:
+            counters = 0
+            for pending in await self.get_events_with_deltas():
+                counters += await self.compact(pending)
+            return counters
+        await self._lock(event_id)
+        folded = (
+            delete(EventStatsDeltaModel)
+            .where(EventStatsDeltaModel.event_id == event_id)
+            .returning(
+                EventStatsDeltaModel.event_id,
+                EventStatsDeltaModel.metric,
+                EventStatsDeltaModel.key,
+                EventStatsDeltaModel.currency,
+                EventStatsDeltaModel.count,
+                EventStatsDeltaModel.amount,
+            )
+            .cte("folded")
+        )
+        keys = [folded.c.event_id, folded.c.metric, folded.c.key, folded.c.currency]
+        sums = select(*keys, func.sum(folded.c.count).cast(Integer), func.sum(folded.c.amount)).group_by(*keys)
+        upsert = pg_insert(EventStatsModel).from_select(
+            ["event_id", "metric", "key", "currency", "count", "amount"], sums
+        )
+        upsert = upsert.on_conflict_do_update(
+            index_elements=["event_id", "metric", "key", "currency"],
+            set_={
+                "count": EventStatsModel.count + upsert.excluded.count,
+                "amount": EventStatsModel.amount + upsert.excluded.amount,
+            },
+        )
+        result = await self.session.execute(upsert)
+        # Counters back to zero, like the ones of deleted works, until a write brings them back.
+        await self.session.execute(
+            delete(EventStatsModel).where(
+                EventStatsModel.event_id == event_id, EventStatsModel.count == 0, EventStatsModel.amount == 0
+            )
+        )
+        await self.session.commit()
+        return result.rowcount
+
+    async def rebuild(self, event_id: UUID | None = None) -> int:
+        """
+        Recounts the counters of the event, or of every event, from the tables they come from,
+        correcting any drift, and drops its deltas. Writes go on meanwhile: the recount and the
+        deltas it drops are read in one statement, from one snapshot, so every write is either
+        recounted or left in a delta. Returns the number of counters written.
+        """
+        await self._lock(event_id)
+        clear = delete(EventStatsModel)
+        cleared = delete(EventStatsDeltaModel)
+        if event_id is not None:
+            clear = clear.where(EventStatsModel.event_id == event_id)
+            cleared = cleared.where(EventStatsDeltaModel.event_id == event_id)
+        await self.session.execute(clear)
+        counts = union_all(*self._counts(event_id))
+        columns = ["event_id", "metric", "key", "currency", "count", "amount"]
+        recount = insert(EventStatsModel).from_select(columns, counts).add_cte(cleared.cte("cleared"))
+        result = await self.session.execute(recount)
+        await self.session.commit()
+        return result.rowcount
+
+    async def _lock(self, event_id: UUID | None) -> None:
+        """
+        Waits for the compactions and rebuilds of the event, or of every event, that are writing its
+        counters, and keeps new ones waiting until the transaction ends. Writes to the tables the
+        counters come from only append deltas, so they never wait.
+        """
+        if event_id is None:
+            await self.session.execute(text("LOCK TABLE event_stats IN EXCLUSIVE MODE"))
+            return
+        await self.session.execute(text("LOCK TABLE event_stats IN ROW EXCLUSIVE MODE"))
+        await self.session.execute(
+            select(func.pg_advisory_xact_lock(EVENT_STATS_LOCK_KEY, func.hashtext(str(event_id))))
+        )
+
+    @staticmethod
+    def _counts(event_id: UUID | None) -> List[Select]:
+        """The counters maintained by the triggers, as (event_id, metric, key, currency, count, amount) queries."""
+
+        def counter(metric: EventStat, event_column, key_column, currency=None, amount=None, where=()) -> Select:
+            query = select(
+                event_column,
+                literal(metric.value),
+                key_column,
+                currency if currency is not None else literal(""),
+                func.count().cast(Integer),
+                amount if amount is not None else literal(0, Numeric),
+            )
+            conditions = [event_column.is_not(None), key_column.is_not(None), *where]
+            if event_id is not None:
+                conditions.append(event_column == event_id)
+            groups = [event_column, key_column] if currency is None else [event_column, key_column, currency]
+            return query.where(*conditions).group_by(*groups)
+
+        roles = select(
+            InscriptionModel.event_id.label("event_id"), func.unnest(InscriptionModel.roles).label("role")
+        ).subquery()
+        return [
+            counter(EventStat.INSCRIPTIONS_BY_STATUS, InscriptionModel.event_id, InscriptionModel.status),
+            counter(EventStat.INSCRIPTIONS_BY_ROLE, roles.c.event_id, roles.c.role),
+            counter(
+                EventStat.PAYMENTS_BY_STATUS,
+                PaymentModel.event_id,
+                PaymentModel.status,
+                currency=func.coalesce(PaymentModel.currency, ""),
+                amount=func.sum(func.coalesce(PaymentModel.amount, 0).cast(Numeric)),
+            ),
+            counter(EventStat.WORKS_BY_STATE, WorkModel.event_id, WorkModel.state),
+            counter(EventStat.WORKS_BY_TRACK, WorkModel.event_id, WorkModel.track),
+            counter(EventStat.REVIEWERS_BY_WORK, ReviewerModel.event_id, ReviewerModel.work_id.cast(String)),
+            counter(EventStat.REVIEWS_BY_WORK, ReviewModel.event_id, ReviewModel.work_id.cast(String)),
+            counter(
+                EventStat.SHARED_REVIEWS_BY_WORK,
+                ReviewModel.event_id,
+                ReviewModel.work_id.cast(String),
+                where=[ReviewModel.shared.is_(True)],
+            ),
+        ]
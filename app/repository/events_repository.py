@@ -1,16 +1,16 @@
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import JSON, Row, func, select, true
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.database.models.chair import ChairModel
 from app.database.models.event import EventModel, EventStatus
+from app.database.models.event_room_slot import EventRoomSlotModel
 from app.database.models.inscription import InscriptionModel
 from app.database.models.organizer import OrganizerModel
 from app.database.models.reviewer import ReviewerModel
 from app.repository.crud_repository import Repository
-from app.schemas.events.public_event_with_roles import PublicEventWithRolesSchema
 from app.schemas.events.roles import EventRole
 from app.schemas.users.utils import UID
 
@@ -54,6 +54,29 @@ class EventsRepository(Repository):
     async def _check_role_exists(self, model, event_id: UUID, user_id: UID) -> bool:
         return await self._exists_with_conditions([model.event_id == event_id, model.user_id == user_id])
 
+    async def get_public_version(self, event_id: UUID) -> Row | None:
+        """
+        (last_update, slots_digest) of an event: the event row plus a digest of its slots,
+        which are part of the public event but don't touch the event's last_update.
+        """
+        slot_fields = func.concat_ws(
+            "|",
+            EventRoomSlotModel.id,
+            EventRoomSlotModel.room_name,
+            EventRoomSlotModel.slot_type,
+            EventRoomSlotModel.title,
+            EventRoomSlotModel.start,
+            EventRoomSlotModel.end,
+        )
+        slots_digest = (
+            select(func.md5(func.string_agg(slot_fields, aggregate_order_by(",", EventRoomSlotModel.id))))
+            .where(EventRoomSlotModel.event_id == event_id)
+            .scalar_subquery()
+        )
+        stmt = select(EventModel.last_update, slots_digest.label("slots_digest")).where(EventModel.id == event_id)
+        result = await self.session.execute(stmt)
+        return result.first()
+
     async def get_roles(self, event_id: UUID, user_id: UID) -> list[EventRole]:
         roles = []
         if await self._check_role_exists(OrganizerModel, event_id, user_id):
@@ -73,7 +96,8 @@ class EventsRepository(Repository):
             roles.extend([EventRole(role) for role in inscription_roles])
         return roles
 
-    async def get_all_events_for_user(self, user_id: UID, offset: int, limit: int) -> list[PublicEventWithRolesSchema]:
+    async def get_all_events_for_user(self, user_id: UID, offset: int, limit: int) -> list[dict]:
+        """Events where the user has any role, newest first, as PublicEventWithRolesSchema dicts."""
         event_ids_subquery = (
             select(EventModel.id, EventModel.creation_date)
             .distinct()
@@ -92,9 +116,42 @@ class EventsRepository(Repository):
             .order_by(EventModel.creation_date.desc())
         ).subquery()
 
+        event_slots = (
+            select(
+                func.json_agg(
+                    aggregate_order_by(
+                        func.json_build_object(
+                            "id",
+                            EventRoomSlotModel.id,
+                            "room_name",
+                            EventRoomSlotModel.room_name,
+                            "slot_type",
+                            EventRoomSlotModel.slot_type,
+                            "start",
+                            EventRoomSlotModel.start,
+                            "end",
+                            EventRoomSlotModel.end,
+                        ),
+                        EventRoomSlotModel.id,
+                    ),
+                    type_=JSON,
+                ).label("event_slots")
+            )
+            .where(EventRoomSlotModel.event_id == EventModel.id)
+            .lateral("event_slots")
+        )
+
         query = (
             select(
-                EventModel,
+                EventModel.id,
+                EventModel.title,
+                EventModel.dates,
+                EventModel.description,
+                EventModel.event_type,
+                EventModel.location,
+                EventModel.tracks,
+                EventModel.status,
+                event_slots.c.event_slots,
                 select(InscriptionModel.roles)
                 .where((InscriptionModel.event_id == EventModel.id) & (InscriptionModel.user_id == user_id))
                 .label("inscription_roles"),
@@ -112,39 +169,25 @@ class EventsRepository(Repository):
                 .label("is_reviewer"),
             )
             .join(event_ids_subquery, EventModel.id == event_ids_subquery.c.id)
-            .options(selectinload(EventModel.event_slots))
+            .outerjoin(event_slots, true())
+            .order_by(EventModel.creation_date.desc())
         )
 
-        result = await self.session.execute(query)
-        events_with_roles_results = result.all()
-
-        events_map = {}
-        for event, inscription_roles, is_organizer, is_chair, is_reviewer in events_with_roles_results:
-            if event.id not in events_map:
-                roles = []
-                if is_organizer:
-                    roles.append(EventRole.ORGANIZER)
-                if is_chair:
-                    roles.append(EventRole.CHAIR)
-                if is_reviewer:
-                    roles.append(EventRole.REVIEWER)
-                if inscription_roles:
-                    roles.extend([EventRole(role) for role in inscription_roles])
-
-                events_map[event.id] = PublicEventWithRolesSchema(
-                    id=event.id,
-                    title=event.title,
-                    dates=event.dates,
-                    description=event.description,
-                    event_type=event.event_type,
-                    location=event.location,
-                    tracks=event.tracks,
-                    status=event.status,
-                    event_slots=event.event_slots,
-                    roles=roles,
-                )
-
-        return list(events_map.values())
+        events = await self._project(query)
+        for event in events:
+            roles = []
+            if event.pop("is_organizer"):
+                roles.append(EventRole.ORGANIZER)
+            if event.pop("is_chair"):
+                roles.append(EventRole.CHAIR)
+            if event.pop("is_reviewer"):
+                roles.append(EventRole.REVIEWER)
+            inscription_roles = event.pop("inscription_roles")
+            if inscription_roles:
+                roles.extend([EventRole(role) for role in inscription_roles])
+            event["roles"] = roles
+            event["event_slots"] = event["event_slots"] or []
+        return events
 
     async def get_all_events(
         self, offset: int, limit: int, status: EventStatus | None, title_search: str | None
@@ -1,10 +1,16 @@
 from uuid import UUID
 
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.models.inscription import InscriptionModel
+from app.database.models.user import UserModel
 from app.repository.crud_repository import Repository
-from app.schemas.inscriptions.inscription import InscriptionRequestSchema, InscriptionStatusSchema
+from app.schemas.inscriptions.inscription import (
+    InscriptionRequestSchema,
+    InscriptionResponseSchema,
+    InscriptionStatusSchema,
+)
 from app.schemas.users.utils import UID
 
 
@@ -22,9 +28,20 @@ class InscriptionsRepository(Repository):
         )
         return await self._create(db_inscription)
 
-    async def get_event_inscriptions(self, event_id: UUID, offset: int, limit: int) -> list[InscriptionModel]:
-        conditions = [InscriptionModel.event_id == event_id]
-        return await self._get_many_with_conditions(conditions, offset, limit)
+    async def get_event_inscriptions(self, event_id: UUID, offset: int, limit: int) -> list[dict]:
+        """Inscriptions of the event as InscriptionResponseSchema dicts."""
+        query = (
+            select(
+                *self._columns_of(InscriptionResponseSchema),
+                (UserModel.name + " " + UserModel.lastname).label("user__fullname"),
+                UserModel.email.label("user__email"),
+            )
+            .join(UserModel, UserModel.id == InscriptionModel.user_id)
+            .where(InscriptionModel.event_id == event_id)
+            .offset(offset)
+            .limit(limit)
+        )
+        return await self._project(query)
 
     async def get_user_inscriptions(self, user_id: UID, offset: int, limit: int) -> list[InscriptionModel]:
         conditions = [InscriptionModel.user_id == user_id]
@@ -0,0 +1,210 @@
+from datetime import timedelta
+from typing import Dict, List
+from uuid import UUID
+
+from sqlalchemy import and_, case, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
+
+from app.database.models.job import JobModel, JobStatus
+from app.repository.crud_repository import Repository
+
+# Serializes claims, so the running jobs counted against the concurrency limits can't change
+# between the count and the claim.
+CLAIM_LOCK_KEY = 0x4A4F4253
+
+
+class JobsRepository(Repository):
+    def __init__(self, session: AsyncSession):
+        super().__init__(session, JobModel)
+
+    async def get_event_job(self, event_id: UUID, job_id: UUID) -> JobModel | None:
+        return await self._get_with_conditions([JobModel.id == job_id, JobModel.event_id == event_id])
+
+    async def get_event_jobs(self, event_id: UUID, status: JobStatus | None, offset: int, limit: int) -> List[JobModel]:
+        query = select(JobModel).where(JobModel.event_id == event_id)
+        if status is not None:
+            query = query.where(JobModel.status == status)
+        query = query.order_by(JobModel.creation_date.desc(), JobModel.id).offset(offset).limit(limit)
+        result = await self.session.execute(query)
+        return list(result.scalars().all())
+
+    async def request_cancel(self, event_id: UUID, job_id: UUID) -> JobModel | None:
+        """
+        Cancels a queued job right away, and asks the worker of a running one to stop it. None when
+        the job doesn't exist or already finished.
+        """
+        queued = JobModel.status == JobStatus.QUEUED
+        query = (
+            update(JobModel)
+            .where(
+                JobModel.id == job_id,
+                JobModel.event_id == event_id,
+                JobModel.status.in_([JobStatus.QUEUED, JobStatus.RUNNING]),
+            )
+            .values(
+                cancel_requested=True,
+                status=case((queued, JobStatus.CANCELLED.value), else_=JobModel.status),
+                finished_at=case((queued, func.now()), else_=JobModel.finished_at),
+            )
+            .returning(JobModel)
+            .execution_options(synchronize_session=False)
+        )
+        job = (await self.session.execute(query)).scalar_one_or_none()
+        await self.session.commit()
+        return job
+
+    async def claim(self, worker_id: str, type_limits: Dict[str, int], per_event_limit: int) -> JobModel | None:
+        """
+        Takes the oldest queued job that is due, of one of the given types, whose type and event
+        are under their limits of running jobs, and marks it as running by this worker.
+        """
+        if not type_limits:
+            return None
+        await self.session.execute(select(func.pg_advisory_xact_lock(CLAIM_LOCK_KEY)))
+        running = aliased(JobModel)
+        running_of_type = (
+            select(running.job_type, func.count().label("running"))
+            .where(running.status == JobStatus.RUNNING)
+            .group_by(running.job_type)
+        )
+        running_of_event = (
+            select(running.event_id)
+            .where(running.status == JobStatus.RUNNING)
+            .group_by(running.event_id)
+            .having(func.count() >= per_event_limit)
+        )
+        full_types = [
+            job_type
+            for job_type, count in (await self.session.execute(running_of_type)).all()
+            if count >= type_limits.get(job_type, 0)
+        ]
+        candidate = (
+            select(JobModel.id)
+            .where(
+                JobModel.status == JobStatus.QUEUED,
+                JobModel.run_after <= func.now(),
+                JobModel.job_type.in_([job_type for job_type in type_limits if job_type not in full_types]),
+                JobModel.event_id.not_in(running_of_event),
+            )
+            .order_by(JobModel.run_after, JobModel.creation_date)
+            .limit(1)
+            .with_for_update(skip_locked=True)
+            .scalar_subquery()
+        )
+        query = (
+            update(JobModel)
+            .where(JobModel.id == candidate)
+            .values(
+                status=JobStatus.RUNNING,
+                attempts=JobModel.attempts + 1,
+                started_at=func.now(),
+                heartbeat_at=func.now(),
+                worker_id=worker_id,
+                error=None,
+            )
+            .returning(JobModel)
+            .execution_options(synchronize_session=False)
+        )
+        job = (await self.session.execute(query)).scalar_one_or_none()
+        await self.session.commit()
+        return job
+
+    async def heartbeat(self, job_id: UUID, worker_id: str) -> bool:
+        """Records that the worker is still running the job. True when it was asked to cancel it."""
+        return await self._update_running(job_id, worker_id, heartbeat_at=func.now())
+
+    async def set_progress(self, job_id: UUID, worker_id: str, progress: float, message: str | None) -> bool:
+        return await self._update_running(
+            job_id, worker_id, progress=progress, progress_message=message, heartbeat_at=func.now()
+        )
+
+    async def finish(
+        self, job_id: UUID, worker_id: str, status: JobStatus, result: dict | None = None, error: str | None = None
+    ) -> None:
+        values = {"status": status, "result": result, "error": error, "finished_at": func.now()}
+        if status == JobStatus.SUCCEEDED:
+            values["progress"] = 1.0
+        await self._update_own(job_id, worker_id, values)
+
+    async def retry(self, job_id: UUID, worker_id: str, error: str, delay_seconds: float) -> None:
+        values = {
+            "status": JobStatus.QUEUED,
+            "error": error,
+            "run_after": func.now() + timedelta(seconds=delay_seconds),
+            "worker_id": None,
+        }
+        await self._update_own(job_id, worker_id, values)
+
+    async def release(self, job_id: UUID, worker_id: str) -> None:
+        """Queues again a job its worker stopped running without finishing it, not counting the attempt."""
+        values = {"status": JobStatus.QUEUED, "attempts": JobModel.attempts - 1, "worker_id": None}
+        await self._update_own(job_id, worker_id, values)
+
+    async def queue_for_events(self, job_type: str, event_ids: List[UUID], max_attempts: int) -> int:
+        """
+        Queues a job of the type, without parameters, for each of the events that has none queued or
+        running. Returns the number of jobs queued.
+        """
+        if not event_ids:
+            return 0
+        # Taken by every worker queueing or claiming, so two of them can't queue the same job.
+        await self.session.execute(select(func.pg_advisory_xact_lock(CLAIM_LOCK_KEY)))
+        pending = select(JobModel.event_id).where(
+            JobModel.job_type == job_type,
+            JobModel.status.in_([JobStatus.QUEUED, JobStatus.RUNNING]),
+            JobModel.event_id.in_(event_ids),
+        )
+        busy = set((await self.session.scalars(pending)).all())
+        jobs = [
+            JobModel(event_id=event_id, job_type=job_type, parameters={}, max_attempts=max_attempts)
+            for event_id in event_ids
+            if event_id not in busy
+        ]
+        self.session.add_all(jobs)
+        await self.session.commit()
+        return len(jobs)
+
+    async def requeue_stale(self, lease_seconds: float) -> int:
+        """Retries, or fails when out of attempts, the running jobs whose worker stopped sending heartbeats."""
+        has_attempts = JobModel.attempts < JobModel.max_attempts
+        query = (
+            update(JobModel)
+            .where(
+                JobModel.status == JobStatus.RUNNING,
+                JobModel.heartbeat_at < func.now() - timedelta(seconds=lease_seconds),
+            )
+            .values(
+                status=case((has_attempts, JobStatus.QUEUED.value), else_=JobStatus.FAILED.value),
+                finished_at=case((has_attempts, None), else_=func.now()),
+                error="The worker running the job stopped",
+                worker_id=None,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        result = await self.session.execute(query)
+        await self.session.commit()
+        return result.rowcount
+
+    async def _update_running(self, job_id: UUID, worker_id: str, **values) -> bool:
+        query = (
+            update(JobModel)
+            .where(JobModel.id == job_id, JobModel.worker_id == worker_id, JobModel.status == JobStatus.RUNNING)
+            .values(**values)
+            .returning(JobModel.cancel_requested)
+            .execution_options(synchronize_session=False)
+        )
+        cancel_requested = (await self.session.execute(query)).scalar_one_or_none()
+        await self.session.commit()
+        # A job that is no longer ours (requeued as stale, or cancelled while queued) must stop too.
+        return cancel_requested is not False
+
+    async def _update_own(self, job_id: UUID, worker_id: str, values: dict) -> None:
+        query = (
+            update(JobModel)
+            .where(and_(JobModel.id == job_id, JobModel.worker_id == worker_id, JobModel.status == JobStatus.RUNNING))
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(query)
+        await self.session.commit()
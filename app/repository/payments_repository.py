@@ -102,20 +102,22 @@ class PaymentsRepository(Repository):
         )
         res = await self.session.execute(stmt)
         rows = res.scalars().all()
+        # The works of every payment in one query, instead of one query per payment.
+        work_ids = {work_id for row in rows for work_id in row.works or []}
+        works_by_id = {}
+        if work_ids:
+            works = await self._get_many_with_values([WorkModel.id.in_(work_ids)], WorkModel, 0, len(work_ids))
+            works_by_id = {str(work.id): work for work in works}
         payments = []
         for row in rows:
-            if row.works:
-                work_conditions = [WorkModel.id.in_(row.works)]
-                works = await self._get_many_with_values(work_conditions, WorkModel, 0, 100)
-            else:
-                works = []
+            works = [works_by_id[str(work_id)] for work_id in row.works or [] if str(work_id) in works_by_id]
             payments.append(
                 PaymentResponseSchema(
                     id=row.id,
                     event_id=row.event_id,
                     inscription_id=row.inscription_id,
                     status=row.status,
-                    works=[PaymentWorkSchema(id=work.id, title=work.title, track=work.track) for work in works or []],
+                    works=[PaymentWorkSchema(id=work.id, title=work.title, track=work.track) for work in works],
                     fare_name=row.fare_name,
                     creation_date=row.creation_date,
                     last_update=row.last_update,
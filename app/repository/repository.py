@@ -1,3 +1,4 @@
+from functools import lru_cache
 from typing import Any, Type, TypeVar
 
 from app.database.session_dep import SessionDep
@@ -6,6 +7,9 @@ from app.repository.crud_repository import Repository
 T = TypeVar("T", bound="Repository")
 
 
+# One provider per repository class, so FastAPI builds each repository once per request
+# however many dependencies ask for it (it caches dependencies by their callable).
+@lru_cache(maxsize=None)
 def get_repository(repository: Type[T]) -> Any:
     async def _get_repository(session: SessionDep) -> T:
         return repository(session)  # type: ignore
@@ -1,11 +1,15 @@
+from datetime import datetime
 from logging import getLogger
+from typing import Iterable, Mapping
 from uuid import UUID
 
-from sqlalchemy import and_, func, select, update
+from sqlalchemy import ARRAY, ColumnElement, Row, and_, any_, case, func, literal, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database.models.event import EventModel
 from app.database.models.review import ReviewModel
 from app.database.models.submission import SubmissionModel
+from app.database.models.user import UserModel
 from app.database.models.work import WorkModel
 from app.repository.crud_repository import Repository
 from app.schemas.users.user import PublicUserSchema
@@ -21,14 +25,12 @@ class ReviewsRepository(Repository):
 
     async def get_all_work_reviews_for_event(
         self, event_id: UUID, work_id: UUID, offset: int, limit: int
-    ) -> list[ReviewResponseSchema]:
+    ) -> list[dict]:
         return await self._get_work_reviews(
             [ReviewModel.event_id == event_id, ReviewModel.work_id == work_id], offset, limit
         )
 
-    async def get_shared_work_reviews(
-        self, event_id: UUID, work_id: UUID, offset: int, limit: int
-    ) -> list[ReviewResponseSchema]:
+    async def get_shared_work_reviews(self, event_id: UUID, work_id: UUID, offset: int, limit: int) -> list[dict]:
         return await self._get_work_reviews(
             [ReviewModel.event_id == event_id, ReviewModel.work_id == work_id, ReviewModel.shared.is_(True)],
             offset,
@@ -81,72 +83,132 @@ class ReviewsRepository(Repository):
         conditions = [ReviewModel.id == review_id]
         return await self._update_with_conditions(conditions, review_update)
 
-    async def publish_reviews(self, event_id: UUID, work_id: UUID, reviews_to_publish: ReviewPublishSchema) -> bool:
-        logger.info("Publishing reviews for work %s in event %s", work_id, event_id)
-        reviews_ids = reviews_to_publish.reviews_to_publish
-        if len(reviews_ids) == 0:
+    async def publish_reviews(self, event_id: UUID, publications: Mapping[UUID, ReviewPublishSchema]) -> bool:
+        """
+        Shares the reviews of each work with its authors, moves the work and the reviewed submissions
+        to its new state and gives the work the next number of the event, in three statements. Nothing
+        is published unless every review belongs to its work, and every work to the event.
+        """
+        logger.info("Publishing reviews for works %s in event %s", list(publications), event_id)
+        if not publications or any(not publication.reviews_to_publish for publication in publications.values()):
             logger.error("No reviews to publish provided")
             return False
-
-        work_num = await self.get_max_work_number_for_event(event_id)
-        logger.info(f"Publishing reviews with work number {work_num}")
-        update_work_query = (
-            update(WorkModel)
-            .where(and_(WorkModel.event_id == event_id, WorkModel.id == work_id))
-            .values(state=reviews_to_publish.new_work_status, work_number=work_num + 1)
+        work_of_review = {
+            review_id: work_id
+            for work_id, publication in publications.items()
+            for review_id in publication.reviews_to_publish
+        }
+
+        shared_query = (
+            update(ReviewModel)
+            .where(ReviewModel.event_id == event_id, _any(ReviewModel.id, work_of_review))
+            .values(shared=True)
+            .returning(ReviewModel.id, ReviewModel.work_id, ReviewModel.submission_id)
+            .execution_options(synchronize_session=False)
         )
-        if reviews_to_publish.resend_deadline is not None:
-            logger.info("Setting new resend deadline for work %s in event %s", work_id, event_id)
-            update_work_query.values(deadline_date=reviews_to_publish.resend_deadline)
-
-        for review_id in reviews_ids:
-            conditions = [ReviewModel.event_id == event_id, ReviewModel.work_id == work_id, ReviewModel.id == review_id]
-            review = await self._get_with_conditions(conditions)
-            if not review:
-                logger.error(
-                    "Couldnt obtain review %s to publish for work %s in event %s", review_id, work_id, event_id
-                )
-                return False
-
-            update_review_query = update(ReviewModel).where(ReviewModel.id == review.id).values(shared=True)
-            update_submission_query = (
-                update(SubmissionModel)
-                .where(SubmissionModel.id == review.submission_id)
-                .values(state=reviews_to_publish.new_work_status)
+        shared = (await self.session.execute(shared_query)).all()
+        if len(shared) != len(work_of_review) or any(work_of_review[row.id] != row.work_id for row in shared):
+            logger.error(
+                "Couldnt obtain every review to publish for works %s in event %s", list(publications), event_id
             )
-            await self.session.execute(update_review_query)
-            await self.session.execute(update_submission_query)
-        await self.session.execute(update_work_query)
+            await self.session.rollback()
+            return False
+
+        states = {work_id: publication.new_work_status.value for work_id, publication in publications.items()}
+        update_submissions_query = (
+            update(SubmissionModel)
+            .where(_any(SubmissionModel.id, {row.submission_id for row in shared}))
+            .values(state=case(states, value=SubmissionModel.work_id))
+            .execution_options(synchronize_session=False)
+        )
+        await self.session.execute(update_submissions_query)
+
+        published = await self.session.execute(self._number_works_query(event_id, publications, states))
+        if len(published.all()) != len(publications):
+            logger.error("Couldnt obtain every work to publish %s in event %s", list(publications), event_id)
+            await self.session.rollback()
+            return False
         await self.session.commit()
-        logger.info("Successfully published reviews for work %s in event %s", work_id, event_id)
+        logger.info("Successfully published reviews for works %s in event %s", list(publications), event_id)
         return True
 
-    async def _get_work_reviews(self, conditions, offset: int, limit: int) -> list[ReviewResponseSchema]:
-        res = await self._get_many_with_conditions(conditions, offset, limit)
-        return [
-            ReviewResponseSchema(
-                id=row.id,
-                event_id=row.event_id,
-                work_id=row.work_id,
-                submission_id=row.submission_id,
-                reviewer_id=row.reviewer_id,
-                status=row.status,
-                review=row.review,
-                shared=row.shared,
-                creation_date=row.creation_date,
-                last_update=row.last_update,
-                reviewer=PublicUserSchema(
-                    email=row.reviewer.email, name=row.reviewer.name, lastname=row.reviewer.lastname
-                ),
-            )
-            for row in res
-        ]
-
-    async def get_max_work_number_for_event(self, event_id: UUID) -> int:
+    @staticmethod
+    def _number_works_query(event_id: UUID, publications: Mapping[UUID, ReviewPublishSchema], states: dict):
         """
-        Return the highest work_number for a given event_id, or 0 if none exist.
-        Works correctly with an AsyncSession.
+        Updates the works with their new state and resend deadline, numbering them from the counter of
+        the event. The counter is incremented by a CTE of the same statement, so concurrent publications
+        can't draw the same numbers.
         """
-        stmt = select(func.coalesce(func.max(WorkModel.work_number), 0)).where(WorkModel.event_id == event_id)
+        work_ids = list(publications)
+        counter = (
+            update(EventModel)
+            .where(EventModel.id == event_id)
+            # The event itself doesn't change: last_update backs its HTTP cache validators.
+            .values(last_work_number=EventModel.last_work_number + len(work_ids), last_update=EventModel.last_update)
+            .returning(EventModel.last_work_number)
+            .cte("work_numbers")
+        )
+        first_number = select(counter.c.last_work_number - len(work_ids)).scalar_subquery()
+        values = {
+            "state": case(states, value=WorkModel.id),
+            "work_number": first_number
+            + case({work_id: n for n, work_id in enumerate(work_ids, 1)}, value=WorkModel.id),
+        }
+        # deadline_date is naive, in the local time it is compared with.
+        deadlines = {
+            work_id: _local(publication.resend_deadline)
+            for work_id, publication in publications.items()
+            if publication.resend_deadline is not None
+        }
+        if deadlines:
+            values["deadline_date"] = case(deadlines, value=WorkModel.id, else_=WorkModel.deadline_date)
+        return (
+            update(WorkModel)
+            .add_cte(counter)
+            .where(WorkModel.event_id == event_id, _any(WorkModel.id, work_ids))
+            .values(values)
+            .returning(WorkModel.id)
+            .execution_options(synchronize_session=False)
+        )
+
+    async def get_work_reviews_version(self, event_id: UUID, work_id: UUID, shared_only: bool) -> Row:
+        """(count, last_update, reviewers_last_update) of the reviews of a work, to validate cached lists."""
+        conditions = [ReviewModel.event_id == event_id, ReviewModel.work_id == work_id]
+        if shared_only:
+            conditions.append(ReviewModel.shared.is_(True))
+        stmt = (
+            select(
+                func.count(ReviewModel.id).label("count"),
+                func.max(ReviewModel.last_update).label("last_update"),
+                func.max(UserModel.last_update).label("reviewers_last_update"),
+            )
+            .outerjoin(UserModel, UserModel.id == ReviewModel.reviewer_id)
+            .where(and_(*conditions))
+        )
         result = await self.session.execute(stmt)
-        return result.scalar_one()
+        return result.one()
+
+    async def _get_work_reviews(self, conditions, offset: int, limit: int) -> list[dict]:
+        """Reviews as ReviewResponseSchema dicts, with their reviewer."""
+        query = (
+            select(
+                *self._columns_of(ReviewResponseSchema),
+                UserModel.email.label("reviewer__email"),
+                UserModel.name.label("reviewer__name"),
+                UserModel.lastname.label("reviewer__lastname"),
+            )
+            .join(UserModel, UserModel.id == ReviewModel.reviewer_id)
+            .where(and_(*conditions))
+            .offset(offset)
+            .limit(limit)
+        )
+        return await self._project(query)
+
+
+def _local(value: datetime) -> datetime:
+    return value.astimezone().replace(tzinfo=None) if value.tzinfo is not None else value
+
+
+def _any(column, values: Iterable) -> ColumnElement[bool]:
+    """`column = ANY(:values)`: one array parameter, instead of one parameter per value as with IN."""
+    return column == any_(literal(list(values), ARRAY(column.type)))
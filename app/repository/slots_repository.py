@@ -2,11 +2,12 @@ import logging
 from typing import Sequence
 from uuid import UUID
 
-from sqlalchemy import select  # <-- ADD THIS
+from sqlalchemy import Row, func, insert, select, update  # <-- ADD THIS
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload  # <-- ADD THIS
 
-from app.database.models import WorkSlotModel
+from app.database.models import WorkModel, WorkSlotModel
 from app.database.models.event_room_slot import EventRoomSlotModel
 from app.repository.crud_repository import Repository
 
@@ -66,8 +67,103 @@ class SlotsRepository(Repository):
         result = await self.session.scalars(stmt)
         return result.unique().all()
 
-    async def get_slots_by_event_id_with_works(self, event_id: UUID) -> Sequence[EventRoomSlotModel]:
-        logger.info(f"Fetching slots and associated work links for event {event_id}")
-        conditions = [EventRoomSlotModel.event_id == event_id, EventRoomSlotModel.slot_type == "slot"]
-        load_options = selectinload(EventRoomSlotModel.work_links).selectinload(WorkSlotModel.work)
-        return await self._get_many_with_conditions(conditions, offset=0, limit=1000, options=[load_options])
+    async def get_solver_slots(self, event_id: UUID) -> Sequence[Row]:
+        """
+        Fetches the assignable slots of an event with only the columns the scheduler needs:
+        (id, room_name, start, end, work_ids), where work_ids lists the works already linked
+        to the slot in the order they were assigned.
+        """
+        logger.info(f"Fetching solver projection of slots for event {event_id}")
+        work_ids = func.array_remove(
+            func.array_agg(aggregate_order_by(WorkSlotModel.work_id, WorkSlotModel.creation_date)), None
+        )
+        stmt = (
+            select(
+                EventRoomSlotModel.id,
+                EventRoomSlotModel.room_name,
+                EventRoomSlotModel.start,
+                EventRoomSlotModel.end,
+                work_ids.label("work_ids"),
+            )
+            .outerjoin(WorkSlotModel, WorkSlotModel.slot_id == EventRoomSlotModel.id)
+            .where(EventRoomSlotModel.event_id == event_id, EventRoomSlotModel.slot_type == "slot")
+            .group_by(EventRoomSlotModel.id)
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def get_grid_slots(self, event_id: UUID) -> Sequence[Row]:
+        """Fetches the columns that define the slot grid of an event: (id, room_name, slot_type, start, end, title)."""
+        stmt = (
+            select(
+                EventRoomSlotModel.id,
+                EventRoomSlotModel.room_name,
+                EventRoomSlotModel.slot_type,
+                EventRoomSlotModel.start,
+                EventRoomSlotModel.end,
+                EventRoomSlotModel.title,
+            )
+            .where(EventRoomSlotModel.event_id == event_id)
+            .order_by(EventRoomSlotModel.id)
+        )
+        result = await self.session.execute(stmt)
+        return result.all()
+
+    async def apply_grid_changes(
+        self,
+        new_slots: Sequence[dict],
+        updated_slots: Sequence[dict],
+        deleted_ids: Sequence[int],
+        unlinked_ids: Sequence[int],
+    ) -> None:
+        """
+        Applies a slot grid delta: inserts `new_slots`, updates `updated_slots` by their "id",
+        deletes `deleted_ids` with their work links, and drops the work links of `unlinked_ids`.
+
+        Like bulk_create it only flushes, so the caller commits the whole delta at once.
+        """
+        logger.info(
+            f"Applying slot grid changes: {len(new_slots)} new, {len(updated_slots)} updated, "
+            f"{len(deleted_ids)} deleted, {len(unlinked_ids)} unlinked"
+        )
+        link_slot_ids = list(deleted_ids) + list(unlinked_ids)
+        if link_slot_ids:
+            await self.session.execute(WorkSlotModel.__table__.delete().where(WorkSlotModel.slot_id.in_(link_slot_ids)))
+        if deleted_ids:
+            await self.session.execute(
+                EventRoomSlotModel.__table__.delete().where(EventRoomSlotModel.id.in_(deleted_ids))
+            )
+        if updated_slots:
+            await self.session.execute(update(EventRoomSlotModel), list(updated_slots))
+        if new_slots:
+            await self.session.execute(insert(EventRoomSlotModel), list(new_slots))
+        await self.session.flush()
+
+    async def get_agenda_rows(self, event_id: UUID, slot_ids: Sequence[int] | None = None) -> Sequence[Row]:
+        """
+        Flat projection of the agenda of an event: one row per (slot, linked work), with
+        NULL work columns for empty slots. Works come in the order they were assigned.
+        Restricted to `slot_ids` when given.
+        """
+        stmt = (
+            select(
+                EventRoomSlotModel.id,
+                EventRoomSlotModel.room_name,
+                EventRoomSlotModel.slot_type,
+                EventRoomSlotModel.start,
+                EventRoomSlotModel.end,
+                EventRoomSlotModel.title,
+                WorkModel.id.label("work_id"),
+                WorkModel.title.label("work_title"),
+                WorkModel.track.label("work_track"),
+                WorkModel.work_number.label("work_number"),
+            )
+            .outerjoin(WorkSlotModel, WorkSlotModel.slot_id == EventRoomSlotModel.id)
+            .outerjoin(WorkModel, WorkModel.id == WorkSlotModel.work_id)
+            .where(EventRoomSlotModel.event_id == event_id)
+            .order_by(EventRoomSlotModel.id, WorkSlotModel.creation_date)
+        )
+        if slot_ids is not None:
+            stmt = stmt.where(EventRoomSlotModel.id.in_(slot_ids))
+        result = await self.session.execute(stmt)
+        return result.all()
@@ -1,7 +1,8 @@
 import logging
+from typing import Sequence, Tuple
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.database.models import EventRoomSlotModel
@@ -73,6 +74,22 @@ class WorkSlotRepository(Repository):
 
         logger.info(f"Successfully added {len(work_slot_links)} work-slot links.")
 
+    async def save_event_assignments(self, event_id: UUID, links: Sequence[Tuple[UUID, int]], replace: bool) -> None:
+        """
+        Inserts (work_id, slot_id) links in bulk, optionally deleting every existing link
+        of the event first, in a single transaction.
+        """
+        logger.info(f"Saving {len(links)} work-slot links for event {event_id} (replace={replace})")
+
+        if replace:
+            subquery = select(EventRoomSlotModel.id).where(EventRoomSlotModel.event_id == event_id).scalar_subquery()
+            await self.session.execute(WorkSlotModel.__table__.delete().where(WorkSlotModel.slot_id.in_(subquery)))
+        if links:
+            await self.session.execute(
+                insert(WorkSlotModel), [{"work_id": work_id, "slot_id": slot_id} for work_id, slot_id in links]
+            )
+        await self.session.commit()
+
     async def delete_assigned_works_by_event_id(self, event_id: UUID) -> None:
         """
         Deletes all work-slot links for slots associated with a given event.
@@ -1,11 +1,11 @@
 from datetime import datetime
 from uuid import UUID
 
-from sqlalchemy import select
+from sqlalchemy import Row, select, true
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.database.models import WorkSlotModel
+from app.database.models.event_room_slot import EventRoomSlotModel
 from app.database.models.work import WorkModel, WorkStates
 from app.repository.crud_repository import Repository
 from app.schemas.users.utils import UID
@@ -15,6 +15,7 @@ from app.schemas.works.work import (
     WorkStateSchema,
     WorkUpdateAdministrationSchema,
     WorkUpdateSchema,
+    WorkWithSchedule,
 )
 
 
@@ -27,33 +28,41 @@ class WorksRepository(Repository):
         work = await self._get_with_conditions(conditions)
         return work
 
+    async def get_work_last_update(self, event_id: UUID, work_id: UUID):
+        conditions = [WorkModel.event_id == event_id, WorkModel.id == work_id]
+        return await self._get_with_values(conditions, WorkModel.last_update)
+
     async def get_all_works_with_talk_not_null(self, event_id: UUID, offset: int, limit: int) -> list[WorkModel]:
         conditions = [WorkModel.event_id == event_id, WorkModel.talk.is_not(None)]
         return await self._get_many_with_conditions(conditions, offset, limit)
 
-    async def get_all_works_for_event(self, event_id: UUID, offset: int, limit: int) -> list[WorkModel]:
-        # Custom query with Eager Loading to avoid MissingGreenlet error
-        stmt = (
-            select(WorkModel)
-            .where(WorkModel.event_id == event_id)
-            .options(selectinload(WorkModel.slot_links).selectinload(WorkSlotModel.slot))
-            .offset(offset)
-            .limit(limit)
+    async def get_works_with_schedule(self, event_id: UUID, track: str | None, offset: int, limit: int) -> list[dict]:
+        """Works of the event (optionally of a track) as WorkWithSchedule dicts, with the slot they are in."""
+        schedule = (
+            select(
+                EventRoomSlotModel.room_name.label("room_name"),
+                EventRoomSlotModel.start.label("start_date"),
+                EventRoomSlotModel.end.label("end_date"),
+            )
+            .join(WorkSlotModel, WorkSlotModel.slot_id == EventRoomSlotModel.id)
+            .where(WorkSlotModel.work_id == WorkModel.id)
+            .order_by(EventRoomSlotModel.start)
+            .limit(1)
+            .lateral("schedule")
         )
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
-
-    async def get_works_by_track(self, event_id: UUID, track: str, offset: int, limit: int) -> list[WorkModel]:
-        # Custom query with Eager Loading
-        stmt = (
-            select(WorkModel)
-            .where(WorkModel.event_id == event_id, WorkModel.track == track)
-            .options(selectinload(WorkModel.slot_links).selectinload(WorkSlotModel.slot))
+        conditions = [WorkModel.event_id == event_id]
+        if track:
+            conditions.append(WorkModel.track == track)
+        query = (
+            select(
+                *self._columns_of(WorkWithSchedule), schedule.c.room_name, schedule.c.start_date, schedule.c.end_date
+            )
+            .outerjoin(schedule, true())
+            .where(*conditions)
             .offset(offset)
             .limit(limit)
         )
-        result = await self.session.execute(stmt)
-        return list(result.scalars().all())
+        return await self._project(query)
 
     async def get_all_works_for_user_in_event(
         self, event_id: UUID, user_id: UID, offset: int, limit: int
@@ -91,9 +100,15 @@ class WorksRepository(Repository):
         conditions = [WorkModel.event_id == event_id, WorkModel.id == work_id]
         return await self._update_with_conditions(conditions, status)
 
-    async def get_all_approved_works_for_event(self, event_id: UUID, offset: int, limit: int) -> list[WorkModel]:
-        conditions = [WorkModel.event_id == event_id, WorkModel.state == WorkStates.APPROVED]
-        return await self._get_many_with_conditions(conditions, offset, limit)
+    async def get_approved_works_for_scheduling(self, event_id: UUID) -> list[Row]:
+        """
+        Fetches (id, track, authors) of every approved work of the event, the only columns the scheduler needs.
+        """
+        stmt = select(WorkModel.id, WorkModel.track, WorkModel.authors).where(
+            WorkModel.event_id == event_id, WorkModel.state == WorkStates.APPROVED
+        )
+        result = await self.session.execute(stmt)
+        return list(result.all())
 
     async def get_unassigned_works(self, event_id: UUID, offset: int, limit: int) -> list[WorkModel]:
         conditions = [
@@ -0,0 +1,24 @@
+from datetime import date
+
+from fastapi import APIRouter, Header, Response
+
+from app.schemas.events.agenda import AgendaSchema
+from app.services.agenda.agenda_service_dep import AgendaServiceDep
+from app.utils.http_cache import PUBLIC_CACHE_CONTROL, etag_matches, not_modified
+
+events_agenda_router = APIRouter(prefix="/{event_id}/agenda", tags=["Events: Agenda"])
+
+
+@events_agenda_router.get("", responses={200: {"model": AgendaSchema}, 304: {"description": "Not Modified"}})
+async def read_event_agenda(
+    agenda_service: AgendaServiceDep,
+    day: date | None = None,
+    room: str | None = None,
+    track: str | None = None,
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    agenda = await agenda_service.get_agenda(day, room, track)
+    headers = {"ETag": agenda.etag, "Cache-Control": PUBLIC_CACHE_CONTROL}
+    if etag_matches(if_none_match, agenda.etag):
+        return not_modified(headers)
+    return Response(content=agenda.body, media_type="application/json", headers=headers)
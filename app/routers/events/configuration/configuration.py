@@ -1,5 +1,4 @@
 import logging
-import time
 from typing import List
 from uuid import UUID
 
@@ -12,12 +11,14 @@ from app.routers.events.configuration.dates import dates_configuration_router
 from app.routers.events.configuration.general import general_configuration_router
 from app.routers.events.configuration.pricing import pricing_configuration_router
 from app.routers.events.configuration.review_skeleton import review_skeleton_configuration_router
-from app.schemas.events.assing_works_parameters import AssignWorksParametersSchema
+from app.schemas.events.assignment_preview import AssignmentPreviewSchema, AssignmentResultSchema
+from app.schemas.events.assing_works_parameters import AssignWorksParametersSchema, RepairWorksParametersSchema
 from app.schemas.events.configuration import EventConfigurationSchema
 from app.schemas.events.slot import SlotSchema
 from app.schemas.events.slot_with_works import SlotWithWorksSchema
 from app.services.events.events_configuration_service_dep import EventsConfigurationServiceDep
 from app.services.slots.slots_configuration_service_dep import SlotsConfigurationServiceDep
+from app.utils.http_cache import PRIVATE_CACHE_CONTROL, ConditionalGetDep
 
 events_configuration_router = APIRouter(prefix="/{event_id}/configuration", tags=["Events: Configuration"])
 
@@ -31,8 +32,13 @@ logger = logging.getLogger(__name__)
 @events_configuration_router.get("", dependencies=[or_(IsOrganizerDep, IsAdminUsrDep)])
 async def get_event_configuration(
     events_configuration_service: EventsConfigurationServiceDep,
+    conditional: ConditionalGetDep,
 ) -> EventConfigurationSchema:
     logger.info(f"Fetching configuration for event {events_configuration_service.event_id}")
+    version = await events_configuration_service.get_configuration_version()
+    response = conditional.not_modified(version, PRIVATE_CACHE_CONTROL)
+    if response is not None:
+        return response
     event = await events_configuration_service.get_configuration()
     return event
 
@@ -43,7 +49,6 @@ async def create_event_slots(
 ) -> None:
     logger.info(f"Starting slot and room configuration for event {slots_configuration_service.event_id}")
     await slots_configuration_service.configure_event_slots_and_rooms()
-    time.sleep(2)
     return
 
 
@@ -108,6 +113,44 @@ async def assign_works_to_slots(
     return
 
 
+@events_configuration_router.post(
+    path="/slots/assign/preview", status_code=200, dependencies=[or_(IsOrganizerDep, IsAdminUsrDep)]
+)
+async def preview_works_assignment(
+    parameters: AssignWorksParametersSchema,
+    slots_configuration_service: SlotsConfigurationServiceDep,
+) -> AssignmentPreviewSchema | None:
+    logger.info(
+        f"Previewing work assignment for event {slots_configuration_service.event_id} with parameters: {parameters}"
+    )
+    return await slots_configuration_service.preview_assignment(parameters)
+
+
+@events_configuration_router.post(
+    path="/slots/assign/{solution_id}/commit", status_code=200, dependencies=[or_(IsOrganizerDep, IsAdminUsrDep)]
+)
+async def commit_works_assignment(
+    solution_id: UUID,
+    slots_configuration_service: SlotsConfigurationServiceDep,
+) -> AssignmentResultSchema:
+    logger.info(f"Committing assignment {solution_id} for event {slots_configuration_service.event_id}")
+    return await slots_configuration_service.commit_solution(solution_id)
+
+
+@events_configuration_router.post(
+    path="/slots/repair", status_code=200, dependencies=[or_(IsOrganizerDep, IsAdminUsrDep)]
+)
+async def repair_work_assignments(
+    parameters: RepairWorksParametersSchema,
+    slots_configuration_service: SlotsConfigurationServiceDep,
+) -> None:
+    logger.info(
+        f"Repairing work assignments for event {slots_configuration_service.event_id} with parameters: {parameters}"
+    )
+    await slots_configuration_service.repair_assignments(parameters)
+    return
+
+
 @events_configuration_router.get(path="/slots/works", status_code=200)
 async def get_slots_with_works(
     slots_configuration_service: SlotsConfigurationServiceDep,
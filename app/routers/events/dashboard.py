@@ -0,0 +1,15 @@
+from fastapi import APIRouter
+
+from app.authorization.admin_user_dep import IsAdminUsrDep
+from app.authorization.chair_dep import IsChairDep
+from app.authorization.organizer_dep import IsOrganizerDep
+from app.authorization.util_dep import or_
+from app.schemas.events.dashboard import EventDashboardSchema
+from app.services.event_stats.event_stats_service_dep import EventStatsServiceDep
+
+events_dashboard_router = APIRouter(prefix="/{event_id}/dashboard", tags=["Events: Dashboard"])
+
+
+@events_dashboard_router.get("", dependencies=[or_(IsOrganizerDep, IsChairDep, IsAdminUsrDep)])
+async def read_event_dashboard(event_stats_service: EventStatsServiceDep) -> EventDashboardSchema:
+    return await event_stats_service.get_dashboard()
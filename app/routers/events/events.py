@@ -7,8 +7,11 @@ from app.authorization.caller_id_dep import CallerIdDep
 from app.authorization.user_id_dep import UserDep, verify_user_exists
 from app.database.models.event import EventStatus
 from app.routers.events.administration import events_admin_router
+from app.routers.events.agenda import events_agenda_router
 from app.routers.events.configuration.configuration import events_configuration_router
+from app.routers.events.dashboard import events_dashboard_router
 from app.routers.events.inscriptions.inscriptions import inscriptions_events_router
+from app.routers.events.jobs import events_jobs_router
 from app.routers.events.media import events_media_router
 from app.routers.events.members.chairs import event_chairs_router
 from app.routers.events.members.members import event_members_router
@@ -23,11 +26,15 @@ from app.schemas.events.create_event import CreateEventSchema
 from app.schemas.events.public_event import PublicEventWithCreatorSchema
 from app.schemas.events.public_event_with_roles import PublicEventWithRolesSchema
 from app.services.events.events_service_dep import EventsServiceDep
+from app.utils.http_cache import PRIVATE_CACHE_CONTROL, ConditionalGetDep
 
 events_router = APIRouter(prefix="/events")
 events_router.include_router(events_media_router)
 events_router.include_router(events_configuration_router)
+events_router.include_router(events_agenda_router)
 events_router.include_router(events_admin_router)
+events_router.include_router(events_jobs_router)
+events_router.include_router(events_dashboard_router)
 events_router.include_router(event_members_router)
 events_router.include_router(event_organizers_router)
 events_router.include_router(event_chairs_router)
@@ -73,5 +80,13 @@ async def create_event(
 
 
 @events_router.get("/{event_id}/public", response_model=PublicEventWithRolesSchema, tags=["Events: General"])
-async def read_event_general(events_service: EventsServiceDep, caller_id: CallerIdDep, event_id: UUID):
-    return await events_service.get_public_event(caller_id, event_id)
+async def read_event_general(
+    events_service: EventsServiceDep, caller_id: CallerIdDep, event_id: UUID, conditional: ConditionalGetDep
+):
+    # The roles are part of the version, and of the event sent when it changed.
+    roles = await events_service.get_caller_roles(caller_id, event_id)
+    version = await events_service.get_public_event_version(event_id, roles)
+    response = conditional.not_modified(version, PRIVATE_CACHE_CONTROL)
+    if response is not None:
+        return response
+    return await events_service.get_public_event(event_id, roles)
@@ -0,0 +1,40 @@
+from typing import List
+from uuid import UUID
+
+from fastapi import APIRouter, Query
+
+from app.authorization.admin_user_dep import IsAdminUsrDep
+from app.authorization.organizer_dep import IsOrganizerDep
+from app.authorization.util_dep import or_
+from app.database.models.job import JobStatus
+from app.schemas.jobs.job import JobSchema, JobSubmitSchema
+from app.services.jobs.jobs_service_dep import JobsServiceDep
+
+events_jobs_router = APIRouter(
+    prefix="/{event_id}/jobs", tags=["Events: Jobs"], dependencies=[or_(IsOrganizerDep, IsAdminUsrDep)]
+)
+
+
+@events_jobs_router.post("", status_code=202)
+async def submit_job(submission: JobSubmitSchema, jobs_service: JobsServiceDep) -> JobSchema:
+    return await jobs_service.submit(submission)
+
+
+@events_jobs_router.get("")
+async def read_jobs(
+    jobs_service: JobsServiceDep,
+    status: JobStatus | None = None,
+    offset: int = 0,
+    limit: int = Query(default=50, le=100),
+) -> List[JobSchema]:
+    return await jobs_service.get_jobs(status, offset, limit)
+
+
+@events_jobs_router.get("/{job_id}")
+async def read_job(job_id: UUID, jobs_service: JobsServiceDep) -> JobSchema:
+    return await jobs_service.get_job(job_id)
+
+
+@events_jobs_router.post("/{job_id}/cancel", status_code=202)
+async def cancel_job(job_id: UUID, jobs_service: JobsServiceDep) -> JobSchema:
+    return await jobs_service.cancel(job_id)
@@ -16,9 +16,9 @@ from app.schemas.provider.provider import ProviderAccountResponseSchema
 from app.services.event_payments.event_payments_service_dep import EventPaymentsServiceWebhookDep
 from app.services.provider.provider_service import ProviderService
 from app.services.provider.provider_service_dep import ProviderServiceDep
-from app.settings.settings import MercadoPagoSettings
+from app.settings.settings import MercadoPagoSettings, get_settings
 
-settings = MercadoPagoSettings()
+settings = get_settings(MercadoPagoSettings)
 provider_router = APIRouter(prefix="/provider")
 provider_global_router = APIRouter(prefix="/provider")
 logger = logging.getLogger(__name__)
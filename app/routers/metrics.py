@@ -0,0 +1,10 @@
+from fastapi import APIRouter, Response
+
+from app.utils.metrics import CONTENT_TYPE, REGISTRY
+
+metrics_router = APIRouter()
+
+
+@metrics_router.get(path="/metrics", include_in_schema=False)
+async def read_metrics() -> Response:
+    return Response(content=REGISTRY.render(), media_type=CONTENT_TYPE)
@@ -15,6 +15,7 @@ from app.schemas.works.review import (
     ReviewUploadSchema,
 )
 from app.services.event_reviews.event_reviews_service_dep import EventReviewsServiceDep
+from app.utils.http_cache import PRIVATE_CACHE_CONTROL, ConditionalGetDep
 
 event_reviews_router = APIRouter(prefix="/{event_id}/works/{work_id}/reviews", tags=["Event: Works Reviews"])
 
@@ -26,8 +27,15 @@ event_reviews_router = APIRouter(prefix="/{event_id}/works/{work_id}/reviews", t
     dependencies=[or_(IsOrganizerDep, IsAdminUsrDep, IsWorkChairDep)],
 )
 async def get_all_reviews(
-    reviews_service: EventReviewsServiceDep, offset: int = 0, limit: int = Query(default=100, le=100)
+    reviews_service: EventReviewsServiceDep,
+    conditional: ConditionalGetDep,
+    offset: int = 0,
+    limit: int = Query(default=100, le=100),
 ) -> list[ReviewResponseSchema]:
+    version = await reviews_service.get_reviews_version(shared_only=False)
+    response = conditional.not_modified(version, PRIVATE_CACHE_CONTROL)
+    if response is not None:
+        return response
     return await reviews_service.get_all_reviews(offset, limit)
 
 
@@ -38,8 +46,15 @@ async def get_all_reviews(
     dependencies=[Depends(verify_is_author)],
 )
 async def get_my_work_reviews(
-    reviews_service: EventReviewsServiceDep, offset: int = 0, limit: int = Query(default=100, le=100)
+    reviews_service: EventReviewsServiceDep,
+    conditional: ConditionalGetDep,
+    offset: int = 0,
+    limit: int = Query(default=100, le=100),
 ) -> list[ReviewResponseSchema]:
+    version = await reviews_service.get_reviews_version(shared_only=True)
+    response = conditional.not_modified(version, PRIVATE_CACHE_CONTROL)
+    if response is not None:
+        return response
     return await reviews_service.get_my_work_reviews(offset, limit)
 
 
@@ -19,6 +19,7 @@ from app.schemas.works.work import (
     WorkWithState,
 )
 from app.services.works.works_service_dep import WorksServiceDep
+from app.utils.http_cache import PRIVATE_CACHE_CONTROL, ConditionalGetDep
 
 works_router = APIRouter(prefix="/{event_id}/works", tags=["Events: Works"])
 
@@ -69,7 +70,11 @@ async def read_my_works(
     response_model=WorkWithState,
     dependencies=[or_(IsOrganizerDep, IsAuthorDep, IsWorkChairDep, IsWorkReviewerDep)],
 )
-async def get_work(work_id: UUID, work_service: WorksServiceDep) -> WorkWithState:
+async def get_work(work_id: UUID, work_service: WorksServiceDep, conditional: ConditionalGetDep) -> WorkWithState:
+    version = await work_service.get_work_version(work_id)
+    response = conditional.not_modified(version, PRIVATE_CACHE_CONTROL)
+    if response is not None:
+        return response
     return await work_service.get_work(work_id)
 
 
@@ -0,0 +1,27 @@
+from datetime import datetime
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel
+
+
+class AgendaWorkSchema(BaseModel):
+    id: UUID
+    title: str
+    track: str
+    work_number: int | None = None
+
+
+class AgendaSlotSchema(BaseModel):
+    id: int
+    room_name: str
+    slot_type: str
+    title: str | None = None
+    start: datetime
+    end: datetime
+    works: List[AgendaWorkSchema] = []
+
+
+class AgendaSchema(BaseModel):
+    event_id: UUID
+    slots: List[AgendaSlotSchema]
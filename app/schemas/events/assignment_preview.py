@@ -0,0 +1,41 @@
+from typing import List
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict
+
+
+class CostBreakdownSchema(BaseModel):
+    distinct_days: int
+    distinct_days_cost: float
+    room_track_mixes: int
+    room_track_mixes_cost: float
+    unassigned_works: int
+    unassigned_works_cost: float
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ProposedAssignmentSchema(BaseModel):
+    work_id: UUID
+    slot_id: int
+
+
+class AssignmentResultSchema(BaseModel):
+    solution_id: UUID
+    assignments_created: int
+    unassigned_works: int
+    final_cost: float
+    is_optimal: bool
+    cost_breakdown: CostBreakdownSchema
+    search_stats: dict
+
+
+class AssignmentPreviewSchema(BaseModel):
+    """A solved assignment that was not written. Commit it by its `solution_id`."""
+
+    solution_id: UUID
+    data_version: str
+    replaces_assignments: bool
+    final_cost: float
+    is_optimal: bool
+    cost_breakdown: CostBreakdownSchema
+    assignments: List[ProposedAssignmentSchema]
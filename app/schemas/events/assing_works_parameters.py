@@ -1,4 +1,11 @@
-from pydantic import BaseModel
+from enum import Enum
+
+from pydantic import BaseModel, Field
+
+
+class PlacementStrategy(str, Enum):
+    GREEDY = "GREEDY"
+    MIN_COST_FLOW = "MIN_COST_FLOW"
 
 
 class AssignWorksParametersWeights(BaseModel):
@@ -14,14 +21,30 @@ class AssignWorksParametersWeights(BaseModel):
         from_attributes = True
 
 
-class AssignWorksParametersSchema(BaseModel):
+class RepairWorksParametersSchema(BaseModel):
     """
-    Schema for parameters to assign works to slots in an event.
+    Schema for parameters to place the still unassigned works of an event,
+    keeping the existing assignments fixed.
     """
 
     time_per_work: int
-    reset_previous_assignments: bool
     weights: AssignWorksParametersWeights
+    workers: int = Field(default=1, ge=1, description="Worker processes used by the branch and bound search")
+    placement: PlacementStrategy = Field(
+        default=PlacementStrategy.GREEDY, description="How works are placed into the slots of the chosen track plan"
+    )
+
+    class Config:
+        # Allows creating the schema from ORM models or dicts
+        from_attributes = True
+
+
+class AssignWorksParametersSchema(RepairWorksParametersSchema):
+    """
+    Schema for parameters to assign works to slots in an event.
+    """
+
+    reset_previous_assignments: bool
 
     class Config:
         # Allows creating the schema from ORM models or dicts
@@ -0,0 +1,46 @@
+from typing import Dict
+from uuid import UUID
+
+from pydantic import BaseModel, Field
+
+
+class CompactEventStatsParametersSchema(BaseModel):
+    pass
+
+
+class InscriptionsStatsSchema(BaseModel):
+    total: int = 0
+    by_status: Dict[str, int] = {}
+    by_role: Dict[str, int] = {}
+
+
+class PaymentsStatusStatsSchema(BaseModel):
+    count: int = 0
+    # Sum of the amounts by currency; amounts without a currency are under "".
+    amounts: Dict[str, float] = {}
+
+
+class PaymentsStatsSchema(BaseModel):
+    total: int = 0
+    by_status: Dict[str, PaymentsStatusStatsSchema] = {}
+
+
+class WorksStatsSchema(BaseModel):
+    total: int = 0
+    by_state: Dict[str, int] = {}
+    by_track: Dict[str, int] = {}
+
+
+class TrackReviewsStatsSchema(BaseModel):
+    # Reviewers assigned to the works of the track, reviews they sent, and reviews shared with the authors.
+    reviewers: int = 0
+    reviews: int = 0
+    shared_reviews: int = 0
+
+
+class EventDashboardSchema(BaseModel):
+    event_id: UUID
+    inscriptions: InscriptionsStatsSchema = Field(default_factory=InscriptionsStatsSchema)
+    payments: PaymentsStatsSchema = Field(default_factory=PaymentsStatsSchema)
+    works: WorksStatsSchema = Field(default_factory=WorksStatsSchema)
+    reviews_by_track: Dict[str, TrackReviewsStatsSchema] = {}
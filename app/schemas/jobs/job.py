@@ -0,0 +1,31 @@
+from datetime import datetime
+from typing import Any, Dict
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.database.models.job import JobStatus
+
+
+class JobSubmitSchema(BaseModel):
+    job_type: str = Field(examples=["slots_assign"])
+    parameters: Dict[str, Any] = {}
+
+
+class JobSchema(BaseModel):
+    id: UUID
+    event_id: UUID
+    job_type: str
+    status: JobStatus
+    parameters: Dict[str, Any]
+    result: Dict[str, Any] | None = None
+    error: str | None = None
+    progress: float
+    progress_message: str | None = None
+    cancel_requested: bool
+    attempts: int
+    max_attempts: int
+    creation_date: datetime
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    model_config = ConfigDict(from_attributes=True)
@@ -0,0 +1,168 @@
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+from uuid import UUID
+
+from sqlalchemy import Row
+
+from app.cache.cache import Cache, namespace_cache
+from app.schemas.events.agenda import AgendaSchema, AgendaSlotSchema, AgendaWorkSchema
+
+DEFAULT_MAX_AGENDAS = 512
+DEFAULT_MAX_RENDERED_VIEWS = 64
+
+AgendaFilters = Tuple[date | None, str | None, str | None]
+
+
+@dataclass(slots=True)
+class RenderedAgenda:
+    etag: str
+    body: bytes
+
+
+@dataclass
+class AgendaDocument:
+    """The agenda of one event, kept in memory and patched slot by slot."""
+
+    event_id: UUID
+    slots: Dict[int, AgendaSlotSchema] = field(default_factory=dict)
+    slot_ids_by_work: Dict[UUID, Set[int]] = field(default_factory=dict)
+    dirty_slot_ids: Set[int] = field(default_factory=set)
+    rendered: OrderedDict[AgendaFilters, RenderedAgenda] = field(default_factory=OrderedDict)
+    # The shared version of the agenda the document is up to date with, None when it couldn't be read.
+    version: int | None = None
+
+    def replace_slots(self, slot_ids: Iterable[int], rows: Sequence[Row]) -> None:
+        """Replaces the given slots with their fresh rows. Slots without rows were deleted."""
+        for slot_id in slot_ids:
+            removed = self.slots.pop(slot_id, None)
+            for work in removed.works if removed else []:
+                self._unlink(work.id, slot_id)
+        for row in rows:
+            slot = self.slots.get(row.id)
+            if slot is None:
+                slot = AgendaSlotSchema(
+                    id=row.id,
+                    room_name=row.room_name,
+                    slot_type=row.slot_type,
+                    title=row.title,
+                    start=row.start,
+                    end=row.end,
+                )
+                self.slots[row.id] = slot
+            if row.work_id is not None:
+                slot.works.append(
+                    AgendaWorkSchema(
+                        id=row.work_id, title=row.work_title, track=row.work_track, work_number=row.work_number
+                    )
+                )
+                self.slot_ids_by_work.setdefault(row.work_id, set()).add(row.id)
+        self.rendered.clear()
+
+    def render(self, filters: AgendaFilters) -> RenderedAgenda:
+        rendered = self.rendered.get(filters)
+        if rendered is not None:
+            self.rendered.move_to_end(filters)
+            return rendered
+
+        body = AgendaSchema(event_id=self.event_id, slots=self._filter(*filters)).model_dump_json().encode()
+        rendered = RenderedAgenda(etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"', body=body)
+        self.rendered[filters] = rendered
+        if len(self.rendered) > DEFAULT_MAX_RENDERED_VIEWS:
+            self.rendered.popitem(last=False)
+        return rendered
+
+    def _filter(self, day: date | None, room: str | None, track: str | None) -> List[AgendaSlotSchema]:
+        slots = []
+        for slot in sorted(self.slots.values(), key=lambda s: (s.start, s.room_name, s.id)):
+            if day is not None and slot.start.date() != day:
+                continue
+            if room is not None and slot.room_name != room:
+                continue
+            if track is not None:
+                works = [work for work in slot.works if work.track == track]
+                if not works:
+                    continue
+                slot = slot.model_copy(update={"works": works})
+            slots.append(slot)
+        return slots
+
+    def _unlink(self, work_id: UUID, slot_id: int) -> None:
+        slot_ids = self.slot_ids_by_work.get(work_id)
+        if slot_ids is not None:
+            slot_ids.discard(slot_id)
+            if not slot_ids:
+                del self.slot_ids_by_work[work_id]
+
+
+class AgendaReadModel:
+    """
+    Agenda documents of this worker, checked against a version of every agenda kept in the
+    shared cache. Every write bumps the version. The worker that wrote patches its document
+    slot by slot on the next read; the others see a version they haven't seen and rebuild.
+    """
+
+    def __init__(self, versions: Cache, max_events: int = DEFAULT_MAX_AGENDAS):
+        self.versions = versions
+        self.max_events = max_events
+        self._documents: OrderedDict[UUID, AgendaDocument] = OrderedDict()
+
+    async def get(self, event_id: UUID) -> AgendaDocument | None:
+        """The document of the event, as long as no other worker changed the agenda since it was read."""
+        document = self._documents.get(event_id)
+        if document is None:
+            return None
+        if document.version is None or document.version != await self.versions.counter(str(event_id)):
+            del self._documents[event_id]
+            return None
+        self._documents.move_to_end(event_id)
+        return document
+
+    async def version(self, event_id: UUID) -> int | None:
+        """Read before loading a document, so a write that races with the load makes it stale."""
+        return await self.versions.counter(str(event_id))
+
+    def store(self, document: AgendaDocument, version: int | None) -> None:
+        document.version = version
+        self._documents[document.event_id] = document
+        self._documents.move_to_end(document.event_id)
+        while len(self._documents) > self.max_events:
+            self._documents.popitem(last=False)
+
+    async def invalidate(self, event_id: UUID) -> None:
+        self._documents.pop(event_id, None)
+        await self.versions.incr(str(event_id))
+
+    async def mark_slots_dirty(self, event_id: UUID, slot_ids: Iterable[int]) -> None:
+        document = await self._bump(event_id)
+        if document is not None:
+            document.dirty_slot_ids.update(slot_ids)
+
+    async def mark_works_dirty(self, event_id: UUID, work_ids: Iterable[UUID]) -> None:
+        document = await self._bump(event_id)
+        if document is not None:
+            for work_id in work_ids:
+                document.dirty_slot_ids.update(document.slot_ids_by_work.get(work_id, ()))
+
+    def clear(self) -> None:
+        self._documents.clear()
+
+    async def _bump(self, event_id: UUID) -> AgendaDocument | None:
+        """
+        Bumps the version for a write of this worker. Its document stays, to be patched, only when
+        the version moved by exactly this write: otherwise another worker wrote too, unseen.
+        """
+        version = await self.versions.incr(str(event_id))
+        document = self._documents.get(event_id)
+        if document is None:
+            return None
+        if version is None or document.version is None or version != document.version + 1:
+            del self._documents[event_id]
+            return None
+        document.version = version
+        return document
+
+
+agenda_read_model = AgendaReadModel(namespace_cache("agenda_versions"))
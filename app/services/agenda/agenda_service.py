@@ -0,0 +1,46 @@
+import logging
+from datetime import date
+from uuid import UUID
+
+from app.database.models.event import EventStatus
+from app.exceptions.events_exceptions import EventNotFound
+from app.repository.events_repository import EventsRepository
+from app.repository.slots_repository import SlotsRepository
+from app.services.agenda.agenda_read_model import AgendaDocument, RenderedAgenda, agenda_read_model
+from app.services.services import BaseService
+
+logger = logging.getLogger(__name__)
+
+# The agenda is public once the event is: before, it would show the works of an unpublished event.
+PUBLIC_AGENDA_STATUSES = (EventStatus.STARTED, EventStatus.FINISHED)
+
+
+class AgendaService(BaseService):
+    def __init__(self, event_id: UUID, events_repository: EventsRepository, slots_repository: SlotsRepository):
+        self.event_id = event_id
+        self.events_repository = events_repository
+        self.slots_repository = slots_repository
+
+    async def get_agenda(self, day: date | None, room: str | None, track: str | None) -> RenderedAgenda:
+        # Checked on every read: status changes don't move the version of the agenda.
+        if await self.events_repository.get_status(self.event_id) not in PUBLIC_AGENDA_STATUSES:
+            raise EventNotFound(self.event_id)
+        document = await agenda_read_model.get(self.event_id)
+        if document is None:
+            document = await self._build_document()
+        elif document.dirty_slot_ids:
+            dirty_slot_ids = set(document.dirty_slot_ids)
+            document.dirty_slot_ids.clear()
+            rows = await self.slots_repository.get_agenda_rows(self.event_id, list(dirty_slot_ids))
+            document.replace_slots(dirty_slot_ids, rows)
+            logger.info(f"Patched {len(dirty_slot_ids)} slots of the agenda of event {self.event_id}")
+        return document.render((day, room, track))
+
+    async def _build_document(self) -> AgendaDocument:
+        version = await agenda_read_model.version(self.event_id)
+        rows = await self.slots_repository.get_agenda_rows(self.event_id)
+        document = AgendaDocument(event_id=self.event_id)
+        document.replace_slots((), rows)
+        agenda_read_model.store(document, version)
+        logger.info(f"Built the agenda of event {self.event_id}: {len(document.slots)} slots")
+        return document
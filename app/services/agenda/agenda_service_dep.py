@@ -0,0 +1,23 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Depends
+
+from app.repository.events_repository import EventsRepository
+from app.repository.repository import get_repository
+from app.repository.slots_repository import SlotsRepository
+from app.services.agenda.agenda_service import AgendaService
+
+
+class AgendaChecker:
+    async def __call__(
+        self,
+        event_id: UUID,
+        events_repository: Annotated[EventsRepository, Depends(get_repository(EventsRepository))],
+        slots_repository: Annotated[SlotsRepository, Depends(get_repository(SlotsRepository))],
+    ) -> AgendaService:
+        return AgendaService(event_id, events_repository, slots_repository)
+
+
+agenda_checker = AgendaChecker()
+AgendaServiceDep = Annotated[AgendaService, Depends(agenda_checker)]
@@ -3,22 +3,22 @@ from uuid import UUID
 
 from fastapi import Depends
 
+from app.database.session_dep import SessionDep
 from app.repository.chairs_repository import ChairRepository
-from app.repository.repository import get_repository
 from app.repository.users_repository import UsersRepository
 from app.services.event_chairs.event_chairs_service import EventChairService
-from app.services.events.events_configuration_service_dep import EventsConfigurationServiceDep
+from app.services.events.events_configuration_service_dep import EventsConfigurationChecker
+from app.services.lazy import lazy
 
 
 class EventsChairChecker:
-    async def __call__(
-        self,
-        event_id: UUID,
-        event_configuration_service: EventsConfigurationServiceDep,
-        users_repository: Annotated[UsersRepository, Depends(get_repository(UsersRepository))],
-        chair_repository: Annotated[ChairRepository, Depends(get_repository(ChairRepository))],
-    ) -> EventChairService:
-        return EventChairService(event_id, event_configuration_service, chair_repository, users_repository)
+    async def __call__(self, event_id: UUID, session: SessionDep) -> EventChairService:
+        return EventChairService(
+            event_id,
+            lazy(lambda: EventsConfigurationChecker.build(event_id, session)),
+            ChairRepository(session),
+            UsersRepository(session),
+        )
 
 
 event_chair_checker = EventsChairChecker()
@@ -104,9 +104,8 @@ class EventInscriptionsService(BaseService):
             response.upload_url = upload_url
         return response
 
-    async def get_event_inscriptions(self, offset: int, limit: int) -> list[InscriptionResponseSchema]:
-        inscriptions = await self.inscriptions_repository.get_event_inscriptions(self.event_id, offset, limit)
-        return list(map(EventInscriptionsService.map_to_schema, inscriptions))
+    async def get_event_inscriptions(self, offset: int, limit: int) -> list[dict]:
+        return await self.inscriptions_repository.get_event_inscriptions(self.event_id, offset, limit)
 
     async def get_inscription(self, inscription_id: UUID) -> InscriptionResponseSchema:
         inscription = await self.inscriptions_repository.get(inscription_id)
@@ -1,35 +1,37 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends
+from fastapi import BackgroundTasks, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.authorization.caller_id_dep import CallerIdDep
+from app.database.session_dep import SessionDep
 from app.repository.inscriptions_repository import InscriptionsRepository
-from app.repository.repository import get_repository
+from app.schemas.users.utils import UID
 from app.services.event_inscriptions.event_inscriptions_service import EventInscriptionsService
-from app.services.event_payments.event_payments_service_dep import EventPaymentsServiceDep
-from app.services.events.events_configuration_service_dep import EventsConfigurationServiceDep
-from app.services.notifications.notifications_service_dep import EventsNotificationServiceDep
-from app.services.storage.event_inscription_storage_service_dep import EventInscriptionStorageServiceDep
+from app.services.event_payments.event_payments_service_dep import EventPaymentsServiceChecker
+from app.services.events.events_configuration_service_dep import EventsConfigurationChecker
+from app.services.lazy import lazy
+from app.services.notifications.notifications_service_dep import EventsNotification
+from app.services.storage.event_inscription_storage_service import EventInscriptionStorageService
 
 
 class EventInscriptionsServiceChecker:
     async def __call__(
-        self,
-        event_id: UUID,
-        caller_id: CallerIdDep,
-        event_notification_service: EventsNotificationServiceDep,
-        event_configuration_service: EventsConfigurationServiceDep,
-        event_payment_service: EventPaymentsServiceDep,
-        storage_service: EventInscriptionStorageServiceDep,
-        inscriptions_repository: Annotated[InscriptionsRepository, Depends(get_repository(InscriptionsRepository))],
+        self, event_id: UUID, caller_id: CallerIdDep, background_tasks: BackgroundTasks, session: SessionDep
+    ) -> EventInscriptionsService:
+        return self.build(event_id, caller_id, background_tasks, session)
+
+    @staticmethod
+    def build(
+        event_id: UUID, caller_id: UID, background_tasks: BackgroundTasks, session: AsyncSession
     ) -> EventInscriptionsService:
         return EventInscriptionsService(
-            event_configuration_service,
-            event_payment_service,
-            storage_service,
-            inscriptions_repository,
-            event_notification_service,
+            lazy(lambda: EventsConfigurationChecker.build(event_id, session)),
+            lazy(lambda: EventPaymentsServiceChecker.build(event_id, caller_id, session)),
+            EventInscriptionStorageService(event_id),
+            InscriptionsRepository(session),
+            lazy(lambda: EventsNotification.build(background_tasks, session)),
             event_id,
             caller_id,
         )
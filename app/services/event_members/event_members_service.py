@@ -67,9 +67,10 @@ class EventMembersService(BaseService):
 
     async def update_rol_member(self, user_id: UID, role_schema: RolesRequestSchema):
         for role, repository in self.repositories.items():
-            if (role not in role_schema.roles) and (await repository.is_member(self.event_id, user_id)):
+            is_member = await repository.is_member(self.event_id, user_id)
+            if (role not in role_schema.roles) and is_member:
                 await repository.remove_member(self.event_id, user_id)
-            if (role in role_schema.roles) and (not await repository.is_member(self.event_id, user_id)):
+            if (role in role_schema.roles) and not is_member:
                 await repository.create_member(self.event_id, user_id)
 
     @staticmethod
@@ -3,7 +3,6 @@ from logging import getLogger
 from uuid import UUID
 
 from fastapi import HTTPException
-from mercadopago import SDK
 
 from app.database.models.inscription import InscriptionStatus
 from app.database.models.payment import PaymentStatus
@@ -21,11 +20,20 @@ from app.schemas.payments.payment import (
 from app.schemas.users.utils import UID
 from app.services.services import BaseService
 from app.services.storage.event_inscription_storage_service import EventInscriptionStorageService
-from app.settings.settings import MercadoPagoSettings
+from app.settings.settings import MercadoPagoSettings, get_settings
+from app.utils.metrics import MERCADOPAGO_REQUEST_DURATION
+from app.utils.tracing import span
 
 logger = getLogger(__name__)
 
 
+def _mercadopago_sdk(access_token: str):
+    # Imported on first use: the SDK and requests take longer to import than most of the app.
+    from mercadopago import SDK
+
+    return SDK(access_token)
+
+
 class EventPaymentsService(BaseService):
     def __init__(
         self,
@@ -44,7 +52,7 @@ class EventPaymentsService(BaseService):
         self.events_repository = events_repository
         self.event_id = event_id
         self.user_id = user_id
-        self._settings = MercadoPagoSettings()
+        self._settings = get_settings(MercadoPagoSettings)
 
     async def pay_inscription(self, inscription_id: UUID, payment_request: PaymentRequestSchema) -> dict:
         payment_id = await self.payments_repository.do_new_payment(self.event_id, inscription_id, payment_request)
@@ -111,7 +119,7 @@ class EventPaymentsService(BaseService):
             "pending": f"{api_base}/events/{event.id}/provider/return/pending",
         }
         notification_url = f"{api_base}/events/{event.id}/provider/webhook"
-        mp = SDK(access_token)
+        mp = _mercadopago_sdk(access_token)
         now_utc = datetime.now(timezone.utc)
         expiration_from = now_utc.isoformat(timespec="seconds").replace("+00:00", "Z")
         expiration_to = (
@@ -137,7 +145,11 @@ class EventPaymentsService(BaseService):
             "expiration_date_to": expiration_to,
             "binary_mode": bool(self._settings.BINARY_MODE),
         }
-        preference_response = mp.preference().create(preference_data)
+        with (
+            MERCADOPAGO_REQUEST_DURATION.time(operation="preference.create"),
+            span("mercadopago preference.create", "http_client"),
+        ):
+            preference_response = mp.preference().create(preference_data)
         checkout_data = preference_response.get("response", {})
         init_point = checkout_data.get("init_point") or checkout_data.get("sandbox_init_point")
         if not init_point:
@@ -196,9 +208,13 @@ class EventPaymentsService(BaseService):
         # merchant_order -> payment
         mo = None
         if access_token and q_topic == "merchant_order" and q_id and not (external_reference and status):
-            mp = SDK(access_token)
+            mp = _mercadopago_sdk(access_token)
             try:
-                mo_resp = mp.merchant_order().get(q_id)
+                with (
+                    MERCADOPAGO_REQUEST_DURATION.time(operation="merchant_order.get"),
+                    span("mercadopago merchant_order.get", "http_client"),
+                ):
+                    mo_resp = mp.merchant_order().get(q_id)
                 mo = mo_resp.get("response", {})
                 payments = mo.get("payments", []) or []
                 logger.info(
@@ -211,7 +227,11 @@ class EventPaymentsService(BaseService):
                 )
                 if payments:
                     provider_payment_id = str(payments[-1].get("id"))
-                    pr_resp = mp.payment().get(provider_payment_id)
+                    with (
+                        MERCADOPAGO_REQUEST_DURATION.time(operation="payment.get"),
+                        span("mercadopago payment.get", "http_client"),
+                    ):
+                        pr_resp = mp.payment().get(provider_payment_id)
                     pr = pr_resp.get("response", {})
                     external_reference = external_reference or pr.get("external_reference")
                     status = status or pr.get("status")
@@ -283,9 +303,13 @@ class EventPaymentsService(BaseService):
                 )
 
         if (not external_reference or not status) and provider_payment_id and access_token:
-            mp = SDK(access_token)
+            mp = _mercadopago_sdk(access_token)
             try:
-                res = mp.payment().get(provider_payment_id)
+                with (
+                    MERCADOPAGO_REQUEST_DURATION.time(operation="payment.get"),
+                    span("mercadopago payment.get", "http_client"),
+                ):
+                    res = mp.payment().get(provider_payment_id)
                 body = res.get("response", {})
                 external_reference = external_reference or body.get("external_reference")
                 status = status or body.get("status")
@@ -370,9 +394,13 @@ class EventPaymentsService(BaseService):
         if not access_token:
             raise HTTPException(status_code=400, detail="No se puede conectar con Mercado Pago")
 
-        mp = SDK(access_token)
+        mp = _mercadopago_sdk(access_token)
         try:
-            pref_response = mp.preference().get(preference_id)
+            with (
+                MERCADOPAGO_REQUEST_DURATION.time(operation="preference.get"),
+                span("mercadopago preference.get", "http_client"),
+            ):
+                pref_response = mp.preference().get(preference_id)
             pref_data = pref_response.get("response", {})
             init_point = pref_data.get("init_point") or pref_data.get("sandbox_init_point")
 
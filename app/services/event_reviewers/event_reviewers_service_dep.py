@@ -1,29 +1,36 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends
+from fastapi import BackgroundTasks, Depends
 
-from app.repository.repository import get_repository
+from app.authorization.caller_id_dep import CallerIdDep
+from app.authorization.user_id_dep import UserDep
+from app.database.session_dep import SessionDep
 from app.repository.reviewers_repository import ReviewerRepository
 from app.repository.users_repository import UsersRepository
 from app.services.event_reviewers.event_reviewers_service import EventReviewerService
-from app.services.events.events_service_dep import EventsServiceDep
-from app.services.notifications.notifications_service_dep import EventsNotificationServiceDep
-from app.services.works.works_service_dep import WorksServiceDep
+from app.services.events.events_service_dep import EventsChecker
+from app.services.lazy import lazy
+from app.services.notifications.notifications_service_dep import EventsNotification
+from app.services.works.works_service_dep import Works
 
 
 class EventsReviewerChecker:
     async def __call__(
         self,
+        _: UserDep,
         event_id: UUID,
-        event_notification_service: EventsNotificationServiceDep,
-        events_service: EventsServiceDep,
-        work_service: WorksServiceDep,
-        users_repository: Annotated[UsersRepository, Depends(get_repository(UsersRepository))],
-        reviewer_repository: Annotated[ReviewerRepository, Depends(get_repository(ReviewerRepository))],
+        caller_id: CallerIdDep,
+        background_tasks: BackgroundTasks,
+        session: SessionDep,
     ) -> EventReviewerService:
         return EventReviewerService(
-            event_id, events_service, work_service, reviewer_repository, users_repository, event_notification_service
+            event_id,
+            lazy(lambda: EventsChecker.build(event_id, background_tasks, session)),
+            lazy(lambda: Works.build(event_id, caller_id, background_tasks, session)),
+            ReviewerRepository(session),
+            UsersRepository(session),
+            lazy(lambda: EventsNotification.build(background_tasks, session)),
         )
 
 
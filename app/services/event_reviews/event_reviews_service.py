@@ -6,13 +6,14 @@ from app.schemas.users.utils import UID
 from app.schemas.works.review import (
     ReviewCreateRequestSchema,
     ReviewPublishSchema,
-    ReviewResponseSchema,
     ReviewUploadSchema,
 )
+from app.services.agenda.agenda_read_model import agenda_read_model
 from app.services.event_submissions.event_submissions_service import SubmissionsService
 from app.services.services import BaseService
 from app.services.storage.work_storage_service import WorkStorageService
 from app.services.works.works_service import WorksService
+from app.utils.http_cache import ResourceVersion
 from app.utils.utils import is_valid_datetime
 
 
@@ -35,14 +36,21 @@ class EventReviewsService(BaseService):
         self.storage_service = storage_service
         self.reviews_repository = reviews_repository
 
-    async def get_all_reviews(self, offset: int, limit: int) -> list[ReviewResponseSchema]:
+    async def get_reviews_version(self, shared_only: bool) -> ResourceVersion:
+        version = await self.reviews_repository.get_work_reviews_version(self.event_id, self.work_id, shared_only)
+        last_modified = max(filter(None, (version.last_update, version.reviewers_last_update)), default=None)
+        return ResourceVersion.of(
+            version.count, version.last_update, version.reviewers_last_update, last_modified=last_modified
+        )
+
+    async def get_all_reviews(self, offset: int, limit: int) -> list[dict]:
         return await self.reviews_repository.get_all_work_reviews_for_event(self.event_id, self.work_id, offset, limit)
 
-    async def get_my_work_reviews(self, offset: int, limit: int) -> list[ReviewResponseSchema]:
+    async def get_my_work_reviews(self, offset: int, limit: int) -> list[dict]:
         reviews = await self.reviews_repository.get_shared_work_reviews(self.event_id, self.work_id, offset, limit)
         for r in reviews:
-            public_answers = [answer for answer in r.review.answers if answer.is_public]
-            r.review.answers = public_answers
+            public_answers = [answer for answer in r["review"].get("answers", []) if answer.get("is_public")]
+            r["review"] = {**r["review"], "answers": public_answers}
         return reviews
 
     async def add_review(self, review_schema: ReviewCreateRequestSchema) -> ReviewUploadSchema:
@@ -68,6 +76,7 @@ class EventReviewsService(BaseService):
         await self.reviews_repository.update_review(review_id, review_schema)
 
     async def publish_reviews(self, reviews_to_publish: ReviewPublishSchema) -> None:
-        published = await self.reviews_repository.publish_reviews(self.event_id, self.work_id, reviews_to_publish)
+        published = await self.reviews_repository.publish_reviews(self.event_id, {self.work_id: reviews_to_publish})
         if not published:
             raise CannotPublishReviews(self.event_id, self.work_id)
+        await agenda_read_model.mark_works_dirty(self.event_id, [self.work_id])
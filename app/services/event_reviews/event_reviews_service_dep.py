@@ -1,30 +1,37 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends
+from fastapi import BackgroundTasks, Depends
 
 from app.authorization.caller_id_dep import CallerIdDep
-from app.repository.repository import get_repository
+from app.authorization.user_id_dep import UserDep
+from app.database.session_dep import SessionDep
 from app.repository.reviews_repository import ReviewsRepository
 from app.services.event_reviews.event_reviews_service import EventReviewsService
-from app.services.event_submissions.event_submissions_service_dep import SubmissionsServiceDep
-from app.services.storage.work_storage_service_dep import WorkStorageServiceDep
-from app.services.works.works_service_dep import WorksServiceDep
+from app.services.event_submissions.event_submissions_service_dep import Submissions
+from app.services.lazy import lazy
+from app.services.storage.work_storage_service import WorkStorageService
+from app.services.works.works_service_dep import Works
 
 
 class EventReviewsServiceChecker:
     async def __call__(
         self,
+        _: UserDep,
         event_id: UUID,
         work_id: UUID,
         caller_id: CallerIdDep,
-        work_service: WorksServiceDep,
-        submission_service: SubmissionsServiceDep,
-        storage_service: WorkStorageServiceDep,
-        reviews_repository: Annotated[ReviewsRepository, Depends(get_repository(ReviewsRepository))],
+        background_tasks: BackgroundTasks,
+        session: SessionDep,
     ) -> EventReviewsService:
         return EventReviewsService(
-            event_id, work_id, caller_id, work_service, submission_service, storage_service, reviews_repository
+            event_id,
+            work_id,
+            caller_id,
+            lazy(lambda: Works.build(event_id, caller_id, background_tasks, session)),
+            lazy(lambda: Submissions.build(event_id, work_id, caller_id, background_tasks, session)),
+            WorkStorageService(event_id, work_id),
+            ReviewsRepository(session),
         )
 
 
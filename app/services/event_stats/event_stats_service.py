@@ -0,0 +1,47 @@
+from uuid import UUID
+
+from app.database.models.event_stats import EventStat
+from app.repository.event_stats_repository import EventStatsRepository
+from app.schemas.events.dashboard import EventDashboardSchema, PaymentsStatusStatsSchema, TrackReviewsStatsSchema
+from app.services.services import BaseService
+
+# Counters of the reviews of a track, by the field of TrackReviewsStatsSchema they go to.
+TRACK_REVIEW_STATS = {
+    EventStat.REVIEWERS_BY_WORK: "reviewers",
+    EventStat.REVIEWS_BY_WORK: "reviews",
+    EventStat.SHARED_REVIEWS_BY_WORK: "shared_reviews",
+}
+
+
+class EventStatsService(BaseService):
+    def __init__(self, event_id: UUID, event_stats_repository: EventStatsRepository):
+        self.event_id = event_id
+        self.event_stats_repository = event_stats_repository
+
+    async def get_dashboard(self) -> EventDashboardSchema:
+        dashboard = EventDashboardSchema(event_id=self.event_id)
+        for stat in await self.event_stats_repository.get_event_stats(self.event_id):
+            # Counters that went back to zero are kept, but not shown.
+            if stat.count == 0:
+                continue
+            metric = EventStat(stat.metric)
+            if metric == EventStat.INSCRIPTIONS_BY_STATUS:
+                dashboard.inscriptions.by_status[stat.key] = stat.count
+                dashboard.inscriptions.total += stat.count
+            elif metric == EventStat.INSCRIPTIONS_BY_ROLE:
+                dashboard.inscriptions.by_role[stat.key] = stat.count
+            elif metric == EventStat.PAYMENTS_BY_STATUS:
+                payments = dashboard.payments.by_status.setdefault(stat.key, PaymentsStatusStatsSchema())
+                payments.count += stat.count
+                if stat.amount:
+                    payments.amounts[stat.currency] = float(stat.amount)
+                dashboard.payments.total += stat.count
+            elif metric == EventStat.WORKS_BY_STATE:
+                dashboard.works.by_state[stat.key] = stat.count
+                dashboard.works.total += stat.count
+            elif metric == EventStat.WORKS_BY_TRACK:
+                dashboard.works.by_track[stat.key] = stat.count
+            else:
+                track = dashboard.reviews_by_track.setdefault(stat.key, TrackReviewsStatsSchema())
+                setattr(track, TRACK_REVIEW_STATS[metric], stat.count)
+        return dashboard
@@ -0,0 +1,21 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Depends
+
+from app.repository.event_stats_repository import EventStatsRepository
+from app.repository.repository import get_repository
+from app.services.event_stats.event_stats_service import EventStatsService
+
+
+class EventStatsChecker:
+    async def __call__(
+        self,
+        event_id: UUID,
+        event_stats_repository: Annotated[EventStatsRepository, Depends(get_repository(EventStatsRepository))],
+    ) -> EventStatsService:
+        return EventStatsService(event_id, event_stats_repository)
+
+
+event_stats_checker = EventStatsChecker()
+EventStatsServiceDep = Annotated[EventStatsService, Depends(event_stats_checker)]
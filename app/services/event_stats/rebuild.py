@@ -0,0 +1,47 @@
+"""
+Recounts the dashboard counters of an event, or of every event, from the inscriptions, payments,
+works, reviewers and reviews tables. The triggers keep the counters up to date; this corrects
+them if they ever drift, e.g. after writes with the triggers disabled.
+
+With --compact, only folds the deltas the triggers appended into the counters, which the job
+workers already do every JOBS_EVENT_STATS_COMPACT_INTERVAL_SECONDS.
+
+    python -m app.services.event_stats.rebuild [--event-id EVENT_ID] [--compact]
+"""
+
+import argparse
+import asyncio
+import logging
+import time
+from uuid import UUID
+
+import app.main  # noqa: F401 - maps every model, as relationships refer to each other by name
+from app.database.database import SessionLocal, engine
+from app.repository.event_stats_repository import EventStatsRepository
+
+logger = logging.getLogger(__name__)
+
+
+async def rebuild(event_id: UUID | None, compact: bool = False) -> int:
+    started = time.perf_counter()
+    async with SessionLocal() as session:
+        repository = EventStatsRepository(session)
+        counters = await (repository.compact(event_id) if compact else repository.rebuild(event_id))
+    await engine.dispose()
+    scope = f"event {event_id}" if event_id is not None else "every event"
+    action = "Compacted" if compact else "Rebuilt"
+    logger.info(f"{action} {counters} counters of {scope} in {time.perf_counter() - started:.2f} s")
+    return counters
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--event-id", type=UUID, default=None, help="Only this event (default: every event)")
+    parser.add_argument("--compact", action="store_true", help="Only fold the deltas into the counters")
+    arguments = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    asyncio.run(rebuild(arguments.event_id, arguments.compact))
+
+
+if __name__ == "__main__":
+    main()
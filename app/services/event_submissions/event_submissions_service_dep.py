@@ -1,27 +1,44 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends
+from fastapi import BackgroundTasks, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.authorization.caller_id_dep import CallerIdDep
-from app.repository.repository import get_repository
+from app.authorization.user_id_dep import UserDep
+from app.database.session_dep import SessionDep
 from app.repository.submissions_repository import SubmissionsRepository
+from app.schemas.users.utils import UID
 from app.services.event_submissions.event_submissions_service import SubmissionsService
-from app.services.storage.work_storage_service_dep import WorkStorageServiceDep
-from app.services.works.works_service_dep import WorksServiceDep
+from app.services.lazy import lazy
+from app.services.storage.work_storage_service import WorkStorageService
+from app.services.works.works_service_dep import Works
 
 
 class Submissions:
     async def __call__(
         self,
+        _: UserDep,
         user_id: CallerIdDep,
         event_id: UUID,
         work_id: UUID,
-        work_service: WorksServiceDep,
-        storage_service: WorkStorageServiceDep,
-        submission_repository: Annotated[SubmissionsRepository, Depends(get_repository(SubmissionsRepository))],
+        background_tasks: BackgroundTasks,
+        session: SessionDep,
     ) -> SubmissionsService:
-        return SubmissionsService(submission_repository, work_service, storage_service, user_id, event_id, work_id)
+        return self.build(event_id, work_id, user_id, background_tasks, session)
+
+    @staticmethod
+    def build(
+        event_id: UUID, work_id: UUID, user_id: UID, background_tasks: BackgroundTasks, session: AsyncSession
+    ) -> SubmissionsService:
+        return SubmissionsService(
+            SubmissionsRepository(session),
+            lazy(lambda: Works.build(event_id, user_id, background_tasks, session)),
+            WorkStorageService(event_id, work_id),
+            user_id,
+            event_id,
+            work_id,
+        )
 
 
 submissions_service = Submissions()
@@ -1,22 +1,22 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends
+from fastapi import BackgroundTasks, Depends
 
+from app.database.session_dep import SessionDep
 from app.repository.events_repository import EventsRepository
-from app.repository.repository import get_repository
 from app.services.events.events_administration_service import EventsAdministrationService
-from app.services.notifications.notifications_service_dep import EventsNotificationServiceDep
+from app.services.lazy import lazy
+from app.services.notifications.notifications_service_dep import EventsNotification
 
 
 class EventsAdministrationServiceChecker:
     async def __call__(
-        self,
-        event_id: UUID,
-        events_notifications_service: EventsNotificationServiceDep,
-        events_repository: Annotated[EventsRepository, Depends(get_repository(EventsRepository))],
+        self, event_id: UUID, background_tasks: BackgroundTasks, session: SessionDep
     ) -> EventsAdministrationService:
-        return EventsAdministrationService(event_id, events_repository, events_notifications_service)
+        return EventsAdministrationService(
+            event_id, EventsRepository(session), lazy(lambda: EventsNotification.build(background_tasks, session))
+        )
 
 
 events_administrations_checker = EventsAdministrationServiceChecker()
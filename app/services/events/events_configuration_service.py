@@ -10,6 +10,7 @@ from app.schemas.events.pricing import PricingSchema
 from app.schemas.events.review_skeleton.review_skeleton import ReviewSkeletonRequestSchema, ReviewSkeletonResponseSchema
 from app.schemas.events.schemas import DynamicTracksEventSchema
 from app.services.services import BaseService
+from app.utils.http_cache import ResourceVersion
 
 
 class EventsConfigurationService(BaseService):
@@ -17,6 +18,12 @@ class EventsConfigurationService(BaseService):
         self.event_id = event_id
         self.events_repository = events_repository
 
+    async def get_configuration_version(self) -> ResourceVersion:
+        last_update = await self.events_repository.get_last_update(self.event_id)
+        if last_update is None:
+            raise EventNotFound(self.event_id)
+        return ResourceVersion.of(last_update, last_modified=last_update)
+
     async def get_configuration(self) -> EventConfigurationSchema:
         return await self.events_repository.get(self.event_id)
 
@@ -2,19 +2,20 @@ from typing import Annotated
 from uuid import UUID
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database.session_dep import SessionDep
 from app.repository.events_repository import EventsRepository
-from app.repository.repository import get_repository
 from app.services.events.events_configuration_service import EventsConfigurationService
 
 
 class EventsConfigurationChecker:
-    async def __call__(
-        self,
-        event_id: UUID,
-        events_repository: Annotated[EventsRepository, Depends(get_repository(EventsRepository))],
-    ) -> EventsConfigurationService:
-        return EventsConfigurationService(event_id, events_repository)
+    async def __call__(self, event_id: UUID, session: SessionDep) -> EventsConfigurationService:
+        return self.build(event_id, session)
+
+    @staticmethod
+    def build(event_id: UUID, session: AsyncSession) -> EventsConfigurationService:
+        return EventsConfigurationService(event_id, EventsRepository(session))
 
 
 events_configuration_checker = EventsConfigurationChecker()
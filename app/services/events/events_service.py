@@ -7,10 +7,12 @@ from app.repository.events_repository import EventsRepository
 from app.schemas.events.configuration import EventConfigurationSchema
 from app.schemas.events.create_event import CreateEventSchema
 from app.schemas.events.public_event_with_roles import PublicEventWithRolesSchema
+from app.schemas.events.roles import EventRole
 from app.schemas.users.utils import UID
 from app.services.event_organizers.event_organizers_service import EventOrganizersService
 from app.services.notifications.events_notifications_service import EventsNotificationsService
 from app.services.services import BaseService
+from app.utils.http_cache import ResourceVersion
 
 
 class EventsService(BaseService):
@@ -45,7 +47,7 @@ class EventsService(BaseService):
 
         return event_created.id
 
-    async def get_my_events(self, caller_id: UID, offset: int, limit: int) -> list[PublicEventWithRolesSchema]:
+    async def get_my_events(self, caller_id: UID, offset: int, limit: int) -> list[dict]:
         return await self.events_repository.get_all_events_for_user(caller_id, offset=offset, limit=limit)
 
     async def get_all_events(
@@ -59,13 +61,20 @@ class EventsService(BaseService):
                 event.creator = None
         return events
 
-    async def get_public_event(self, caller_id: UID | None, event_id: UUID) -> PublicEventWithRolesSchema:
+    async def get_caller_roles(self, caller_id: UID | None, event_id: UUID) -> list[EventRole]:
+        return await self.events_repository.get_roles(event_id, caller_id) if caller_id is not None else []
+
+    async def get_public_event_version(self, event_id: UUID, roles: list[EventRole]) -> ResourceVersion:
+        version = await self.events_repository.get_public_version(event_id)
+        if version is None:
+            raise EventNotFound(event_id)
+        # No Last-Modified: slot changes don't move the event's last_update.
+        return ResourceVersion.of(version.last_update, version.slots_digest, sorted(roles))
+
+    async def get_public_event(self, event_id: UUID, roles: list[EventRole]) -> PublicEventWithRolesSchema:
         event = await self.events_repository.get(event_id)
         if event is None:
             raise EventNotFound(event_id)
         event = PublicEventWithRolesSchema.model_validate(event)
-        if caller_id is None:
-            return event
-        event_roles = await self.events_repository.get_roles(event_id, caller_id)
-        event.roles = event_roles
+        event.roles = roles
         return event
@@ -1,22 +1,30 @@
 from typing import Annotated
+from uuid import UUID
 
-from fastapi import Depends
+from fastapi import BackgroundTasks, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database.session_dep import SessionDep
 from app.repository.events_repository import EventsRepository
-from app.repository.repository import get_repository
-from app.services.event_organizers.event_organizers_service_dep import EventOrganizersServiceDep
+from app.services.event_organizers.event_organizers_service_dep import EventsOrganizerChecker
 from app.services.events.events_service import EventsService
-from app.services.notifications.notifications_service_dep import EventsNotificationServiceDep
+from app.services.lazy import lazy
+from app.services.notifications.notifications_service_dep import EventsNotification
 
 
 class EventsChecker:
     async def __call__(
-        self,
-        event_notification_service: EventsNotificationServiceDep,
-        organizers_service: EventOrganizersServiceDep,
-        events_repository: Annotated[EventsRepository, Depends(get_repository(EventsRepository))],
+        self, background_tasks: BackgroundTasks, session: SessionDep, event_id: UUID | None = None
     ) -> EventsService:
-        return EventsService(events_repository, organizers_service, event_notification_service)
+        return self.build(event_id, background_tasks, session)
+
+    @staticmethod
+    def build(event_id: UUID | None, background_tasks: BackgroundTasks, session: AsyncSession) -> EventsService:
+        return EventsService(
+            EventsRepository(session),
+            lazy(lambda: EventsOrganizerChecker.build(event_id, session)),
+            lazy(lambda: EventsNotification.build(background_tasks, session)),
+        )
 
 
 events_checker = EventsChecker()
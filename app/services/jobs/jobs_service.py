@@ -0,0 +1,63 @@
+import logging
+from typing import List
+from uuid import UUID
+
+from pydantic import ValidationError
+
+from app.database.models.job import JobModel, JobStatus
+from app.exceptions.jobs_exceptions import InvalidJobParameters, JobAlreadyFinished, JobNotFound, UnknownJobType
+from app.jobs.registry import JOB_TYPES
+from app.repository.jobs_repository import JobsRepository
+from app.schemas.jobs.job import JobSchema, JobSubmitSchema
+from app.services.services import BaseService
+
+logger = logging.getLogger(__name__)
+
+
+class JobsService(BaseService):
+    def __init__(self, event_id: UUID, caller_id: str, jobs_repository: JobsRepository):
+        self.event_id = event_id
+        self.caller_id = caller_id
+        self.jobs_repository = jobs_repository
+
+    async def submit(self, submission: JobSubmitSchema) -> JobSchema:
+        """Queues a job for the workers. Its parameters are validated now, not when it runs."""
+        job_type = JOB_TYPES.get(submission.job_type)
+        if job_type is None:
+            raise UnknownJobType(submission.job_type, sorted(JOB_TYPES))
+        try:
+            parameters = job_type.parameters.model_validate(submission.parameters)
+        except ValidationError as error:
+            raise InvalidJobParameters(
+                submission.job_type, error.errors(include_url=False, include_context=False)
+            ) from error
+        job = await self.jobs_repository._create(
+            JobModel(
+                event_id=self.event_id,
+                job_type=job_type.name,
+                parameters=parameters.model_dump(mode="json"),
+                created_by=self.caller_id,
+                max_attempts=job_type.max_attempts,
+            )
+        )
+        logger.info(f"Queued job {job.id} ({job.job_type}) for event {self.event_id}")
+        return JobSchema.model_validate(job)
+
+    async def get_jobs(self, status: JobStatus | None, offset: int, limit: int) -> List[JobSchema]:
+        jobs = await self.jobs_repository.get_event_jobs(self.event_id, status, offset, limit)
+        return [JobSchema.model_validate(job) for job in jobs]
+
+    async def get_job(self, job_id: UUID) -> JobSchema:
+        job = await self.jobs_repository.get_event_job(self.event_id, job_id)
+        if job is None:
+            raise JobNotFound(self.event_id, job_id)
+        return JobSchema.model_validate(job)
+
+    async def cancel(self, job_id: UUID) -> JobSchema:
+        """Cancels a queued job, or asks its worker to stop a running one."""
+        job = await self.jobs_repository.request_cancel(self.event_id, job_id)
+        if job is None:
+            current = await self.get_job(job_id)
+            raise JobAlreadyFinished(job_id, current.status)
+        logger.info(f"Cancellation of job {job_id} of event {self.event_id} requested")
+        return JobSchema.model_validate(job)
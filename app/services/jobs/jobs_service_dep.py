@@ -0,0 +1,23 @@
+from typing import Annotated
+from uuid import UUID
+
+from fastapi import Depends
+
+from app.authorization.caller_id_dep import CallerIdDep
+from app.repository.jobs_repository import JobsRepository
+from app.repository.repository import get_repository
+from app.services.jobs.jobs_service import JobsService
+
+
+class JobsChecker:
+    async def __call__(
+        self,
+        event_id: UUID,
+        caller_id: CallerIdDep,
+        jobs_repository: Annotated[JobsRepository, Depends(get_repository(JobsRepository))],
+    ) -> JobsService:
+        return JobsService(event_id, caller_id, jobs_repository)
+
+
+jobs_checker = JobsChecker()
+JobsServiceDep = Annotated[JobsService, Depends(jobs_checker)]
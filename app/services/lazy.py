@@ -0,0 +1,29 @@
+from typing import Callable, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class Lazy:
+    """
+    Stands in for a collaborator that is expensive to build or seldom used: the first attribute
+    access builds it with the factory, and every access goes to that same instance.
+    """
+
+    __slots__ = ("_factory", "_instance")
+
+    def __init__(self, factory: Callable[[], object]):
+        self._factory = factory
+        self._instance = None
+
+    def __getattr__(self, name: str):
+        if self._instance is None:
+            self._instance = self._factory()
+        return getattr(self._instance, name)
+
+    def __repr__(self) -> str:
+        return f"Lazy({self._instance!r})" if self._instance is not None else "Lazy(<not built>)"
+
+
+def lazy(factory: Callable[[], T]) -> T:
+    """A collaborator built by the factory on first use, typed as what it builds."""
+    return cast(T, Lazy(factory))
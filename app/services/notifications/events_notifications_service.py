@@ -11,16 +11,18 @@ from app.repository.organizers_repository import OrganizerRepository
 from app.repository.users_repository import UsersRepository
 from app.schemas.members.reviewer_schema import ReviewerCreateRequestSchema
 from app.services.notifications.notifications_service import NotificationsService, load_html
+from app.utils.metrics import EMAIL_QUEUE_DEPTH
 
 email_regex = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-CREATE_EVENT_NOTIFICATION_HTML = load_html("created-event-notification.html")
-START_ORGS_EVENT_NOTIFICATION_HTML = load_html("started-orgs-event-notification.html")
-WAITING_APPROVAL_USER_EVENT_NOTIFICATION_HTML = load_html("waiting-user-event-notification.html")
-WAITING_APPROVAL_ADMIN_EVENT_NOTIFICATION_HTML = load_html("waiting-admin-event-notification.html")
-INSCRIPTION_EVENT_NOTIFICATION_HTML = load_html("inscription-event-notification.html")
-INSCRIPTION_USER_EVENT_NOTIFICATION_HTML = load_html("inscription-user-event-notification.html")
-REVIEWER_EVENT_NOTIFICATION_HTML = load_html("reviewer-event-notification.html")
-CHANGE_WORK_STATUS_NOTIFICATION_HTML = load_html("change-work-status-notification.html")
+# Templates in assets/email-templates, read on their first email.
+CREATE_EVENT_NOTIFICATION_HTML = "created-event-notification.html"
+START_ORGS_EVENT_NOTIFICATION_HTML = "started-orgs-event-notification.html"
+WAITING_APPROVAL_USER_EVENT_NOTIFICATION_HTML = "waiting-user-event-notification.html"
+WAITING_APPROVAL_ADMIN_EVENT_NOTIFICATION_HTML = "waiting-admin-event-notification.html"
+INSCRIPTION_EVENT_NOTIFICATION_HTML = "inscription-event-notification.html"
+INSCRIPTION_USER_EVENT_NOTIFICATION_HTML = "inscription-user-event-notification.html"
+REVIEWER_EVENT_NOTIFICATION_HTML = "reviewer-event-notification.html"
+CHANGE_WORK_STATUS_NOTIFICATION_HTML = "change-work-status-notification.html"
 
 
 class EventsNotificationsService(NotificationsService):
@@ -37,6 +39,18 @@ class EventsNotificationsService(NotificationsService):
         self.recipients_emails: list[str] = []
         self.background_tasks = background_tasks
 
+    def _enqueue_email(self, notify, *args):
+        """Sends the email in a background task, after the response, counting it as queued until then."""
+        EMAIL_QUEUE_DEPTH.inc()
+
+        def send():
+            try:
+                notify(*args)
+            finally:
+                EMAIL_QUEUE_DEPTH.dec()
+
+        self.background_tasks.add_task(send)
+
     def __recipients_message(self):
         message = EmailMessage()
         if len(self.recipients_emails) > 0:
@@ -108,12 +122,12 @@ class EventsNotificationsService(NotificationsService):
     def __print_email_to_send(self, emails, message):
         print(f"Sending emails to {emails} | email message: {message}")
 
-    def __config_common_and_send_specific_email(self, event, emails_to_send, body_common, subject, params=None):
+    def __config_common_and_send_specific_email(self, event, emails_to_send, template, subject, params=None):
         self.recipients_emails = emails_to_send
 
         message = self.__recipients_message()
 
-        body = self.__common_body(body_common, event)
+        body = self.__common_body(load_html(template), event)
         # Using replace parameters with [$x]
         if params is not None:
             body = self._replace_params(params, body)
@@ -168,14 +182,12 @@ class EventsNotificationsService(NotificationsService):
         params_org = [user_creator_fullname]
         subject = f"El evento {event.title} ha sido enviado para su aprobación"
 
-        self.background_tasks.add_task(
-            self.__notify_event_waiting_approval, event, subject, org_emails_to_send, params_org
-        )
+        self._enqueue_email(self.__notify_event_waiting_approval, event, subject, org_emails_to_send, params_org)
 
         params_creator = [user_creator_fullname, creator_id]
         admin_emails_to_send = await self.__search_emails_admin()
         subject = f"El evento {event.title} espera aprobación"
-        self.background_tasks.add_task(
+        self._enqueue_email(
             self.__notify_event_waiting_approval_admin, event, subject, admin_emails_to_send, params_creator
         )
 
@@ -185,7 +197,7 @@ class EventsNotificationsService(NotificationsService):
         org_emails_to_send = await self.__search_emails_organizers(event)
 
         subject = "Su solicitud de creación de evento fue aprobada"
-        self.background_tasks.add_task(self.__notify_event_created, event, subject, org_emails_to_send)
+        self._enqueue_email(self.__notify_event_created, event, subject, org_emails_to_send)
 
         return True
 
@@ -194,7 +206,7 @@ class EventsNotificationsService(NotificationsService):
 
         subject = f"El evento {event.title} ha sido publicado"
 
-        self.background_tasks.add_task(self.__notify_event_started_user, event, subject, org_emails_to_send)
+        self._enqueue_email(self.__notify_event_started_user, event, subject, org_emails_to_send)
 
         return True
 
@@ -206,12 +218,12 @@ class EventsNotificationsService(NotificationsService):
         org_emails_to_send = await self.__search_emails_organizers(event)
         params = [user_fullname, user_inscripted.id]
         subject = f"El usuario {user_fullname} se ha inscripto al evento {event.title}"
-        self.background_tasks.add_task(self.__notify_inscription_gral, event, subject, org_emails_to_send, params)
+        self._enqueue_email(self.__notify_inscription_gral, event, subject, org_emails_to_send, params)
 
         user_inscripted_emails = [user_inscripted.email]
         params = [user_fullname]
         subject = "Su inscripción fue registrada con exito"
-        self.background_tasks.add_task(self.__notify_inscription_user, event, subject, user_inscripted_emails, params)
+        self._enqueue_email(self.__notify_inscription_user, event, subject, user_inscripted_emails, params)
 
         return True
 
@@ -228,7 +240,7 @@ class EventsNotificationsService(NotificationsService):
 
                 subject = f"{fullname} fue asignado como reviewer"
 
-                self.background_tasks.add_task(self.__notify_new_reviewers, event, subject, emails_to_send, params)
+                self._enqueue_email(self.__notify_new_reviewers, event, subject, emails_to_send, params)
 
         return True
 
@@ -249,6 +261,6 @@ class EventsNotificationsService(NotificationsService):
         subject = "Su trabajo a cambiado de estado"
         params = [str(obj_work["work"].title), status_msg]
 
-        self.background_tasks.add_task(self.__notify_change_work_status, event, subject, emails_to_send, params)
+        self._enqueue_email(self.__notify_change_work_status, event, subject, emails_to_send, params)
 
         return True
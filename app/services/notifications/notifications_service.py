@@ -1,13 +1,23 @@
 import smtplib
 import ssl
+import time
 from email.message import EmailMessage
+from functools import lru_cache
 
-from app.settings.settings import NotificationsSettings
+from app.settings.settings import NotificationsSettings, get_settings
+from app.utils.metrics import EMAIL_SEND_DURATION
+from app.utils.tracing import span
 
-settings = NotificationsSettings()
-SLL_DEFAULT_CONTEXT = ssl.create_default_context()
+settings = get_settings(NotificationsSettings)
 
 
+# Templates, the logo and the TLS context are loaded on the first email, not at import.
+@lru_cache(maxsize=1)
+def ssl_default_context() -> ssl.SSLContext:
+    return ssl.create_default_context()
+
+
+@lru_cache(maxsize=None)
 def load_file(file_path):
     with open("./assets/" + file_path, "r", encoding="utf-8") as file:
         return file.read()
@@ -17,6 +27,7 @@ def load_html(file_path):
     return load_file("email-templates/" + file_path)
 
 
+@lru_cache(maxsize=1)
 def get_body_template():
     styles = load_html("styles.html")
     header = load_html("header.html")
@@ -32,21 +43,24 @@ def get_body_template():
     return body_filled
 
 
-BODY_TEMPLATE = get_body_template()
-
-
 class NotificationsService:
     def _send_email(self, message: EmailMessage):
         if not settings.ENABLE_SEND_EMAILS:
             print("not setting send emails")
             return
         message["From"] = settings.EMAIL
+        started = time.perf_counter()
         try:
-            with smtplib.SMTP_SSL("smtp.gmail.com", settings.SMTPS_PORT, context=SLL_DEFAULT_CONTEXT) as server:
+            with (
+                span("smtp send_message", "smtp"),
+                smtplib.SMTP_SSL("smtp.gmail.com", settings.SMTPS_PORT, context=ssl_default_context()) as server,
+            ):
                 server.login(settings.EMAIL, settings.EMAIL_PASSWORD)
                 server.send_message(message)
+            EMAIL_SEND_DURATION.observe(time.perf_counter() - started, outcome="sent")
             return True
         except Exception as e:
+            EMAIL_SEND_DURATION.observe(time.perf_counter() - started, outcome="failed")
             print(f"There was an error: {str(e)} " f"sending an email: {message.as_string()}.")
             return False
 
@@ -65,7 +79,7 @@ class NotificationsService:
         return message
 
     def _add_body_extra(self, message: EmailMessage, body):
-        body_filled = BODY_TEMPLATE.replace("{{ body }}", body)
+        body_filled = get_body_template().replace("{{ body }}", body)
         message.set_content("This is a HTML email. If you see this text, your client does not support HTML.")
         message.add_alternative(body_filled, subtype="html")
 
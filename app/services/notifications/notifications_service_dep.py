@@ -1,23 +1,24 @@
 from typing import Annotated
 
 from fastapi import BackgroundTasks, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.database.session_dep import SessionDep
 from app.repository.events_repository import EventsRepository
 from app.repository.organizers_repository import OrganizerRepository
-from app.repository.repository import get_repository
 from app.repository.users_repository import UsersRepository
 from app.services.notifications.events_notifications_service import EventsNotificationsService
 
 
 class EventsNotification:
-    async def __call__(
-        self,
-        background_tasks: BackgroundTasks,
-        events_repository: Annotated[EventsRepository, Depends(get_repository(EventsRepository))],
-        users_repository: Annotated[UsersRepository, Depends(get_repository(UsersRepository))],
-        organizer_repository: Annotated[OrganizerRepository, Depends(get_repository(OrganizerRepository))],
-    ) -> EventsNotificationsService:
-        return EventsNotificationsService(events_repository, users_repository, organizer_repository, background_tasks)
+    async def __call__(self, background_tasks: BackgroundTasks, session: SessionDep) -> EventsNotificationsService:
+        return self.build(background_tasks, session)
+
+    @staticmethod
+    def build(background_tasks: BackgroundTasks, session: AsyncSession) -> EventsNotificationsService:
+        return EventsNotificationsService(
+            EventsRepository(session), UsersRepository(session), OrganizerRepository(session), background_tasks
+        )
 
 
 events_notification_service = EventsNotification()
@@ -2,7 +2,6 @@ from logging import getLogger
 from typing import Annotated
 from uuid import UUID
 
-import requests  # type: ignore[import-untyped]
 from fastapi import Path
 
 from app.exceptions.provider_exceptions import (
@@ -13,10 +12,19 @@ from app.repository.events_repository import EventsRepository
 from app.repository.provider_account_repository import ProviderAccountRepository
 from app.schemas.provider.provider import ProviderAccountResponseSchema, ProviderAccountSchema
 from app.services.services import BaseService
-from app.settings.settings import MercadoPagoSettings
+from app.settings.settings import MercadoPagoSettings, get_settings
+from app.utils.metrics import MERCADOPAGO_REQUEST_DURATION
+from app.utils.tracing import span
 
 logger = getLogger(__name__)
-settings = MercadoPagoSettings()
+settings = get_settings(MercadoPagoSettings)
+
+
+def _http():
+    # Imported on first use: requests is slow to import and only linking accounts needs it.
+    import requests  # type: ignore[import-untyped]
+
+    return requests
 
 
 class ProviderService(BaseService):
@@ -40,7 +48,8 @@ class ProviderService(BaseService):
 
         try:
             headers = {"Authorization": f"Bearer {account_data.access_token}"}
-            response = requests.get("https://api.mercadopago.com/users/me", headers=headers)
+            with MERCADOPAGO_REQUEST_DURATION.time(operation="users.me"), span("mercadopago users.me", "http_client"):
+                response = _http().get("https://api.mercadopago.com/users/me", headers=headers)
 
             if response.status_code != 200:
                 raise InvalidProviderCredentials("No se pudo validar el token de acceso")
@@ -138,7 +147,8 @@ class ProviderService(BaseService):
             "Content-Type": "application/x-www-form-urlencoded",
             "Accept": "application/json",
         }
-        token_res = requests.post(token_url, data=form, headers=headers)
+        with MERCADOPAGO_REQUEST_DURATION.time(operation="oauth.token"), span("mercadopago oauth.token", "http_client"):
+            token_res = _http().post(token_url, data=form, headers=headers)
         logger.info(f"Token response status: {token_res.status_code}")
 
         if token_res.status_code != 200:
@@ -152,7 +162,8 @@ class ProviderService(BaseService):
 
         logger.info("Getting user info from Mercado Pago")
         headers_me = {"Authorization": f"Bearer {access_token}"}
-        me_res = requests.get("https://api.mercadopago.com/users/me", headers=headers_me)
+        with MERCADOPAGO_REQUEST_DURATION.time(operation="users.me"), span("mercadopago users.me", "http_client"):
+            me_res = _http().get("https://api.mercadopago.com/users/me", headers=headers_me)
         logger.info(f"User info response status: {me_res.status_code}")
 
         if me_res.status_code != 200:
@@ -1,4 +1,11 @@
+from app.utils.tracing import trace_methods
+
+
 class BaseService:
     """
     Base class For services
     """
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        trace_methods(cls, "service")
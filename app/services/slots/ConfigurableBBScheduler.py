@@ -1,13 +1,27 @@
+import copy
 import logging
 from dataclasses import dataclass, field
 from datetime import date, datetime, timedelta
-from typing import Dict, List, Set, Tuple, cast
+from typing import Dict, FrozenSet, Hashable, List, Set, Tuple
 from uuid import UUID
 
-from app.database.models import EventRoomSlotModel, WorkModel
+from app.services.slots.parallel_search import run_parallel_search
+from app.services.slots.placement import GreedyPlacement, PlacementBackend
+from app.services.slots.transposition_table import TranspositionTable
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_TRANSPOSITION_TABLE_SIZE = 200_000
+DEFAULT_SPLIT_DEPTH = 3
+# The search looks for a cancellation every this many nodes.
+CANCEL_CHECK_NODES = 1024
+# Open slots near the root whose branches estimate the progress of the search.
+PROGRESS_DEPTH = 8
+
+
+class SolveCancelled(Exception):
+    """Raised by `solve` when `cancel` was called while it was searching."""
+
 
 @dataclass
 class CostPenalties:
@@ -23,6 +37,36 @@ class CostPenalties:
         )
 
 
+@dataclass(slots=True)
+class SolverWork:
+    """
+    The columns of an approved work that the scheduler needs. `unavailable` holds the
+    time ranges the work can't be presented in, because a speaker presents another work
+    then. The placement backends also keep works sharing one of `speakers` (mails) apart.
+    """
+
+    id: UUID
+    track: str
+    unavailable: Tuple[Tuple[datetime, datetime], ...] = ()
+    speakers: FrozenSet[str] = frozenset()
+
+
+@dataclass(slots=True)
+class SolverSlot:
+    """
+    The columns of a slot that the scheduler needs, with the ids of the works already in it.
+    The capacities are filled in by the scheduler from its `time_per_work`.
+    """
+
+    id: int
+    room_name: str
+    start: datetime
+    end: datetime
+    work_ids: Tuple[UUID, ...] = ()
+    total_capacity: int = 0
+    available_space: int = 0
+
+
 @dataclass
 class SearchState:
     slot_index: int = 0
@@ -34,10 +78,36 @@ class SearchState:
     room_track_map: Dict[str, Set[str]] = field(default_factory=dict)
 
 
+@dataclass(slots=True)
+class CostBreakdown:
+    """How the final cost of a solution splits between the penalties."""
+
+    distinct_days: int
+    distinct_days_cost: float
+    room_track_mixes: int
+    room_track_mixes_cost: float
+    unassigned_works: int
+    unassigned_works_cost: float
+
+
+@dataclass
+class SolverStats:
+    nodes_explored: int = 0
+    bound_prunes: int = 0
+    transposition_prunes: int = 0
+    transposition_hits: int = 0
+    transposition_misses: int = 0
+    transposition_evictions: int = 0
+
+    def merge(self, other: "SolverStats") -> None:
+        for name, value in vars(other).items():
+            setattr(self, name, getattr(self, name) + value)
+
+
 def _has_time_conflict(state: SearchState, track_name: str, slot) -> bool:
     # Use .date() to compare dates, not datetimes
-    slot_start = cast(datetime, slot.start).date()
-    slot_end = cast(datetime, slot.end).date()
+    slot_start = slot.start.date()
+    slot_end = slot.end.date()
 
     for existing_start, existing_end in state.track_time_usage.get(track_name, []):
         if slot_start < existing_end and slot_end > existing_start:
@@ -47,14 +117,24 @@ def _has_time_conflict(state: SearchState, track_name: str, slot) -> bool:
 
 class ConfigurableBBScheduler:
     def __init__(
-        self, works: List[WorkModel], slots: List[EventRoomSlotModel], time_per_work: int, penalties: CostPenalties
+        self,
+        works: List[SolverWork],
+        slots: List[SolverSlot],
+        time_per_work: int,
+        penalties: CostPenalties,
+        transposition_table_size: int = DEFAULT_TRANSPOSITION_TABLE_SIZE,
+        workers: int = 1,
+        split_depth: int = DEFAULT_SPLIT_DEPTH,
+        placement: PlacementBackend | None = None,
     ):
         self.penalties = penalties
+        self.placement = placement or GreedyPlacement()
+        self.workers = workers
+        self.split_depth = split_depth
         self.time_delta = timedelta(minutes=time_per_work)
         self.time_per_work = time_per_work
 
-        # FIX 1: Map keys are UUIDs, not ints
-        all_works_map: Dict[UUID, WorkModel] = {cast(UUID, w.id): w for w in works}
+        all_works_map: Dict[UUID, SolverWork] = {w.id: w for w in works}
 
         self.slot_pre_assigned_track: Dict[int, str] = {}
         assigned_work_ids: Set[UUID] = set()
@@ -62,10 +142,9 @@ class ConfigurableBBScheduler:
         initial_state = SearchState()
 
         # Group works by track
-        all_works_by_track: Dict[str, List[WorkModel]] = {}
+        all_works_by_track: Dict[str, List[SolverWork]] = {}
         for w in works:
-            # FIX 2: Cast Column[str] to str
-            track_name = cast(str, w.track)
+            track_name = w.track
             all_works_by_track.setdefault(track_name, []).append(w)
 
         initial_track_counts_remaining: Dict[str, int] = {
@@ -75,11 +154,11 @@ class ConfigurableBBScheduler:
         # Delegate slot initialization
         self._initialize_slots(slots, all_works_map, initial_state, initial_track_counts_remaining, assigned_work_ids)
 
-        unassigned_works = [w for w in works if cast(UUID, w.id) not in assigned_work_ids]
+        unassigned_works = [w for w in works if w.id not in assigned_work_ids]
 
-        self.works_by_track: Dict[str, List[WorkModel]] = {}
+        self.works_by_track: Dict[str, List[SolverWork]] = {}
         for w in unassigned_works:
-            track_name = cast(str, w.track)
+            track_name = w.track
             self.works_by_track.setdefault(track_name, []).append(w)
 
         self.track_counts: Dict[str, int] = {
@@ -90,10 +169,13 @@ class ConfigurableBBScheduler:
 
         logger.info(f"Scheduler initialized. Total unassigned works to place: {self.total_works}")
 
-        self.all_slots: List[EventRoomSlotModel] = sorted(slots, key=lambda s: (s.start, s.room_name))
+        sorted_slots = sorted(slots, key=lambda s: (s.start, s.room_name))
+
+        self.slot_map: Dict[int, SolverSlot] = {s.id: s for s in sorted_slots}
 
-        # FIX 3: Cast Column[int] to int for Slot IDs
-        self.slot_map: Dict[int, EventRoomSlotModel] = {cast(int, s.id): s for s in self.all_slots}
+        # Full slots, or locked slots whose track has nothing left to place, can't change the
+        # outcome of the search, so they are only accounted for in the initial state.
+        self.all_slots: List[SolverSlot] = [s for s in sorted_slots if self._is_searchable(s)]
         self.total_slots = len(self.all_slots)
 
         self.global_best_cost = float("inf")
@@ -101,10 +183,67 @@ class ConfigurableBBScheduler:
         self.initial_state = initial_state
         self.initial_state.track_work_counts_remaining = initial_track_counts_remaining
 
+        self.transposition_table = TranspositionTable(transposition_table_size)
+        self.stats = SolverStats()
+
+        # Set only while splitting the tree into subproblems for the parallel search.
+        self._frontier_depth: int | None = None
+        self._frontier: List[SearchState] = []
+
+        # Best cost shared between worker processes (see parallel_search.py).
+        self._shared_best_cost = None
+        self._shared_best_lock = None
+
+        # Set from another thread to stop the search; worker processes read a shared flag instead.
+        self._cancel_requested = False
+        self._shared_cancel = None
+        # [branch taken, branches] of the open slots on the current path, down to PROGRESS_DEPTH.
+        self._progress_path: List[List[int]] = []
+        self._subproblems_done = 0
+        self._subproblems_total = 0
+
+    def _is_searchable(self, slot: SolverSlot) -> bool:
+        if slot.available_space <= 0:
+            return False
+        pre_assigned_track = self.slot_pre_assigned_track.get(slot.id)
+        return pre_assigned_track is None or pre_assigned_track in self.track_counts
+
+    def restrict_to_neighbourhood(self) -> None:
+        """
+        Limits the open slots the search may use to those closest to the existing schedule,
+        for repairing an assignment after small edits instead of re-solving the whole event.
+
+        Open slots are taken, in order of preference, from: days already in use in rooms that
+        are empty or already host a pending track; any day already in use; every open slot.
+        The first group with enough room for the pending works is used.
+        """
+        locked_slots = [s for s in self.all_slots if s.id in self.slot_pre_assigned_track]
+        open_slots = [s for s in self.all_slots if s.id not in self.slot_pre_assigned_track]
+        locked_space = sum(s.available_space for s in locked_slots)
+
+        days_used = self.initial_state.days_used
+        pending_tracks = set(self.track_counts)
+
+        def hosts_pending_track_or_nothing(slot) -> bool:
+            tracks_in_room = self.initial_state.room_track_map.get(slot.room_name, set())
+            return not tracks_in_room or bool(tracks_in_room & pending_tracks)
+
+        on_used_days = [s for s in open_slots if s.start.date() in days_used]
+        candidates = [[s for s in on_used_days if hosts_pending_track_or_nothing(s)], on_used_days, open_slots]
+
+        for neighbourhood in candidates:
+            if locked_space + sum(s.available_space for s in neighbourhood) >= self.total_works:
+                break
+
+        selected_ids = {s.id for s in locked_slots + neighbourhood}
+        self.all_slots = [s for s in self.all_slots if s.id in selected_ids]
+        self.total_slots = len(self.all_slots)
+        logger.info(f"Repair neighbourhood: {self.total_slots} slots for {self.total_works} pending works")
+
     def _initialize_slots(
         self,
-        slots: List[EventRoomSlotModel],
-        all_works_map: Dict[UUID, WorkModel],
+        slots: List[SolverSlot],
+        all_works_map: Dict[UUID, SolverWork],
         state: SearchState,
         track_counts: Dict[str, int],
         assigned_work_ids: Set[UUID],
@@ -113,39 +252,39 @@ class ConfigurableBBScheduler:
         for slot in slots:
             slot_duration = (slot.end - slot.start).total_seconds() / 60
             slot.total_capacity = int(slot_duration // self.time_per_work)
-            num_existing_works = len(slot.work_links)
+            num_existing_works = len(slot.work_ids)
             slot.available_space = slot.total_capacity - num_existing_works
 
             if num_existing_works > 0:
-                self._handle_slot_pre_assignment(
-                    slot, all_works_map, state, track_counts, assigned_work_ids, num_existing_works
-                )
+                self._handle_slot_pre_assignment(slot, all_works_map, state, track_counts, assigned_work_ids)
 
     def _handle_slot_pre_assignment(
-        self, slot, works_map: Dict[UUID, WorkModel], state, track_counts, assigned_ids: Set[UUID], num_existing
+        self, slot, works_map: Dict[UUID, SolverWork], state, track_counts, assigned_ids: Set[UUID]
     ):
         try:
-            first_work_id = slot.work_links[0].work_id
+            first_work_id = slot.work_ids[0]
             first_work = works_map.get(first_work_id)
 
             if not first_work:
                 logger.warning(f"Could not find work {first_work_id} for slot {slot.id}")
                 return
 
-            track_name = cast(str, first_work.track)
-            slot_id = cast(int, slot.id)
+            track_name = first_work.track
+            slot_id = slot.id
 
             self.slot_pre_assigned_track[slot_id] = track_name
 
-            for link in slot.work_links:
-                assigned_ids.add(link.work_id)
+            assigned_ids.update(slot.work_ids)
 
-            track_counts[track_name] -= num_existing
+            # Manual moves can leave works of several tracks in a slot: each one is taken off its own track.
+            for work_id in slot.work_ids:
+                work = works_map.get(work_id)
+                if work is not None:
+                    track_counts[work.track] -= 1
             state.slot_track_map[slot_id] = track_name
 
-            # FIX 4: Use dates instead of datetime columns
-            start_date = cast(datetime, slot.start).date()
-            end_date = cast(datetime, slot.end).date()
+            start_date = slot.start.date()
+            end_date = slot.end.date()
             state.track_time_usage.setdefault(track_name, []).append((start_date, end_date))
 
             self._apply_cost_for_assignment(state, slot, track_name)
@@ -155,12 +294,12 @@ class ConfigurableBBScheduler:
 
     def _apply_cost_for_assignment(self, state, slot, track_name):
         """Updates state cost and sets for day/room usage."""
-        day = cast(datetime, slot.start).date()
+        day = slot.start.date()
         if day not in state.days_used:
             state.days_used.add(day)
             state.current_cost += self.penalties.per_distinct_day
 
-        room_name = cast(str, slot.room_name)
+        room_name = slot.room_name
         tracks_in_room = state.room_track_map.get(room_name, set())
         if track_name not in tracks_in_room:
             if tracks_in_room:
@@ -170,21 +309,130 @@ class ConfigurableBBScheduler:
     def solve(self, greedy_cost_bound=float("inf")):
         logger.info(f"Starting B&B with initial cost bound: {greedy_cost_bound}")
         self.global_best_cost = greedy_cost_bound
-        self._search(self.initial_state)
-        logger.info(f"B&B search complete. Optimal cost found: {self.global_best_cost}")
+        self.transposition_table.clear()
+        self.stats = SolverStats()
+        self._progress_path = []
+        self._subproblems_done = self._subproblems_total = 0
+        if self.workers > 1 and self.total_slots > self.split_depth:
+            run_parallel_search(self, self.workers)
+        else:
+            self._search(self.initial_state)
+            self._collect_transposition_stats()
+        # The parallel search returns early when cancelled.
+        if self._cancel_requested:
+            raise SolveCancelled()
+        logger.info(f"B&B search complete. Optimal cost found: {self.global_best_cost}. Stats: {self.stats}")
+
+        planned_slots = [slot for slot in self.slot_map.values() if slot.id in self.global_best_solution]
+        final_work_assignments = self.placement.place(self.global_best_solution, self.works_by_track, planned_slots)
+
+        # The search only counts works per track: works a backend can't place because of
+        # their own constraints are charged as unassigned on top of the plan cost.
+        shortfall = self._planned_placements() - len(final_work_assignments)
+        if shortfall > 0:
+            logger.info(f"Placement left {shortfall} planned works unassigned")
+            self.global_best_cost += shortfall * self.penalties.unassigned_work
+        return final_work_assignments, self.global_best_cost
 
-        final_work_assignments = []
-        works_map_copy = {track: list(works) for track, works in self.works_by_track.items()}
+    def cancel(self) -> None:
+        """Asks a running `solve`, in another thread, to stop: it raises SolveCancelled soon after."""
+        self._cancel_requested = True
+
+    @property
+    def cancel_requested(self) -> bool:
+        return self._cancel_requested
+
+    def progress(self) -> float:
+        """
+        Estimated fraction of the search done, from 0 to 1, readable from another thread while
+        `solve` runs: the finished subproblems of a parallel search, or the share of the tree
+        left behind by the branches taken near the root.
+        """
+        if self._subproblems_total:
+            return self._subproblems_done / self._subproblems_total
+        fraction, weight = 0.0, 1.0
+        for taken, branches in list(self._progress_path):
+            fraction += weight * taken / branches
+            weight /= branches
+        return fraction
+
+    def record_subproblems(self, done: int, total: int) -> None:
+        self._subproblems_done = done
+        self._subproblems_total = total
+
+    def cost_breakdown(self, assignments: List[Tuple[SolverWork, SolverSlot]]) -> CostBreakdown:
+        """Splits the cost of the best solution, given the placement `solve` returned for it."""
+        days = {self.slot_map[slot_id].start.date() for slot_id in self.global_best_solution}
+        tracks_by_room: Dict[str, Set[str]] = {}
+        for slot_id, track_name in self.global_best_solution.items():
+            tracks_by_room.setdefault(self.slot_map[slot_id].room_name, set()).add(track_name)
+        room_track_mixes = sum(len(tracks) - 1 for tracks in tracks_by_room.values())
+        unassigned_works = self.total_works - len(assignments)
+        return CostBreakdown(
+            distinct_days=len(days),
+            distinct_days_cost=len(days) * self.penalties.per_distinct_day,
+            room_track_mixes=room_track_mixes,
+            room_track_mixes_cost=room_track_mixes * self.penalties.per_room_track_mix,
+            unassigned_works=unassigned_works,
+            unassigned_works_cost=unassigned_works * self.penalties.unassigned_work,
+        )
 
+    def _planned_placements(self) -> int:
+        space_by_track: Dict[str, int] = {}
         for slot_id, track_name in self.global_best_solution.items():
-            slot = self.slot_map[slot_id]
-            for _ in range(slot.available_space):
-                if works_map_copy.get(track_name):
-                    work_obj = works_map_copy[track_name].pop()
-                    final_work_assignments.append((work_obj, slot))
-                else:
-                    break
-        return final_work_assignments, self.global_best_cost
+            space_by_track[track_name] = space_by_track.get(track_name, 0) + self.slot_map[slot_id].available_space
+        return sum(min(count, space_by_track.get(track, 0)) for track, count in self.track_counts.items())
+
+    def split_subproblems(self) -> List[SearchState]:
+        """
+        Expands the first `split_depth` slot decisions and returns the reached states,
+        in the same depth-first order the serial search would visit them.
+        """
+        self._frontier_depth = self.split_depth
+        self._frontier = []
+        try:
+            self._search(self.initial_state)
+            self._collect_transposition_stats()
+            return self._frontier
+        finally:
+            self._frontier_depth = None
+            self._frontier = []
+            self.transposition_table.clear()
+
+    def solve_subproblem(self, state: SearchState) -> Tuple[float, Dict[int, str], SolverStats]:
+        """
+        Searches the subtree rooted at `state` on its own, so the result only depends on the
+        subproblem and not on which worker ran it or what it ran before.
+        """
+        self.global_best_cost = float("inf")
+        self.global_best_solution = {}
+        self.transposition_table.clear()
+        self.stats = SolverStats()
+        self._search(state)
+        self._collect_transposition_stats()
+        return self.global_best_cost, self.global_best_solution, self.stats
+
+    def attach_shared_incumbent(self, shared_best_cost, lock, shared_cancel) -> None:
+        self._shared_best_cost = shared_best_cost
+        self._shared_best_lock = lock
+        self._shared_cancel = shared_cancel
+
+    def _is_cancelled(self) -> bool:
+        return self._cancel_requested or (self._shared_cancel is not None and bool(self._shared_cancel.value))
+
+    def _is_bounded_out(self, bound: float) -> bool:
+        if bound >= self.global_best_cost:
+            return True
+        # Strict comparison against other workers: ties are kept so that every subproblem
+        # still finds its first optimal solution and the merged result is deterministic.
+        return self._shared_best_cost is not None and bound > self._shared_best_cost.value
+
+    def _publish_best_cost(self, cost: float) -> None:
+        if self._shared_best_cost is None:
+            return
+        with self._shared_best_lock:
+            if cost < self._shared_best_cost.value:
+                self._shared_best_cost.value = cost
 
     def _calculate_bound(self, state: SearchState) -> float:
         current_cost = state.current_cost
@@ -197,16 +445,51 @@ class ConfigurableBBScheduler:
         future_unassigned_works = max(0, works_still_needed - total_remaining_space)
         return current_cost + (future_unassigned_works * self.penalties.unassigned_work)
 
+    def _state_key(self, state: SearchState) -> Hashable:
+        """
+        Canonical key of everything that determines the cost of the remaining search.
+        The per-slot track choices are left out: different orders that lead to the
+        same counts, days, room mixes and track time usage share the same future.
+        """
+        return (
+            state.slot_index,
+            tuple(sorted(state.track_work_counts_remaining.items())),
+            frozenset(state.days_used),
+            frozenset((room, frozenset(tracks)) for room, tracks in state.room_track_map.items() if tracks),
+            frozenset(
+                (track, tuple(sorted(intervals))) for track, intervals in state.track_time_usage.items() if intervals
+            ),
+        )
+
+    def _collect_transposition_stats(self):
+        self.stats.transposition_hits = self.transposition_table.hits
+        self.stats.transposition_misses = self.transposition_table.misses
+        self.stats.transposition_evictions = self.transposition_table.evictions
+
     def _search(self, state: SearchState):
+        self.stats.nodes_explored += 1
+        if self.stats.nodes_explored % CANCEL_CHECK_NODES == 0 and self._is_cancelled():
+            raise SolveCancelled()
         if state.slot_index >= self.total_slots:
             self._update_best_solution(state)
             return
 
-        if self._calculate_bound(state) >= self.global_best_cost:
+        if self._is_bounded_out(self._calculate_bound(state)):
+            self.stats.bound_prunes += 1
+            return
+
+        if self.transposition_table.enabled and self.transposition_table.is_dominated(
+            self._state_key(state), state.current_cost
+        ):
+            self.stats.transposition_prunes += 1
+            return
+
+        if self._frontier_depth is not None and state.slot_index >= self._frontier_depth:
+            self._frontier.append(copy.deepcopy(state))
             return
 
         slot_to_try = self.all_slots[state.slot_index]
-        slot_id = cast(int, slot_to_try.id)
+        slot_id = slot_to_try.id
         pre_assigned_track = self.slot_pre_assigned_track.get(slot_id)
 
         if pre_assigned_track:
@@ -222,6 +505,7 @@ class ConfigurableBBScheduler:
             logger.info(f"New best solution found! Cost: {final_cost}")
             self.global_best_cost = final_cost
             self.global_best_solution = dict(state.slot_track_map)
+            self._publish_best_cost(final_cost)
 
     def _process_pre_assigned_slot(self, state: SearchState, slot, track_name: str):
         """Handles recursion for a slot that already has a track locked."""
@@ -242,27 +526,38 @@ class ConfigurableBBScheduler:
     def _process_open_slot(self, state: SearchState, slot):
         """Tries all valid tracks for an open slot, then tries skipping the slot."""
         tracks_with_work = [t for t in self.available_tracks if state.track_work_counts_remaining.get(t, 0) > 0]
+        # Every branch restores the state, so the conflicts can be found upfront.
+        tracks_to_try = [t for t in tracks_with_work if not _has_time_conflict(state, t, slot)]
 
-        for track_name in tracks_with_work:
-            if _has_time_conflict(state, track_name, slot):
-                continue
+        progress = None
+        if state.slot_index < PROGRESS_DEPTH:
+            progress = [0, len(tracks_to_try) + 1]
+            self._progress_path.append(progress)
 
+        for branch, track_name in enumerate(tracks_to_try):
+            if progress is not None:
+                progress[0] = branch
             self._assign_track_and_recurse(state, slot, track_name)
 
         # Option: Leave slot empty for now (skip)
+        if progress is not None:
+            progress[0] = len(tracks_to_try)
         state.slot_index += 1
         self._search(state)
         state.slot_index -= 1
 
+        if progress is not None:
+            self._progress_path.pop()
+
     def _assign_track_and_recurse(self, state: SearchState, slot, track_name: str):
         works_assigned = min(slot.available_space, state.track_work_counts_remaining[track_name])
 
         # Calculate Deltas
         cost_increase = 0
-        day = cast(datetime, slot.start).date()
+        day = slot.start.date()
         is_new_day = day not in state.days_used
 
-        room_name = cast(str, slot.room_name)
+        room_name = slot.room_name
         tracks_in_room = state.room_track_map.get(room_name, set())
         is_new_track = track_name not in tracks_in_room
         is_mix = is_new_track and len(tracks_in_room) > 0
@@ -276,14 +571,14 @@ class ConfigurableBBScheduler:
         state.current_cost += cost_increase
         state.slot_index += 1
 
-        slot_id = cast(int, slot.id)
+        slot_id = slot.id
         state.slot_track_map[slot_id] = track_name
 
         state.track_work_counts_remaining[track_name] -= works_assigned
 
         # Use simple date objects for storage
-        start_date = cast(datetime, slot.start).date()
-        end_date = cast(datetime, slot.end).date()
+        start_date = slot.start.date()
+        end_date = slot.end.date()
         state.track_time_usage.setdefault(track_name, []).append((start_date, end_date))
 
         if is_new_day:
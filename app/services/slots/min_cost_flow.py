@@ -0,0 +1,84 @@
+from collections import deque
+from dataclasses import dataclass
+from typing import List, Tuple
+
+INFINITE_CAPACITY = float("inf")
+
+
+@dataclass(slots=True)
+class _Edge:
+    to: int
+    capacity: float
+    cost: int
+    flow: float = 0
+
+
+class MinCostFlow:
+    """
+    Min-cost flow by successive shortest augmenting paths (Bellman-Ford with a queue).
+
+    Each augmentation pushes the bottleneck capacity of the path, so graphs where many
+    units share the same edges (e.g. works grouped by track) are solved in few iterations.
+    """
+
+    def __init__(self, nodes: int):
+        self.graph: List[List[int]] = [[] for _ in range(nodes)]
+        self.edges: List[_Edge] = []
+
+    def add_edge(self, source: int, target: int, capacity: float, cost: int) -> int:
+        """Adds an edge and returns its id, to read the flow through it after solving."""
+        edge_id = len(self.edges)
+        self.graph[source].append(edge_id)
+        self.edges.append(_Edge(target, capacity, cost))
+        self.graph[target].append(edge_id + 1)
+        self.edges.append(_Edge(source, 0, -cost))
+        return edge_id
+
+    def flow(self, edge_id: int) -> float:
+        return self.edges[edge_id].flow
+
+    def solve(self, source: int, sink: int) -> Tuple[float, float]:
+        """Sends as much flow as possible from source to sink at minimum cost. Returns (flow, cost)."""
+        total_flow, total_cost = 0.0, 0.0
+        while True:
+            parent_edge = self._shortest_path(source, sink)
+            if parent_edge[sink] == -1:
+                return total_flow, total_cost
+
+            bottleneck = INFINITE_CAPACITY
+            node = sink
+            while node != source:
+                edge = self.edges[parent_edge[node]]
+                bottleneck = min(bottleneck, edge.capacity - edge.flow)
+                node = self.edges[parent_edge[node] ^ 1].to
+
+            node = sink
+            while node != source:
+                edge_id = parent_edge[node]
+                self.edges[edge_id].flow += bottleneck
+                self.edges[edge_id ^ 1].flow -= bottleneck
+                total_cost += bottleneck * self.edges[edge_id].cost
+                node = self.edges[edge_id ^ 1].to
+            total_flow += bottleneck
+
+    def _shortest_path(self, source: int, sink: int) -> List[int]:
+        distance = [INFINITE_CAPACITY] * len(self.graph)
+        parent_edge = [-1] * len(self.graph)
+        in_queue = [False] * len(self.graph)
+        distance[source] = 0
+        queue = deque([source])
+        while queue:
+            node = queue.popleft()
+            in_queue[node] = False
+            for edge_id in self.graph[node]:
+                edge = self.edges[edge_id]
+                if edge.capacity - edge.flow <= 0:
+                    continue
+                new_distance = distance[node] + edge.cost
+                if new_distance < distance[edge.to]:
+                    distance[edge.to] = new_distance
+                    parent_edge[edge.to] = edge_id
+                    if not in_queue[edge.to]:
+                        in_queue[edge.to] = True
+                        queue.append(edge.to)
+        return parent_edge
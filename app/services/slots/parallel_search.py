@@ -0,0 +1,69 @@
+import logging
+import multiprocessing
+import os
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from app.services.slots.ConfigurableBBScheduler import ConfigurableBBScheduler, SearchState
+
+logger = logging.getLogger(__name__)
+
+# How often the parent looks for a cancellation while the workers search.
+CANCEL_POLL_SECONDS = 0.1
+
+# Each worker process keeps its own copy of the scheduler, set by the pool initializer.
+_worker_scheduler: "ConfigurableBBScheduler | None" = None
+
+
+def _init_worker(scheduler: "ConfigurableBBScheduler", shared_best_cost, lock, shared_cancel) -> None:
+    global _worker_scheduler
+    scheduler.attach_shared_incumbent(shared_best_cost, lock, shared_cancel)
+    _worker_scheduler = scheduler
+
+
+def _solve_subproblem(state: "SearchState"):
+    assert _worker_scheduler is not None
+    return _worker_scheduler.solve_subproblem(state)
+
+
+def run_parallel_search(scheduler: "ConfigurableBBScheduler", workers: int) -> None:
+    """
+    Splits the search tree at the first `scheduler.split_depth` slot decisions and solves
+    every subproblem in a process pool. Workers share the best cost found so far through
+    shared memory, so a good solution in one worker tightens pruning in all of them.
+
+    The merged result is deterministic: among the subproblems reaching the optimal cost,
+    the first one in depth-first order wins, which is the solution the serial search returns.
+
+    When the scheduler is cancelled, the workers stop through a shared flag and this returns
+    without merging anything.
+    """
+    subproblems = scheduler.split_subproblems()
+    workers = max(1, min(workers, os.cpu_count() or 1, len(subproblems)))
+    logger.info(f"Starting parallel B&B: {len(subproblems)} subproblems on {workers} workers")
+    if not subproblems:
+        return
+
+    shared_best_cost = multiprocessing.RawValue("d", scheduler.global_best_cost)
+    shared_cancel = multiprocessing.RawValue("b", 0)
+    lock = multiprocessing.Lock()
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(scheduler, shared_best_cost, lock, shared_cancel)
+    ) as executor:
+        futures = [executor.submit(_solve_subproblem, state) for state in subproblems]
+        pending = set(futures)
+        while pending:
+            if scheduler.cancel_requested:
+                shared_cancel.value = 1
+                executor.shutdown(cancel_futures=True)
+                return
+            _, pending = wait(pending, timeout=CANCEL_POLL_SECONDS, return_when=FIRST_COMPLETED)
+            scheduler.record_subproblems(len(futures) - len(pending), len(futures))
+        results = [future.result() for future in futures]
+
+    for cost, solution, stats in results:
+        scheduler.stats.merge(stats)
+        if cost < scheduler.global_best_cost:
+            scheduler.global_best_cost = cost
+            scheduler.global_best_solution = solution
@@ -0,0 +1,228 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import TYPE_CHECKING, Dict, Iterable, List, Set, Tuple
+from uuid import UUID
+
+from app.schemas.events.assing_works_parameters import PlacementStrategy
+from app.services.slots.min_cost_flow import INFINITE_CAPACITY, MinCostFlow
+
+if TYPE_CHECKING:
+    from app.services.slots.ConfigurableBBScheduler import SolverSlot, SolverWork
+
+Placement = List[Tuple["SolverWork", "SolverSlot"]]
+
+
+class PlacementBackend(ABC):
+    """
+    Fills the slots of a track plan (slot id -> track chosen by the branch and bound)
+    with concrete works, using at most the available space of every slot.
+    """
+
+    @abstractmethod
+    def place(
+        self, plan: Dict[int, str], works_by_track: Dict[str, List["SolverWork"]], slots: List["SolverSlot"]
+    ) -> Placement:
+        """`slots` holds the slots of the plan in chronological order."""
+
+
+class GreedyPlacement(PlacementBackend):
+    """
+    Pops works of the planned track into each slot in turn, skipping the works that aren't
+    available then or whose speakers already present a work placed at the same time.
+    """
+
+    def place(self, plan, works_by_track, slots) -> Placement:
+        placement = []
+        calendar = SpeakerCalendar()
+        works_left = {track: list(works) for track, works in works_by_track.items()}
+        for slot in slots:
+            track_works = works_left.get(plan[slot.id], [])
+            space = slot.available_space
+            position = len(track_works) - 1
+            while space and position >= 0:
+                work = track_works[position]
+                if is_available(work, slot) and calendar.is_free(work, slot):
+                    del track_works[position]
+                    calendar.book(work, slot)
+                    placement.append((work, slot))
+                    space -= 1
+                position -= 1
+        return placement
+
+
+class SpeakerCalendar:
+    """When each speaker presents, as works are placed: a speaker can't present two works at once."""
+
+    def __init__(self):
+        self.busy: Dict[str, List[Tuple[datetime, datetime]]] = {}
+
+    def is_free(self, work: "SolverWork", slot: "SolverSlot") -> bool:
+        return not any(
+            _overlaps(start, end, slot.start, slot.end)
+            for speaker in work.speakers
+            for start, end in self.busy.get(speaker, ())
+        )
+
+    def book(self, work: "SolverWork", slot: "SolverSlot") -> None:
+        for speaker in work.speakers:
+            self.busy.setdefault(speaker, []).append((slot.start, slot.end))
+
+
+def time_windows(slots: List["SolverSlot"]) -> List[int]:
+    """
+    The time window of each slot, by position: slots that overlap, directly or through other
+    slots, share a window. `slots` is in chronological order.
+    """
+    windows = []
+    window, window_end = -1, None
+    for slot in slots:
+        if window_end is None or slot.start >= window_end:
+            window, window_end = window + 1, slot.end
+        else:
+            window_end = max(window_end, slot.end)
+        windows.append(window)
+    return windows
+
+
+def speaker_unavailability(
+    slots: List["SolverSlot"], speakers_by_work: Dict[UUID, Iterable[str]]
+) -> Dict[UUID, Tuple[Tuple[datetime, datetime], ...]]:
+    """
+    The time ranges in which each work that is not in a slot can't be presented, because one
+    of its speakers already presents another work in a slot then. Speakers are identified by mail.
+    """
+    speaking: Dict[str, Set[Tuple[datetime, datetime]]] = {}
+    scheduled = set()
+    for slot in slots:
+        for work_id in slot.work_ids:
+            scheduled.add(work_id)
+            for speaker in speakers_by_work.get(work_id, ()):
+                speaking.setdefault(speaker, set()).add((slot.start, slot.end))
+    return {
+        work_id: tuple(sorted(set().union(*(speaking.get(speaker, ()) for speaker in speakers))))
+        for work_id, speakers in speakers_by_work.items()
+        if work_id not in scheduled
+    }
+
+
+def is_available(work: "SolverWork", slot: "SolverSlot") -> bool:
+    return not any(_overlaps(start, end, slot.start, slot.end) for start, end in work.unavailable)
+
+
+def _overlaps(start: datetime, end: datetime, other_start: datetime, other_end: datetime) -> bool:
+    return start < other_end and other_start < end
+
+
+class MinCostFlowPlacement(PlacementBackend):
+    """
+    Solves the placement as a transportation problem: works flow into slots of their
+    planned track where they are available, and slots absorb up to their available space.
+    The flow places as many works as possible, preferring earlier slots.
+
+    Works of a track with the same constraints and speakers are interchangeable, so they are
+    grouped into a single supply node. Without per-work constraints the network has one node
+    per track and is solved in a handful of augmentations.
+
+    The works of a group with speakers reach the slots of a time window through a node of
+    capacity one, as its speakers can present one of them at a time. Works of different groups
+    that share a speaker (e.g. with another co-speaker, or in another track) are kept apart
+    afterwards: the later one moves to a free seat its speakers can take, or stays unplaced.
+    """
+
+    def place(self, plan, works_by_track, slots) -> Placement:
+        group_works = self._interchangeable_works(works_by_track)
+
+        windows = time_windows(slots)
+        group_slots = [self._slots_by_window(works[0], plan, slots, windows) for works in group_works]
+
+        source, sink = 0, 1
+        first_group_node = 2
+        first_slot_node = first_group_node + len(group_works)
+        first_window_node = first_slot_node + len(slots)
+        window_nodes = sum(
+            len(by_window) for works, by_window in zip(group_works, group_slots, strict=True) if works[0].speakers
+        )
+        network = MinCostFlow(first_window_node + window_nodes)
+
+        for slot_position, slot in enumerate(slots):
+            network.add_edge(first_slot_node + slot_position, sink, slot.available_space, 0)
+
+        group_edges: List[List[Tuple[int, "SolverSlot"]]] = []
+        next_window_node = first_window_node
+        for group_position, (works, by_window) in enumerate(zip(group_works, group_slots, strict=True)):
+            group_node = first_group_node + group_position
+            network.add_edge(source, group_node, len(works), 0)
+            edges = []
+            for slot_positions in by_window.values():
+                window_node = group_node
+                if works[0].speakers:
+                    window_node, next_window_node = next_window_node, next_window_node + 1
+                    network.add_edge(group_node, window_node, 1, 0)
+                for slot_position in slot_positions:
+                    edge_id = network.add_edge(
+                        window_node, first_slot_node + slot_position, INFINITE_CAPACITY, slot_position
+                    )
+                    edges.append((edge_id, slots[slot_position]))
+            group_edges.append(edges)
+
+        network.solve(source, sink)
+
+        placement = []
+        for works, edges in zip(group_works, group_edges, strict=True):
+            works_left = iter(works)
+            for edge_id, slot in edges:
+                for _ in range(int(network.flow(edge_id))):
+                    placement.append((next(works_left), slot))
+        return self._keep_speakers_apart(placement, plan, slots)
+
+    @staticmethod
+    def _interchangeable_works(works_by_track: Dict[str, List["SolverWork"]]) -> List[List["SolverWork"]]:
+        groups: Dict[Tuple[str, tuple, frozenset], List["SolverWork"]] = {}
+        for track, works in works_by_track.items():
+            for work in works:
+                groups.setdefault((track, work.unavailable, work.speakers), []).append(work)
+        return list(groups.values())
+
+    @staticmethod
+    def _slots_by_window(
+        work: "SolverWork", plan: Dict[int, str], slots: List["SolverSlot"], windows: List[int]
+    ) -> Dict[int, List[int]]:
+        """The positions of the slots the work can go to, by time window."""
+        by_window: Dict[int, List[int]] = {}
+        for slot_position, slot in enumerate(slots):
+            if plan[slot.id] == work.track and is_available(work, slot):
+                by_window.setdefault(windows[slot_position], []).append(slot_position)
+        return by_window
+
+    @staticmethod
+    def _keep_speakers_apart(placement: Placement, plan: Dict[int, str], slots: List["SolverSlot"]) -> Placement:
+        slot_positions = {slot.id: position for position, slot in enumerate(slots)}
+        calendar = SpeakerCalendar()
+        space = {slot.id: slot.available_space for slot in slots}
+        kept, moved = [], []
+        for work, slot in sorted(placement, key=lambda placed: slot_positions[placed[1].id]):
+            if calendar.is_free(work, slot):
+                calendar.book(work, slot)
+                kept.append((work, slot))
+                space[slot.id] -= 1
+            else:
+                moved.append(work)
+        for work in moved:
+            for slot in slots:
+                if (
+                    space[slot.id]
+                    and plan[slot.id] == work.track
+                    and is_available(work, slot)
+                    and calendar.is_free(work, slot)
+                ):
+                    calendar.book(work, slot)
+                    kept.append((work, slot))
+                    space[slot.id] -= 1
+                    break
+        return kept
+
+
+PLACEMENT_BACKENDS: Dict[PlacementStrategy, type[PlacementBackend]] = {
+    PlacementStrategy.GREEDY: GreedyPlacement,
+    PlacementStrategy.MIN_COST_FLOW: MinCostFlowPlacement,
+}
@@ -1,21 +1,48 @@
-import copy
+import asyncio
+import hashlib
 import logging
-from datetime import datetime
-from uuid import UUID
+from dataclasses import asdict, replace
+from datetime import datetime, timezone
+from typing import Awaitable, Callable
+from uuid import UUID, uuid4
 
-from app.database.models import WorkSlotModel
 from app.database.models.event_room_slot import EventRoomSlotModel
+from app.exceptions.slots_exceptions import AssignmentSolutionNotFound, StaleAssignmentSolution
 from app.repository.events_repository import EventsRepository
 from app.repository.slots_repository import SlotsRepository
 from app.repository.work_slot_repository import WorkSlotRepository
 from app.repository.works_repository import WorksRepository
-from app.schemas.events.assing_works_parameters import AssignWorksParametersSchema
+from app.schemas.events.assignment_preview import (
+    AssignmentPreviewSchema,
+    AssignmentResultSchema,
+    CostBreakdownSchema,
+    ProposedAssignmentSchema,
+)
+from app.schemas.events.assing_works_parameters import AssignWorksParametersSchema, RepairWorksParametersSchema
 from app.schemas.events.slot import SlotSchema
+from app.services.agenda.agenda_read_model import agenda_read_model
 from app.services.services import BaseService
-from app.services.slots.ConfigurableBBScheduler import ConfigurableBBScheduler, CostPenalties
+from app.services.slots.ConfigurableBBScheduler import ConfigurableBBScheduler, CostPenalties, SolverSlot, SolverWork
+from app.services.slots.placement import PLACEMENT_BACKENDS, speaker_unavailability
+from app.services.slots.solution_cache import CachedSolution, SolutionCache
+from app.utils.metrics import SCHEDULER_NODES_EXPLORED, SCHEDULER_SOLVE_DURATION
 
 logger = logging.getLogger(__name__)
 
+# Receives the estimated fraction of the solve done, from 0 to 1, while the search runs.
+SolveProgress = Callable[[float], Awaitable[None]]
+# How often a running solve reports its progress.
+SOLVE_PROGRESS_INTERVAL_SECONDS = 1.0
+
+
+def _as_utc(moment: datetime) -> datetime:
+    # Naive datetimes from the mdata are stored as UTC.
+    return moment.replace(tzinfo=timezone.utc) if moment.tzinfo is None else moment.astimezone(timezone.utc)
+
+
+def _grid_key(room_name: str, start: datetime) -> tuple:
+    return room_name, _as_utc(start)
+
 
 class SlotsConfigurationService(BaseService):
     def __init__(
@@ -25,25 +52,66 @@ class SlotsConfigurationService(BaseService):
         slots_repository: SlotsRepository,
         works_repository: WorksRepository,
         work_slot_repository: WorkSlotRepository,
+        solution_cache: SolutionCache,
     ):
         self.event_id = event_id
         self.events_repository = events_repository
         self.slots_repository = slots_repository
         self.works_repository = works_repository
         self.work_slot_repository = work_slot_repository
+        self.solution_cache = solution_cache
 
     async def configure_event_slots_and_rooms(self):
+        """
+        Materializes the slot grid described by the event mdata (slots x rooms). Existing
+        slots are matched by room and start time: matching slots are updated in place and
+        keep their assigned works, and only the missing or leftover ones are inserted or
+        deleted, all in one transaction. Running it again without changes writes nothing.
+        """
         logger.info(f"Configuring slots and rooms for event {self.event_id}")
         event = await self.events_repository.get(self.event_id)
-        slots = event.mdata.get("slots", [])
-        rooms = event.mdata.get("rooms", [])
-        was_configured = event.mdata.get("was_configured", False)
-        if was_configured:
-            return
+        desired_slots = self._desired_grid(event.mdata.get("slots", []), event.mdata.get("rooms", []))
+        existing_slots = await self.slots_repository.get_grid_slots(self.event_id)
+
+        existing_by_key: dict[tuple, list] = {}
+        for existing in existing_slots:
+            existing_by_key.setdefault(_grid_key(existing.room_name, existing.start), []).append(existing)
+
+        new_slots, updated_slots, unlinked_ids = [], [], []
+        for desired in desired_slots:
+            matches = existing_by_key.get(_grid_key(desired["room_name"], desired["start"]))
+            if not matches:
+                new_slots.append({"event_id": self.event_id, **desired})
+                continue
+            existing = matches.pop(0)
+            if _as_utc(existing.end) != _as_utc(desired["end"]) or any(
+                getattr(existing, column) != desired[column] for column in ("slot_type", "title")
+            ):
+                updated_slots.append({"id": existing.id, **desired})
+                if existing.slot_type == "slot" and desired["slot_type"] != "slot":
+                    unlinked_ids.append(existing.id)
+        deleted_ids = [existing.id for matches in existing_by_key.values() for existing in matches]
+
+        logger.info(
+            f"Slot grid delta for event {self.event_id}: {len(new_slots)} new, {len(updated_slots)} updated, "
+            f"{len(deleted_ids)} deleted"
+        )
+        grid_changed = bool(new_slots or updated_slots or deleted_ids)
+        if grid_changed:
+            await self.slots_repository.apply_grid_changes(new_slots, updated_slots, deleted_ids, unlinked_ids)
+        if grid_changed or not event.mdata.get("was_configured", False):
+            event.mdata["was_configured"] = True
+            # Commits the grid delta too.
+            await self.events_repository.update(self.event_id, {"mdata": event.mdata})
+        if grid_changed:
+            # Only once committed: an agenda read before would cache the old grid under the new version.
+            await agenda_read_model.invalidate(self.event_id)
+        logger.info(f"Finished configuring slots and rooms for event {self.event_id}")
 
+    @staticmethod
+    def _desired_grid(slots: list[dict], rooms: list[dict]) -> list[dict]:
         entries = []
         for slot in slots:
-            logger.info(f"Processing slot: {slot}")
             slot_type = slot.get("type")
             start = slot.get("start")
             end = slot.get("end")
@@ -53,34 +121,27 @@ class SlotsConfigurationService(BaseService):
             if isinstance(end, str):
                 end = datetime.fromisoformat(end)
             if slot_type in ("slot", "break"):
-                logger.info(f"Creating slots for type '{slot_type}' in all rooms")
                 for room in rooms:
                     entries.append(
-                        EventRoomSlotModel(
-                            event_id=self.event_id,
-                            room_name=room.get("name"),
-                            slot_type=slot_type,
-                            start=start,
-                            end=end,
-                            title=title,
-                        )
+                        {
+                            "room_name": room.get("name"),
+                            "slot_type": slot_type,
+                            "start": start,
+                            "end": end,
+                            "title": title,
+                        }
                     )
             elif slot_type == "plenary":
-                logger.info(f"Creating slot for plenary session in room '{rooms[0].get('name')}'")
                 entries.append(
-                    EventRoomSlotModel(
-                        event_id=self.event_id,
-                        room_name=slot.get("room_name"),
-                        slot_type=slot_type,
-                        start=start,
-                        title=title,
-                        end=end,
-                    )
+                    {
+                        "room_name": slot.get("room_name"),
+                        "slot_type": slot_type,
+                        "start": start,
+                        "end": end,
+                        "title": title,
+                    }
                 )
-        await self.slots_repository.bulk_create(entries)
-        event.mdata["was_configured"] = True
-        await self.events_repository.update(self.event_id, {"mdata": event.mdata})
-        logger.info(f"Finished configuring slots and rooms for event {self.event_id}")
+        return entries
 
     async def delete_event_slots_and_rooms(self):
         logger.info(f"Deleting slots and rooms for event {self.event_id}")
@@ -88,6 +149,7 @@ class SlotsConfigurationService(BaseService):
         event = await self.events_repository.get(self.event_id)
         event.mdata["was_configured"] = False
         await self.events_repository.update(self.event_id, {"mdata": event.mdata})
+        await agenda_read_model.invalidate(self.event_id)
         logger.info(f"Finished deleting slots and rooms for event {self.event_id}")
 
     async def delete_event_slot(self, slot_id: int) -> None:
@@ -95,6 +157,7 @@ class SlotsConfigurationService(BaseService):
         logger.info(f"Deleting slot {slot_id} for event {self.event_id}")
         # repository.remove will fetch and delete the object and commit
         await self.slots_repository.remove(slot_id)
+        await agenda_read_model.mark_slots_dirty(self.event_id, [slot_id])
         logger.info(f"Deleted slot {slot_id} for event {self.event_id}")
 
     async def create_event_slot(self, new_slot: SlotSchema) -> EventRoomSlotModel:
@@ -108,6 +171,7 @@ class SlotsConfigurationService(BaseService):
             end=new_slot.end,
         )
         created = await self.slots_repository._create(db_in)
+        await agenda_read_model.mark_slots_dirty(self.event_id, [created.id])
         logger.info(f"Created slot {created.id} for event {self.event_id}")
         return created
 
@@ -121,6 +185,7 @@ class SlotsConfigurationService(BaseService):
             "title": new_slot.title,
         }
         result = await self.slots_repository.update(slot_id, update_data)
+        await agenda_read_model.mark_slots_dirty(self.event_id, [slot_id])
         logger.info(f"Updated slot {slot_id} for event {self.event_id}")
         return result
 
@@ -128,40 +193,140 @@ class SlotsConfigurationService(BaseService):
         logger.info(f"Fetching slots with works for event {self.event_id}")
         slots = await self.slots_repository.get_by_event_id_with_works(self.event_id)
         logger.info(f"Fetched {len(slots)} slots with works for event {self.event_id}")
-        logger.info(f"Slots obtained: {slots}")
         return slots
 
     async def delete_slot_work(self, work_id: UUID):
         logger.info(f"Removing assignment for work {work_id}")
         await self.work_slot_repository.remove_for_work_id(work_id)
+        await agenda_read_model.mark_works_dirty(self.event_id, [work_id])
         logger.info(f"Removed assignment for work {work_id}")
 
     async def assign_work_to_slot(self, slots_id: int, work_id: UUID):
         logger.info(f"Assigning work {work_id} to slot {slots_id}")
         await self.work_slot_repository.add_work_to_slot_by_id(slots_id, work_id)
+        await agenda_read_model.mark_slots_dirty(self.event_id, [slots_id])
 
     async def delete_all_assignments(self):
         logger.info(f"Deleting all assigned works in event {self.event_id}")
         await self.work_slot_repository.delete_assigned_works_by_event_id(self.event_id)
+        await agenda_read_model.invalidate(self.event_id)
 
-    async def assign_works_to_slots(self, parameters: AssignWorksParametersSchema):
+    async def assign_works_to_slots(
+        self, parameters: AssignWorksParametersSchema, on_progress: SolveProgress | None = None
+    ):
         """
-        (This is your main function from the class 'YourAssignmentService')
+        Solves the assignment and writes it. A solution previewed with the same parameters
+        and data is reused instead of running the search again.
         """
         logger.info(f"Starting new optimal assignment with parameters: {parameters}")
+        solution = await self._get_solution(
+            parameters, reset=parameters.reset_previous_assignments, repair=False, on_progress=on_progress
+        )
+        if solution is None:
+            if parameters.reset_previous_assignments:
+                await self.delete_all_assignments()
+            return {"message": "No works or slots to assign."}
+        return await self._save_solution(solution)
+
+    async def repair_assignments(
+        self, parameters: RepairWorksParametersSchema, on_progress: SolveProgress | None = None
+    ):
+        """
+        Places the works left without a slot after manual edits (new approved works,
+        deleted slots, moved works) keeping every existing assignment fixed, and only
+        searching the slots around the current schedule.
+        """
+        logger.info(f"Starting assignment repair with parameters: {parameters}")
+        solution = await self._get_solution(parameters, reset=False, repair=True, on_progress=on_progress)
+        if solution is None:
+            return {"message": "No works or slots to assign."}
+        return await self._save_solution(solution)
+
+    async def preview_assignment(
+        self, parameters: AssignWorksParametersSchema, on_progress: SolveProgress | None = None
+    ) -> AssignmentPreviewSchema | None:
+        """Solves the assignment without writing it. The solution stays cached to be committed."""
+        logger.info(f"Previewing assignment with parameters: {parameters}")
+        solution = await self._get_solution(
+            parameters, reset=parameters.reset_previous_assignments, repair=False, on_progress=on_progress
+        )
+        if solution is None:
+            return None
+        return AssignmentPreviewSchema(
+            solution_id=solution.id,
+            data_version=solution.data_version,
+            replaces_assignments=solution.replaces_assignments,
+            final_cost=solution.final_cost,
+            is_optimal=solution.is_optimal,
+            cost_breakdown=CostBreakdownSchema.model_validate(solution.cost_breakdown),
+            assignments=[
+                ProposedAssignmentSchema(work_id=work_id, slot_id=slot_id) for work_id, slot_id in solution.links
+            ],
+        )
+
+    async def commit_solution(self, solution_id: UUID):
+        """Writes a previewed solution, as long as the slots and works didn't change since."""
+        solution = await self.solution_cache.get(solution_id)
+        if solution is None or solution.event_id != self.event_id:
+            raise AssignmentSolutionNotFound(self.event_id, solution_id)
 
-        if parameters.reset_previous_assignments:
-            logger.info("Resetting previous assignments...")
-            await self.delete_all_assignments()
+        slots, works = await self._get_solver_inputs()
+        if self._data_version(slots, works) != solution.data_version:
+            raise StaleAssignmentSolution(self.event_id, solution_id)
+        return await self._save_solution(solution)
 
-        available_slots = await self.slots_repository.get_slots_by_event_id_with_works(self.event_id)
-        assignable_works = await self.works_repository.get_all_approved_works_for_event(
-            self.event_id, offset=0, limit=9999
+    async def _save_solution(self, solution: CachedSolution) -> AssignmentResultSchema:
+        await self.work_slot_repository.save_event_assignments(
+            self.event_id, solution.links, replace=solution.replaces_assignments
+        )
+        if solution.replaces_assignments:
+            await agenda_read_model.invalidate(self.event_id)
+        else:
+            await agenda_read_model.mark_slots_dirty(self.event_id, {slot_id for _, slot_id in solution.links})
+        logger.info(f"Saved {len(solution.links)} assignments of solution {solution.id}")
+        return AssignmentResultSchema(
+            solution_id=solution.id,
+            assignments_created=len(solution.links),
+            unassigned_works=solution.cost_breakdown.unassigned_works,
+            final_cost=solution.final_cost,
+            is_optimal=solution.is_optimal,
+            cost_breakdown=CostBreakdownSchema.model_validate(solution.cost_breakdown),
+            search_stats=asdict(solution.search_stats),
         )
 
+    async def _get_solution(
+        self, parameters: RepairWorksParametersSchema, reset: bool, repair: bool, on_progress: SolveProgress | None
+    ) -> CachedSolution | None:
+        available_slots, assignable_works = await self._get_solver_inputs()
         if not assignable_works or not available_slots:
             logger.warning("No assignable works or available slots.")
-            return {"message": "No works or slots to assign."}
+            return None
+
+        data_version = self._data_version(available_slots, assignable_works)
+        # The number of workers doesn't change the solution, only how fast it is found.
+        cache_key = (self.event_id, parameters.model_dump_json(exclude={"workers"}), reset, repair, data_version)
+        return await self.solution_cache.get_or_solve(
+            cache_key,
+            lambda: self._solve(
+                parameters, available_slots, assignable_works, data_version, reset, repair, on_progress
+            ),
+        )
+
+    async def _solve(
+        self,
+        parameters: RepairWorksParametersSchema,
+        available_slots: list[SolverSlot],
+        assignable_works: list[SolverWork],
+        data_version: str,
+        reset: bool,
+        repair: bool,
+        on_progress: SolveProgress | None,
+    ) -> CachedSolution:
+        if reset:
+            # The speakers are only busy in the assignments being replaced: the placement keeps the
+            # works they present in the new ones apart.
+            available_slots = [replace(slot, work_ids=()) for slot in available_slots]
+            assignable_works = [replace(work, unavailable=()) for work in assignable_works]
 
         # --- 2. Define Penalties ---
         # You can customize these priorities
@@ -176,37 +341,99 @@ class SlotsConfigurationService(BaseService):
         # --- 4. Run Branch and Bound Algorithm ---
         logger.info("Starting Branch and Bound search for optimal cost...")
 
-        # Pass deepcopies so the original data isn't modified
-        available_slots_list = list(available_slots)
         scheduler = ConfigurableBBScheduler(
-            works=copy.deepcopy(assignable_works),
-            slots=copy.deepcopy(available_slots_list),
+            works=assignable_works,
+            slots=available_slots,
             time_per_work=parameters.time_per_work,
             penalties=penalties,
+            workers=parameters.workers,
+            placement=PLACEMENT_BACKENDS[parameters.placement](),
         )
+        if repair:
+            scheduler.restrict_to_neighbourhood()
 
         # Pass the greedy solution's cost as the initial bound
-        optimal_assignments_list, optimal_cost = scheduler.solve(greedy_cost_bound=initial_greedy_cost)
+        solve_mode = "repair" if repair else "full"
+        with SCHEDULER_SOLVE_DURATION.time(mode=solve_mode):
+            optimal_assignments_list, optimal_cost = await self._run_solver(scheduler, initial_greedy_cost, on_progress)
+        SCHEDULER_NODES_EXPLORED.observe(scheduler.stats.nodes_explored, mode=solve_mode)
 
         # --- 5. Finalization ---
-        assignments_created = len(optimal_assignments_list)
-        unassigned_works = len(assignable_works) - assignments_created
-
+        cost_breakdown = scheduler.cost_breakdown(optimal_assignments_list)
         logger.info(f"Optimal assignment complete. Final Cost: {optimal_cost}")
-        logger.info(f"Assignments: {assignments_created}, Unassigned: {unassigned_works}")
+        logger.info(f"Assignments: {len(optimal_assignments_list)}, Unassigned: {cost_breakdown.unassigned_works}")
+        logger.info(f"Search stats: {scheduler.stats}")
 
-        new_links_to_create = [
-            WorkSlotModel(work_id=work.id, slot_id=slot.id) for work, slot in optimal_assignments_list
-        ]
+        solution = CachedSolution(
+            id=uuid4(),
+            event_id=self.event_id,
+            data_version=data_version,
+            replaces_assignments=reset,
+            is_optimal=not repair,
+            links=tuple((work.id, slot.id) for work, slot in optimal_assignments_list),
+            final_cost=optimal_cost,
+            cost_breakdown=cost_breakdown,
+            search_stats=scheduler.stats,
+        )
+        return solution
 
-        if new_links_to_create:
-            # Assuming a bulk_create method on your repository
-            await self.work_slot_repository.add_all(new_links_to_create)
-            logger.info("Successfully saved optimal assignments to the database.")
+    @staticmethod
+    async def _run_solver(
+        scheduler: ConfigurableBBScheduler, initial_cost: float, on_progress: SolveProgress | None
+    ) -> tuple[list, float]:
+        """
+        Runs the search in a thread, which also waits for the worker processes of a parallel search,
+        as it is CPU bound and can take minutes: the event loop keeps serving (and beating the
+        heartbeats of jobs) meanwhile. When the caller is cancelled, or `on_progress` raises, the
+        search is stopped and waited for before the error goes on, so it doesn't keep burning CPU.
+        """
+        solving = asyncio.ensure_future(asyncio.to_thread(scheduler.solve, initial_cost))
+        try:
+            while True:
+                done, _ = await asyncio.wait({solving}, timeout=SOLVE_PROGRESS_INTERVAL_SECONDS)
+                if done:
+                    return solving.result()
+                if on_progress is not None:
+                    await on_progress(scheduler.progress())
+        except BaseException:
+            if not solving.done():
+                scheduler.cancel()
+                await asyncio.wait({solving})
+                # The search ended with SolveCancelled: the original error is the one to raise.
+                solving.exception()
+            raise
 
-        return {
-            "assignments_created": assignments_created,
-            "unassigned_works": unassigned_works,
-            "final_cost": optimal_cost,
-            "is_optimal": True,
+    async def _get_solver_inputs(self) -> tuple[list[SolverSlot], list[SolverWork]]:
+        slots = await self._get_solver_slots()
+        return slots, await self._get_solver_works(slots)
+
+    @staticmethod
+    def _data_version(slots: list[SolverSlot], works: list[SolverWork]) -> str:
+        """Fingerprint of everything the solver reads: changes whenever a solution may go stale."""
+        digest = hashlib.sha256()
+        for slot in sorted(slots, key=lambda s: s.id):
+            digest.update(f"{slot.id}|{slot.room_name}|{slot.start}|{slot.end}|{sorted(slot.work_ids)}\n".encode())
+        for work in sorted(works, key=lambda w: w.id):
+            digest.update(f"{work.id}|{work.track}|{work.unavailable}|{sorted(work.speakers)}\n".encode())
+        return digest.hexdigest()
+
+    async def _get_solver_slots(self) -> list[SolverSlot]:
+        rows = await self.slots_repository.get_solver_slots(self.event_id)
+        return [
+            SolverSlot(id=row.id, room_name=row.room_name, start=row.start, end=row.end, work_ids=tuple(row.work_ids))
+            for row in rows
+        ]
+
+    async def _get_solver_works(self, slots: list[SolverSlot]) -> list[SolverWork]:
+        rows = await self.works_repository.get_approved_works_for_scheduling(self.event_id)
+        speakers_by_work = {
+            row.id: frozenset(author["mail"].lower() for author in row.authors if author.get("is_speaker"))
+            for row in rows
         }
+        unavailable = speaker_unavailability(slots, speakers_by_work)
+        return [
+            SolverWork(
+                id=row.id, track=row.track, unavailable=unavailable.get(row.id, ()), speakers=speakers_by_work[row.id]
+            )
+            for row in rows
+        ]
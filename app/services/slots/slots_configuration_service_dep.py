@@ -3,12 +3,14 @@ from uuid import UUID
 
 from fastapi import Depends
 
+from app.cache.cache import Cache, get_cache
 from app.repository.events_repository import EventsRepository
 from app.repository.repository import get_repository
 from app.repository.slots_repository import SlotsRepository
 from app.repository.work_slot_repository import WorkSlotRepository
 from app.repository.works_repository import WorksRepository
 from app.services.slots.slots_configuration_service import SlotsConfigurationService
+from app.services.slots.solution_cache import SolutionCache
 
 
 class SlotsConfigurationChecker:
@@ -19,9 +21,15 @@ class SlotsConfigurationChecker:
         slots_repository: Annotated[SlotsRepository, Depends(get_repository(SlotsRepository))],
         works_repository: Annotated[WorksRepository, Depends(get_repository(WorksRepository))],
         work_slot_repository: Annotated[WorkSlotRepository, Depends(get_repository(WorkSlotRepository))],
+        solutions: Annotated[Cache, Depends(get_cache("solutions"))],
     ) -> SlotsConfigurationService:
         return SlotsConfigurationService(
-            event_id, events_repository, slots_repository, works_repository, work_slot_repository
+            event_id,
+            events_repository,
+            slots_repository,
+            works_repository,
+            work_slot_repository,
+            SolutionCache(solutions),
         )
 
 
@@ -0,0 +1,93 @@
+import hashlib
+import json
+from dataclasses import asdict, dataclass
+from typing import Awaitable, Callable, Hashable, Tuple
+from uuid import UUID
+
+from app.cache.cache import Cache
+from app.cache.codec import Codec
+from app.services.slots.ConfigurableBBScheduler import CostBreakdown, SolverStats
+
+DEFAULT_SOLUTION_TTL_SECONDS = 60 * 60
+
+
+@dataclass(slots=True)
+class CachedSolution:
+    """A solved assignment that can be shown to the organizers and committed later."""
+
+    id: UUID
+    event_id: UUID
+    data_version: str
+    replaces_assignments: bool
+    is_optimal: bool
+    links: Tuple[Tuple[UUID, int], ...]
+    final_cost: float
+    cost_breakdown: CostBreakdown
+    search_stats: SolverStats
+
+
+class SolutionCodec(Codec[CachedSolution]):
+    """Solutions as JSON. A new field or a change of meaning needs a new version."""
+
+    version = "solution1"
+
+    def encode(self, solution: CachedSolution) -> bytes:
+        return json.dumps(
+            {
+                "id": str(solution.id),
+                "event_id": str(solution.event_id),
+                "data_version": solution.data_version,
+                "replaces_assignments": solution.replaces_assignments,
+                "is_optimal": solution.is_optimal,
+                "links": [[str(work_id), slot_id] for work_id, slot_id in solution.links],
+                "final_cost": solution.final_cost,
+                "cost_breakdown": asdict(solution.cost_breakdown),
+                "search_stats": asdict(solution.search_stats),
+            }
+        ).encode()
+
+    def decode(self, data: bytes) -> CachedSolution:
+        fields = json.loads(data)
+        return CachedSolution(
+            id=UUID(fields["id"]),
+            event_id=UUID(fields["event_id"]),
+            data_version=fields["data_version"],
+            replaces_assignments=fields["replaces_assignments"],
+            is_optimal=fields["is_optimal"],
+            links=tuple((UUID(work_id), slot_id) for work_id, slot_id in fields["links"]),
+            final_cost=fields["final_cost"],
+            cost_breakdown=CostBreakdown(**fields["cost_breakdown"]),
+            search_stats=SolverStats(**fields["search_stats"]),
+        )
+
+
+SOLUTION_CODEC = SolutionCodec()
+
+
+class SolutionCache:
+    """
+    Solutions in the shared cache, reachable both by the key of the request that produced them,
+    (event_id, parameters, data version), and by their own id, so a solution previewed on one
+    worker can be committed through any other.
+    """
+
+    def __init__(self, cache: Cache, ttl_seconds: float = DEFAULT_SOLUTION_TTL_SECONDS):
+        self.cache = cache
+        self.ttl_seconds = ttl_seconds
+
+    async def get(self, solution_id: UUID) -> CachedSolution | None:
+        return await self.cache.get(f"id:{solution_id}", SOLUTION_CODEC)
+
+    async def get_or_solve(self, key: Hashable, solve: Callable[[], Awaitable[CachedSolution]]) -> CachedSolution:
+        """
+        The solution cached for the key, or the one `solve` finds. Concurrent solves of a key run
+        once per worker: workers that miss the key at the same time each solve it.
+        """
+
+        async def solve_and_store() -> CachedSolution:
+            solution = await solve()
+            await self.cache.set(f"id:{solution.id}", solution, self.ttl_seconds, codec=SOLUTION_CODEC)
+            return solution
+
+        digest = hashlib.sha256(repr(key).encode()).hexdigest()
+        return await self.cache.get_or_load(f"key:{digest}", solve_and_store, self.ttl_seconds, codec=SOLUTION_CODEC)
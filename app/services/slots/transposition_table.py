@@ -0,0 +1,53 @@
+from collections import OrderedDict
+from typing import Hashable
+
+
+class TranspositionTable:
+    """
+    Bounded LRU memo of search states already expanded by the branch and bound.
+
+    Each entry maps a canonical state key to the lowest cost at which that state
+    was reached. Two states with the same key have identical futures, so reaching
+    one again at an equal or higher cost cannot lead to a better solution.
+    """
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, float] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def is_dominated(self, key: Hashable, cost: float) -> bool:
+        """
+        Returns True if the state was already reached at a cost <= `cost`.
+        Otherwise records `cost` as the best cost for the state and returns False.
+        """
+        best_cost = self._entries.get(key)
+        if best_cost is not None:
+            self._entries.move_to_end(key)
+            if best_cost <= cost:
+                self.hits += 1
+                return True
+
+        self.misses += 1
+        self._entries[key] = cost
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+        return False
+
+    def clear(self) -> None:
+        """Empties the table and resets its counters, so the stats of a solve are only its own."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
@@ -4,7 +4,7 @@ from uuid import UUID
 from app.schemas.media.image import ImgSchema
 from app.schemas.storage.schemas import UploadURLSchema
 from app.services.storage.storage_service import StorageService
-from app.settings.settings import StorageSettings
+from app.settings.settings import StorageSettings, get_settings
 
 
 class EventsStaticFiles(str, Enum):
@@ -25,7 +25,7 @@ class EventsStorageService(StorageService):
 
     @staticmethod
     def get_public_event_url(event_id: UUID, file_to_get: EventsStaticFiles):
-        storage_settings = StorageSettings()
+        storage_settings = get_settings(StorageSettings)
         return storage_settings.PUBLIC_BASE_URL + storage_settings.EVENTS_BUCKET + f"/{event_id}/{file_to_get.value}"
 
     @staticmethod
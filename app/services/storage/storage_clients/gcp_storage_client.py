@@ -4,6 +4,7 @@ from google.cloud import storage
 from google.oauth2 import service_account
 
 from app.schemas.storage.schemas import DownloadURLSchema, UploadURLSchema
+from app.utils.tracing import span
 
 
 class GCPStorageClient:
@@ -14,7 +15,8 @@ class GCPStorageClient:
         self, bucket_name, blob_name, expiration=3600, max_size_mb=3
     ) -> UploadURLSchema:
         blob = await self.__get_blob(bucket_name, blob_name)
-        url = blob.generate_signed_url(version="v4", expiration=expiration, method="PUT")
+        with span("gcs generate_signed_url", "storage", method="PUT"):
+            url = blob.generate_signed_url(version="v4", expiration=expiration, method="PUT")
 
         return UploadURLSchema(upload_url=url, expiration_time_seconds=expiration, max_upload_size_mb=max_size_mb)
 
@@ -26,7 +28,8 @@ class GCPStorageClient:
     ) -> DownloadURLSchema:
         blob = await self.__get_blob(bucket_name, blob_name)
 
-        url = blob.generate_signed_url(version="v4", expiration=expiration, method="GET")
+        with span("gcs generate_signed_url", "storage", method="GET"):
+            url = blob.generate_signed_url(version="v4", expiration=expiration, method="GET")
         return DownloadURLSchema(
             download_url=url,
             expiration_time_seconds=expiration,
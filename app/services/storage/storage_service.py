@@ -1,14 +1,20 @@
+from functools import lru_cache
+
 from app.services.services import BaseService
-from app.services.storage.storage_clients.gcp_storage_client import get_gcp_storage_client
 from app.services.storage.storage_clients.no_storage_provided_client import NoStorageProvidedClient
-from app.settings.settings import StorageSettings, StorageTypes
+from app.settings.settings import StorageSettings, StorageTypes, get_settings
 
-storage_settings = StorageSettings()
+storage_settings = get_settings(StorageSettings)
 
 
+# Only one storage client per process (not one for each request), created on first use: the
+# GCP client library is slow to import and only needed with TYPE_STORAGE=GCP_STORAGE.
+@lru_cache(maxsize=1)
 def get_storage_client():
     try:
         if storage_settings.TYPE_STORAGE == StorageTypes.GCP_STORAGE:
+            from app.services.storage.storage_clients.gcp_storage_client import get_gcp_storage_client
+
             return get_gcp_storage_client(storage_settings)
         return NoStorageProvidedClient()
     except Exception as e:
@@ -16,11 +22,10 @@ def get_storage_client():
         return NoStorageProvidedClient()
 
 
-# this must be called only once to have only one storage client up (not one for each request).
-storage_client = get_storage_client()
-
-
 class StorageService(BaseService):
     def __init__(self):
-        self.storage_client = storage_client
         self.storage_settings = storage_settings
+
+    @property
+    def storage_client(self):
+        return get_storage_client()
@@ -22,13 +22,14 @@ from app.schemas.works.work import (
     WorkStateSchema,
     WorkUpdateAdministrationSchema,
     WorkUpdateSchema,
-    WorkWithSchedule,
     WorkWithState,
 )
+from app.services.agenda.agenda_read_model import agenda_read_model
 from app.services.event_inscriptions.event_inscriptions_service import EventInscriptionsService
 from app.services.events.events_configuration_service import EventsConfigurationService
 from app.services.notifications.events_notifications_service import EventsNotificationsService
 from app.services.services import BaseService
+from app.utils.http_cache import ResourceVersion
 from app.utils.utils import is_valid_date_and_time
 
 
@@ -49,29 +50,8 @@ class WorksService(BaseService):
         self.works_repository = works_repository
         self.event_notification_service = event_notification_service
 
-    async def get_works(self, track: str, offset: int, limit: int):
-        if track:
-            works_models = await self.works_repository.get_works_by_track(self.event_id, track, offset, limit)
-        else:
-            works_models = await self.works_repository.get_all_works_for_event(self.event_id, offset, limit)
-
-        results = []
-        for work in works_models:
-            work_dto = WorkWithSchedule.model_validate(work, from_attributes=True)
-
-            # Map Schedule Data
-            if work.slot_links and len(work.slot_links) > 0:
-                work_slot = work.slot_links[0]
-
-                if work_slot.slot:
-                    # UPDATED: Use 'start', 'end', and 'room_name' directly
-                    work_dto.start_date = work_slot.slot.start
-                    work_dto.end_date = work_slot.slot.end
-                    work_dto.room_name = work_slot.slot.room_name
-
-            results.append(work_dto)
-
-        return results
+    async def get_works(self, track: str, offset: int, limit: int) -> list[dict]:
+        return await self.works_repository.get_works_with_schedule(self.event_id, track, offset, limit)
 
     async def get_my_works(self, offset: int, limit: int):
         works = await self.works_repository.get_all_works_for_user_in_event(self.event_id, self.user_id, offset, limit)
@@ -105,6 +85,12 @@ class WorksService(BaseService):
         work = await self.__get_work(self.event_id, work_id)
         return work.author_id == caller_id
 
+    async def get_work_version(self, work_id: UUID) -> ResourceVersion:
+        last_update = await self.works_repository.get_work_last_update(self.event_id, work_id)
+        if last_update is None:
+            raise WorkNotFound(event_id=self.event_id, work_id=work_id)
+        return ResourceVersion.of(last_update, last_modified=last_update)
+
     async def get_work(self, work_id: UUID) -> WorkWithState:
         work = await self.__get_work(self.event_id, work_id)
         return work
@@ -112,9 +98,11 @@ class WorksService(BaseService):
     async def update_work(self, work_id: UUID, work_update: WorkUpdateSchema) -> None:
         await self.validate_update_work(work_id, work_update)
         await self.works_repository.update_work(work_update, self.event_id, work_id)
+        await agenda_read_model.mark_works_dirty(self.event_id, [work_id])
 
     async def update_work_administration(self, work_id: UUID, work_update: WorkUpdateAdministrationSchema) -> None:
         await self.works_repository.update_work_administration(work_update, self.event_id, work_id)
+        await agenda_read_model.mark_works_dirty(self.event_id, [work_id])
 
     async def update_work_status(self, work_id: UUID, status: WorkStateSchema) -> None:
         if not await self.exist_work(work_id):
@@ -1,36 +1,42 @@
 from typing import Annotated
 from uuid import UUID
 
-from fastapi import Depends
+from fastapi import BackgroundTasks, Depends
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.authorization.caller_id_dep import CallerIdDep
 from app.authorization.user_id_dep import UserDep
-from app.repository.repository import get_repository
+from app.database.session_dep import SessionDep
 from app.repository.works_repository import WorksRepository
-from app.services.event_inscriptions.event_inscriptions_service_dep import EventInscriptionsServiceDep
-from app.services.events.events_configuration_service_dep import EventsConfigurationServiceDep
-from app.services.notifications.notifications_service_dep import EventsNotificationServiceDep
+from app.schemas.users.utils import UID
+from app.services.event_inscriptions.event_inscriptions_service_dep import EventInscriptionsServiceChecker
+from app.services.events.events_configuration_service_dep import EventsConfigurationChecker
+from app.services.lazy import lazy
+from app.services.notifications.notifications_service_dep import EventsNotification
 from app.services.works.works_service import WorksService
 
 
 class Works:
     async def __call__(
         self,
-        event_notification_service: EventsNotificationServiceDep,
         _: UserDep,
         caller_id: CallerIdDep,
         event_id: UUID,
-        events_configuration_service: EventsConfigurationServiceDep,
-        inscription_service: EventInscriptionsServiceDep,
-        works_repository: Annotated[WorksRepository, Depends(get_repository(WorksRepository))],
+        background_tasks: BackgroundTasks,
+        session: SessionDep,
     ) -> WorksService:
+        return self.build(event_id, caller_id, background_tasks, session)
+
+    @staticmethod
+    def build(event_id: UUID, caller_id: UID, background_tasks: BackgroundTasks, session: AsyncSession) -> WorksService:
+        """The service, without checking that the caller is a user: dependencies that build it check it."""
         return WorksService(
             caller_id,
             event_id,
-            events_configuration_service,
-            event_notification_service,
-            inscription_service,
-            works_repository,
+            lazy(lambda: EventsConfigurationChecker.build(event_id, session)),
+            lazy(lambda: EventsNotification.build(background_tasks, session)),
+            lazy(lambda: EventInscriptionsServiceChecker.build(event_id, caller_id, background_tasks, session)),
+            WorksRepository(session),
         )
 
 
@@ -1,7 +1,11 @@
 from enum import Enum
+from functools import lru_cache
+from typing import Type, TypeVar
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+S = TypeVar("S", bound=BaseSettings)
+
 
 class StorageTypes(str, Enum):
     GCP_STORAGE = "GCP_STORAGE"
@@ -45,3 +49,63 @@ class NotificationsSettings(BaseSettings):
 
 class DatabaseSettings(BaseSettings):
     DATABASE_URL: str
+
+
+class DiagnosticsSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="DIAGNOSTICS_")
+    # Adds diagnostic headers to responses. Never enable it in production.
+    DEBUG: bool = False
+    # A request warns when it runs more statements, or repeats a statement shape this many times.
+    MAX_STATEMENTS_PER_REQUEST: int = 50
+    REPEATED_STATEMENT_THRESHOLD: int = 10
+    LAZY_LOADS_RAISE: bool = False
+    # Lets admins profile single requests with the X-Profile header. Off, the middleware isn't installed.
+    PROFILING_ENABLED: bool = False
+    PROFILES_DIRECTORY: str = "profiles"
+    PROFILING_SAMPLING_INTERVAL_MS: float = 1.0
+    # Watches the event loop for callbacks that run longer than the threshold without yielding.
+    LOOP_MONITOR_ENABLED: bool = False
+    LOOP_MONITOR_INTERVAL_MS: float = 50
+    LOOP_BLOCK_THRESHOLD_MS: float = 250
+
+
+class TracingSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="TRACING_")
+    # Fraction of the requests traced, from 0 (tracing off) to 1.
+    SAMPLE_RATE: float = 0.0
+    # Where the spans go: "json" appends them to FILE, "memory" keeps them in the process.
+    EXPORTER: str = "json"
+    FILE: str = "traces.jsonl"
+
+
+class CacheSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="CACHE_")
+    # "memory" keeps an LRU in every worker; "resp" shares a Redis protocol server at URL between them.
+    BACKEND: str = "memory"
+    URL: str = "redis://localhost:6379/0"
+    MAX_ENTRIES: int = 10_000
+    POOL_SIZE: int = 10
+    TIMEOUT_SECONDS: float = 1.0
+    DEFAULT_TTL_SECONDS: float = 60 * 60
+
+
+class JobsSettings(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="JOBS_")
+    # Jobs a worker process runs at once, and jobs of one event running at once across all workers.
+    WORKER_CONCURRENCY: int = 4
+    PER_EVENT_CONCURRENCY: int = 1
+    POLL_INTERVAL_SECONDS: float = 1.0
+    HEARTBEAT_SECONDS: float = 5.0
+    # A running job without a heartbeat for this long lost its worker, and is retried.
+    LEASE_SECONDS: float = 120.0
+    RETRY_BACKOFF_SECONDS: float = 10.0
+    # How often the workers queue the compaction of the dashboard counters of the events written to.
+    EVENT_STATS_COMPACT_INTERVAL_SECONDS: float = 300.0
+    # Runs a worker inside the API process too, for single process deployments.
+    RUN_IN_APP: bool = False
+
+
+@lru_cache(maxsize=None)
+def get_settings(settings_type: Type[S]) -> S:
+    """The process-wide instance of a settings class, read from the environment on first use."""
+    return settings_type()
@@ -0,0 +1,90 @@
+import hashlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Annotated
+
+from fastapi import Depends, Request, Response
+
+# Responses any cache may store, but must revalidate before reusing.
+PUBLIC_CACHE_CONTROL = "public, max-age=0, must-revalidate"
+# Responses that depend on who is asking (or that only some callers may see).
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """Weak comparison of an If-None-Match header against an ETag, as RFC 9110 requires for GET."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(candidate.strip().removeprefix("W/") == opaque for candidate in if_none_match.split(","))
+
+
+def not_modified(headers: dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
+
+
+def _as_utc(moment: datetime) -> datetime:
+    # Timestamps without time zone are stored in UTC.
+    return moment.replace(tzinfo=timezone.utc) if moment.tzinfo is None else moment.astimezone(timezone.utc)
+
+
+@dataclass(frozen=True)
+class ResourceVersion:
+    """Validators of a resource: a weak ETag and, when known, its last modification time."""
+
+    etag: str
+    last_modified: datetime | None = None
+
+    @classmethod
+    def of(cls, *parts, last_modified: datetime | None = None) -> "ResourceVersion":
+        """Builds the version from whatever values change when the representation changes."""
+        digest = hashlib.sha256(repr(parts).encode()).hexdigest()[:32]
+        return cls(etag=f'W/"{digest}"', last_modified=_as_utc(last_modified) if last_modified else None)
+
+    def headers(self) -> dict[str, str]:
+        headers = {"ETag": self.etag}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(self.last_modified, usegmt=True)
+        return headers
+
+
+class ConditionalGet:
+    """
+    Answers conditional GETs from a cheap version of the resource, before loading it.
+
+    If-None-Match wins over If-Modified-Since, which only has second precision.
+    """
+
+    def __init__(self, request: Request, response: Response):
+        self.request = request
+        self.response = response
+
+    def not_modified(self, version: ResourceVersion, cache_control: str) -> Response | None:
+        """Returns the 304 to send, or None after setting the validators on the full response."""
+        headers = {**version.headers(), "Cache-Control": cache_control}
+        if cache_control == PRIVATE_CACHE_CONTROL:
+            headers["Vary"] = "X-User-Id"
+        if self._is_fresh(version):
+            return not_modified(headers)
+        self.response.headers.update(headers)
+        return None
+
+    def _is_fresh(self, version: ResourceVersion) -> bool:
+        if_none_match = self.request.headers.get("if-none-match")
+        if if_none_match is not None:
+            return etag_matches(if_none_match, version.etag)
+
+        if_modified_since = self.request.headers.get("if-modified-since")
+        if if_modified_since is None or version.last_modified is None:
+            return False
+        try:
+            since = _as_utc(parsedate_to_datetime(if_modified_since))
+        except (TypeError, ValueError):
+            return False
+        return version.last_modified.replace(microsecond=0) <= since
+
+
+ConditionalGetDep = Annotated[ConditionalGet, Depends(ConditionalGet)]
@@ -0,0 +1,121 @@
+"""
+Event loop lag watchdog.
+
+A heartbeat coroutine wakes up every `interval` and measures how late it was scheduled: the time
+the loop spent running other callbacks without yielding. A watchdog thread notices when the
+heartbeat stops beating for longer than `threshold`, and captures the stack of the event loop
+thread while it is still blocked, which points at the blocking call.
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from dataclasses import dataclass
+from logging import getLogger
+from types import FrameType
+from typing import Deque, List
+
+from app.utils.metrics import EVENT_LOOP_BLOCKS, EVENT_LOOP_LAG
+
+logger = getLogger(__name__)
+
+APP_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# Blocks reported for stacks that don't go through the application code.
+OUTSIDE_APP = "outside_app"
+
+
+@dataclass
+class BlockingCall:
+    """The event loop thread blocked for at least `duration` seconds, running `stack`."""
+
+    duration: float
+    location: str
+    stack: List[str]
+
+    def __str__(self) -> str:
+        return f"Event loop blocked for {self.duration * 1000:.0f} ms in {self.location}:\n{''.join(self.stack)}"
+
+
+class EventLoopBlocked(AssertionError):
+    def __init__(self, blocking_calls: List[BlockingCall]):
+        super().__init__("\n".join(str(call) for call in blocking_calls))
+        self.blocking_calls = blocking_calls
+
+
+def blocking_location(frame: FrameType) -> str:
+    """The innermost application function in the stack: a bounded label for metrics."""
+    current: FrameType | None = frame
+    while current is not None:
+        filename = current.f_code.co_filename
+        if filename.startswith(APP_DIRECTORY):
+            relative = os.path.relpath(filename, os.path.dirname(APP_DIRECTORY))
+            return f"{relative}:{current.f_code.co_qualname}"
+        current = current.f_back
+    return OUTSIDE_APP
+
+
+class LoopLagMonitor:
+    def __init__(self, interval: float = 0.05, threshold: float = 0.25, keep: int = 100):
+        self.interval = interval
+        self.threshold = threshold
+        # The last blocking calls seen, for tests and debugging.
+        self.blocking_calls: Deque[BlockingCall] = deque(maxlen=keep)
+        self._last_beat = time.monotonic()
+        self._loop_thread = 0
+        self._heartbeat: asyncio.Task | None = None
+        self._watchdog: threading.Thread | None = None
+        self._stopped = threading.Event()
+
+    async def start(self) -> None:
+        self._loop_thread = threading.get_ident()
+        self._last_beat = time.monotonic()
+        self._stopped.clear()
+        self._heartbeat = asyncio.create_task(self._beat(), name="loop-lag-heartbeat")
+        self._watchdog = threading.Thread(target=self._watch, name="loop-lag-watchdog", daemon=True)
+        self._watchdog.start()
+
+    async def stop(self) -> None:
+        self._stopped.set()
+        if self._heartbeat is not None:
+            self._heartbeat.cancel()
+            try:
+                await self._heartbeat
+            except asyncio.CancelledError:
+                pass
+        if self._watchdog is not None:
+            self._watchdog.join()
+
+    def assert_not_blocked(self) -> None:
+        """Raises EventLoopBlocked with the stacks of the blocking calls seen so far."""
+        if self.blocking_calls:
+            raise EventLoopBlocked(list(self.blocking_calls))
+
+    async def _beat(self) -> None:
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            self._last_beat = time.monotonic()
+            EVENT_LOOP_LAG.observe(max(0.0, self._last_beat - expected))
+
+    def _watch(self) -> None:
+        reported_beat = None
+        check_interval = min(self.interval, self.threshold / 2)
+        while not self._stopped.wait(check_interval):
+            last_beat = self._last_beat
+            blocked_for = time.monotonic() - last_beat - self.interval
+            if blocked_for < self.threshold or last_beat == reported_beat:
+                continue
+            frame = sys._current_frames().get(self._loop_thread)
+            if frame is None:
+                continue
+            reported_beat = last_beat
+            self._report(BlockingCall(blocked_for, blocking_location(frame), traceback.format_stack(frame)))
+
+    def _report(self, call: BlockingCall) -> None:
+        self.blocking_calls.append(call)
+        EVENT_LOOP_BLOCKS.inc(location=call.location)
+        logger.warning(str(call))
@@ -0,0 +1,282 @@
+"""
+In-process metrics in the Prometheus text exposition format.
+
+Metrics are module-level singletons registered in REGISTRY, and GET /metrics renders them.
+Observing takes a lock and a dict lookup, so it is cheap enough for every request and statement.
+"""
+
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Sequence, Tuple, TypeVar
+
+LabelValues = Tuple[str, ...]
+
+# Request and external call latencies, in seconds.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Fast operations such as single SQL statements or pool checkouts.
+FAST_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+# Long running work such as the slot scheduler.
+SLOW_BUCKETS = (0.01, 0.1, 0.5, 1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0)
+COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000)
+NODES_BUCKETS = (10, 100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(str(value))}"' for name, value in zip(names, values, strict=True)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+class Metric:
+    type_name = ""
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.label_names = tuple(labels)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Dict[str, str]) -> LabelValues:
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def samples(self) -> List[str]:
+        raise NotImplementedError
+
+    def render(self) -> str:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.type_name}"]
+        return "\n".join(lines + self.samples())
+
+    def clear(self) -> None:
+        raise NotImplementedError
+
+
+class Counter(Metric):
+    type_name = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        super().__init__(name, documentation, labels)
+        self._values: Dict[LabelValues, float] = {}
+        self.clear()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            values = list(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, key)} {_format_value(value)}" for key, value in values]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            # Metrics without labels have a single series, exposed from the start.
+            if not self.label_names:
+                self._values[()] = 0
+
+
+class Gauge(Counter):
+    type_name = "gauge"
+
+    def dec(self, amount: float = 1, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    @contextmanager
+    def track_in_progress(self, **labels: str) -> Iterator[None]:
+        self.inc(**labels)
+        try:
+            yield
+        finally:
+            self.dec(**labels)
+
+
+class _HistogramValues:
+    __slots__ = ("bucket_counts", "count", "sum")
+
+    def __init__(self, buckets: int):
+        # Non cumulative counts per bucket, the last one being +Inf.
+        self.bucket_counts = [0] * (buckets + 1)
+        self.count = 0
+        self.sum = 0.0
+
+
+class Histogram(Metric):
+    type_name = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (), buckets=LATENCY_BUCKETS):
+        super().__init__(name, documentation, labels)
+        self.buckets = tuple(sorted(buckets))
+        self._values: Dict[LabelValues, _HistogramValues] = {}
+        self.clear()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = self._key(labels)
+        bucket = bisect_left(self.buckets, value)
+        with self._lock:
+            values = self._values.get(key)
+            if values is None:
+                values = self._values[key] = _HistogramValues(len(self.buckets))
+            values.bucket_counts[bucket] += 1
+            values.count += 1
+            values.sum += value
+
+    @contextmanager
+    def time(self, **labels: str) -> Iterator[None]:
+        """Observes the duration of the block, also when it raises."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started, **labels)
+
+    def count(self, **labels: str) -> int:
+        values = self._values.get(self._key(labels))
+        return values.count if values else 0
+
+    def sum(self, **labels: str) -> float:
+        values = self._values.get(self._key(labels))
+        return values.sum if values else 0.0
+
+    def samples(self) -> List[str]:
+        with self._lock:
+            snapshot = [(key, list(v.bucket_counts), v.count, v.sum) for key, v in self._values.items()]
+        lines = []
+        label_names = self.label_names + ("le",)
+        for key, bucket_counts, count, total in snapshot:
+            cumulative = 0
+            for upper_bound, bucket_count in zip(self.buckets + (float("inf"),), bucket_counts, strict=True):
+                cumulative += bucket_count
+                labels = _format_labels(label_names, key + (_format_value(upper_bound),))
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.label_names, key)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {count}")
+        return lines
+
+    def clear(self) -> None:
+        with self._lock:
+            self._values.clear()
+            if not self.label_names:
+                self._values[()] = _HistogramValues(len(self.buckets))
+
+
+M = TypeVar("M", bound=Metric)
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: M) -> M:
+        if metric.name in self._metrics:
+            raise ValueError(f"Metric {metric.name} is already registered")
+        self._metrics[metric.name] = metric
+        return metric
+
+    def render(self) -> str:
+        return "\n".join(metric.render() for metric in self._metrics.values()) + "\n"
+
+    def clear(self) -> None:
+        for metric in self._metrics.values():
+            metric.clear()
+
+
+REGISTRY = MetricsRegistry()
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def counter(name: str, documentation: str, labels: Sequence[str] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, documentation, labels))
+
+
+def gauge(name: str, documentation: str, labels: Sequence[str] = ()) -> Gauge:
+    return REGISTRY.register(Gauge(name, documentation, labels))
+
+
+def histogram(name: str, documentation: str, labels: Sequence[str] = (), buckets=LATENCY_BUCKETS) -> Histogram:
+    return REGISTRY.register(Histogram(name, documentation, labels, buckets))
+
+
+# --- Application metrics ---
+
+HTTP_REQUEST_DURATION = histogram(
+    "http_request_duration_seconds", "Time to answer HTTP requests, by route template.", ("method", "route", "status")
+)
+HTTP_REQUESTS_IN_PROGRESS = gauge("http_requests_in_progress", "HTTP requests being answered.", ("method",))
+
+DB_STATEMENT_DURATION = histogram(
+    "db_statement_duration_seconds", "Time to execute single SQL statements.", buckets=FAST_BUCKETS
+)
+DB_STATEMENTS_PER_REQUEST = histogram(
+    "db_statements_per_request", "SQL statements executed to answer a request.", ("route",), buckets=COUNT_BUCKETS
+)
+DB_TIME_PER_REQUEST = histogram(
+    "db_time_per_request_seconds", "Time spent in SQL statements while answering a request.", ("route",)
+)
+DB_POOL_CHECKOUT_DURATION = histogram(
+    "db_pool_checkout_duration_seconds",
+    "Time to get a connection from the pool, including opening it.",
+    buckets=FAST_BUCKETS,
+)
+
+SCHEDULER_SOLVE_DURATION = histogram(
+    "scheduler_solve_duration_seconds", "Time to solve a work to slot assignment.", ("mode",), buckets=SLOW_BUCKETS
+)
+SCHEDULER_NODES_EXPLORED = histogram(
+    "scheduler_nodes_explored", "Branch and bound nodes explored per solve.", ("mode",), buckets=NODES_BUCKETS
+)
+
+EMAIL_QUEUE_DEPTH = gauge("email_queue_depth", "Emails scheduled as background tasks and not sent yet.")
+EMAIL_SEND_DURATION = histogram("email_send_duration_seconds", "Time to send an email over SMTP.", ("outcome",))
+
+APP_STARTUP_SECONDS = gauge("app_startup_seconds", "Time the last startup of the process took, by step.", ("step",))
+
+CACHE_REQUESTS = counter(
+    "cache_requests_total", "Cache lookups, by namespace and hit or miss.", ("namespace", "result")
+)
+CACHE_ERRORS = counter(
+    "cache_errors_total", "Cache operations that failed in the backend, by namespace.", ("namespace", "operation")
+)
+CACHE_LOAD_DURATION = histogram(
+    "cache_load_duration_seconds", "Time to load the values missing from the cache.", ("namespace",)
+)
+
+JOBS_FINISHED = counter("jobs_finished_total", "Background job attempts finished, by outcome.", ("job_type", "outcome"))
+JOB_DURATION = histogram(
+    "job_duration_seconds", "Time to run background job attempts.", ("job_type",), buckets=SLOW_BUCKETS
+)
+JOBS_RUNNING = gauge("jobs_running", "Background jobs running in this process.", ("job_type",))
+
+EVENT_LOOP_LAG = histogram(
+    "event_loop_lag_seconds", "How late the event loop runs a callback scheduled on time.", buckets=FAST_BUCKETS
+)
+EVENT_LOOP_BLOCKS = counter(
+    "event_loop_blocks_total",
+    "Times the event loop was blocked past the threshold, by blocking function.",
+    ("location",),
+)
+
+MERCADOPAGO_REQUEST_DURATION = histogram(
+    "mercadopago_request_duration_seconds", "Time of calls to the Mercado Pago API.", ("operation",)
+)
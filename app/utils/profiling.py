@@ -0,0 +1,107 @@
+"""
+Profilers for a single request.
+
+Both observe the thread running the event loop, so work of other requests served concurrently
+shows up too. Profile on an otherwise idle instance to get a clean picture.
+"""
+
+import cProfile
+import io
+import marshal
+import os
+import sys
+import threading
+from collections import Counter
+from enum import Enum
+from functools import lru_cache
+from types import CodeType, FrameType
+
+
+class ProfilerMode(str, Enum):
+    # Samples the stack every few milliseconds: low overhead, output in the folded stack format.
+    SAMPLING = "sampling"
+    # Traces every call with cProfile: exact call counts, noticeable overhead, output in pstats format.
+    DETERMINISTIC = "deterministic"
+
+
+IDLE_STACK = "[idle]"
+
+
+@lru_cache(maxsize=8192)
+def _frame_label(code: CodeType) -> str:
+    filename = code.co_filename
+    if filename.startswith(os.getcwd()):
+        filename = os.path.relpath(filename)
+    return f"{code.co_qualname} ({filename}:{code.co_firstlineno})"
+
+
+def _is_idle(code: CodeType) -> bool:
+    # The event loop waiting for I/O.
+    return code.co_name == "select" and code.co_filename.endswith("selectors.py")
+
+
+def folded_stack(frame: FrameType) -> str:
+    """The stack of a frame in the folded format (root first, frames separated by `;`)."""
+    if _is_idle(frame.f_code):
+        return IDLE_STACK
+    labels = []
+    current: FrameType | None = frame
+    while current is not None:
+        labels.append(_frame_label(current.f_code))
+        current = current.f_back
+    return ";".join(reversed(labels))
+
+
+class SamplingProfiler:
+    """
+    Samples the stack of the calling thread from a background thread. The dump has one line per
+    distinct stack with its sample count, the input of flamegraph.pl, speedscope and inferno.
+    """
+
+    extension = "folded"
+    media_type = "text/plain; charset=utf-8"
+
+    def __init__(self, interval: float = 0.001):
+        self.interval = interval
+        self.samples: Counter = Counter()
+        self._target_thread = threading.get_ident()
+        self._stopped = threading.Event()
+        self._sampler = threading.Thread(target=self._sample, name="request-profiler", daemon=True)
+
+    def start(self) -> None:
+        self._sampler.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._sampler.join()
+
+    def _sample(self) -> None:
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self._target_thread)
+            if frame is not None:
+                self.samples[folded_stack(frame)] += 1
+
+    def dump(self) -> bytes:
+        return "".join(f"{stack} {count}\n" for stack, count in self.samples.most_common()).encode()
+
+
+class DeterministicProfiler:
+    """cProfile over the request. The dump loads with pstats, snakeviz or flameprof."""
+
+    extension = "prof"
+    media_type = "application/octet-stream"
+
+    def __init__(self):
+        self._profile = cProfile.Profile()
+
+    def start(self) -> None:
+        self._profile.enable()
+
+    def stop(self) -> None:
+        self._profile.disable()
+
+    def dump(self) -> bytes:
+        self._profile.create_stats()
+        buffer = io.BytesIO()
+        marshal.dump(self._profile.stats, buffer)
+        return buffer.getvalue()
@@ -0,0 +1,50 @@
+"""
+Ordered, timed application startup.
+
+The lifespan enters its startup steps in the order they are declared and exits them in reverse on
+shutdown. Every step is timed into `app_startup_seconds`, together with the time it took to import
+the application, so a slow cold start can be traced to the subsystem that caused it.
+"""
+
+import time
+from contextlib import AsyncExitStack, asynccontextmanager
+from logging import getLogger
+from typing import AsyncContextManager, AsyncIterator, Callable, Dict, List, Tuple
+
+from app import IMPORT_STARTED
+from app.utils.metrics import APP_STARTUP_SECONDS
+
+logger = getLogger(__name__)
+
+StartupStep = Callable[[], AsyncContextManager[object]]
+
+
+class StartupReport:
+    def __init__(self):
+        self.steps: Dict[str, float] = {}
+
+    def record(self, name: str, seconds: float) -> None:
+        self.steps[name] = seconds
+        APP_STARTUP_SECONDS.set(seconds, step=name)
+
+    @property
+    def total(self) -> float:
+        return sum(self.steps.values())
+
+    def __str__(self) -> str:
+        steps = ", ".join(f"{name} {seconds * 1000:.0f} ms" for name, seconds in self.steps.items())
+        return f"Started in {self.total * 1000:.0f} ms ({steps})"
+
+
+@asynccontextmanager
+async def run_startup(steps: List[Tuple[str, StartupStep]], imported: float) -> AsyncIterator[StartupReport]:
+    """Enters the steps in order, timing each one, and exits them in reverse when the block ends."""
+    report = StartupReport()
+    report.record("import", imported - IMPORT_STARTED)
+    async with AsyncExitStack() as stack:
+        for name, step in steps:
+            started = time.perf_counter()
+            await stack.enter_async_context(step())
+            report.record(name, time.perf_counter() - started)
+        logger.info(str(report))
+        yield report
@@ -0,0 +1,243 @@
+"""
+Lightweight request tracing.
+
+A sampled request opens a root span, and every span opened while it is running (routes, services,
+repositories, SQL statements, outbound calls) becomes its descendant through a context variable,
+which also flows into the tasks the request starts. When the root span ends, all the spans of the
+trace go to the exporter.
+
+Outside a sampled trace, opening a span costs a context variable lookup.
+"""
+
+import functools
+import inspect
+import json
+import os
+import queue
+import random
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from logging import getLogger
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List
+
+logger = getLogger(__name__)
+
+
+def _new_id(bits: int) -> str:
+    return os.urandom(bits // 8).hex()
+
+
+@dataclass
+class Span:
+    name: str
+    kind: str
+    trace_id: str
+    parent_id: str | None = None
+    attributes: Dict[str, Any] = field(default_factory=dict)
+    span_id: str = field(default_factory=lambda: _new_id(64))
+    start_time: float = field(default_factory=time.time)
+    duration: float | None = None
+    error: str | None = None
+    # Finished spans of the trace, shared by all its spans.
+    _finished: List["Span"] = field(default_factory=list, repr=False)
+    _started: float = field(default_factory=time.perf_counter, repr=False)
+
+    def child(self, name: str, kind: str, attributes: Dict[str, Any]) -> "Span":
+        return Span(name, kind, self.trace_id, self.span_id, attributes, _finished=self._finished)
+
+    def end(self, error: BaseException | None = None) -> None:
+        self.duration = time.perf_counter() - self._started
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        self._finished.append(self)
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "kind": self.kind,
+            "start_time": self.start_time,
+            "duration_ms": round(self.duration * 1000, 3) if self.duration is not None else None,
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+_current_span: ContextVar[Span | None] = ContextVar("current_span", default=None)
+
+
+def current_span() -> Span | None:
+    return _current_span.get()
+
+
+@contextmanager
+def span(name: str, kind: str, **attributes: Any) -> Iterator[Span | None]:
+    """A child of the current span, which is current within the block. Yields None outside a trace."""
+    parent = _current_span.get()
+    if parent is None:
+        yield None
+        return
+    child = parent.child(name, kind, attributes)
+    token = _current_span.set(child)
+    try:
+        yield child
+    except BaseException as error:
+        child.end(error)
+        raise
+    else:
+        child.end()
+    finally:
+        _current_span.reset(token)
+
+
+def start_span(name: str, kind: str, **attributes: Any) -> Span | None:
+    """A child of the current span that doesn't become current, for callbacks that start and end apart."""
+    parent = _current_span.get()
+    return parent.child(name, kind, attributes) if parent is not None else None
+
+
+def _traced_method(function: Callable, kind: str) -> Callable:
+    @functools.wraps(function)
+    async def traced(self, *args, **kwargs):
+        if _current_span.get() is None:
+            return await function(self, *args, **kwargs)
+        with span(f"{type(self).__name__}.{function.__name__}", kind):
+            return await function(self, *args, **kwargs)
+
+    traced.__traced__ = True
+    return traced
+
+
+def trace_methods(cls: type, kind: str) -> None:
+    """Wraps the public coroutine methods defined by a class in spans named Class.method."""
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or not inspect.iscoroutinefunction(member) or getattr(member, "__traced__", False):
+            continue
+        setattr(cls, name, _traced_method(member, kind))
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    def export(self, spans: List[Span]) -> None:
+        """Receives the spans of a finished trace, the root span last. Called on the event loop: it must not block."""
+
+    @abstractmethod
+    def shutdown(self) -> None:
+        """Exports the traces still pending. Called once, on shutdown, from a thread."""
+
+
+class InMemoryExporter(SpanExporter):
+    """Keeps the traces in memory, for tests."""
+
+    def __init__(self):
+        self.traces: List[List[Span]] = []
+
+    def export(self, spans: List[Span]) -> None:
+        self.traces.append(spans)
+
+    def clear(self) -> None:
+        self.traces.clear()
+
+    def shutdown(self) -> None:
+        pass
+
+
+class JsonFileExporter(SpanExporter):
+    """
+    Appends every span as a JSON line to a local file. Exporting only queues the trace: a writer
+    thread serializes the queued traces and appends them in batches. When the disk can't keep up
+    and `max_pending` traces are queued, new traces are dropped.
+    """
+
+    def __init__(self, path: str | Path, max_pending: int = 10_000):
+        self.path = Path(path)
+        self.dropped = 0
+        # A None closes the writer.
+        self._pending: queue.Queue[List[Span] | None] = queue.Queue(maxsize=max_pending)
+        self._writer: threading.Thread | None = None
+        self._writer_lock = threading.Lock()
+
+    def export(self, spans: List[Span]) -> None:
+        if self._writer is None:
+            self._start_writer()
+        try:
+            self._pending.put_nowait(spans)
+        except queue.Full:
+            self.dropped += 1
+
+    def flush(self) -> None:
+        """Waits until the queued traces are written."""
+        self._pending.join()
+
+    def shutdown(self) -> None:
+        with self._writer_lock:
+            writer, self._writer = self._writer, None
+        if writer is not None:
+            self._pending.put(None)
+            writer.join()
+
+    def _start_writer(self) -> None:
+        with self._writer_lock:
+            if self._writer is None:
+                self._writer = threading.Thread(target=self._write, name="trace-writer", daemon=True)
+                self._writer.start()
+
+    def _write(self) -> None:
+        closed = False
+        while not closed:
+            batch = [self._pending.get()]
+            while len(batch) < self._pending.maxsize:
+                try:
+                    batch.append(self._pending.get_nowait())
+                except queue.Empty:
+                    break
+            closed = None in batch
+            lines = "".join(
+                json.dumps(span.as_dict(), default=str) + "\n" for spans in batch if spans is not None for span in spans
+            )
+            try:
+                with self.path.open("a") as file:
+                    file.write(lines)
+            except OSError:
+                logger.exception(f"Could not write {len(batch)} traces to {self.path}")
+            finally:
+                for _ in batch:
+                    self._pending.task_done()
+
+
+EXPORTERS: Dict[str, Callable[[str], SpanExporter]] = {
+    "json": JsonFileExporter,
+    "memory": lambda _: InMemoryExporter(),
+}
+
+
+class Tracer:
+    def __init__(self, exporter: SpanExporter, sample_rate: float = 1.0):
+        self.exporter = exporter
+        self.sample_rate = sample_rate
+
+    @contextmanager
+    def trace(self, name: str, kind: str = "server", **attributes: Any) -> Iterator[Span | None]:
+        """Starts a trace for a sampled fraction of the calls. Yields None for the rest."""
+        if random.random() >= self.sample_rate:
+            yield None
+            return
+        root = Span(name, kind, trace_id=_new_id(128), attributes=attributes)
+        token = _current_span.set(root)
+        try:
+            yield root
+        except BaseException as error:
+            root.end(error)
+            raise
+        else:
+            root.end()
+        finally:
+            _current_span.reset(token)
+            self.exporter.export(root._finished)
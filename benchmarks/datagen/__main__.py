@@ -0,0 +1,68 @@
+"""
+Synthetic data generator: fills DATABASE_URL with an internally consistent dataset covering every
+model (users, provider accounts, events with tracks, pricing, dates and a slot grid, organizers,
+chairs, inscriptions, works with their authors, submissions, reviewers, reviews answering the
+review skeleton of their event, payments and the agenda) and reports the rows loaded per table.
+
+The rows are derived from --seed and sized by --scale (1 is 10k events, 200k users, 500k
+inscriptions and 100k works, reviews and payments), so the same arguments always produce the same
+database. It drops and recreates every table first: point it to a database of its own.
+
+    python -m benchmarks.datagen --scale 0.1 --seed 7
+    python -m benchmarks.datagen --scale 1 --inscriptions 2000000
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import asdict, fields, replace
+from pathlib import Path
+
+from benchmarks.datagen.dataset import FULL_SIZE, Dataset
+from benchmarks.datagen.loader import reset_and_load
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.datagen", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--scale", type=float, default=0.01, help="Dataset size relative to scale 1")
+    parser.add_argument("--seed", type=int, default=0)
+    for size in fields(FULL_SIZE):
+        parser.add_argument(f"--{size.name}", type=int, help=f"Overrides the {size.name} given by the scale")
+    parser.add_argument("--batch-size", type=int, default=50_000, help="Rows per COPY")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file instead of stdout")
+    return parser.parse_args(argv)
+
+
+def dataset_from_args(args) -> Dataset:
+    size = FULL_SIZE.scaled(args.scale)
+    overrides = {name: value for name, value in vars(args).items() if name in asdict(size) and value is not None}
+    size = replace(size, **overrides)
+    size.validate()
+    return Dataset(size, args.seed)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    try:
+        dataset = dataset_from_args(args)
+    except ValueError as error:
+        print(f"Invalid dataset size: {error}", file=sys.stderr)
+        return 2
+    report = {
+        "size": asdict(dataset.size),
+        "seed": dataset.seed,
+        **asyncio.run(reset_and_load(dataset, args.batch_size)),
+    }
+    report_json = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(report_json + "\n")
+    else:
+        print(report_json)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,445 @@
+"""
+Synthetic dataset for performance tests, bulk-loaded with COPY.
+
+Rows are related by index arithmetic, so load tests can derive the ids of consistent rows (an
+inscription, its user and its event) from an index without keeping the dataset in memory:
+
+    event e         is created by user e % creators, who organizes it, with one chair outside the creators
+    inscription i   belongs to user i % users, in event (user * 31 + i // users) % events
+    work w          is authored by the user of inscription w % inscriptions, in its event
+    review r        reviews work r % works, by a user assigned as its reviewer
+    payment p       pays inscription p % inscriptions
+
+Text and choices come from a random generator seeded with `seed`, so the same size and seed
+always produce the same rows.
+"""
+
+import json
+import random
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Tuple
+from uuid import UUID
+
+TRACKS = ["math", "physics", "chemistry", "biology"]
+ROOMS = ["Aula 1", "Aula 2"]
+# The free fare, which payments use, needs no payment provider.
+FARE = {
+    "name": "General",
+    "description": "Entrada general",
+    "value": 0,
+    "currency": "ARS",
+    "roles": [],
+    "related_date": None,
+    "need_verification": False,
+}
+PRICING = [
+    FARE,
+    {**FARE, "name": "Profesionales", "description": "Con certificado", "value": 15000},
+    {**FARE, "name": "Expositores", "description": "Incluye la publicación", "value": 8000, "roles": ["SPEAKER"]},
+]
+RECOMMENDATION = {
+    "type_question": "multiple_choice",
+    "question": "Recomendación",
+    "options": ["Aprobado", "Desaprobado", "A revisar"],
+    "more_than_one_answer_allowed": False,
+}
+# Events alternate between these review skeletons, and reviews answer the one of their event.
+REVIEW_SKELETONS = [
+    {
+        "questions": [
+            {"type_question": "simple_question", "question": "Comentarios", "is_mandatory": True, "is_public": True},
+            {"type_question": "rating", "question": "Originalidad", "max_value": 10, "is_mandatory": True},
+        ],
+        "recommendation": RECOMMENDATION,
+    },
+    {
+        "questions": [
+            {"type_question": "rating", "question": "Claridad", "max_value": 5, "is_mandatory": True},
+            {"type_question": "rating", "question": "Relevancia", "max_value": 5, "is_mandatory": True},
+            {
+                "type_question": "multiple_choice",
+                "question": "Aportes",
+                "options": ["Teórico", "Experimental", "Aplicado", "Revisión"],
+                "more_than_one_answer_allowed": True,
+                "is_public": True,
+            },
+            {"type_question": "simple_question", "question": "Comentarios al autor", "is_public": True},
+        ],
+        "recommendation": RECOMMENDATION,
+    },
+]
+# Far enough in the future for works to be reviewable whenever the test runs.
+DEADLINE = datetime(2035, 12, 31, 23, 59)
+EVENT_START = datetime(2035, 5, 10, 9, 0, tzinfo=timezone.utc)
+# (title, slot type, hours after the start, duration in hours) of the daily grid of every event.
+DAILY_GRID = [("Mañana", "slot", 0, 1), ("Café", "break", 1, 0.5), ("Tarde", "slot", 5, 1)]
+WORK_SLOTS = [number for number, (_, slot_type, _, _) in enumerate(DAILY_GRID) if slot_type == "slot"]
+EVENT_CREATOR_SHARE = 20  # one user in 20 creates events
+PROVIDER_SHARE = 4  # all but one event in 4 take payments through the provider account of the creator
+WORDS = (
+    "analisis modelo sistema datos red aprendizaje estudio metodo algoritmo energia materia "
+    "celula proteina teoria grafo optimizacion simulacion muestra experimento estructura"
+).split()
+
+
+@dataclass(frozen=True)
+class DatasetSize:
+    events: int
+    users: int
+    inscriptions: int
+    works: int
+    reviews: int
+    payments: int
+
+    def scaled(self, factor: float) -> "DatasetSize":
+        return DatasetSize(**{name: max(1, round(value * factor)) for name, value in asdict(self).items()})
+
+    def validate(self) -> None:
+        if self.inscriptions > self.users * self.events:
+            raise ValueError("Every user can only be inscribed once per event")
+        if self.payments > self.inscriptions:
+            raise ValueError("There can't be more payments than inscriptions")
+        if self.reviews > self.works * (self.users - 1):
+            raise ValueError("Every work needs different reviewers")
+
+
+# Scale 1: the size of a busy installation.
+FULL_SIZE = DatasetSize(
+    events=10_000, users=200_000, inscriptions=500_000, works=100_000, reviews=100_000, payments=100_000
+)
+
+# Tags in the high bits of the deterministic UUIDs, one per table.
+_EVENT, _INSCRIPTION, _WORK, _SUBMISSION, _REVIEW, _PAYMENT, _PROVIDER_ACCOUNT = range(1, 8)
+
+
+def _uuid(tag: int, index: int) -> UUID:
+    return UUID(int=(tag << 96) | index)
+
+
+@dataclass(frozen=True)
+class Dataset:
+    size: DatasetSize
+    seed: int = 0
+
+    def user_id(self, user: int) -> str:
+        return f"loaduser{user:020d}"
+
+    def event_id(self, event: int) -> UUID:
+        return _uuid(_EVENT, event)
+
+    def event_tracks(self, event: int) -> List[str]:
+        return TRACKS[: 1 + event % len(TRACKS)]
+
+    @property
+    def creators(self) -> int:
+        return max(1, self.size.users // EVENT_CREATOR_SHARE)
+
+    def event_creator(self, event: int) -> int:
+        return event % self.creators
+
+    def event_chair(self, event: int) -> int:
+        if self.size.users == self.creators:
+            return self.event_creator(event)
+        return self.creators + event % (self.size.users - self.creators)
+
+    def event_review_skeleton(self, event: int) -> dict:
+        return REVIEW_SKELETONS[event % len(REVIEW_SKELETONS)]
+
+    def event_provider_account(self, event: int) -> int | None:
+        """The creator whose provider account takes the payments of the event, if it has one."""
+        return None if event % PROVIDER_SHARE == PROVIDER_SHARE - 1 else self.event_creator(event)
+
+    def provider_account_id(self, creator: int) -> UUID:
+        return _uuid(_PROVIDER_ACCOUNT, creator)
+
+    def inscription_id(self, inscription: int) -> UUID:
+        return _uuid(_INSCRIPTION, inscription)
+
+    def inscription_user(self, inscription: int) -> int:
+        return inscription % self.size.users
+
+    def inscription_event(self, inscription: int) -> int:
+        user = self.inscription_user(inscription)
+        return (user * 31 + inscription // self.size.users) % self.size.events
+
+    def event_not_inscribed(self, user: int, offset: int) -> int | None:
+        """An event the user has no inscription in, if there is one."""
+        inscribed = (self.size.inscriptions - 1 - user) // self.size.users + 1
+        if inscribed >= self.size.events:
+            return None
+        return (user * 31 + inscribed + offset % (self.size.events - inscribed)) % self.size.events
+
+    def work_id(self, work: int) -> UUID:
+        return _uuid(_WORK, work)
+
+    def work_inscription(self, work: int) -> int:
+        return work % self.size.inscriptions
+
+    def work_event(self, work: int) -> int:
+        return self.inscription_event(self.work_inscription(work))
+
+    def work_author(self, work: int) -> int:
+        return self.inscription_user(self.work_inscription(work))
+
+    def submission_id(self, work: int) -> UUID:
+        return _uuid(_SUBMISSION, work)
+
+    def review_id(self, review: int) -> UUID:
+        return _uuid(_REVIEW, review)
+
+    def review_work(self, review: int) -> int:
+        return review % self.size.works
+
+    def review_reviewer(self, review: int) -> int:
+        author = self.work_author(self.review_work(review))
+        return (author + 1 + review // self.size.works) % self.size.users
+
+    def payment_id(self, payment: int) -> UUID:
+        return _uuid(_PAYMENT, payment)
+
+    def payment_inscription(self, payment: int) -> int:
+        return payment % self.size.inscriptions
+
+    def slot_id(self, event: int, room: int, grid_slot: int) -> int:
+        return (event * len(ROOMS) + room) * len(DAILY_GRID) + grid_slot + 1
+
+
+def _sentence(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words)).capitalize()
+
+
+class Rows:
+    """Row generators for each table, in the column order of COLUMNS."""
+
+    def __init__(self, dataset: Dataset):
+        self.dataset = dataset
+        self.size = dataset.size
+        self.rng = random.Random(dataset.seed)
+
+    def users(self) -> Iterator[tuple]:
+        for user in range(self.size.users):
+            role = "ADMIN" if user == 0 else "EVENT_CREATOR" if user < self.dataset.creators else "DEFAULT"
+            name, lastname = self.rng.choice(WORDS).capitalize(), self.rng.choice(WORDS).capitalize()
+            yield self.dataset.user_id(user), f"user{user}@load.eventito.com", name, lastname, role
+
+    def events(self) -> Iterator[tuple]:
+        mdata = json.dumps(
+            {
+                "rooms": [{"name": room} for room in ROOMS],
+                "slots": [
+                    {
+                        "type": slot_type,
+                        "title": title,
+                        "start": (EVENT_START + timedelta(hours=start)).replace(tzinfo=None).isoformat(),
+                        "end": (EVENT_START + timedelta(hours=start + hours)).replace(tzinfo=None).isoformat(),
+                    }
+                    for title, slot_type, start, hours in DAILY_GRID
+                ],
+                "was_configured": True,
+            }
+        )
+        dates = json.dumps(
+            [
+                {"name": "START_DATE", "label": "Comienzo", "description": "Comienzo", "is_mandatory": True,
+                 "date": EVENT_START.date().isoformat(), "time": "09:00:00"},
+                {"name": "END_DATE", "label": "Fin", "description": "Fin", "is_mandatory": True,
+                 "date": (EVENT_START + timedelta(days=1)).date().isoformat(), "time": "18:00:00"},
+                {"name": "SUBMISSION_DEADLINE_DATE", "label": "Envío", "description": "Envío de trabajos",
+                 "is_mandatory": True, "date": DEADLINE.date().isoformat(), "time": "23:59:00"},
+            ]
+        )  # fmt: skip
+        pricing = json.dumps(PRICING)
+        review_skeletons = [json.dumps(skeleton) for skeleton in REVIEW_SKELETONS]
+        for event in range(self.size.events):
+            provider_account = self.dataset.event_provider_account(event)
+            yield (
+                self.dataset.event_id(event),
+                self.dataset.user_id(self.dataset.event_creator(event)),
+                f"Evento {event}: {_sentence(self.rng, 3)}",
+                _sentence(self.rng, 30),
+                self.rng.choice(["CONFERENCE", "TALK"]),
+                "STARTED",
+                f"Paseo Colon {self.rng.randint(100, 2000)}",
+                f"eventos{event}@load.eventito.com",
+                "Facultad de Ingeniería",
+                self.dataset.event_tracks(event),
+                [f"eventos{event}@load.eventito.com"],
+                review_skeletons[event % len(REVIEW_SKELETONS)],
+                pricing,
+                dates,
+                mdata,
+                self.dataset.provider_account_id(provider_account) if provider_account is not None else None,
+            )
+
+    def provider_accounts(self) -> Iterator[tuple]:
+        for creator in range(min(self.dataset.creators, self.size.events)):
+            yield (
+                self.dataset.provider_account_id(creator),
+                self.dataset.user_id(creator),
+                "mercadopago",
+                f"TEST-{self.rng.getrandbits(128):032x}",
+                f"TG-{self.rng.getrandbits(128):032x}",
+                f"TEST-{self.rng.getrandbits(64):016x}",
+                str(100_000_000 + creator),
+                "ACTIVE",
+                0.0,
+                "percentage",
+            )
+
+    def organizers(self) -> Iterator[tuple]:
+        for event in range(self.size.events):
+            yield self.dataset.user_id(self.dataset.event_creator(event)), self.dataset.event_id(event)
+
+    def chairs(self) -> Iterator[tuple]:
+        for event in range(self.size.events):
+            tracks = self.dataset.event_tracks(event)
+            yield self.dataset.user_id(self.dataset.event_chair(event)), self.dataset.event_id(event), tracks
+
+    def inscriptions(self) -> Iterator[tuple]:
+        speakers = {self.dataset.work_inscription(work) for work in range(min(self.size.works, self.size.inscriptions))}
+        for inscription in range(self.size.inscriptions):
+            roles = ["ATTENDEE", "SPEAKER"] if inscription in speakers else ["ATTENDEE"]
+            yield (
+                self.dataset.inscription_id(inscription),
+                self.dataset.user_id(self.dataset.inscription_user(inscription)),
+                self.dataset.event_id(self.dataset.inscription_event(inscription)),
+                "APPROVED",
+                roles,
+            )
+
+    def works(self) -> Iterator[tuple]:
+        numbers: dict[int, int] = {}
+        for work in range(self.size.works):
+            event = self.dataset.work_event(work)
+            numbers[event] = numbers.get(event, 0) + 1
+            authors = [
+                {
+                    "full_name": _sentence(self.rng, 2),
+                    "membership": "FIUBA",
+                    "mail": f"autor{work}.{number}@load.eventito.com",
+                    "notify_updates": number == 0,
+                }
+                for number in range(self.rng.randint(1, 4))
+            ]
+            yield (
+                self.dataset.work_id(work),
+                self.dataset.event_id(event),
+                self.dataset.user_id(self.dataset.work_author(work)),
+                f"Trabajo {work}: {_sentence(self.rng, 6)}",
+                self.rng.choice(self.dataset.event_tracks(event)),
+                _sentence(self.rng, 80),
+                self.rng.sample(WORDS, 3),
+                json.dumps(authors),
+                "APPROVED" if work % 3 == 0 else "SUBMITTED",
+                DEADLINE,
+                numbers[event],
+            )
+
+    def submissions(self) -> Iterator[tuple]:
+        for work in range(self.size.works):
+            yield (
+                self.dataset.submission_id(work),
+                self.dataset.event_id(self.dataset.work_event(work)),
+                self.dataset.work_id(work),
+                "SUBMITTED",
+            )
+
+    def reviewers(self) -> Iterator[tuple]:
+        for review in range(self.size.reviews):
+            work = self.dataset.review_work(review)
+            yield (
+                self.dataset.user_id(self.dataset.review_reviewer(review)),
+                self.dataset.event_id(self.dataset.work_event(work)),
+                self.dataset.work_id(work),
+                DEADLINE,
+            )
+
+    def reviews(self) -> Iterator[tuple]:
+        for review in range(self.size.reviews):
+            work = self.dataset.review_work(review)
+            event = self.dataset.work_event(work)
+            yield (
+                self.dataset.review_id(review),
+                self.dataset.submission_id(work),
+                self.dataset.user_id(self.dataset.review_reviewer(review)),
+                self.dataset.event_id(event),
+                self.dataset.work_id(work),
+                self.rng.choice(["APPROVED", "NOT_APPROVED", "RE_SUBMIT"]),
+                json.dumps(review_answers(self.dataset.event_review_skeleton(event), self.rng)),
+                False,
+            )
+
+    def payments(self) -> Iterator[tuple]:
+        for payment in range(self.size.payments):
+            inscription = self.dataset.payment_inscription(payment)
+            yield (
+                self.dataset.payment_id(payment),
+                self.dataset.event_id(self.dataset.inscription_event(inscription)),
+                self.dataset.inscription_id(inscription),
+                FARE["name"],
+                "APPROVED",
+                [],
+                0.0,
+                "ARS",
+            )
+
+    def event_room_slots(self) -> Iterator[tuple]:
+        for event in range(self.size.events):
+            for room, room_name in enumerate(ROOMS):
+                for grid_slot, (title, slot_type, start, hours) in enumerate(DAILY_GRID):
+                    yield (
+                        self.dataset.slot_id(event, room, grid_slot),
+                        self.dataset.event_id(event),
+                        room_name,
+                        title,
+                        slot_type,
+                        EVENT_START + timedelta(hours=start),
+                        EVENT_START + timedelta(hours=start + hours),
+                    )
+
+    def work_slots(self) -> Iterator[tuple]:
+        placed: dict[int, int] = {}
+        for work in range(0, self.size.works, 3):  # the approved works
+            event = self.dataset.work_event(work)
+            position = placed.get(event, 0)
+            placed[event] = position + 1
+            cell = position % (len(ROOMS) * len(WORK_SLOTS))
+            room, grid_slot = divmod(cell, len(WORK_SLOTS))
+            yield self.dataset.slot_id(event, room, WORK_SLOTS[grid_slot]), self.dataset.work_id(work)
+
+
+def _answer(question: dict, rng: random.Random):
+    if question["type_question"] == "rating":
+        return rng.randint(1, question["max_value"])
+    if question["type_question"] == "multiple_choice":
+        count = rng.randint(1, len(question["options"])) if question["more_than_one_answer_allowed"] else 1
+        return rng.sample(question["options"], count)
+    return _sentence(rng, 12)
+
+
+def review_answers(review_skeleton: dict, rng: random.Random) -> dict:
+    """Answers to every question of a review skeleton."""
+    return {"answers": [{**question, "answer": _answer(question, rng)} for question in review_skeleton["questions"]]}
+
+
+# Tables in foreign key order, with the columns their rows fill.
+COLUMNS: List[Tuple[str, Tuple[str, ...]]] = [
+    ("users", ("id", "email", "name", "lastname", "role")),
+    ("provider_accounts", ("id", "user_id", "provider", "access_token", "refresh_token", "public_key", "account_id",
+                           "account_status", "marketplace_fee", "marketplace_fee_type")),
+    ("events", ("id", "creator_id", "title", "description", "event_type", "status", "location", "contact",
+                "organized_by", "tracks", "notification_mails", "review_skeleton", "pricing", "dates", "mdata",
+                "provider_account_id")),
+    ("organizers", ("user_id", "event_id")),
+    ("chairs", ("user_id", "event_id", "tracks")),
+    ("inscriptions", ("id", "user_id", "event_id", "status", "roles")),
+    ("works", ("id", "event_id", "author_id", "title", "track", "abstract", "keywords", "authors", "state",
+               "deadline_date", "work_number")),
+    ("submissions", ("id", "event_id", "work_id", "state")),
+    ("reviewers", ("user_id", "event_id", "work_id", "review_deadline")),
+    ("reviews", ("id", "submission_id", "reviewer_id", "event_id", "work_id", "status", "review", "shared")),
+    ("payments", ("id", "event_id", "inscription_id", "fare_name", "status", "works", "amount", "currency")),
+    ("event_room_slots", ("id", "event_id", "room_name", "title", "slot_type", "start", "end")),
+    ("work_slots", ("slot_id", "work_id")),
+]  # fmt: skip
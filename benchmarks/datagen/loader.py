@@ -0,0 +1,73 @@
+"""
+Bulk loading of the synthetic dataset with COPY, bypassing the ORM.
+"""
+
+import time
+from typing import Iterator, List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+
+from app.database.models.event_stats import EVENT_STATS_SOURCES
+from app.repository.event_stats_repository import EventStatsRepository
+from benchmarks.datagen.dataset import COLUMNS, Dataset, Rows
+
+
+def _batches(rows: Iterator[tuple], batch_size: int) -> Iterator[List[tuple]]:
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def load(connection: AsyncConnection, dataset: Dataset, batch_size: int = 50_000) -> dict:
+    """COPYs the dataset into empty tables and returns the rows loaded per table."""
+    dataset.size.validate()
+    raw_connection = await connection.get_raw_connection()
+    driver = raw_connection.driver_connection
+    rows = Rows(dataset)
+    loaded = {}
+    # The dashboard counters are rebuilt once at the end, instead of by a trigger per row.
+    for table in EVENT_STATS_SOURCES:
+        await connection.execute(text(f"ALTER TABLE {table} DISABLE TRIGGER USER"))
+    for table, columns in COLUMNS:
+        loaded[table] = 0
+        for batch in _batches(getattr(rows, table)(), batch_size):
+            await driver.copy_records_to_table(table, records=batch, columns=columns)
+            loaded[table] += len(batch)
+    for table in EVENT_STATS_SOURCES:
+        await connection.execute(text(f"ALTER TABLE {table} ENABLE TRIGGER USER"))
+    async with AsyncSession(bind=connection, join_transaction_mode="create_savepoint") as session:
+        loaded["event_stats"] = await EventStatsRepository(session).rebuild()
+    await connection.execute(
+        text("SELECT setval(pg_get_serial_sequence('event_room_slots', 'id'), (SELECT max(id) FROM event_room_slots))")
+    )
+    await connection.execute(
+        text(
+            "UPDATE events SET last_work_number = numbers.last_work_number FROM "
+            "(SELECT event_id, max(work_number) AS last_work_number FROM works GROUP BY event_id) AS numbers "
+            "WHERE numbers.event_id = events.id"
+        )
+    )
+    for table in [*(table for table, _ in COLUMNS), "event_stats", "event_stats_deltas"]:
+        await connection.execute(text(f"ANALYZE {table}"))
+    return loaded
+
+
+async def reset_and_load(dataset: Dataset, batch_size: int = 50_000) -> dict:
+    """Drops and recreates every table of DATABASE_URL, loads the dataset and reports rows and time per table."""
+    import app.main  # noqa: F401 - maps every model, as relationships refer to each other by name
+    from app.database.database import engine
+    from app.database.models.base import Base
+
+    started = time.perf_counter()
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.drop_all)
+        await connection.run_sync(Base.metadata.create_all)
+        loaded = await load(connection, dataset, batch_size)
+    await engine.dispose()
+    return {"tables": loaded, "seconds": round(time.perf_counter() - started, 2)}
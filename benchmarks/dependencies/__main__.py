@@ -0,0 +1,43 @@
+"""
+Dependency resolution benchmark: time to resolve the service dependencies of every route, and how
+many dependencies run for it. Nothing reaches the database, so it only needs the app settings.
+
+    python -m benchmarks.dependencies --iterations 500
+    python -m benchmarks.dependencies --path works
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.dependencies.runner import run
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.dependencies", description=__doc__)
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--path", help="Only the routes whose path contains this text")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file instead of stdout")
+    return parser.parse_args(argv)
+
+
+async def _run(args) -> dict:
+    from app.main import app
+
+    return await run(app, args.iterations, args.path)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    report_json = json.dumps(asyncio.run(_run(args)), indent=2)
+    if args.output:
+        args.output.write_text(report_json + "\n")
+    else:
+        print(report_json)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,140 @@
+import inspect
+import platform
+import re
+import statistics
+import time
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from typing import Iterator, List
+from uuid import UUID
+
+from fastapi import FastAPI
+from fastapi.dependencies.models import Dependant, _get_cache_key
+from fastapi.dependencies.utils import solve_dependencies
+from fastapi.routing import APIRoute, _IncludedRouter
+from starlette.requests import Request
+
+from app.authorization.user_id_dep import verify_user_exists
+from app.database.models.user import UserRole
+from app.services.services import BaseService
+
+PATH_PARAMETER = re.compile(r"{(\w+)}")
+PARAMETER_VALUE = str(UUID(int=1))
+CALLER_ID = "benchmarkcaller0000000000000"
+
+
+@dataclass
+class RouteServices:
+    method: str
+    path: str
+    # The dependencies of the endpoint that provide a service, with their own dependencies.
+    dependant: Dependant
+
+
+def environment() -> dict:
+    return {"python": platform.python_version(), "machine": platform.machine(), "system": platform.system()}
+
+
+def _provides_service(dependant: Dependant) -> bool:
+    returned = inspect.signature(dependant.call).return_annotation if dependant.call is not None else None
+    return inspect.isclass(returned) and issubclass(returned, BaseService)
+
+
+def _routes(routes, prefix: str = "") -> Iterator[APIRoute]:
+    for route in routes:
+        if isinstance(route, _IncludedRouter):
+            yield from _routes(route.original_router.routes, prefix + route.include_context.prefix)
+        elif isinstance(route, APIRoute):
+            yield prefix, route
+
+
+def service_routes(app: FastAPI) -> List[RouteServices]:
+    """The routes whose endpoints depend on services, with the dependencies that build them."""
+    found = []
+    for prefix, route in _routes(app.router.routes):
+        services = [dependency for dependency in route.dependant.dependencies if _provides_service(dependency)]
+        if services:
+            for method in sorted(route.methods):
+                found.append(RouteServices(method, prefix + route.path, Dependant(dependencies=services)))
+    return found
+
+
+def _request(app: FastAPI, route: RouteServices, stack: AsyncExitStack) -> Request:
+    parameters = {name: PARAMETER_VALUE for name in PATH_PARAMETER.findall(route.path)}
+    return Request(
+        {
+            "type": "http",
+            "app": app,
+            "method": route.method,
+            "path": route.path,
+            # Included routes declare the parameters of the prefix as query parameters.
+            "query_string": "&".join(f"{name}={value}" for name, value in parameters.items()).encode(),
+            "headers": [(b"x-user-id", CALLER_ID.encode())],
+            "path_params": parameters,
+            "fastapi_inner_astack": stack,
+            "fastapi_function_astack": stack,
+        }
+    )
+
+
+def _authentication(dependant: Dependant) -> dict:
+    """Cache entries that resolve the authentication dependencies of the tree to an admin."""
+    entries = {}
+    for dependency in dependant.dependencies:
+        if dependency.call is verify_user_exists:
+            entries[_get_cache_key(dependant=dependency)] = UserRole.ADMIN
+        else:
+            entries.update(_authentication(dependency))
+    return entries
+
+
+async def _solve(app: FastAPI, route: RouteServices) -> int:
+    """Resolves the service dependencies of a route once. Returns the dependencies that ran."""
+    authentication = _authentication(route.dependant)
+    cache = dict(authentication)
+    async with AsyncExitStack() as stack:
+        solved = await solve_dependencies(
+            request=_request(app, route, stack),
+            dependant=route.dependant,
+            dependency_cache=cache,
+            async_exit_stack=stack,
+            embed_body_fields=False,
+        )
+    if solved.errors:
+        raise RuntimeError(f"{route.method} {route.path}: {solved.errors}")
+    return len(cache) - len(authentication)
+
+
+async def measure(app: FastAPI, route: RouteServices, iterations: int) -> dict:
+    dependencies = await _solve(app, route)
+    samples = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        await _solve(app, route)
+        samples.append(time.perf_counter() - started)
+    return {
+        "route": f"{route.method} {route.path}",
+        "dependencies": dependencies,
+        "p50_us": round(statistics.median(samples) * 1e6, 1),
+        "mean_us": round(statistics.fmean(samples) * 1e6, 1),
+    }
+
+
+async def run(app: FastAPI, iterations: int, path_filter: str | None = None) -> dict:
+    """
+    Times the resolution of the service dependencies of every route. The authentication of the
+    caller comes from the dependency cache, as if the route had resolved it first, so only building
+    the services is measured: sessions don't connect until their first statement.
+
+    Dependency overrides aren't used on purpose: with any override in place, FastAPI analyzes the
+    signature of every dependency again on each request, which would dominate the measure.
+    """
+    routes = [route for route in service_routes(app) if path_filter is None or path_filter in route.path]
+    results = [await measure(app, route, iterations) for route in routes]
+    results.sort(key=lambda result: result["p50_us"], reverse=True)
+    return {
+        "environment": environment(),
+        "iterations": iterations,
+        "total_p50_us": round(sum(result["p50_us"] for result in results), 1),
+        "routes": results,
+    }
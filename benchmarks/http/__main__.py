@@ -0,0 +1,40 @@
+"""
+HTTP serialization benchmark: time and size of large responses per serialization mode and content coding.
+
+    python -m benchmarks.http                                  # print results as JSON
+    python -m benchmarks.http --payloads works_500 --encodings identity br
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.http.payloads import PAYLOADS, PAYLOADS_BY_NAME
+from benchmarks.http.runner import ENCODINGS, MODES, run
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.http", description=__doc__)
+    parser.add_argument("--payloads", nargs="+", choices=sorted(PAYLOADS_BY_NAME), help="Payloads (default: all)")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--encodings", nargs="+", choices=ENCODINGS, default=ENCODINGS)
+    parser.add_argument("--iterations", type=int, default=30)
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    specs = [PAYLOADS_BY_NAME[name] for name in args.payloads] if args.payloads else PAYLOADS
+
+    report_json = json.dumps(run(specs, args.modes, args.encodings, args.iterations), indent=2)
+    if args.output:
+        args.output.write_text(report_json + "\n")
+    else:
+        print(report_json)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Callable, List
+from uuid import UUID
+
+from app.database.models.work import WorkStates
+from app.schemas.events.agenda import AgendaSchema, AgendaSlotSchema, AgendaWorkSchema
+from app.schemas.works.review import ReviewResponseSchema
+from app.schemas.works.work import WorkWithSchedule
+
+EVENT_START = datetime(2030, 3, 1, 9, 0)
+WORDS = (
+    "análisis rendimiento criptografía curvas redes distribuidas aprendizaje modelo sistema datos "
+    "energía simulación protocolo estudio caso método evaluación latencia algoritmo grafo óptimo"
+).split()
+
+
+def _uuid(rng: random.Random) -> UUID:
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def _text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def works(rng: random.Random, count: int) -> List[WorkWithSchedule]:
+    """Works as listed to organizers: long abstracts, several authors and their schedule."""
+    result = []
+    for number in range(count):
+        start = EVENT_START + timedelta(minutes=30 * number)
+        result.append(
+            WorkWithSchedule(
+                id=_uuid(rng),
+                title=_text(rng, 12).capitalize(),
+                track=f"track-{number % 8}",
+                abstract=_text(rng, 180),
+                keywords=[rng.choice(WORDS) for _ in range(5)],
+                authors=[
+                    {"full_name": f"Autor {number}-{author}", "mail": f"autor{number}.{author}@mail.com"}
+                    for author in range(rng.randint(1, 5))
+                ],
+                state=rng.choice(list(WorkStates)),
+                deadline_date=EVENT_START,
+                creation_date=EVENT_START - timedelta(days=60),
+                last_update=EVENT_START - timedelta(days=rng.randint(1, 30)),
+                room_name=f"Aula {number % 6}",
+                start_date=start,
+                end_date=start + timedelta(minutes=30),
+            )
+        )
+    return result
+
+
+def reviews(rng: random.Random, count: int) -> List[ReviewResponseSchema]:
+    """Reviews of an event with a handful of answered questions each."""
+    return [
+        ReviewResponseSchema(
+            id=_uuid(rng),
+            event_id=_uuid(rng),
+            work_id=_uuid(rng),
+            submission_id=_uuid(rng),
+            reviewer_id=f"reviewer{number:020d}",
+            reviewer={"name": "Revisor", "lastname": f"Número {number}", "email": f"revisor{number}@mail.com"},
+            creation_date=EVENT_START,
+            last_update=EVENT_START,
+            status="APPROVED",
+            review={
+                "answers": [
+                    {"type_question": "simple_question", "question": _text(rng, 8), "answer": _text(rng, 60)},
+                    {"type_question": "rating", "question": _text(rng, 8), "max_value": 10, "answer": 7},
+                    {
+                        "type_question": "multiple_choice",
+                        "question": _text(rng, 8),
+                        "options": ["Sí", "No", "Tal vez"],
+                        "more_than_one_answer_allowed": False,
+                        "answer": ["Sí"],
+                    },
+                ]
+            },
+        )
+        for number in range(count)
+    ]
+
+
+def agenda(rng: random.Random, slots: int) -> AgendaSchema:
+    """The public agenda of an event with `slots` slots of four works."""
+    return AgendaSchema(
+        event_id=_uuid(rng),
+        slots=[
+            AgendaSlotSchema(
+                id=number,
+                room_name=f"Aula {number % 6}",
+                slot_type="slot",
+                start=EVENT_START + timedelta(hours=number // 6),
+                end=EVENT_START + timedelta(hours=number // 6 + 1),
+                works=[
+                    AgendaWorkSchema(id=_uuid(rng), title=_text(rng, 12), track="track-1", work_number=number * 4 + i)
+                    for i in range(4)
+                ],
+            )
+            for number in range(slots)
+        ],
+    )
+
+
+@dataclass(frozen=True)
+class PayloadSpec:
+    """A response body as some endpoint returns it, and the type it is declared with."""
+
+    name: str
+    response_type: Any
+    build: Callable[[random.Random], Any]
+    seed: int = 0
+
+    def generate(self) -> Any:
+        return self.build(random.Random(self.seed))
+
+
+PAYLOADS = [
+    PayloadSpec("works_500", List[WorkWithSchedule], lambda rng: works(rng, 500)),
+    PayloadSpec("works_20", List[WorkWithSchedule], lambda rng: works(rng, 20)),
+    PayloadSpec("reviews_300", List[ReviewResponseSchema], lambda rng: reviews(rng, 300)),
+    PayloadSpec("agenda_200_slots", AgendaSchema, lambda rng: agenda(rng, 200)),
+]
+PAYLOADS_BY_NAME = {spec.name: spec for spec in PAYLOADS}
@@ -0,0 +1,95 @@
+import asyncio
+import platform
+import statistics
+import time
+import warnings
+from typing import Any, Callable
+
+from fastapi import FastAPI, Response
+from fastapi.exceptions import FastAPIDeprecationWarning
+from fastapi.responses import ORJSONResponse
+from httpx import ASGITransport, AsyncClient
+from pydantic import TypeAdapter
+
+from app.middlewares.compression import CompressionMiddleware
+from benchmarks.http.payloads import PayloadSpec
+
+PATH = "/payload"
+
+
+def _response_model_app(response_type: Any, body: Any, **app_options) -> FastAPI:
+    app = FastAPI(**app_options)
+    app.add_api_route(PATH, lambda: body, response_model=response_type)
+    return app
+
+
+def _type_adapter_app(response_type: Any, body: Any) -> FastAPI:
+    adapter = TypeAdapter(response_type)
+    app = FastAPI()
+    app.add_api_route(PATH, lambda: Response(adapter.dump_json(body), media_type="application/json"))
+    return app
+
+
+def _orjson_app(response_type: Any, body: Any) -> FastAPI:
+    # ORJSONResponse warns on every response; it is measured on purpose.
+    warnings.filterwarnings("ignore", category=FastAPIDeprecationWarning)
+    return _response_model_app(response_type, body, default_response_class=ORJSONResponse)
+
+
+# How the endpoint turns the returned models into bytes.
+#   response_model: what the routers do, FastAPI dumps straight to bytes with the model's TypeAdapter
+#   orjson: an ORJSONResponse default class, which goes through jsonable_encoder before orjson
+#   type_adapter: the route serializes the body itself and returns a plain Response
+MODES: dict[str, Callable[[Any, Any], FastAPI]] = {
+    "response_model": _response_model_app,
+    "orjson": _orjson_app,
+    "type_adapter": _type_adapter_app,
+}
+ENCODINGS = ["identity", "gzip", "br"]
+
+
+def environment() -> dict:
+    return {"python": platform.python_version(), "machine": platform.machine(), "system": platform.system()}
+
+
+def _percentile(samples: list[float], percentile: int) -> float:
+    return statistics.quantiles(samples, n=100, method="inclusive")[percentile - 1]
+
+
+async def _measure(app: FastAPI, encoding: str, iterations: int) -> tuple[list[float], int]:
+    samples = []
+    wire_bytes = 0
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        headers = {"Accept-Encoding": encoding}
+        await client.get(PATH, headers=headers)
+        for _ in range(iterations):
+            started = time.perf_counter()
+            response = await client.get(PATH, headers=headers)
+            samples.append(time.perf_counter() - started)
+            response.raise_for_status()
+            wire_bytes = int(response.headers["content-length"])
+    return samples, wire_bytes
+
+
+def run_case(spec: PayloadSpec, mode: str, encoding: str, iterations: int) -> dict:
+    app = MODES[mode](spec.response_type, spec.generate())
+    app.add_middleware(CompressionMiddleware)
+    samples, wire_bytes = asyncio.run(_measure(app, encoding, iterations))
+    return {
+        "payload": spec.name,
+        "mode": mode,
+        "encoding": encoding,
+        "p50_ms": round(statistics.median(samples) * 1000, 3),
+        "p95_ms": round(_percentile(samples, 95) * 1000, 3),
+        "response_bytes": wire_bytes,
+    }
+
+
+def run(specs: list[PayloadSpec], modes: list[str], encodings: list[str], iterations: int) -> dict:
+    return {
+        "environment": environment(),
+        "iterations": iterations,
+        "results": [
+            run_case(spec, mode, encoding, iterations) for spec in specs for mode in modes for encoding in encodings
+        ],
+    }
@@ -0,0 +1,78 @@
+"""
+End-to-end load test: boots app.main:app with uvicorn against DATABASE_URL, replays weighted user
+scenarios (browsing events, my events, inscriptions, payments, provider webhook bursts, reviews and
+the agenda) with concurrent virtual users, and reports p50/p95/p99 latency, throughput and error
+rates per endpoint as JSON.
+
+The dataset is derived from the seed and the scale (1 is 10k events, 200k users, 500k inscriptions
+and 100k works, reviews and payments). --reset drops and recreates every table of DATABASE_URL and
+loads the dataset of benchmarks.datagen into it, so point it to a database dedicated to load tests.
+Later runs with the same --scale and --seed reuse the loaded data.
+
+    python -m benchmarks.load --reset --scale 0.01 --duration 30 --concurrency 20
+    python -m benchmarks.load --target http://localhost:8080 --weights inscribe=0 pay=0
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.datagen.dataset import FULL_SIZE, Dataset
+from benchmarks.datagen.loader import reset_and_load
+from benchmarks.load.runner import app_server, run_load
+from benchmarks.load.scenarios import DEFAULT_WEIGHTS
+
+
+def _weight(value: str):
+    name, _, weight = value.partition("=")
+    if name not in DEFAULT_WEIGHTS or not weight:
+        raise argparse.ArgumentTypeError(f"Expected <scenario>=<weight> with a scenario in {list(DEFAULT_WEIGHTS)}")
+    return name, float(weight)
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.load", description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--scale", type=float, default=0.01, help="Dataset size relative to scale 1")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--reset", action="store_true", help="Recreate the tables of DATABASE_URL and load the dataset")
+    parser.add_argument("--duration", type=float, default=30, help="Seconds of load")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent virtual users")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers of the booted server")
+    parser.add_argument("--target", help="Base URL of a running server to load instead of booting one")
+    parser.add_argument("--weights", nargs="+", type=_weight, default=[], help="Overrides, as <scenario>=<weight>")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    dataset = Dataset(FULL_SIZE.scaled(args.scale), args.seed)
+    weights = {**DEFAULT_WEIGHTS, **dict(args.weights)}
+    if args.reset:
+        loaded = asyncio.run(reset_and_load(dataset))
+        print(f"Loaded {json.dumps(loaded)}", file=sys.stderr)
+
+    def _run(base_url: str) -> dict:
+        return asyncio.run(run_load(base_url, dataset, weights, args.concurrency, args.duration, args.seed))
+
+    if args.target:
+        report = _run(args.target)
+    else:
+        with app_server(args.workers) as base_url:
+            report = _run(base_url)
+    report["parameters"]["scale"] = args.scale
+
+    report_json = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(report_json + "\n")
+    else:
+        print(report_json)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import os
+import platform
+import random
+import socket
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from dataclasses import asdict
+from typing import Dict, Iterator
+
+import httpx
+
+from benchmarks.datagen.dataset import Dataset
+from benchmarks.load.scenarios import SCENARIOS, ScenarioContext
+from benchmarks.load.stats import Recorder
+
+READY_PATH = "/metrics"
+
+
+def environment() -> dict:
+    return {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "system": platform.system(),
+        "cpus": os.cpu_count(),
+    }
+
+
+def _free_port() -> int:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+@contextmanager
+def app_server(workers: int = 1, startup_timeout: float = 60.0) -> Iterator[str]:
+    """Boots app.main:app with uvicorn in a child process, with the environment of this one."""
+    port = _free_port()
+    command = [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port)]
+    command += ["--workers", str(workers), "--log-level", "warning", "--no-access-log"]
+    # The report goes to stdout, so whatever the server prints goes to stderr.
+    server = subprocess.Popen(command, stdout=sys.stderr)
+    base_url = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.monotonic() + startup_timeout
+        while True:
+            if server.poll() is not None:
+                raise RuntimeError(f"The app server exited with code {server.returncode}")
+            try:
+                if httpx.get(base_url + READY_PATH).status_code == 200:
+                    break
+            except httpx.TransportError:
+                pass
+            if time.monotonic() > deadline:
+                raise RuntimeError("The app server didn't start in time")
+            time.sleep(0.2)
+        yield base_url
+    finally:
+        server.terminate()
+        server.wait()
+
+
+async def _virtual_user(context: ScenarioContext, weights: Dict[str, float], deadline: float) -> None:
+    names, scenario_weights = list(weights), list(weights.values())
+    while time.monotonic() < deadline:
+        [name] = context.rng.choices(names, scenario_weights)
+        await SCENARIOS[name](context)
+
+
+async def run_load(
+    base_url: str, dataset: Dataset, weights: Dict[str, float], concurrency: int, duration: float, seed: int
+) -> dict:
+    """Runs `concurrency` virtual users replaying weighted scenarios for `duration` seconds."""
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=concurrency * 2)
+    async with httpx.AsyncClient(base_url=base_url, limits=limits, timeout=30) as client:
+        started = time.monotonic()
+        deadline = started + duration
+        await asyncio.gather(
+            *(
+                _virtual_user(
+                    ScenarioContext(client, dataset, random.Random(seed * 1000 + number), recorder), weights, deadline
+                )
+                for number in range(concurrency)
+            )
+        )
+        elapsed = time.monotonic() - started
+    return {
+        "environment": environment(),
+        "parameters": {
+            "dataset": {**asdict(dataset.size), "seed": dataset.seed},
+            "weights": weights,
+            "concurrency": concurrency,
+            "duration_seconds": round(elapsed, 2),
+        },
+        **recorder.report(elapsed),
+    }
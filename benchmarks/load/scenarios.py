@@ -0,0 +1,151 @@
+"""
+Weighted user scenarios replayed against the app. Each scenario picks consistent rows of the
+dataset by index and issues the requests a real user would, recording them by route template.
+"""
+
+import asyncio
+import random
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Dict
+
+from httpx import AsyncClient
+
+from benchmarks.datagen.dataset import FARE, Dataset, review_answers
+from benchmarks.load.stats import Recorder
+
+Scenario = Callable[["ScenarioContext"], Awaitable[None]]
+
+WEBHOOK_BURST = 10
+PAGE_SIZE = 20
+
+
+@dataclass
+class ScenarioContext:
+    client: AsyncClient
+    dataset: Dataset
+    rng: random.Random
+    recorder: Recorder
+
+    async def request(self, method: str, route: str, url: str, user: int | None = None, **kwargs) -> int:
+        headers = {"X-User-Id": self.dataset.user_id(user)} if user is not None else {}
+        return await self.recorder.request(self.client, method, route, url, headers=headers, **kwargs)
+
+    def pick(self, count: int) -> int:
+        return self.rng.randrange(count)
+
+
+async def browse_events(context: ScenarioContext) -> None:
+    pages = max(1, context.dataset.size.events // PAGE_SIZE)
+    offset = context.pick(min(pages, 50)) * PAGE_SIZE
+    user = context.pick(context.dataset.size.users)
+    await context.request("GET", "/events/", f"/events/?status=STARTED&offset={offset}&limit={PAGE_SIZE}", user=user)
+    event = context.dataset.event_id(context.pick(context.dataset.size.events))
+    await context.request("GET", "/events/{event_id}/public", f"/events/{event}/public", user=user)
+
+
+async def my_events(context: ScenarioContext) -> None:
+    user = context.dataset.inscription_user(context.pick(context.dataset.size.inscriptions))
+    await context.request("GET", "/events/my-events", "/events/my-events", user=user)
+
+
+async def inscribe(context: ScenarioContext) -> None:
+    user = context.pick(context.dataset.size.users)
+    event = context.dataset.event_not_inscribed(user, context.pick(context.dataset.size.events))
+    if event is None:
+        return
+    await context.request(
+        "POST",
+        "/events/{event_id}/inscriptions",
+        f"/events/{context.dataset.event_id(event)}/inscriptions",
+        user=user,
+        json={"roles": ["ATTENDEE"]},
+    )
+
+
+async def pay(context: ScenarioContext) -> None:
+    inscription = context.pick(context.dataset.size.inscriptions)
+    event_id = context.dataset.event_id(context.dataset.inscription_event(inscription))
+    inscription_id = context.dataset.inscription_id(inscription)
+    user = context.dataset.inscription_user(inscription)
+    await context.request(
+        "PUT",
+        "/events/{event_id}/inscriptions/{inscription_id}/pay",
+        f"/events/{event_id}/inscriptions/{inscription_id}/pay",
+        user=user,
+        json={"fare_name": FARE["name"], "works": []},
+    )
+    await context.request(
+        "GET",
+        "/events/{event_id}/inscriptions/{inscription_id}/payments",
+        f"/events/{event_id}/inscriptions/{inscription_id}/payments",
+        user=user,
+    )
+
+
+async def webhook_burst(context: ScenarioContext) -> None:
+    """The payment provider retrying notifications: several concurrent webhooks for the same payments."""
+    payments = [context.pick(context.dataset.size.payments) for _ in range(3)]
+    requests = []
+    for number in range(WEBHOOK_BURST):
+        payment = payments[number % len(payments)]
+        event = context.dataset.inscription_event(context.dataset.payment_inscription(payment))
+        requests.append(
+            context.request(
+                "POST",
+                "/events/{event_id}/provider/webhook",
+                f"/events/{context.dataset.event_id(event)}/provider/webhook",
+                json={"external_reference": str(context.dataset.payment_id(payment)), "status": "approved"},
+            )
+        )
+    await asyncio.gather(*requests)
+
+
+async def review(context: ScenarioContext) -> None:
+    review = context.pick(context.dataset.size.reviews)
+    work = context.dataset.review_work(review)
+    event = context.dataset.work_event(work)
+    event_id = context.dataset.event_id(event)
+    work_id = context.dataset.work_id(work)
+    reviewer = context.dataset.review_reviewer(review)
+    await context.request(
+        "GET",
+        "/events/{event_id}/reviewers/my-assignments",
+        f"/events/{event_id}/reviewers/my-assignments",
+        user=reviewer,
+    )
+    await context.request(
+        "PUT",
+        "/events/{event_id}/works/{work_id}/reviews/{review_id}",
+        f"/events/{event_id}/works/{work_id}/reviews/{context.dataset.review_id(review)}",
+        user=reviewer,
+        json={
+            "status": "APPROVED",
+            "review": review_answers(context.dataset.event_review_skeleton(event), context.rng),
+        },
+    )
+
+
+async def schedule(context: ScenarioContext) -> None:
+    event_id = context.dataset.event_id(context.pick(context.dataset.size.events))
+    await context.request("GET", "/events/{event_id}/agenda", f"/events/{event_id}/agenda")
+
+
+SCENARIOS: Dict[str, Scenario] = {
+    "browse_events": browse_events,
+    "my_events": my_events,
+    "inscribe": inscribe,
+    "pay": pay,
+    "webhook_burst": webhook_burst,
+    "review": review,
+    "schedule": schedule,
+}
+# Relative frequency of every scenario: mostly reads, as in a real installation.
+DEFAULT_WEIGHTS: Dict[str, float] = {
+    "browse_events": 30,
+    "my_events": 20,
+    "inscribe": 8,
+    "pay": 8,
+    "webhook_burst": 4,
+    "review": 10,
+    "schedule": 20,
+}
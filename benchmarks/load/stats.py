@@ -0,0 +1,70 @@
+import statistics
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+from httpx import AsyncClient, HTTPError
+
+
+def _percentile(samples: List[float], percentile: int) -> float:
+    if len(samples) == 1:
+        return samples[0]
+    return statistics.quantiles(samples, n=100, method="inclusive")[percentile - 1]
+
+
+@dataclass
+class EndpointStats:
+    latencies: List[float] = field(default_factory=list)
+    statuses: Counter = field(default_factory=Counter)
+
+    def summary(self, elapsed: float) -> dict:
+        requests = sum(self.statuses.values())
+        server_errors = sum(count for status, count in self.statuses.items() if status == "error" or status >= 500)
+        client_errors = sum(count for status, count in self.statuses.items() if status != "error" and status >= 400)
+        summary = {
+            "requests": requests,
+            "throughput_rps": round(requests / elapsed, 2),
+            "error_rate": round(server_errors / requests, 4),
+            "client_error_rate": round(client_errors / requests, 4),
+            "statuses": {str(status): count for status, count in sorted(self.statuses.items(), key=str)},
+        }
+        if self.latencies:
+            summary.update(
+                {
+                    "p50_ms": round(_percentile(self.latencies, 50) * 1000, 2),
+                    "p95_ms": round(_percentile(self.latencies, 95) * 1000, 2),
+                    "p99_ms": round(_percentile(self.latencies, 99) * 1000, 2),
+                    "max_ms": round(max(self.latencies) * 1000, 2),
+                }
+            )
+        return summary
+
+
+class Recorder:
+    """Latency and outcome of every request, by method and route template."""
+
+    def __init__(self):
+        self.endpoints: Dict[str, EndpointStats] = {}
+
+    async def request(self, client: AsyncClient, method: str, route: str, url: str, **kwargs) -> int | str:
+        stats = self.endpoints.setdefault(f"{method} {route}", EndpointStats())
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except HTTPError:
+            stats.statuses["error"] += 1
+            return "error"
+        stats.latencies.append(time.perf_counter() - started)
+        stats.statuses[response.status_code] += 1
+        return response.status_code
+
+    def report(self, elapsed: float) -> dict:
+        overall = EndpointStats()
+        for stats in self.endpoints.values():
+            overall.latencies += stats.latencies
+            overall.statuses.update(stats.statuses)
+        return {
+            "overall": overall.summary(elapsed) if overall.statuses else {},
+            "endpoints": {name: stats.summary(elapsed) for name, stats in sorted(self.endpoints.items())},
+        }
@@ -0,0 +1,47 @@
+"""
+Read path benchmark: per-row cost of listing works through ORM hydration versus row projection.
+
+Seeds an event inside a transaction that is rolled back at the end, so it needs DATABASE_URL
+pointing to a migrated database but leaves it untouched.
+
+    python -m benchmarks.projection --rows 2000 --repeat 10
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.projection.runner import MODES, run
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.projection", description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000, help="Works to seed and list in a single page")
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file instead of stdout")
+    return parser.parse_args(argv)
+
+
+async def _run(args) -> dict:
+    import app.main  # noqa: F401 - maps every model, as relationships refer to each other by name
+    from app.database.database import engine
+
+    async with engine.connect() as connection:
+        return await run(connection, args.rows, args.repeat, args.modes)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    report_json = json.dumps(asyncio.run(_run(args)), indent=2)
+    if args.output:
+        args.output.write_text(report_json + "\n")
+    else:
+        print(report_json)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+import platform
+import statistics
+import time
+from datetime import datetime, timedelta
+from typing import List
+from uuid import uuid4
+
+from pydantic import TypeAdapter
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.database.models import WorkSlotModel
+from app.database.models.event import EventModel
+from app.database.models.event_room_slot import EventRoomSlotModel
+from app.database.models.user import UserModel
+from app.database.models.work import WorkModel
+from app.repository.works_repository import WorksRepository
+from app.schemas.works.work import WorkWithSchedule
+
+EVENT_START = datetime(2030, 3, 1, 9, 0)
+WORKS_PER_SLOT = 2
+RESPONSE = TypeAdapter(List[WorkWithSchedule])
+
+
+def environment() -> dict:
+    return {"python": platform.python_version(), "machine": platform.machine(), "system": platform.system()}
+
+
+async def seed(session: AsyncSession, works: int):
+    """An event with `works` works, each linked to a slot. Returns the event id."""
+    user = UserModel(id=uuid4().hex[:28], email=f"{uuid4().hex}@bench.com", name="Bench", lastname="Mark")
+    event = EventModel(id=uuid4(), creator_id=user.id, title=f"Benchmark {uuid4().hex}", tracks=["math"])
+    session.add_all([user, event])
+    await session.flush()
+
+    slots = [
+        EventRoomSlotModel(
+            event_id=event.id,
+            room_name=f"Aula {number % 4}",
+            slot_type="slot",
+            start=EVENT_START + timedelta(hours=number),
+            end=EVENT_START + timedelta(hours=number + 1),
+        )
+        for number in range(works // WORKS_PER_SLOT + 1)
+    ]
+    work_models = [
+        WorkModel(
+            id=uuid4(),
+            event_id=event.id,
+            author_id=user.id,
+            title=f"Work {number}",
+            track="math",
+            abstract="Resumen del trabajo " * 40,
+            keywords=["bench", "mark"],
+            authors=[{"full_name": "Autor", "mail": "autor@mail.com"}] * 3,
+            deadline_date=EVENT_START,
+        )
+        for number in range(works)
+    ]
+    session.add_all(slots + work_models)
+    await session.flush()
+    session.add_all(
+        [
+            WorkSlotModel(slot_id=slots[number // WORKS_PER_SLOT].id, work_id=work.id)
+            for number, work in enumerate(work_models)
+        ]
+    )
+    await session.flush()
+    return event.id
+
+
+async def orm_hydration(session: AsyncSession, event_id, limit: int) -> list:
+    """The previous read path: eager-loaded WorkModel objects validated into schemas row by row."""
+    stmt = (
+        select(WorkModel)
+        .where(WorkModel.event_id == event_id)
+        .options(selectinload(WorkModel.slot_links).selectinload(WorkSlotModel.slot))
+        .limit(limit)
+    )
+    results = []
+    for work in (await session.execute(stmt)).scalars().all():
+        work_dto = WorkWithSchedule.model_validate(work, from_attributes=True)
+        if work.slot_links and work.slot_links[0].slot:
+            work_dto.start_date = work.slot_links[0].slot.start
+            work_dto.end_date = work.slot_links[0].slot.end
+            work_dto.room_name = work.slot_links[0].slot.room_name
+        results.append(work_dto)
+    return results
+
+
+async def row_projection(session: AsyncSession, event_id, limit: int) -> list:
+    return await WorksRepository(session).get_works_with_schedule(event_id, None, 0, limit)
+
+
+# How a list of works is read, before FastAPI validates it against the response model and dumps it.
+MODES = {"orm_hydration": orm_hydration, "row_projection": row_projection}
+
+
+async def run_mode(connection: AsyncConnection, mode: str, event_id, rows: int, repeat: int) -> dict:
+    samples = []
+    body = b""
+    for _ in range(repeat):
+        # A new session per run, so ORM objects are not served from a warm identity map.
+        async with AsyncSession(bind=connection, join_transaction_mode="create_savepoint") as session:
+            started = time.perf_counter()
+            works = await MODES[mode](session, event_id, rows)
+            body = RESPONSE.dump_json(RESPONSE.validate_python(works))
+            samples.append(time.perf_counter() - started)
+    median = statistics.median(samples)
+    return {
+        "mode": mode,
+        "rows": rows,
+        "median_ms": round(median * 1000, 2),
+        "per_row_us": round(median / rows * 1_000_000, 1),
+        "response_bytes": len(body),
+    }
+
+
+async def run(connection: AsyncConnection, rows: int, repeat: int, modes: list[str]) -> dict:
+    transaction = await connection.begin()
+    try:
+        async with AsyncSession(bind=connection, join_transaction_mode="create_savepoint") as session:
+            event_id = await seed(session, rows)
+            # Releases the savepoint only: the outer transaction is rolled back below.
+            await session.commit()
+        # Fresh rows have no statistics yet; plan the reads as on a database that has been analyzed.
+        for table in (WorkModel, WorkSlotModel, EventRoomSlotModel):
+            await connection.execute(text(f"ANALYZE {table.__tablename__}"))
+        results = [await run_mode(connection, mode, event_id, rows, repeat) for mode in modes]
+    finally:
+        await transaction.rollback()
+    return {"environment": environment(), "repeat": repeat, "results": results}
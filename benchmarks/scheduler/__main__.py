@@ -0,0 +1,61 @@
+"""
+Scheduler benchmark.
+
+    python -m benchmarks.scheduler                       # print results as JSON
+    python -m benchmarks.scheduler --check               # fail on regressions against the baseline
+    python -m benchmarks.scheduler --update-baseline     # store the current results as the baseline
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+from benchmarks.scheduler.cases import CASES, CASES_BY_NAME
+from benchmarks.scheduler.runner import MODES, Tolerances, find_regressions, run
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.scheduler", description=__doc__)
+    parser.add_argument("--cases", nargs="+", choices=sorted(CASES_BY_NAME), help="Cases to run (default: all)")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES), help="Solver modes to run")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file instead of stdout")
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--check", action="store_true", help="Exit with an error if results regress")
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--time-tolerance", type=float, default=Tolerances.wall_time)
+    parser.add_argument("--nodes-tolerance", type=float, default=Tolerances.nodes)
+    parser.add_argument("--memory-tolerance", type=float, default=Tolerances.memory)
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    logging.basicConfig(level=logging.WARNING)
+    args = parse_args(argv)
+    specs = [CASES_BY_NAME[name] for name in args.cases] if args.cases else CASES
+
+    report = run(specs, args.modes)
+    report_json = json.dumps(report, indent=2)
+    if args.output:
+        args.output.write_text(report_json + "\n")
+    else:
+        print(report_json)
+
+    if args.update_baseline:
+        args.baseline.write_text(report_json + "\n")
+        return 0
+
+    if args.check:
+        tolerances = Tolerances(wall_time=args.time_tolerance, nodes=args.nodes_tolerance, memory=args.memory_tolerance)
+        regressions = find_regressions(report, json.loads(args.baseline.read_text()), tolerances)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,38 @@
+from benchmarks.scheduler.generators import SyntheticEventSpec
+
+CASES = [
+    SyntheticEventSpec(name="small", tracks=2, works_per_track=4, rooms=2, days=1, slots_per_day=4),
+    SyntheticEventSpec(name="medium", tracks=3, works_per_track=6, rooms=3, days=2, slots_per_day=3, seed=1),
+    SyntheticEventSpec(
+        name="medium_pre_assigned",
+        tracks=3,
+        works_per_track=6,
+        rooms=3,
+        days=2,
+        slots_per_day=3,
+        pre_assigned_ratio=0.3,
+        seed=2,
+    ),
+    SyntheticEventSpec(
+        name="short_slots",
+        tracks=3,
+        works_per_track=3,
+        rooms=2,
+        days=2,
+        slots_per_day=3,
+        slot_minutes=30,
+        seed=3,
+    ),
+    SyntheticEventSpec(
+        name="large_pre_assigned",
+        tracks=5,
+        works_per_track=30,
+        rooms=5,
+        days=3,
+        slots_per_day=8,
+        pre_assigned_ratio=0.6,
+        seed=4,
+    ),
+]
+
+CASES_BY_NAME = {case.name: case for case in CASES}
@@ -0,0 +1,82 @@
+import random
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from uuid import UUID
+
+from app.services.slots.ConfigurableBBScheduler import SolverSlot, SolverWork
+
+EVENT_START = datetime(2030, 3, 1, 9, 0)
+
+
+@dataclass(frozen=True)
+class SyntheticEventSpec:
+    """
+    Shape of a generated event. Every day has `slots_per_day` consecutive slots of
+    `slot_minutes` in every room, and `pre_assigned_ratio` of the slots already hold
+    works of a single track, as if they had been scheduled by hand.
+    """
+
+    name: str
+    tracks: int
+    works_per_track: int
+    rooms: int
+    days: int
+    slots_per_day: int
+    slot_minutes: int = 60
+    time_per_work: int = 30
+    pre_assigned_ratio: float = 0.0
+    seed: int = 0
+
+
+@dataclass
+class SyntheticEvent:
+    spec: SyntheticEventSpec
+    works: list[SolverWork]
+    slots: list[SolverSlot]
+
+    @property
+    def pre_assigned_links(self) -> int:
+        return sum(len(slot.work_ids) for slot in self.slots)
+
+
+def generate_event(spec: SyntheticEventSpec) -> SyntheticEvent:
+    rng = random.Random(spec.seed)
+
+    works_by_track: dict[str, list[SolverWork]] = {}
+    for track_number in range(spec.tracks):
+        track = f"track-{track_number}"
+        works_by_track[track] = [
+            SolverWork(id=UUID(int=rng.getrandbits(128), version=4), track=track) for _ in range(spec.works_per_track)
+        ]
+
+    slots = []
+    slot_id = 1
+    for day in range(spec.days):
+        for slot_number in range(spec.slots_per_day):
+            start = EVENT_START + timedelta(days=day, minutes=slot_number * spec.slot_minutes)
+            for room_number in range(spec.rooms):
+                slots.append(
+                    SolverSlot(
+                        id=slot_id,
+                        room_name=f"room-{room_number}",
+                        start=start,
+                        end=start + timedelta(minutes=spec.slot_minutes),
+                    )
+                )
+                slot_id += 1
+
+    _pre_assign(spec, rng, slots, works_by_track)
+    works = [work for track_works in works_by_track.values() for work in track_works]
+    return SyntheticEvent(spec=spec, works=works, slots=slots)
+
+
+def _pre_assign(spec, rng, slots, works_by_track) -> None:
+    capacity = spec.slot_minutes // spec.time_per_work
+    pending = {track: list(track_works) for track, track_works in works_by_track.items()}
+    for slot in rng.sample(slots, round(len(slots) * spec.pre_assigned_ratio)):
+        tracks_with_works = sorted(track for track, track_works in pending.items() if track_works)
+        if not tracks_with_works:
+            return
+        track = rng.choice(tracks_with_works)
+        placed, pending[track] = pending[track][:capacity], pending[track][capacity:]
+        slot.work_ids = tuple(work.id for work in placed)
@@ -0,0 +1,108 @@
+import platform
+import time
+import tracemalloc
+from dataclasses import dataclass
+
+from app.services.slots.ConfigurableBBScheduler import ConfigurableBBScheduler, CostPenalties
+from benchmarks.scheduler.generators import SyntheticEventSpec, generate_event
+
+PENALTIES = CostPenalties.from_params(same_day_tracks=2, same_room_tracks=1)
+
+# Scheduler options per solver mode. "repair" only searches around the pre-assigned slots.
+MODES: dict[str, dict] = {
+    "serial": {},
+    "serial_without_transposition": {"transposition_table_size": 0},
+    "parallel": {"workers": 2},
+    "repair": {"repair": True},
+}
+
+# Node counts of the parallel search depend on how fast workers share their incumbents.
+NON_DETERMINISTIC_NODES_MODES = {"parallel"}
+
+
+@dataclass(frozen=True)
+class Tolerances:
+    """Relative increase over the baseline that is still accepted."""
+
+    wall_time: float = 1.0
+    nodes: float = 0.1
+    memory: float = 0.5
+    # Wall time differences below this many seconds are considered noise.
+    min_wall_time_delta: float = 0.05
+
+
+def environment() -> dict:
+    return {"python": platform.python_version(), "machine": platform.machine(), "system": platform.system()}
+
+
+def run_case(spec: SyntheticEventSpec, mode: str) -> dict:
+    options = dict(MODES[mode])
+    repair = options.pop("repair", False)
+    event = generate_event(spec)
+
+    tracemalloc.start()
+    started = time.perf_counter()
+    scheduler = ConfigurableBBScheduler(
+        works=event.works, slots=event.slots, time_per_work=spec.time_per_work, penalties=PENALTIES, **options
+    )
+    if repair:
+        scheduler.restrict_to_neighbourhood()
+    assignments, cost = scheduler.solve()
+    wall_time = time.perf_counter() - started
+    _, peak_memory = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "case": spec.name,
+        "mode": mode,
+        "works": len(event.works),
+        "slots": len(event.slots),
+        "pre_assigned_links": event.pre_assigned_links,
+        "wall_time_s": round(wall_time, 4),
+        "nodes_explored": scheduler.stats.nodes_explored,
+        "bound_prunes": scheduler.stats.bound_prunes,
+        "transposition_prunes": scheduler.stats.transposition_prunes,
+        "transposition_hits": scheduler.stats.transposition_hits,
+        "transposition_misses": scheduler.stats.transposition_misses,
+        # Only the calling process is traced: memory used by parallel workers is not included.
+        "peak_memory_kib": round(peak_memory / 1024, 1),
+        "final_cost": cost,
+        "assignments": len(assignments),
+    }
+
+
+def run(specs: list[SyntheticEventSpec], modes: list[str]) -> dict:
+    return {"environment": environment(), "results": [run_case(spec, mode) for spec in specs for mode in modes]}
+
+
+def find_regressions(report: dict, baseline: dict, tolerances: Tolerances) -> list[str]:
+    baseline_results = {(entry["case"], entry["mode"]): entry for entry in baseline.get("results", [])}
+    regressions = []
+    for result in report["results"]:
+        key = (result["case"], result["mode"])
+        expected = baseline_results.get(key)
+        if expected is None:
+            continue
+        label = f"{result['case']}/{result['mode']}"
+
+        if result["final_cost"] > expected["final_cost"]:
+            regressions.append(f"{label}: final cost {result['final_cost']} > baseline {expected['final_cost']}")
+
+        if result["mode"] not in NON_DETERMINISTIC_NODES_MODES:
+            nodes_limit = expected["nodes_explored"] * (1 + tolerances.nodes)
+            if result["nodes_explored"] > nodes_limit:
+                regressions.append(
+                    f"{label}: nodes explored {result['nodes_explored']} > baseline {expected['nodes_explored']}"
+                )
+
+        wall_time_limit = expected["wall_time_s"] * (1 + tolerances.wall_time)
+        wall_time_delta = result["wall_time_s"] - expected["wall_time_s"]
+        if result["wall_time_s"] > wall_time_limit and wall_time_delta > tolerances.min_wall_time_delta:
+            regressions.append(f"{label}: wall time {result['wall_time_s']}s > baseline {expected['wall_time_s']}s")
+
+        memory_limit = expected["peak_memory_kib"] * (1 + tolerances.memory)
+        if result["peak_memory_kib"] > memory_limit:
+            regressions.append(
+                f"{label}: peak memory {result['peak_memory_kib']}KiB > baseline {expected['peak_memory_kib']}KiB"
+            )
+    return regressions
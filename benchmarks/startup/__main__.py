@@ -0,0 +1,36 @@
+"""
+Cold start benchmark: starts fresh processes that import the app and run its lifespan, and reports
+the median import time, the time of every startup step and the import time of every subsystem
+(`python -X importtime` self times, grouped by app subpackage or third party package).
+
+    python -m benchmarks.startup --runs 5
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from benchmarks.startup.runner import run
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.startup", description=__doc__)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=25, help="Subsystems listed, slowest first")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file instead of stdout")
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    report_json = json.dumps(run(args.runs, args.top), indent=2)
+    if args.output:
+        args.output.write_text(report_json + "\n")
+    else:
+        print(report_json)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
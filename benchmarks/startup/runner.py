@@ -0,0 +1,73 @@
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from typing import Dict, List
+
+# Imports the app and runs its lifespan, as a fresh process does on a cold start.
+COLD_START = """
+import asyncio, json, time
+started = time.perf_counter()
+from app.main import app
+imported = time.perf_counter()
+
+async def startup():
+    async with app.router.lifespan_context(app):
+        return dict(app.state.startup.steps)
+
+steps = asyncio.run(startup())
+print(json.dumps({"import": imported - started, "steps": steps}))
+"""
+
+
+def subsystem(module: str) -> str:
+    """app.<subpackage> for the application modules, the top level package for the rest."""
+    parts = module.split(".")
+    if parts[0] == "app" and len(parts) > 1:
+        return f"app.{parts[1]}"
+    return parts[0]
+
+
+def parse_importtime(stderr: str) -> Dict[str, float]:
+    """Seconds spent importing each subsystem, from the self times of `python -X importtime`."""
+    totals: Dict[str, float] = defaultdict(float)
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, module = line[len("import time:") :].split("|")
+        totals[subsystem(module.strip())] += int(self_us) / 1_000_000
+    return totals
+
+
+def cold_start() -> dict:
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", COLD_START],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=os.environ.copy(),
+    )
+    measured = json.loads(result.stdout.strip().splitlines()[-1])
+    measured["subsystems"] = parse_importtime(result.stderr)
+    return measured
+
+
+def _median_ms(values: List[float]) -> float:
+    return round(statistics.median(values) * 1000, 1)
+
+
+def run(runs: int, top: int) -> dict:
+    starts = [cold_start() for _ in range(runs)]
+    subsystems = {name for start in starts for name in start["subsystems"]}
+    by_subsystem = {name: _median_ms([start["subsystems"].get(name, 0) for start in starts]) for name in subsystems}
+    steps = {name: _median_ms([start["steps"][name] for start in starts]) for name in starts[0]["steps"]}
+    return {
+        "environment": {"python": platform.python_version(), "machine": platform.machine(), "cpus": os.cpu_count()},
+        "runs": runs,
+        "import_ms": _median_ms([start["import"] for start in starts]),
+        "startup_steps_ms": steps,
+        "import_by_subsystem_ms": dict(sorted(by_subsystem.items(), key=lambda item: -item[1])[:top]),
+    }
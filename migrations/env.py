@@ -18,6 +18,8 @@ from app.database.models.user import UserModel
 from app.database.models.work import WorkModel
 from app.database.models.reviewer import ReviewerModel
 from app.database.models.payment import PaymentModel
+from app.database.models.job import JobModel
+from app.database.models.event_stats import EventStatsDeltaModel, EventStatsModel
 from app.database.models.base import Base
 from dotenv import load_dotenv
 import os
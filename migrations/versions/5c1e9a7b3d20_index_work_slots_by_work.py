@@ -0,0 +1,24 @@
+"""index_work_slots_by_work
+
+Revision ID: 5c1e9a7b3d20
+Revises: 11b01a79a25d
+Create Date: 2026-10-19 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e9a7b3d20'
+down_revision: Union[str, None] = '11b01a79a25d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+def upgrade() -> None:
+    # The primary key (slot_id, work_id) can't serve lookups of the slot of a work.
+    op.create_index('ix_work_slots_work_id', 'work_slots', ['work_id'])
+
+def downgrade() -> None:
+    op.drop_index('ix_work_slots_work_id', table_name='work_slots')
@@ -0,0 +1,56 @@
+"""create_jobs_table
+
+Revision ID: 9d4f2b6c8e11
+Revises: 5c1e9a7b3d20
+Create Date: 2026-10-19 15:02:17.504122
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4f2b6c8e11'
+down_revision: Union[str, None] = '5c1e9a7b3d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'jobs',
+        sa.Column('id', UUID(as_uuid=True), nullable=False),
+        sa.Column('creation_date', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('last_update', sa.DateTime(), server_default=sa.text('now()'), nullable=True),
+        sa.Column('event_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('job_type', sa.String(), nullable=False),
+        sa.Column('status', sa.String(), nullable=False),
+        sa.Column('parameters', sa.JSON(), nullable=False),
+        sa.Column('result', sa.JSON(), nullable=True),
+        sa.Column('error', sa.String(), nullable=True),
+        sa.Column('progress', sa.Float(), nullable=False),
+        sa.Column('progress_message', sa.String(), nullable=True),
+        sa.Column('created_by', sa.String(length=128), nullable=True),
+        sa.Column('cancel_requested', sa.Boolean(), nullable=False),
+        sa.Column('attempts', sa.Integer(), nullable=False),
+        sa.Column('max_attempts', sa.Integer(), nullable=False),
+        sa.Column('run_after', sa.DateTime(), server_default=sa.text('now()'), nullable=False),
+        sa.Column('started_at', sa.DateTime(), nullable=True),
+        sa.Column('finished_at', sa.DateTime(), nullable=True),
+        sa.Column('worker_id', sa.String(), nullable=True),
+        sa.Column('heartbeat_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['event_id'], ['events.id']),
+        sa.ForeignKeyConstraint(['created_by'], ['users.id']),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_jobs_event_id', 'jobs', ['event_id'])
+    op.create_index('ix_jobs_status_run_after', 'jobs', ['status', 'run_after'])
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_status_run_after', table_name='jobs')
+    op.drop_index('ix_jobs_event_id', table_name='jobs')
+    op.drop_table('jobs')
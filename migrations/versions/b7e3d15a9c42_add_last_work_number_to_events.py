@@ -0,0 +1,32 @@
+"""add_last_work_number_to_events
+
+Revision ID: b7e3d15a9c42
+Revises: 9d4f2b6c8e11
+Create Date: 2026-10-19 16:40:08.271935
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e3d15a9c42'
+down_revision: Union[str, None] = '9d4f2b6c8e11'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('events', sa.Column('last_work_number', sa.Integer(), server_default='0', nullable=False))
+    # The counter continues from the numbers already given.
+    op.execute(
+        "UPDATE events SET last_work_number = numbers.last_work_number "
+        "FROM (SELECT event_id, max(work_number) AS last_work_number FROM works GROUP BY event_id) AS numbers "
+        "WHERE numbers.event_id = events.id AND numbers.last_work_number IS NOT NULL"
+    )
+
+
+def downgrade() -> None:
+    op.drop_column('events', 'last_work_number')
@@ -0,0 +1,193 @@
+"""create_event_stats
+
+Revision ID: e41c7a2f9b63
+Revises: b7e3d15a9c42
+Create Date: 2026-10-19 18:21:44.603517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import UUID
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e41c7a2f9b63'
+down_revision: Union[str, None] = 'b7e3d15a9c42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+FUNCTIONS = [
+    """
+CREATE OR REPLACE FUNCTION event_stats_add(
+    stats_event_id uuid,
+    stats_metric varchar,
+    stats_key varchar,
+    delta integer,
+    amount_delta numeric = 0,
+    stats_currency varchar = ''
+) RETURNS void LANGUAGE plpgsql AS $$
+BEGIN
+    IF stats_event_id IS NULL OR stats_key IS NULL OR (delta = 0 AND amount_delta = 0) THEN
+        RETURN;
+    END IF;
+    INSERT INTO event_stats_deltas (event_id, metric, key, currency, count, amount)
+    VALUES (stats_event_id, stats_metric, stats_key, stats_currency, delta, amount_delta);
+END $$
+""",
+    """
+CREATE OR REPLACE FUNCTION event_stats_inscriptions() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM event_stats_add(OLD.event_id, 'inscriptions_by_status', OLD.status, -1);
+        PERFORM event_stats_add(OLD.event_id, 'inscriptions_by_role', role, -1) FROM unnest(OLD.roles) AS role;
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        PERFORM event_stats_add(NEW.event_id, 'inscriptions_by_status', NEW.status, 1);
+        PERFORM event_stats_add(NEW.event_id, 'inscriptions_by_role', role, 1) FROM unnest(NEW.roles) AS role;
+    END IF;
+    RETURN NULL;
+END $$
+""",
+    """
+CREATE OR REPLACE FUNCTION event_stats_payments() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM event_stats_add(
+            OLD.event_id, 'payments_by_status', OLD.status, -1, -coalesce(OLD.amount, 0)::numeric, coalesce(OLD.currency, '')
+        );
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        PERFORM event_stats_add(
+            NEW.event_id, 'payments_by_status', NEW.status, 1, coalesce(NEW.amount, 0)::numeric, coalesce(NEW.currency, '')
+        );
+    END IF;
+    RETURN NULL;
+END $$
+""",
+    """
+CREATE OR REPLACE FUNCTION event_stats_works() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM event_stats_add(OLD.event_id, 'works_by_state', OLD.state, -1);
+        PERFORM event_stats_add(OLD.event_id, 'works_by_track', OLD.track, -1);
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        PERFORM event_stats_add(NEW.event_id, 'works_by_state', NEW.state, 1);
+        PERFORM event_stats_add(NEW.event_id, 'works_by_track', NEW.track, 1);
+    END IF;
+    RETURN NULL;
+END $$
+""",
+    """
+CREATE OR REPLACE FUNCTION event_stats_reviewers() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM event_stats_add(OLD.event_id, 'reviewers_by_work', OLD.work_id::varchar, -1);
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        PERFORM event_stats_add(NEW.event_id, 'reviewers_by_work', NEW.work_id::varchar, 1);
+    END IF;
+    RETURN NULL;
+END $$
+""",
+    """
+CREATE OR REPLACE FUNCTION event_stats_reviews() RETURNS trigger LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP <> 'INSERT' THEN
+        PERFORM event_stats_add(OLD.event_id, 'reviews_by_work', OLD.work_id::varchar, -1);
+        PERFORM event_stats_add(OLD.event_id, 'shared_reviews_by_work', OLD.work_id::varchar, CASE WHEN OLD.shared THEN -1 ELSE 0 END);
+    END IF;
+    IF TG_OP <> 'DELETE' THEN
+        PERFORM event_stats_add(NEW.event_id, 'reviews_by_work', NEW.work_id::varchar, 1);
+        PERFORM event_stats_add(NEW.event_id, 'shared_reviews_by_work', NEW.work_id::varchar, CASE WHEN NEW.shared THEN 1 ELSE 0 END);
+    END IF;
+    RETURN NULL;
+END $$
+""",
+]
+
+# Table, and the columns whose updates change its counters.
+SOURCES = {
+    'inscriptions': ('event_id', 'status', 'roles'),
+    'payments': ('event_id', 'status', 'amount', 'currency'),
+    'works': ('event_id', 'state', 'track'),
+    'reviewers': ('event_id', 'work_id'),
+    'reviews': ('event_id', 'work_id', 'shared'),
+}
+
+BACKFILL = """
+INSERT INTO event_stats (event_id, metric, key, currency, count, amount)
+SELECT event_id, 'inscriptions_by_status', status, '', count(*), 0 FROM inscriptions GROUP BY event_id, status
+UNION ALL
+SELECT event_id, 'inscriptions_by_role', role, '', count(*), 0
+FROM inscriptions, unnest(roles) AS role GROUP BY event_id, role
+UNION ALL
+SELECT event_id, 'payments_by_status', status, coalesce(currency, ''), count(*), sum(coalesce(amount, 0)::numeric)
+FROM payments GROUP BY event_id, status, coalesce(currency, '')
+UNION ALL
+SELECT event_id, 'works_by_state', state, '', count(*), 0 FROM works GROUP BY event_id, state
+UNION ALL
+SELECT event_id, 'works_by_track', track, '', count(*), 0 FROM works GROUP BY event_id, track
+UNION ALL
+SELECT event_id, 'reviewers_by_work', work_id::varchar, '', count(*), 0
+FROM reviewers WHERE event_id IS NOT NULL GROUP BY event_id, work_id
+UNION ALL
+SELECT event_id, 'reviews_by_work', work_id::varchar, '', count(*), 0
+FROM reviews WHERE event_id IS NOT NULL GROUP BY event_id, work_id
+UNION ALL
+SELECT event_id, 'shared_reviews_by_work', work_id::varchar, '', count(*), 0
+FROM reviews WHERE event_id IS NOT NULL AND shared GROUP BY event_id, work_id
+"""
+
+
+def upgrade() -> None:
+    op.create_table(
+        'event_stats',
+        sa.Column('event_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('metric', sa.String(), nullable=False),
+        sa.Column('key', sa.String(), nullable=False),
+        sa.Column('currency', sa.String(), server_default='', nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('amount', sa.Numeric(), nullable=False),
+        sa.ForeignKeyConstraint(['event_id'], ['events.id']),
+        sa.PrimaryKeyConstraint('event_id', 'metric', 'key', 'currency'),
+    )
+    op.create_table(
+        'event_stats_deltas',
+        sa.Column('id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('event_id', UUID(as_uuid=True), nullable=False),
+        sa.Column('metric', sa.String(), nullable=False),
+        sa.Column('key', sa.String(), nullable=False),
+        sa.Column('currency', sa.String(), server_default='', nullable=False),
+        sa.Column('count', sa.Integer(), nullable=False),
+        sa.Column('amount', sa.Numeric(), nullable=False),
+        sa.PrimaryKeyConstraint('id'),
+    )
+    op.create_index('ix_event_stats_deltas_event_id', 'event_stats_deltas', ['event_id'])
+    for function in FUNCTIONS:
+        op.execute(function)
+    for table, columns in SOURCES.items():
+        changed = " OR ".join(f"OLD.{column} IS DISTINCT FROM NEW.{column}" for column in columns)
+        op.execute(
+            f"CREATE TRIGGER event_stats AFTER INSERT OR DELETE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION event_stats_{table}()"
+        )
+        op.execute(
+            f"CREATE TRIGGER event_stats_update AFTER UPDATE ON {table} "
+            f"FOR EACH ROW WHEN ({changed}) EXECUTE FUNCTION event_stats_{table}()"
+        )
+    op.execute(BACKFILL)
+
+
+def downgrade() -> None:
+    for table in SOURCES:
+        op.execute(f"DROP TRIGGER event_stats_update ON {table}")
+        op.execute(f"DROP TRIGGER event_stats ON {table}")
+    for table in reversed(list(SOURCES)):
+        op.execute(f"DROP FUNCTION event_stats_{table}()")
+    op.execute("DROP FUNCTION event_stats_add(uuid, varchar, varchar, integer, numeric, varchar)")
+    op.drop_index('ix_event_stats_deltas_event_id', table_name='event_stats_deltas')
+    op.drop_table('event_stats_deltas')
+    op.drop_table('event_stats')
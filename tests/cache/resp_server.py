@@ -0,0 +1,77 @@
+"""A stand-in for a Redis server, with the commands the cache backend uses, to test it without one."""
+
+import asyncio
+import time
+from typing import Dict, Set, Tuple
+
+from app.cache.resp import INVALIDATE_TAGS_SCRIPT, read_reply
+
+
+class RespServer:
+    def __init__(self):
+        self.values: Dict[bytes, Tuple[bytes, float | None]] = {}
+        self.sets: Dict[bytes, Set[bytes]] = {}
+        self.commands: list = []
+        self.connections = 0
+        self._server: asyncio.Server | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"redis://{host}:{port}/0"
+
+    async def start(self) -> None:
+        self._server = await asyncio.start_server(self._serve, "127.0.0.1", 0)
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                command = await read_reply(reader)
+                self.commands.append(command[0].decode().upper())
+                writer.write(self._execute(command[0].decode().upper(), command[1:]))
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            writer.close()
+
+    def _get(self, key: bytes) -> bytes | None:
+        value, expires_at = self.values.get(key, (None, None))
+        if expires_at is not None and time.monotonic() >= expires_at:
+            del self.values[key]
+            return None
+        return value
+
+    def _execute(self, name: str, arguments: list) -> bytes:
+        if name in ("PING", "SELECT", "AUTH"):
+            return b"+OK\r\n"
+        if name == "GET":
+            value = self._get(arguments[0])
+            return b"$-1\r\n" if value is None else b"$%d\r\n%s\r\n" % (len(value), value)
+        if name == "SET":
+            expires_at = time.monotonic() + int(arguments[3]) / 1000 if len(arguments) == 4 else None
+            self.values[arguments[0]] = (arguments[1], expires_at)
+            return b"+OK\r\n"
+        if name == "DEL":
+            deleted = sum(
+                self.values.pop(key, None) is not None or self.sets.pop(key, None) is not None for key in arguments
+            )
+            return b":%d\r\n" % deleted
+        if name == "SADD":
+            self.sets.setdefault(arguments[0], set()).update(arguments[1:])
+            return b":1\r\n"
+        if name == "SMEMBERS":
+            members = self.sets.get(arguments[0], set())
+            return b"*%d\r\n" % len(members) + b"".join(b"$%d\r\n%s\r\n" % (len(m), m) for m in members)
+        if name == "EVAL" and arguments[0] == INVALIDATE_TAGS_SCRIPT.encode():
+            tags = arguments[2 : 2 + int(arguments[1])]
+            keys = [key for tag in tags for key in self.sets.get(tag, ())]
+            return self._execute("DEL", [*keys, *tags])
+        if name == "INCR":
+            counter = int(self._get(arguments[0]) or 0) + 1
+            self.values[arguments[0]] = (str(counter).encode(), None)
+            return b":%d\r\n" % counter
+        return b"-ERR unknown command '%s'\r\n" % name.encode()
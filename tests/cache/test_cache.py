@@ -0,0 +1,192 @@
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from app.cache.cache import Cache
+from app.cache.memory import MemoryCacheBackend
+from app.cache.resp import RespCacheBackend
+from app.services.agenda.agenda_read_model import AgendaDocument, AgendaReadModel
+from app.services.slots.ConfigurableBBScheduler import CostBreakdown, SolverStats
+from app.services.slots.solution_cache import CachedSolution, SolutionCache
+from app.utils.metrics import CACHE_ERRORS, CACHE_REQUESTS
+
+from .resp_server import RespServer
+
+
+@pytest.fixture
+async def resp_server():
+    server = RespServer()
+    await server.start()
+    yield server
+    await server.stop()
+
+
+@pytest.fixture(params=["memory", "resp"])
+async def backend(request, resp_server):
+    backend = MemoryCacheBackend() if request.param == "memory" else RespCacheBackend(resp_server.url, pool_size=2)
+    yield backend
+    await backend.close()
+
+
+async def test_values_are_stored_by_namespace(backend):
+    events = Cache("events", backend)
+    users = Cache("users", backend)
+
+    await events.set("1", {"name": "Congress", "tracks": ["math"]})
+    await users.set("1", "Jorge")
+
+    assert await events.get("1") == {"name": "Congress", "tracks": ["math"]}
+    assert await users.get("1") == "Jorge"
+    await events.delete("1")
+    assert await events.get("1") is None
+    assert await users.get("1") == "Jorge"
+
+
+async def test_values_expire_after_their_ttl(backend):
+    cache = Cache("expiring", backend)
+
+    await cache.set("short", 1, ttl=0.05)
+    await cache.set("long", 2, ttl=60)
+    await asyncio.sleep(0.1)
+
+    assert await cache.get("short") is None
+    assert await cache.get("long") == 2
+
+
+async def test_invalidating_a_tag_deletes_its_keys(backend):
+    cache = Cache("tagged", backend)
+    await cache.set("works", [1, 2], tags=["event:a"])
+    await cache.set("agenda", [3], tags=["event:a", "agendas"])
+    await cache.set("other", [4], tags=["event:b"])
+
+    await cache.invalidate_tags("event:a")
+
+    assert await cache.get("works") is None
+    assert await cache.get("agenda") is None
+    assert await cache.get("other") == [4]
+
+
+async def test_counters_are_shared_through_the_backend(backend):
+    first_worker, second_worker = Cache("counters", backend), Cache("counters", backend)
+
+    assert await first_worker.counter("event") == 0
+    assert await first_worker.incr("event") == 1
+    assert await second_worker.incr("event") == 2
+    assert await first_worker.counter("event") == 2
+
+
+async def test_memory_counters_are_not_evicted():
+    cache = Cache("counters", MemoryCacheBackend(max_entries=2))
+
+    assert await cache.incr("event") == 1
+    for number in range(3):
+        await cache.set(str(number), number)
+
+    assert await cache.incr("event") == 2
+
+
+async def test_values_that_cant_be_decoded_are_misses(backend):
+    cache = Cache("undecodable", backend)
+    await backend.set("undecodable:json1:key", b"\x80\x04K\x01.")
+    errors = CACHE_ERRORS.value(namespace="undecodable", operation="decode")
+
+    assert await cache.get("key") is None
+    assert await cache.get_or_load("key", lambda: asyncio.sleep(0, "loaded")) == "loaded"
+    assert await cache.get("key") == "loaded"
+    assert CACHE_ERRORS.value(namespace="undecodable", operation="decode") == errors + 2
+
+
+async def test_solutions_are_stored_and_read_back(backend):
+    solutions = SolutionCache(Cache("solutions", backend))
+    solution = CachedSolution(
+        id=uuid4(),
+        event_id=uuid4(),
+        data_version="3",
+        replaces_assignments=True,
+        is_optimal=False,
+        links=((uuid4(), 1), (uuid4(), 2)),
+        final_cost=12.5,
+        cost_breakdown=CostBreakdown(2, 10.0, 1, 2.5, 0, 0.0),
+        search_stats=SolverStats(nodes_explored=40, bound_prunes=7),
+    )
+
+    assert await solutions.get_or_solve(("event", 1), lambda: asyncio.sleep(0, solution)) == solution
+    assert await solutions.get(solution.id) == solution
+    assert await solutions.get_or_solve(("event", 1), lambda: asyncio.sleep(0, None)) == solution
+
+
+async def test_concurrent_misses_load_once(backend):
+    cache = Cache("single_flight", backend)
+    loads = 0
+
+    async def load():
+        nonlocal loads
+        loads += 1
+        await asyncio.sleep(0.05)
+        return "schedule"
+
+    results = await asyncio.gather(*(cache.get_or_load("key", load) for _ in range(5)))
+
+    assert results == ["schedule"] * 5
+    assert loads == 1
+    assert await cache.get_or_load("key", load) == "schedule"
+    assert loads == 1
+
+
+async def test_lookups_are_counted_by_namespace():
+    cache = Cache("counted", MemoryCacheBackend())
+    hits, misses = (
+        CACHE_REQUESTS.value(namespace="counted", result="hit"),
+        CACHE_REQUESTS.value(namespace="counted", result="miss"),
+    )
+
+    await cache.get("key")
+    await cache.set("key", 1)
+    await cache.get("key")
+    await cache.get("key")
+
+    assert CACHE_REQUESTS.value(namespace="counted", result="miss") == misses + 1
+    assert CACHE_REQUESTS.value(namespace="counted", result="hit") == hits + 2
+
+
+async def test_an_unreachable_server_behaves_as_an_empty_cache(resp_server):
+    url = resp_server.url
+    await resp_server.stop()
+    cache = Cache("unreachable", RespCacheBackend(url, timeout=0.2))
+    errors = CACHE_ERRORS.value(namespace="unreachable", operation="get")
+
+    await cache.set("key", 1)
+
+    assert await cache.get("key") is None
+    assert await cache.get_or_load("key", lambda: asyncio.sleep(0, "loaded")) == "loaded"
+    assert CACHE_ERRORS.value(namespace="unreachable", operation="get") == errors + 2
+
+
+async def test_connections_are_reused_and_commands_pipelined(resp_server):
+    backend = RespCacheBackend(resp_server.url, pool_size=1)
+    cache = Cache("pipelined", backend)
+
+    for number in range(10):
+        await cache.set(str(number), number, tags=["all"])
+    await cache.invalidate_tags("all")
+
+    assert resp_server.connections == 1
+    # Reading the keys of the tag and deleting them is a single script, atomic on the server.
+    assert resp_server.commands[-1] == "EVAL"
+    assert "SMEMBERS" not in resp_server.commands
+    await backend.close()
+
+
+async def test_agenda_writes_of_another_worker_make_the_document_stale(backend):
+    event_id = uuid4()
+    worker, other_worker = (AgendaReadModel(Cache("agenda_versions", backend)) for _ in range(2))
+    document = AgendaDocument(event_id=event_id)
+    worker.store(document, await worker.version(event_id))
+
+    await worker.mark_slots_dirty(event_id, [1])
+    assert await worker.get(event_id) is document
+    assert document.dirty_slot_ids == {1}
+
+    await other_worker.mark_slots_dirty(event_id, [2])
+    assert await worker.get(event_id) is None
@@ -0,0 +1,75 @@
+from app.repository.events_repository import EventsRepository
+
+from ..commontest import create_headers
+
+
+async def test_get_event_answers_not_modified_for_matching_etag(client, create_event, create_user):
+    headers = create_headers(create_user["id"])
+    response = await client.get(f"/events/{create_event['id']}/public", headers=headers)
+    assert response.status_code == 200
+    assert response.headers["cache-control"] == "private, no-cache"
+    etag = response.headers["etag"]
+
+    response = await client.get(f"/events/{create_event['id']}/public", headers={**headers, "If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+async def test_get_event_etag_changes_with_slots(client, admin_data, create_event_with_slots):
+    headers = create_headers(admin_data.id)
+    response = await client.get(f"/events/{create_event_with_slots}/public", headers=headers)
+    etag = response.headers["etag"]
+
+    response = await client.delete(f"/events/{create_event_with_slots}/configuration/slots", headers=headers)
+    assert response.status_code == 200
+
+    response = await client.get(f"/events/{create_event_with_slots}/public", headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["event_slots"] == []
+    assert response.headers["etag"] != etag
+
+
+async def test_get_configuration_answers_conditional_requests(client, admin_data, create_event):
+    headers = create_headers(admin_data.id)
+    response = await client.get(f"/events/{create_event['id']}/configuration", headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    last_modified = response.headers["last-modified"]
+
+    response = await client.get(
+        f"/events/{create_event['id']}/configuration", headers={**headers, "If-Modified-Since": last_modified}
+    )
+    assert response.status_code == 304
+
+    response = await client.get(f"/events/{create_event['id']}/configuration", headers=headers)
+    configuration = response.json()
+    configuration["location"] = "Otra sede"
+    response = await client.put(
+        f"/events/{create_event['id']}/configuration/general", json=configuration, headers=headers
+    )
+    assert response.status_code == 204
+
+    response = await client.get(
+        f"/events/{create_event['id']}/configuration", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["location"] == "Otra sede"
+
+
+async def test_get_event_reads_the_caller_roles_once(client, create_inscription, monkeypatch):
+    headers = create_headers(create_inscription["user_id"])
+    calls = []
+    get_roles = EventsRepository.get_roles
+
+    async def recorded_get_roles(repository, *args):
+        calls.append(args)
+        return await get_roles(repository, *args)
+
+    monkeypatch.setattr(EventsRepository, "get_roles", recorded_get_roles)
+    response = await client.get(f"/events/{create_inscription['event_id']}/public", headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["roles"] == ["ATTENDEE"]
+    assert len(calls) == 1
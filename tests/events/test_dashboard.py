@@ -0,0 +1,221 @@
+from collections import Counter
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import func, select, text, update
+
+from app.database.database import SessionLocal
+from app.database.models.event_stats import EventStatsDeltaModel, EventStatsModel
+from app.database.models.job import JobModel, JobStatus
+from app.database.models.payment import PaymentModel, PaymentStatus
+from app.database.models.review import ReviewModel
+from app.database.models.reviewer import ReviewerModel
+from app.database.models.submission import SubmissionModel
+from app.database.models.work import WorkModel, WorkStates
+from app.jobs.event_stats_jobs import EVENT_STATS_COMPACT, EVENT_STATS_COMPACTION
+from app.jobs.worker import JobWorker
+from app.repository.event_stats_repository import EventStatsRepository
+from app.repository.reviews_repository import ReviewsRepository
+from app.schemas.works.review import ReviewPublishSchema
+
+from ..commontest import create_headers
+
+
+@pytest.fixture
+def session_factory(connection, session_override):
+    return lambda: SessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+
+
+async def dashboard(client, event_id, caller_id):
+    response = await client.get(f"/events/{event_id}/dashboard", headers=create_headers(caller_id))
+    assert response.status_code == 200
+    return response.json()
+
+
+async def test_dashboard_counts_inscriptions_and_works(client, admin_data, create_event_started, create_many_works):
+    stats = await dashboard(client, create_event_started, admin_data.id)
+
+    assert stats["inscriptions"]["total"] == 1
+    assert stats["inscriptions"]["by_role"] == {"SPEAKER": 1}
+    assert sum(stats["inscriptions"]["by_status"].values()) == 1
+    assert stats["works"] == {
+        "total": len(create_many_works),
+        "by_state": {WorkStates.SUBMITTED: len(create_many_works)},
+        "by_track": Counter(work["track"] for work in create_many_works),
+    }
+    assert stats["payments"] == {"total": 0, "by_status": {}}
+    assert stats["reviews_by_track"] == {}
+
+
+async def test_dashboard_follows_every_write_path(
+    client, admin_data, session_factory, create_speaker_inscription, create_many_works
+):
+    event_id = UUID(create_speaker_inscription["event_id"])
+    work_id = UUID(create_many_works[0]["id"])
+    track = create_many_works[0]["track"]
+    async with session_factory() as session:
+        payment = PaymentModel(
+            event_id=event_id,
+            inscription_id=UUID(create_speaker_inscription["id"]),
+            fare_name="General",
+            amount=1500,
+            currency="ARS",
+        )
+        submission = SubmissionModel(id=uuid4(), event_id=event_id, work_id=work_id)
+        session.add_all([payment, submission])
+        await session.flush()
+        session.add(
+            ReviewerModel(
+                user_id=admin_data.id, event_id=event_id, work_id=work_id, review_deadline=datetime.now() + timedelta(1)
+            )
+        )
+        review = ReviewModel(
+            event_id=event_id, work_id=work_id, submission_id=submission.id, reviewer_id=admin_data.id, shared=False
+        )
+        session.add(review)
+        await session.commit()
+        await session.execute(
+            update(PaymentModel).where(PaymentModel.id == payment.id).values(status=PaymentStatus.APPROVED)
+        )
+        await session.commit()
+    stats = await dashboard(client, event_id, admin_data.id)
+    assert stats["payments"] == {
+        "total": 1,
+        "by_status": {PaymentStatus.APPROVED: {"count": 1, "amounts": {"ARS": 1500}}},
+    }
+    assert stats["reviews_by_track"] == {track: {"reviewers": 1, "reviews": 1, "shared_reviews": 0}}
+
+    async with session_factory() as session:
+        publication = ReviewPublishSchema(reviews_to_publish=[review.id], new_work_status=WorkStates.APPROVED)
+        assert await ReviewsRepository(session).publish_reviews(event_id, {work_id: publication})
+    stats = await dashboard(client, event_id, admin_data.id)
+    assert stats["works"]["by_state"] == {WorkStates.APPROVED: 1, WorkStates.SUBMITTED: len(create_many_works) - 1}
+    assert stats["reviews_by_track"] == {track: {"reviewers": 1, "reviews": 1, "shared_reviews": 1}}
+
+    async with session_factory() as session:
+        await session.execute(update(WorkModel).where(WorkModel.id == work_id).values(track="astronomy"))
+        await session.commit()
+    stats = await dashboard(client, event_id, admin_data.id)
+    assert stats["reviews_by_track"] == {"astronomy": {"reviewers": 1, "reviews": 1, "shared_reviews": 1}}
+    assert stats["works"]["by_track"]["astronomy"] == 1
+
+
+async def test_rebuild_corrects_drifted_counters(
+    client, admin_data, session_factory, create_event_started, create_many_works
+):
+    expected = await dashboard(client, create_event_started, admin_data.id)
+    async with session_factory() as session:
+        await EventStatsRepository(session).compact()
+        await session.execute(update(EventStatsModel).values(count=EventStatsModel.count + 7))
+        await session.commit()
+    assert await dashboard(client, create_event_started, admin_data.id) != expected
+
+    async with session_factory() as session:
+        assert await EventStatsRepository(session).rebuild(UUID(create_event_started)) > 0
+    assert await dashboard(client, create_event_started, admin_data.id) == expected
+
+    async with session_factory() as session:
+        await EventStatsRepository(session).rebuild()
+    assert await dashboard(client, create_event_started, admin_data.id) == expected
+
+
+async def test_compaction_folds_the_deltas_into_the_counters(
+    client, admin_data, session_factory, create_event_started, create_many_works
+):
+    event_id = UUID(create_event_started)
+    expected = await dashboard(client, event_id, admin_data.id)
+    deltas = select(func.count()).select_from(EventStatsDeltaModel).where(EventStatsDeltaModel.event_id == event_id)
+    async with session_factory() as session:
+        assert await session.scalar(deltas) > 0
+        assert await EventStatsRepository(session).compact(event_id) > 0
+        assert await session.scalar(deltas) == 0
+        assert await EventStatsRepository(session).compact(event_id) == 0
+    assert await dashboard(client, event_id, admin_data.id) == expected
+
+
+async def test_workers_compact_the_events_written_to(
+    client, admin_data, session_factory, create_event_started, create_many_works
+):
+    event_id = UUID(create_event_started)
+    expected = await dashboard(client, event_id, admin_data.id)
+    worker = JobWorker(
+        session_factory,
+        job_types={EVENT_STATS_COMPACT.name: EVENT_STATS_COMPACT},
+        periodic_jobs=[EVENT_STATS_COMPACTION],
+    )
+
+    assert await worker.queue_periodic() == 1
+    # Not due again until the interval passes, and never queued twice for an event.
+    assert await worker.queue_periodic() == 0
+    worker._periodic_due.clear()
+    assert await worker.queue_periodic() == 0
+
+    job = await worker.run_next()
+    assert job.event_id == event_id
+    async with session_factory() as session:
+        finished = await session.get(JobModel, job.id)
+        assert finished.status == JobStatus.SUCCEEDED
+        assert finished.result["counters"] > 0
+        deltas = select(func.count()).select_from(EventStatsDeltaModel).where(EventStatsDeltaModel.event_id == event_id)
+        assert await session.scalar(deltas) == 0
+    assert await dashboard(client, event_id, admin_data.id) == expected
+
+
+async def test_deleting_a_work_with_its_reviews_drops_them_from_the_dashboard(
+    client, admin_data, session_factory, create_speaker_inscription, create_many_works
+):
+    event_id = UUID(create_speaker_inscription["event_id"])
+    work_id = UUID(create_many_works[0]["id"])
+    track = create_many_works[0]["track"]
+    async with session_factory() as session:
+        submission = SubmissionModel(id=uuid4(), event_id=event_id, work_id=work_id)
+        session.add(submission)
+        await session.flush()
+        session.add_all(
+            [
+                ReviewerModel(
+                    user_id=admin_data.id,
+                    event_id=event_id,
+                    work_id=work_id,
+                    review_deadline=datetime.now() + timedelta(1),
+                ),
+                ReviewModel(
+                    event_id=event_id,
+                    work_id=work_id,
+                    submission_id=submission.id,
+                    reviewer_id=admin_data.id,
+                    shared=True,
+                ),
+            ]
+        )
+        await session.commit()
+    stats = await dashboard(client, event_id, admin_data.id)
+    assert stats["reviews_by_track"] == {track: {"reviewers": 1, "reviews": 1, "shared_reviews": 1}}
+
+    # In one statement: the reviews and reviewers are deleted with the work already gone.
+    async with session_factory() as session:
+        await session.execute(
+            text(
+                "WITH work AS (DELETE FROM works WHERE id = :work_id),"
+                " reviews AS (DELETE FROM reviews WHERE work_id = :work_id),"
+                " reviewers AS (DELETE FROM reviewers WHERE work_id = :work_id)"
+                " DELETE FROM submissions WHERE work_id = :work_id"
+            ),
+            {"work_id": work_id},
+        )
+        await session.commit()
+    stats = await dashboard(client, event_id, admin_data.id)
+    assert stats["reviews_by_track"] == {}
+    assert stats["works"]["total"] == len(create_many_works) - 1
+
+    async with session_factory() as session:
+        await EventStatsRepository(session).compact(event_id)
+        counters = select(EventStatsModel).where(EventStatsModel.key == str(work_id))
+        assert (await session.scalars(counters)).all() == []
+    assert await dashboard(client, event_id, admin_data.id) == stats
+
+
+async def test_attendees_cant_read_the_dashboard(client, create_user, create_event):
+    response = await client.get(f"/events/{create_event['id']}/dashboard", headers=create_headers(create_user["id"]))
+    assert response.status_code == 403
@@ -125,3 +125,15 @@ async def test_get_my_events_includes_events_where_i_am_chair(client, create_eve
 @pytest.mark.skip(reason="TODO: Write this code. Which date should we take? Or add a param for ordering?")
 async def test_get_my_events_should_be_ordered_by_date():
     raise AssertionError("Test not implemented yet")
+
+
+async def test_get_my_events_lists_event_slots(client, admin_data, create_event_with_slots):
+    response = await client.get("/events/my-events", headers=create_headers(admin_data.id))
+
+    assert response.status_code == 200
+    [event] = [event for event in response.json() if event["id"] == create_event_with_slots]
+    assert EventRole.ORGANIZER in event["roles"]
+    slots = event["event_slots"]
+    assert len(slots) == 6
+    assert [slot["id"] for slot in slots] == sorted(slot["id"] for slot in slots)
+    assert {slot["room_name"] for slot in slots} == {"Aula 1", "Aula 2"}
@@ -0,0 +1,43 @@
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from app.database.models.work import WorkStates
+from app.schemas.works.work import WorkStateSchema
+
+from ...commontest import create_headers
+
+SLOTS_MDATA = {
+    "rooms": [{"name": "Aula 1"}, {"name": "Aula 2"}],
+    "slots": [
+        {"type": "slot", "title": "Mañana", "start": "2030-05-10T09:00:00", "end": "2030-05-10T10:00:00"},
+        {"type": "break", "title": "Café", "start": "2030-05-10T10:00:00", "end": "2030-05-10T10:30:00"},
+        {"type": "slot", "title": "Tarde", "start": "2030-05-10T14:00:00", "end": "2030-05-10T15:00:00"},
+    ],
+}
+
+
+@pytest.fixture(scope="function")
+async def create_event_with_slots(client, admin_data, create_event_started, create_many_works):
+    for work in create_many_works:
+        response = await client.patch(
+            f"/events/{create_event_started}/works/{work['id']}/status",
+            json=jsonable_encoder(WorkStateSchema(state=WorkStates.APPROVED)),
+            headers=create_headers(admin_data.id),
+        )
+        assert response.status_code == 204
+
+    response = await client.get(f"/events/{create_event_started}/configuration", headers=create_headers(admin_data.id))
+    configuration = response.json()
+    configuration["mdata"] = SLOTS_MDATA
+    response = await client.put(
+        f"/events/{create_event_started}/configuration/general",
+        json=configuration,
+        headers=create_headers(admin_data.id),
+    )
+    assert response.status_code == 204
+
+    response = await client.get(
+        f"/events/{create_event_started}/configuration/slots", headers=create_headers(admin_data.id)
+    )
+    assert response.status_code == 201
+    return create_event_started
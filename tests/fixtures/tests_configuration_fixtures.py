@@ -2,11 +2,16 @@ import pytest
 from httpx import ASGITransport, AsyncClient
 
 from app.database.database import SessionLocal, engine
+from app.database.instrumentation import raise_on_lazy_loads
 from app.database.models.base import Base
 from app.database.session_dep import get_db
 
 # With this import, the Base metadate is filled with the Database Models.
-from app.main import app
+from app.main import app, diagnostics
+from app.utils.loop_monitor import LoopLagMonitor
+
+# Generous, as shared CI runners stall on their own: the monitor catches calls that block for seconds.
+LOOP_BLOCK_THRESHOLD_MS = 1000
 
 
 @pytest.fixture(scope="session")
@@ -42,6 +47,8 @@ async def session_override(connection, transaction):
             bind=connection,
             join_transaction_mode="create_savepoint",
         )
+        # A relationship that was not loaded with the query fails the test instead of issuing a query per row.
+        raise_on_lazy_loads(async_session.sync_session)
         async with async_session:
             yield async_session
 
@@ -53,6 +60,24 @@ async def session_override(connection, transaction):
 
 
 @pytest.fixture(scope="function")
-async def client(session_override):
+async def loop_monitor(request):
+    """
+    With the loop_monitor marker, fails the test when the code under test blocks the event loop
+    past the threshold, LOOP_BLOCK_THRESHOLD_MS or the threshold_ms of the marker.
+    """
+    marker = request.node.get_closest_marker("loop_monitor")
+    if marker is None:
+        yield None
+        return
+    threshold_ms = marker.kwargs.get("threshold_ms", LOOP_BLOCK_THRESHOLD_MS)
+    monitor = LoopLagMonitor(interval=diagnostics.LOOP_MONITOR_INTERVAL_MS / 1000, threshold=threshold_ms / 1000)
+    await monitor.start()
+    yield monitor
+    await monitor.stop()
+    monitor.assert_not_blocked()
+
+
+@pytest.fixture(scope="function")
+async def client(session_override, loop_monitor):
     async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as ac:
         yield ac
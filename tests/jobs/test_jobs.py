@@ -0,0 +1,173 @@
+from uuid import UUID, uuid4
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+
+from app.database.database import SessionLocal
+from app.database.models.job import JobModel, JobStatus
+from app.jobs.job_types import JobType
+from app.jobs.worker import JobWorker
+from app.repository.jobs_repository import JobsRepository
+from app.schemas.events.assing_works_parameters import AssignWorksParametersSchema, AssignWorksParametersWeights
+from app.settings.settings import JobsSettings
+
+from ..commontest import create_headers
+
+# Solving is CPU bound: it must not run on the event loop.
+pytestmark = pytest.mark.loop_monitor
+
+SETTINGS = JobsSettings(HEARTBEAT_SECONDS=60, RETRY_BACKOFF_SECONDS=0)
+
+
+class NoParameters(BaseModel):
+    pass
+
+
+@pytest.fixture
+def session_factory(connection, session_override):
+    # The worker sessions join the transaction of the test, so they see its data and are rolled back with it.
+    return lambda: SessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+
+
+@pytest.fixture
+def worker(session_factory):
+    return JobWorker(session_factory, settings=SETTINGS)
+
+
+async def queue(session_factory, event_id, job_type, max_attempts=1) -> JobModel:
+    async with session_factory() as session:
+        job = JobModel(event_id=UUID(str(event_id)), job_type=job_type, parameters={}, max_attempts=max_attempts)
+        return await JobsRepository(session)._create(job)
+
+
+async def test_submitted_assignment_runs_in_a_worker(
+    client, admin_data, worker, create_event_with_slots, create_many_works
+):
+    parameters = AssignWorksParametersSchema(
+        time_per_work=30,
+        reset_previous_assignments=True,
+        weights=AssignWorksParametersWeights(same_day_tracks=2, same_room_tracks=1),
+    )
+    response = await client.post(
+        f"/events/{create_event_with_slots}/jobs",
+        json={"job_type": "slots_assign", "parameters": jsonable_encoder(parameters)},
+        headers=create_headers(admin_data.id),
+    )
+    assert response.status_code == 202
+    job = response.json()
+    assert job["status"] == JobStatus.QUEUED
+
+    assert str((await worker.run_next()).id) == job["id"]
+
+    response = await client.get(
+        f"/events/{create_event_with_slots}/jobs/{job['id']}", headers=create_headers(admin_data.id)
+    )
+    assert response.status_code == 200
+    finished = response.json()
+    assert finished["status"] == JobStatus.SUCCEEDED
+    assert finished["progress"] == 1
+    assert finished["result"]["assignments_created"] == len(create_many_works)
+
+    response = await client.get(
+        f"/events/{create_event_with_slots}/works/unassigned", headers=create_headers(admin_data.id)
+    )
+    assert response.json() == []
+
+    response = await client.get(f"/events/{create_event_with_slots}/jobs", headers=create_headers(admin_data.id))
+    assert [listed["id"] for listed in response.json()] == [job["id"]]
+
+
+async def test_submissions_are_validated(client, admin_data, create_event):
+    response = await client.post(
+        f"/events/{create_event['id']}/jobs",
+        json={"job_type": "export_everything"},
+        headers=create_headers(admin_data.id),
+    )
+    assert response.status_code == 400
+    assert response.json()["detail"]["errorcode"] == "UNKNOWN_JOB_TYPE"
+
+    response = await client.post(
+        f"/events/{create_event['id']}/jobs",
+        json={"job_type": "slots_assign", "parameters": {"time_per_work": "soon"}},
+        headers=create_headers(admin_data.id),
+    )
+    assert response.status_code == 422
+    assert response.json()["detail"]["errorcode"] == "INVALID_JOB_PARAMETERS"
+
+
+async def test_only_organizers_use_jobs(client, create_event, create_user):
+    response = await client.get(f"/events/{create_event['id']}/jobs", headers=create_headers(create_user["id"]))
+    assert response.status_code == 403
+
+
+async def test_queued_jobs_are_cancelled_right_away(client, admin_data, worker, session_factory, create_event):
+    job = await queue(session_factory, create_event["id"], "slots_assign")
+
+    response = await client.post(
+        f"/events/{create_event['id']}/jobs/{job.id}/cancel", headers=create_headers(admin_data.id)
+    )
+    assert response.status_code == 202
+    assert response.json()["status"] == JobStatus.CANCELLED
+    assert await worker.run_next() is None
+
+    response = await client.post(
+        f"/events/{create_event['id']}/jobs/{job.id}/cancel", headers=create_headers(admin_data.id)
+    )
+    assert response.status_code == 409
+
+
+async def test_running_jobs_stop_at_their_next_progress_report(worker, session_factory, create_event):
+    async def cancelled_meanwhile(context):
+        await JobsRepository(context.session).request_cancel(context.event_id, context.job_id)
+        await context.progress(0.5, "Halfway")
+        return {"finished": True}
+
+    worker.job_types = {"cancelled": JobType("cancelled", cancelled_meanwhile, NoParameters)}
+    job = await queue(session_factory, create_event["id"], "cancelled")
+
+    await worker.run_next()
+
+    async with session_factory() as session:
+        job = await JobsRepository(session).get(job.id)
+    assert job.status == JobStatus.CANCELLED
+    assert job.result is None
+
+
+async def test_failed_jobs_are_retried_until_out_of_attempts(worker, session_factory, create_event):
+    attempts = []
+
+    async def flaky(context):
+        attempts.append(context.attempt)
+        if context.attempt < 2:
+            raise ConnectionError("database restarting")
+        return {"attempt": context.attempt}
+
+    worker.job_types = {"flaky": JobType("flaky", flaky, NoParameters, max_attempts=2)}
+    job = await queue(session_factory, create_event["id"], "flaky", max_attempts=2)
+
+    await worker.run_next()
+    async with session_factory() as session:
+        retried = await JobsRepository(session).get(job.id)
+    assert retried.status == JobStatus.QUEUED
+    assert retried.error == "ConnectionError: database restarting"
+
+    await worker.run_next()
+    async with session_factory() as session:
+        succeeded = await JobsRepository(session).get(job.id)
+    assert attempts == [1, 2]
+    assert succeeded.status == JobStatus.SUCCEEDED
+    assert succeeded.result == {"attempt": 2}
+
+
+async def test_running_jobs_per_event_and_type_are_bounded(session_factory, create_many_events):
+    first_event, second_event = create_many_events[:2]
+    for event_id in (first_event, first_event, second_event, second_event):
+        await queue(session_factory, event_id, "slots_assign")
+
+    async with session_factory() as session:
+        repository = JobsRepository(session)
+        claimed = [await repository.claim(str(uuid4()), {"slots_assign": 2}, per_event_limit=1) for _ in range(3)]
+
+    assert claimed[2] is None
+    assert {str(job.event_id) for job in claimed[:2]} == {first_event, second_event}
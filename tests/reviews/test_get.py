@@ -429,3 +429,17 @@ async def test_get_my_work_reviews_non_author(
     )
 
     assert get_my_work_reviews_response.status_code == 403
+
+
+async def test_get_reviews_answers_not_modified_for_matching_etag(
+    client, admin_data, create_event_started, create_work_from_user
+):
+    url = f"/events/{create_event_started}/works/{create_work_from_user}/reviews"
+    response = await client.get(url, headers=create_headers(admin_data.id))
+    assert response.status_code == 200
+    assert response.json() == []
+
+    response = await client.get(
+        url, headers={**create_headers(admin_data.id), "If-None-Match": response.headers["etag"]}
+    )
+    assert response.status_code == 304
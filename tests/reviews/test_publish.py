@@ -0,0 +1,122 @@
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+
+import pytest
+from sqlalchemy import select
+
+from app.database.database import SessionLocal
+from app.database.instrumentation import track_statements
+from app.database.models.event import EventModel
+from app.database.models.review import ReviewModel
+from app.database.models.submission import SubmissionModel
+from app.database.models.work import WorkModel, WorkStates
+from app.repository.reviews_repository import ReviewsRepository
+from app.schemas.works.review import ReviewPublishSchema
+
+
+@pytest.fixture
+def session_factory(connection, session_override):
+    return lambda: SessionLocal(bind=connection, join_transaction_mode="create_savepoint")
+
+
+@pytest.fixture
+async def reviewed_works(session_factory, admin_data, create_event_started, create_many_works):
+    """(work id, submission id, review id) of the works of the event, with one review each."""
+    event_id = UUID(create_event_started)
+    reviewed = []
+    async with session_factory() as session:
+        for work in create_many_works:
+            submission = SubmissionModel(id=uuid4(), event_id=event_id, work_id=UUID(work["id"]))
+            review = ReviewModel(
+                id=uuid4(),
+                event_id=event_id,
+                work_id=UUID(work["id"]),
+                submission_id=submission.id,
+                reviewer_id=admin_data.id,
+                status="APPROVED",
+                review={"answers": []},
+                shared=False,
+            )
+            session.add(submission)
+            await session.flush()
+            session.add(review)
+            reviewed.append((UUID(work["id"]), submission.id, review.id))
+        await session.commit()
+    return reviewed
+
+
+async def published_state(session_factory, event_id):
+    async with session_factory() as session:
+        works = {
+            work.id: work for work in await session.scalars(select(WorkModel).where(WorkModel.event_id == event_id))
+        }
+        submissions = dict(
+            (
+                await session.execute(
+                    select(SubmissionModel.work_id, SubmissionModel.state).where(SubmissionModel.event_id == event_id)
+                )
+            ).all()
+        )
+        shared = set(await session.scalars(select(ReviewModel.id).where(ReviewModel.shared.is_(True))))
+        counter = await session.scalar(select(EventModel.last_work_number).where(EventModel.id == event_id))
+    return works, submissions, shared, counter
+
+
+async def test_reviews_of_many_works_are_published_in_three_statements(
+    session_factory, create_event_started, reviewed_works
+):
+    event_id = UUID(create_event_started)
+    (approved, _, approved_review), (resubmit, _, resubmit_review) = reviewed_works
+    deadline = (datetime.now() + timedelta(days=15)).replace(microsecond=0)
+    publications = {
+        approved: ReviewPublishSchema(reviews_to_publish=[approved_review], new_work_status=WorkStates.APPROVED),
+        resubmit: ReviewPublishSchema(
+            reviews_to_publish=[resubmit_review], new_work_status=WorkStates.RE_SUBMIT, resend_deadline=deadline
+        ),
+    }
+
+    async with session_factory() as session:
+        with track_statements() as statements:
+            assert await ReviewsRepository(session).publish_reviews(event_id, publications)
+
+    # The savepoints are of the test transaction.
+    assert sum(count for shape, count in statements.fingerprints.items() if "SAVEPOINT" not in shape) == 3
+    works, submissions, shared, counter = await published_state(session_factory, event_id)
+    assert shared == {approved_review, resubmit_review}
+    assert (works[approved].state, submissions[approved]) == (WorkStates.APPROVED, WorkStates.APPROVED)
+    assert (works[resubmit].state, submissions[resubmit]) == (WorkStates.RE_SUBMIT, WorkStates.RE_SUBMIT)
+    assert works[resubmit].deadline_date == deadline
+    assert {works[approved].work_number, works[resubmit].work_number} == {1, 2}
+    assert counter == 2
+
+
+async def test_work_numbers_continue_from_the_event_counter(session_factory, create_event_started, reviewed_works):
+    event_id = UUID(create_event_started)
+    for work_id, _, review_id in reviewed_works:
+        async with session_factory() as session:
+            publication = ReviewPublishSchema(reviews_to_publish=[review_id], new_work_status=WorkStates.APPROVED)
+            assert await ReviewsRepository(session).publish_reviews(event_id, {work_id: publication})
+
+    works, _, _, counter = await published_state(session_factory, event_id)
+    assert [works[work_id].work_number for work_id, _, _ in reviewed_works] == [1, 2]
+    assert counter == 2
+
+
+async def test_nothing_is_published_when_a_review_is_of_another_work(
+    session_factory, create_event_started, reviewed_works
+):
+    event_id = UUID(create_event_started)
+    (first, _, first_review), (_, _, second_review) = reviewed_works
+    publication = ReviewPublishSchema(
+        reviews_to_publish=[first_review, second_review], new_work_status=WorkStates.APPROVED
+    )
+
+    async with session_factory() as session:
+        assert not await ReviewsRepository(session).publish_reviews(event_id, {first: publication})
+
+    works, submissions, shared, counter = await published_state(session_factory, event_id)
+    assert shared == set()
+    assert works[first].state == WorkStates.SUBMITTED
+    assert works[first].work_number is None
+    assert submissions[first] == WorkStates.SUBMITTED
+    assert counter == 0
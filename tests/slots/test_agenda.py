@@ -0,0 +1,83 @@
+from fastapi.encoders import jsonable_encoder
+
+from app.schemas.events.assing_works_parameters import AssignWorksParametersSchema, AssignWorksParametersWeights
+
+from ..commontest import create_headers
+
+WEIGHTS = AssignWorksParametersWeights(same_day_tracks=2, same_room_tracks=1)
+
+
+async def assign_all_works(client, admin_data, event_id):
+    parameters = AssignWorksParametersSchema(time_per_work=30, reset_previous_assignments=True, weights=WEIGHTS)
+    response = await client.post(
+        f"/events/{event_id}/configuration/slots/assign",
+        json=jsonable_encoder(parameters),
+        headers=create_headers(admin_data.id),
+    )
+    assert response.status_code == 200
+
+
+async def test_agenda_lists_every_slot(client, create_event_with_slots):
+    response = await client.get(f"/events/{create_event_with_slots}/agenda")
+
+    assert response.status_code == 200
+    slots = response.json()["slots"]
+    assert len(slots) == 6
+    assert [slot["start"][11:16] for slot in slots] == ["09:00", "09:00", "10:00", "10:00", "14:00", "14:00"]
+    assert all(slot["works"] == [] for slot in slots)
+
+
+async def test_agenda_of_an_unpublished_event_is_not_found(client, create_event):
+    response = await client.get(f"/events/{create_event['id']}/agenda")
+
+    assert response.status_code == 404
+
+
+async def test_agenda_answers_not_modified_for_matching_etag(client, create_event_with_slots):
+    response = await client.get(f"/events/{create_event_with_slots}/agenda")
+    etag = response.headers["etag"]
+
+    response = await client.get(f"/events/{create_event_with_slots}/agenda", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+
+async def test_agenda_follows_work_assignments(client, admin_data, create_event_with_slots, create_many_works):
+    response = await client.get(f"/events/{create_event_with_slots}/agenda")
+    etag = response.headers["etag"]
+
+    await assign_all_works(client, admin_data, create_event_with_slots)
+
+    response = await client.get(f"/events/{create_event_with_slots}/agenda", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assigned = [work["id"] for slot in response.json()["slots"] for work in slot["works"]]
+    assert sorted(assigned) == sorted(work["id"] for work in create_many_works)
+
+    removed_work_id = create_many_works[0]["id"]
+    await client.delete(
+        f"/events/{create_event_with_slots}/configuration/slots/works/{removed_work_id}",
+        headers=create_headers(admin_data.id),
+    )
+
+    response = await client.get(f"/events/{create_event_with_slots}/agenda")
+    assigned = [work["id"] for slot in response.json()["slots"] for work in slot["works"]]
+    assert removed_work_id not in assigned
+    assert len(assigned) == len(create_many_works) - 1
+
+
+async def test_agenda_filters_by_day_room_and_track(client, admin_data, create_event_with_slots, create_many_works):
+    await assign_all_works(client, admin_data, create_event_with_slots)
+
+    response = await client.get(f"/events/{create_event_with_slots}/agenda", params={"room": "Aula 1"})
+    assert {slot["room_name"] for slot in response.json()["slots"]} == {"Aula 1"}
+
+    response = await client.get(f"/events/{create_event_with_slots}/agenda", params={"day": "2030-05-11"})
+    assert response.json()["slots"] == []
+
+    track = create_many_works[0]["track"]
+    response = await client.get(f"/events/{create_event_with_slots}/agenda", params={"track": track})
+    works = [work for slot in response.json()["slots"] for work in slot["works"]]
+    assert works
+    assert {work["track"] for work in works} == {track}
@@ -0,0 +1,217 @@
+import asyncio
+import time
+from uuid import uuid4
+
+import pytest
+from fastapi.encoders import jsonable_encoder
+
+from app.jobs.job_types import JobCancelled
+from app.schemas.events.assing_works_parameters import (
+    AssignWorksParametersSchema,
+    AssignWorksParametersWeights,
+    RepairWorksParametersSchema,
+)
+from app.services.slots import slots_configuration_service
+from app.services.slots.ConfigurableBBScheduler import ConfigurableBBScheduler, CostPenalties
+from app.services.slots.slots_configuration_service import SlotsConfigurationService
+
+from ..commontest import create_headers
+from .test_scheduler import make_big_event
+
+# Solving is CPU bound: it must not run on the event loop.
+pytestmark = pytest.mark.loop_monitor
+
+WEIGHTS = AssignWorksParametersWeights(same_day_tracks=2, same_room_tracks=1)
+
+
+async def test_assign_works_to_slots_assigns_every_approved_work(
+    client, admin_data, create_event_with_slots, create_many_works
+):
+    parameters = AssignWorksParametersSchema(time_per_work=30, reset_previous_assignments=True, weights=WEIGHTS)
+    response = await client.post(
+        f"/events/{create_event_with_slots}/configuration/slots/assign",
+        json=jsonable_encoder(parameters),
+        headers=create_headers(admin_data.id),
+    )
+    assert response.status_code == 200
+
+    response = await client.get(
+        f"/events/{create_event_with_slots}/works/unassigned", headers=create_headers(admin_data.id)
+    )
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+async def test_repair_places_works_removed_from_their_slot(
+    client, admin_data, create_event_with_slots, create_many_works
+):
+    parameters = AssignWorksParametersSchema(time_per_work=30, reset_previous_assignments=True, weights=WEIGHTS)
+    await client.post(
+        f"/events/{create_event_with_slots}/configuration/slots/assign",
+        json=jsonable_encoder(parameters),
+        headers=create_headers(admin_data.id),
+    )
+
+    removed_work_id = create_many_works[0]["id"]
+    response = await client.delete(
+        f"/events/{create_event_with_slots}/configuration/slots/works/{removed_work_id}",
+        headers=create_headers(admin_data.id),
+    )
+    assert response.status_code == 200
+
+    response = await client.get(
+        f"/events/{create_event_with_slots}/works/unassigned", headers=create_headers(admin_data.id)
+    )
+    assert [work["id"] for work in response.json()] == [removed_work_id]
+
+    repair_parameters = RepairWorksParametersSchema(time_per_work=30, weights=WEIGHTS)
+    response = await client.post(
+        f"/events/{create_event_with_slots}/configuration/slots/repair",
+        json=jsonable_encoder(repair_parameters),
+        headers=create_headers(admin_data.id),
+    )
+    assert response.status_code == 200
+
+    response = await client.get(
+        f"/events/{create_event_with_slots}/works/unassigned", headers=create_headers(admin_data.id)
+    )
+    assert response.json() == []
+
+
+async def test_preview_does_not_write_and_commit_persists_it(
+    client, admin_data, create_event_with_slots, create_many_works
+):
+    parameters = AssignWorksParametersSchema(time_per_work=30, reset_previous_assignments=True, weights=WEIGHTS)
+    response = await client.post(
+        f"/events/{create_event_with_slots}/configuration/slots/assign/preview",
+        json=jsonable_encoder(parameters),
+        headers=create_headers(admin_data.id),
+    )
+    assert response.status_code == 200
+    preview = response.json()
+    assert len(preview["assignments"]) == len(create_many_works)
+    assert preview["cost_breakdown"]["unassigned_works"] == 0
+
+    response = await client.get(
+        f"/events/{create_event_with_slots}/works/unassigned", headers=create_headers(admin_data.id)
+    )
+    assert len(response.json()) == len(create_many_works)
+
+    response = await client.post(
+        f"/events/{create_event_with_slots}/configuration/slots/assign/preview",
+        json=jsonable_encoder(parameters),
+        headers=create_headers(admin_data.id),
+    )
+    assert response.json()["solution_id"] == preview["solution_id"]
+
+    response = await client.post(
+        f"/events/{create_event_with_slots}/configuration/slots/assign/{preview['solution_id']}/commit",
+        headers=create_headers(admin_data.id),
+    )
+    assert response.status_code == 200
+    assert response.json()["assignments_created"] == len(create_many_works)
+
+    response = await client.get(
+        f"/events/{create_event_with_slots}/works/unassigned", headers=create_headers(admin_data.id)
+    )
+    assert response.json() == []
+
+
+async def test_commit_fails_when_data_changed_since_preview(
+    client, admin_data, create_event_with_slots, create_many_works
+):
+    parameters = AssignWorksParametersSchema(time_per_work=30, reset_previous_assignments=False, weights=WEIGHTS)
+    response = await client.post(
+        f"/events/{create_event_with_slots}/configuration/slots/assign/preview",
+        json=jsonable_encoder(parameters),
+        headers=create_headers(admin_data.id),
+    )
+    solution_id = response.json()["solution_id"]
+
+    await client.post(
+        f"/events/{create_event_with_slots}/configuration/slots/assign",
+        json=jsonable_encoder(parameters),
+        headers=create_headers(admin_data.id),
+    )
+
+    response = await client.post(
+        f"/events/{create_event_with_slots}/configuration/slots/assign/{solution_id}/commit",
+        headers=create_headers(admin_data.id),
+    )
+    assert response.status_code == 409
+    assert response.json()["detail"]["errorcode"] == "STALE_ASSIGNMENT_SOLUTION"
+
+
+async def test_commit_unknown_solution_is_not_found(client, admin_data, create_event_with_slots):
+    response = await client.post(
+        f"/events/{create_event_with_slots}/configuration/slots/assign/{uuid4()}/commit",
+        headers=create_headers(admin_data.id),
+    )
+    assert response.status_code == 404
+
+
+@pytest.mark.parametrize("path", ["slots/assign/preview", f"slots/assign/{uuid4()}/commit", "slots/repair"])
+async def test_only_organizers_can_solve_assignments(client, create_user, create_event_with_slots, path):
+    parameters = RepairWorksParametersSchema(time_per_work=30, weights=WEIGHTS)
+    response = await client.post(
+        f"/events/{create_event_with_slots}/configuration/{path}",
+        json=jsonable_encoder(parameters),
+        headers=create_headers(create_user["id"]),
+    )
+    assert response.status_code == 403
+
+
+async def test_solving_does_not_block_the_event_loop(
+    client, admin_data, create_event_with_slots, create_many_works, monkeypatch
+):
+    solve = ConfigurableBBScheduler.solve
+
+    def slow_solve(scheduler, *args, **kwargs):
+        time.sleep(0.3)
+        return solve(scheduler, *args, **kwargs)
+
+    monkeypatch.setattr(ConfigurableBBScheduler, "solve", slow_solve)
+    ticks = 0
+
+    async def tick():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    ticker = asyncio.create_task(tick())
+    parameters = AssignWorksParametersSchema(time_per_work=30, reset_previous_assignments=True, weights=WEIGHTS)
+    response = await client.post(
+        f"/events/{create_event_with_slots}/configuration/slots/assign",
+        json=jsonable_encoder(parameters),
+        headers=create_headers(admin_data.id),
+    )
+    ticker.cancel()
+
+    assert response.status_code == 200
+    assert ticks >= 10
+
+
+async def test_solving_reports_progress_and_stops_when_the_caller_gives_up(monkeypatch):
+    monkeypatch.setattr(slots_configuration_service, "SOLVE_PROGRESS_INTERVAL_SECONDS", 0.05)
+    works, slots = make_big_event()
+    scheduler = ConfigurableBBScheduler(
+        works=works,
+        slots=slots,
+        time_per_work=30,
+        penalties=CostPenalties.from_params(2, 1),
+        transposition_table_size=0,
+    )
+    reported = []
+
+    async def on_progress(fraction):
+        reported.append(fraction)
+        if len(reported) == 3:
+            raise JobCancelled()
+
+    with pytest.raises(JobCancelled):
+        await SlotsConfigurationService._run_solver(scheduler, float("inf"), on_progress)
+
+    assert scheduler.cancel_requested
+    assert reported == sorted(reported)
+    assert 0 <= reported[0] and reported[-1] < 1
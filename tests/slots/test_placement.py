@@ -0,0 +1,177 @@
+import random
+from datetime import timedelta
+
+import pytest
+
+from app.services.slots.ConfigurableBBScheduler import SolverWork
+from app.services.slots.min_cost_flow import MinCostFlow
+from app.services.slots.placement import (
+    GreedyPlacement,
+    MinCostFlowPlacement,
+    is_available,
+    speaker_unavailability,
+    time_windows,
+)
+
+from .test_scheduler import START, make_event, make_slot, make_works, solve
+
+
+def unavailable_on(day):
+    start = START + timedelta(days=day) - timedelta(hours=START.hour)
+    return ((start, start + timedelta(days=1)),)
+
+
+def random_event(seed):
+    rng = random.Random(seed)
+    works = []
+    for track in ("math", "chemistry", "physics")[: rng.randint(1, 3)]:
+        works += make_works(track, rng.randint(1, 4))
+    for work in works:
+        if rng.random() < 0.4:
+            work.unavailable = unavailable_on(rng.randint(0, 1))
+    slots = [
+        make_slot(slot_id, room, day, hour, minutes=rng.choice([30, 60]))
+        for slot_id, (room, day, hour) in enumerate(
+            [(room, day, hour) for day in range(2) for hour in range(2) for room in ("A", "B")], start=1
+        )
+    ]
+    return works, slots
+
+
+def best_possible_placement(plan, works, slots):
+    """Maximum bipartite matching of works to slot seats (augmenting paths), as a reference."""
+    seats = [slot for slot in slots if slot.id in plan for _ in range(slot.available_space)]
+    seat_owner = [None] * len(seats)
+
+    def try_place(work, visited):
+        for seat, slot in enumerate(seats):
+            if seat in visited or plan[slot.id] != work.track or not is_available(work, slot):
+                continue
+            visited.add(seat)
+            if seat_owner[seat] is None or try_place(seat_owner[seat], visited):
+                seat_owner[seat] = work
+                return True
+        return False
+
+    return sum(try_place(work, set()) for work in works)
+
+
+def test_min_cost_flow_sends_max_flow_at_min_cost():
+    network = MinCostFlow(4)
+    cheap = network.add_edge(0, 1, 2, 1)
+    expensive = network.add_edge(0, 2, 2, 5)
+    network.add_edge(1, 3, 3, 0)
+    network.add_edge(2, 3, 3, 0)
+
+    flow, cost = network.solve(0, 3)
+
+    assert flow == 4
+    assert cost == 2 * 1 + 2 * 5
+    assert network.flow(cheap) == 2
+    assert network.flow(expensive) == 2
+
+
+def test_flow_placement_matches_branch_and_bound_without_constraints():
+    works, slots = make_event()
+    greedy_scheduler, greedy_assignments, greedy_cost = solve(works, slots)
+    flow_scheduler, flow_assignments, flow_cost = solve(works, slots, placement=MinCostFlowPlacement())
+
+    assert flow_cost == greedy_cost
+    assert flow_scheduler.global_best_solution == greedy_scheduler.global_best_solution
+    assert len(flow_assignments) == len(greedy_assignments) == len(works)
+    for work, slot in flow_assignments:
+        assert flow_scheduler.global_best_solution[slot.id] == work.track
+
+
+def test_flow_placement_respects_author_availability():
+    works = make_works("math", 2)
+    works[0].unavailable = unavailable_on(0)
+    slots = [make_slot(1, "A", day=0), make_slot(2, "A", day=1)]
+    plan = {1: "math", 2: "math"}
+    for slot in slots:
+        slot.available_space = 1
+
+    placement = MinCostFlowPlacement().place(plan, {"math": works}, slots)
+
+    assert {(work.id, slot.id) for work, slot in placement} == {(works[0].id, 2), (works[1].id, 1)}
+
+
+def test_speakers_are_unavailable_while_presenting_scheduled_works():
+    scheduled, pending, other = make_works("math", 3)
+    slots = [make_slot(1, "A"), make_slot(2, "B"), make_slot(3, "A", hour=1)]
+    slots[0].work_ids = (scheduled.id,)
+    speakers = {scheduled.id: {"ana@mail.com"}, pending.id: {"ana@mail.com", "bob@mail.com"}, other.id: set()}
+
+    unavailable = speaker_unavailability(slots, speakers)
+
+    assert unavailable == {pending.id: ((slots[0].start, slots[0].end),), other.id: ()}
+    pending.unavailable = unavailable[pending.id]
+    for slot in slots:
+        slot.available_space = 1
+    placement = MinCostFlowPlacement().place({1: "math", 2: "math", 3: "math"}, {"math": [pending]}, slots)
+    assert [(work.id, slot.id) for work, slot in placement] == [(pending.id, 3)]
+
+
+def assert_speakers_present_one_work_at_a_time(placement, slots):
+    windows = dict(zip((slot.id for slot in slots), time_windows(slots), strict=True))
+    presenting = [(speaker, windows[slot.id]) for work, slot in placement for speaker in work.speakers]
+    assert len(presenting) == len(set(presenting))
+
+
+@pytest.mark.parametrize("backend", [GreedyPlacement, MinCostFlowPlacement])
+def test_works_sharing_a_speaker_are_placed_at_different_times(backend):
+    works = make_works("math", 2)
+    for work in works:
+        work.speakers = frozenset({"ana@mail.com"})
+    slots = [make_slot(1, "A"), make_slot(2, "B"), make_slot(3, "A", hour=1)]
+    for slot in slots:
+        slot.available_space = 2
+
+    placement = backend().place({1: "math", 2: "math", 3: "math"}, {"math": works}, slots)
+
+    assert {work.id for work, _ in placement} == {work.id for work in works}
+    assert_speakers_present_one_work_at_a_time(placement, slots)
+
+
+def test_flow_placement_keeps_speakers_apart_across_tracks():
+    math_works = make_works("math", 2)
+    chemistry_works = make_works("chemistry", 1)
+    math_works[0].speakers = frozenset({"ana@mail.com"})
+    math_works[1].speakers = frozenset({"ana@mail.com", "bob@mail.com"})
+    chemistry_works[0].speakers = frozenset({"bob@mail.com"})
+    slots = [make_slot(1, "A"), make_slot(2, "B"), make_slot(3, "C"), make_slot(4, "A", hour=1)]
+    for slot in slots:
+        slot.available_space = 2
+    plan = {1: "math", 2: "math", 3: "chemistry", 4: "math"}
+
+    placement = MinCostFlowPlacement().place(plan, {"math": math_works, "chemistry": chemistry_works}, slots)
+
+    assert len(placement) == 3
+    assert_speakers_present_one_work_at_a_time(placement, slots)
+
+
+def test_flow_placement_is_optimal_on_small_instances():
+    for seed in range(30):
+        works, slots = random_event(seed)
+        scheduler, flow_assignments, flow_cost = solve(works, slots, placement=MinCostFlowPlacement())
+        unconstrained = [SolverWork(id=work.id, track=work.track) for work in works]
+        greedy_scheduler, greedy_assignments, greedy_cost = solve(unconstrained, slots)
+
+        plan = scheduler.global_best_solution
+        assert plan == greedy_scheduler.global_best_solution
+        assert all(is_available(work, slot) for work, slot in flow_assignments)
+        assert len({work.id for work, _ in flow_assignments}) == len(flow_assignments)
+        assert len(flow_assignments) == best_possible_placement(plan, works, slots)
+        shortfall = len(greedy_assignments) - len(flow_assignments)
+        assert flow_cost == greedy_cost + shortfall * scheduler.penalties.unassigned_work
+
+
+def test_greedy_placement_fills_planned_slots():
+    works = make_works("math", 3)
+    slots = [make_slot(1, "A"), make_slot(2, "B")]
+    for slot in slots:
+        slot.available_space = 2
+
+    placement = GreedyPlacement().place({1: "math", 2: "chemistry"}, {"math": works}, slots)
+
+    assert [slot.id for _, slot in placement] == [1, 1]
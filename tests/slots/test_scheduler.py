@@ -0,0 +1,274 @@
+import threading
+import time
+from datetime import datetime, timedelta
+from uuid import uuid4
+
+import pytest
+
+from app.services.slots.ConfigurableBBScheduler import (
+    ConfigurableBBScheduler,
+    CostPenalties,
+    SolveCancelled,
+    SolverSlot,
+    SolverWork,
+)
+from app.services.slots.transposition_table import TranspositionTable
+
+START = datetime(2030, 5, 10, 9, 0)
+
+
+def make_slot(slot_id, room_name, day=0, hour=0, minutes=60):
+    start = START + timedelta(days=day, hours=hour)
+    return SolverSlot(id=slot_id, room_name=room_name, start=start, end=start + timedelta(minutes=minutes))
+
+
+def make_works(track, amount):
+    return [SolverWork(id=uuid4(), track=track) for _ in range(amount)]
+
+
+def make_event():
+    works = make_works("math", 3) + make_works("chemistry", 2) + make_works("physics", 2)
+    slots = [
+        make_slot(slot_id, room, day, hour)
+        for slot_id, (room, day, hour) in enumerate(
+            [(room, day, hour) for day in range(2) for hour in range(2) for room in ("A", "B")], start=1
+        )
+    ]
+    return works, slots
+
+
+def make_big_event():
+    """Without a transposition table, searching it takes minutes."""
+    works = [work for track in ("math", "chemistry", "physics", "biology") for work in make_works(track, 6)]
+    slots = [
+        make_slot(slot_id, room, day, hour)
+        for slot_id, (room, day, hour) in enumerate(
+            [(room, day, hour) for day in range(3) for hour in range(4) for room in ("A", "B", "C")], start=1
+        )
+    ]
+    return works, slots
+
+
+def solve(works, slots, **kwargs):
+    scheduler = ConfigurableBBScheduler(
+        works=works, slots=slots, time_per_work=30, penalties=CostPenalties.from_params(2, 1), **kwargs
+    )
+    assignments, cost = scheduler.solve()
+    return scheduler, assignments, cost
+
+
+def test_transposition_table_prunes_equal_or_worse_states():
+    table = TranspositionTable(max_entries=10)
+
+    assert not table.is_dominated("state", 10)
+    assert table.is_dominated("state", 10)
+    assert table.is_dominated("state", 12)
+    assert not table.is_dominated("state", 8)
+    assert table.hits == 2
+    assert table.misses == 2
+
+
+def test_transposition_table_evicts_least_recently_used():
+    table = TranspositionTable(max_entries=2)
+
+    table.is_dominated("a", 1)
+    table.is_dominated("b", 1)
+    table.is_dominated("a", 1)
+    table.is_dominated("c", 1)
+
+    assert len(table) == 2
+    assert table.evictions == 1
+    assert not table.is_dominated("b", 1)
+
+
+def test_transposition_table_clear_resets_counters():
+    table = TranspositionTable(max_entries=1)
+    table.is_dominated("a", 1)
+    table.is_dominated("a", 1)
+    table.is_dominated("b", 1)
+
+    table.clear()
+
+    assert len(table) == 0
+    assert (table.hits, table.misses, table.evictions) == (0, 0, 0)
+
+
+def test_scheduler_stats_are_per_solve():
+    works, slots = make_event()
+    scheduler, _, _ = solve(works, slots)
+    first_stats = scheduler.stats
+
+    scheduler.solve()
+
+    assert scheduler.stats == first_stats
+
+
+def test_scheduler_with_transposition_table_keeps_optimal_cost():
+    works, slots = make_event()
+    _, plain_assignments, plain_cost = solve(works, slots, transposition_table_size=0)
+    scheduler, assignments, cost = solve(works, slots)
+
+    assert cost == plain_cost
+    assert len(assignments) == len(plain_assignments) == len(works)
+    assert scheduler.stats.transposition_hits > 0
+    assert scheduler.stats.transposition_prunes == scheduler.stats.transposition_hits
+
+
+def test_scheduler_transposition_table_explores_fewer_nodes():
+    works, slots = make_event()
+    plain_scheduler, _, _ = solve(works, slots, transposition_table_size=0)
+    scheduler, _, _ = solve(works, slots)
+
+    assert scheduler.stats.nodes_explored < plain_scheduler.stats.nodes_explored
+
+
+def test_scheduler_transposition_table_reports_evictions_when_bounded():
+    works, slots = make_event()
+    scheduler, _, cost = solve(works, slots, transposition_table_size=4)
+    _, _, plain_cost = solve(works, slots, transposition_table_size=0)
+
+    assert cost == plain_cost
+    assert scheduler.stats.transposition_evictions > 0
+
+
+def test_scheduler_keeps_pre_assigned_slots():
+    works, slots = make_event()
+    math_work = works[0]
+    slots[0].work_ids = (math_work.id,)
+
+    _, assignments, _ = solve(works, slots)
+
+    assigned_ids = {work.id for work, _ in assignments}
+    assert math_work.id not in assigned_ids
+    assert len(assignments) == len(works) - 1
+
+
+def test_scheduler_counts_works_of_a_mixed_slot_against_their_own_tracks():
+    math_works, chemistry_works = make_works("math", 2), make_works("chemistry", 2)
+    slots = [make_slot(1, "A"), make_slot(2, "A", hour=1), make_slot(3, "B", hour=1)]
+    # A manual move left one work of each track in the first slot
+    slots[0].work_ids = (math_works[0].id, chemistry_works[0].id)
+
+    scheduler, assignments, cost = solve(math_works + chemistry_works, slots)
+
+    assert {work.id for work, _ in assignments} == {math_works[1].id, chemistry_works[1].id}
+    breakdown = scheduler.cost_breakdown(assignments)
+    assert breakdown.unassigned_works == 0
+    assert breakdown.distinct_days_cost + breakdown.room_track_mixes_cost == cost
+
+
+def test_parallel_scheduler_matches_serial_solution():
+    works, slots = make_event()
+    serial_scheduler, serial_assignments, serial_cost = solve(works, slots)
+    parallel_scheduler, parallel_assignments, parallel_cost = solve(works, slots, workers=2, split_depth=2)
+
+    assert parallel_cost == serial_cost
+    assert parallel_scheduler.global_best_solution == serial_scheduler.global_best_solution
+    assert len(parallel_assignments) == len(serial_assignments)
+    assert parallel_scheduler.stats.nodes_explored > 0
+
+
+def test_parallel_scheduler_is_reproducible():
+    works, slots = make_event()
+    first, _, first_cost = solve(works, slots, workers=2, split_depth=3)
+    second, _, second_cost = solve(works, slots, workers=2, split_depth=3)
+
+    assert first_cost == second_cost
+    assert first.global_best_solution == second.global_best_solution
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_cancel_stops_a_running_solve(workers):
+    works, slots = make_big_event()
+    scheduler = ConfigurableBBScheduler(
+        works=works,
+        slots=slots,
+        time_per_work=30,
+        penalties=CostPenalties.from_params(2, 1),
+        transposition_table_size=0,
+        workers=workers,
+        split_depth=2,
+    )
+    threading.Timer(0.3, scheduler.cancel).start()
+    started = time.monotonic()
+
+    with pytest.raises(SolveCancelled):
+        scheduler.solve()
+
+    assert time.monotonic() - started < 10
+    assert 0 <= scheduler.progress() < 1
+
+
+def make_scheduled_event(days, hours, rooms, pending_per_track):
+    """An event whose first day is fully scheduled, one track per room, plus some new works."""
+    tracks = [f"track-{room}" for room in rooms]
+    slots, works = [], []
+    slot_id = 1
+    for day in range(days):
+        for hour in range(hours):
+            for room, track in zip(rooms, tracks, strict=True):
+                slot = make_slot(slot_id, room, day, hour)
+                if day == 0:
+                    scheduled = make_works(track, 2)
+                    slot.work_ids = tuple(work.id for work in scheduled)
+                    works += scheduled
+                slots.append(slot)
+                slot_id += 1
+    for track in tracks:
+        works += make_works(track, pending_per_track)
+    return works, slots
+
+
+def test_repair_only_places_pending_works_near_existing_schedule():
+    works, slots = make_scheduled_event(days=3, hours=4, rooms=["A", "B"], pending_per_track=0)
+    # Free one slot on the scheduled day
+    slots[0].work_ids = ()
+    freed_works = {work.id for work in works[:2]}
+
+    scheduler = ConfigurableBBScheduler(
+        works=works, slots=slots, time_per_work=30, penalties=CostPenalties.from_params(2, 1)
+    )
+    scheduler.restrict_to_neighbourhood()
+    assignments, _ = scheduler.solve()
+
+    assert {work.id for work, _ in assignments} == freed_works
+    assert all(slot.start.date() == START.date() for _, slot in assignments)
+    assert scheduler.total_slots < len(slots)
+
+
+def test_repair_widens_neighbourhood_when_existing_days_are_full():
+    works, slots = make_scheduled_event(days=2, hours=2, rooms=["A", "B"], pending_per_track=2)
+
+    scheduler = ConfigurableBBScheduler(
+        works=works, slots=slots, time_per_work=30, penalties=CostPenalties.from_params(2, 1)
+    )
+    scheduler.restrict_to_neighbourhood()
+    assignments, _ = scheduler.solve()
+
+    assert len(assignments) == 4
+    assert all(slot.start.date() != START.date() for _, slot in assignments)
+
+
+def test_repair_on_big_event_explores_few_nodes():
+    works, slots = make_scheduled_event(days=4, hours=8, rooms=["A", "B", "C", "D", "E"], pending_per_track=0)
+    works += make_works("track-A", 1)
+
+    scheduler = ConfigurableBBScheduler(
+        works=works, slots=slots, time_per_work=30, penalties=CostPenalties.from_params(2, 1)
+    )
+    scheduler.restrict_to_neighbourhood()
+    assignments, _ = scheduler.solve()
+
+    assert len(assignments) == 1
+    assert scheduler.stats.nodes_explored < 1000
+
+
+def test_cost_breakdown_adds_up_to_final_cost():
+    works, slots = make_event()
+    works += make_works("biology", 20)
+    scheduler, assignments, cost = solve(works, slots)
+
+    breakdown = scheduler.cost_breakdown(assignments)
+
+    assert breakdown.unassigned_works > 0
+    assert breakdown.distinct_days_cost + breakdown.room_track_mixes_cost + breakdown.unassigned_works_cost == cost
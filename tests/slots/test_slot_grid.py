@@ -0,0 +1,111 @@
+import copy
+
+from fastapi.encoders import jsonable_encoder
+
+from app.repository.events_repository import EventsRepository
+from app.schemas.events.assing_works_parameters import AssignWorksParametersSchema, AssignWorksParametersWeights
+from app.services.agenda.agenda_read_model import agenda_read_model
+
+from ..commontest import create_headers
+from ..fixtures.data.slots_fixtures import SLOTS_MDATA
+
+
+async def update_slots_mdata(client, admin_data, event_id, mdata):
+    response = await client.get(f"/events/{event_id}/configuration", headers=create_headers(admin_data.id))
+    configuration = response.json()
+    configuration["mdata"] = mdata
+    response = await client.put(
+        f"/events/{event_id}/configuration/general", json=configuration, headers=create_headers(admin_data.id)
+    )
+    assert response.status_code == 204
+
+    response = await client.get(f"/events/{event_id}/configuration/slots", headers=create_headers(admin_data.id))
+    assert response.status_code == 201
+
+
+async def get_slots(client, admin_data, event_id):
+    response = await client.get(f"/events/{event_id}/configuration/slots/works", headers=create_headers(admin_data.id))
+    assert response.status_code == 200
+    return {(slot["room_name"], slot["start"][:16]): slot for slot in response.json()}
+
+
+async def test_reconfiguring_slots_is_idempotent(client, admin_data, create_event_with_slots):
+    slots = await get_slots(client, admin_data, create_event_with_slots)
+
+    await update_slots_mdata(client, admin_data, create_event_with_slots, SLOTS_MDATA)
+
+    assert await get_slots(client, admin_data, create_event_with_slots) == slots
+
+
+async def test_reconfiguring_slots_only_changes_the_delta(client, admin_data, create_event_with_slots):
+    slots = await get_slots(client, admin_data, create_event_with_slots)
+
+    mdata = copy.deepcopy(SLOTS_MDATA)
+    mdata["rooms"].append({"name": "Aula 3"})
+    mdata["slots"][0]["title"] = "Mañana temprano"
+    del mdata["slots"][2]
+    await update_slots_mdata(client, admin_data, create_event_with_slots, mdata)
+
+    new_slots = await get_slots(client, admin_data, create_event_with_slots)
+    assert len(new_slots) == 6
+    for room in ("Aula 1", "Aula 2"):
+        assert new_slots[(room, "2030-05-10T09:00")]["id"] == slots[(room, "2030-05-10T09:00")]["id"]
+        assert new_slots[(room, "2030-05-10T09:00")]["title"] == "Mañana temprano"
+        assert new_slots[(room, "2030-05-10T10:00")] == slots[(room, "2030-05-10T10:00")]
+        assert (room, "2030-05-10T14:00") not in new_slots
+    assert ("Aula 3", "2030-05-10T09:00") in new_slots
+
+
+async def test_reconfiguring_slots_keeps_assignments_of_surviving_slots(
+    client, admin_data, create_event_with_slots, create_many_works
+):
+    slots = await get_slots(client, admin_data, create_event_with_slots)
+    weights = AssignWorksParametersWeights(same_day_tracks=2, same_room_tracks=1)
+    parameters = AssignWorksParametersSchema(time_per_work=30, reset_previous_assignments=True, weights=weights)
+    response = await client.post(
+        f"/events/{create_event_with_slots}/configuration/slots/assign/preview",
+        json=jsonable_encoder(parameters),
+        headers=create_headers(admin_data.id),
+    )
+    preview = response.json()
+    await client.post(
+        f"/events/{create_event_with_slots}/configuration/slots/assign/{preview['solution_id']}/commit",
+        headers=create_headers(admin_data.id),
+    )
+
+    mdata = copy.deepcopy(SLOTS_MDATA)
+    del mdata["slots"][2]
+    await update_slots_mdata(client, admin_data, create_event_with_slots, mdata)
+
+    removed_slot_ids = {slots[(room, "2030-05-10T14:00")]["id"] for room in ("Aula 1", "Aula 2")}
+    expected_unassigned = {
+        assignment["work_id"] for assignment in preview["assignments"] if assignment["slot_id"] in removed_slot_ids
+    }
+    response = await client.get(
+        f"/events/{create_event_with_slots}/works/unassigned", headers=create_headers(admin_data.id)
+    )
+    assert {work["id"] for work in response.json()} == expected_unassigned
+    assert len(expected_unassigned) < len(create_many_works)
+
+
+async def test_reconfiguring_slots_invalidates_the_agenda_after_committing(
+    client, admin_data, create_event_with_slots, monkeypatch
+):
+    calls = []
+    update, invalidate = EventsRepository.update, agenda_read_model.invalidate
+
+    async def recorded_update(repository, *args):
+        calls.append("commit")
+        return await update(repository, *args)
+
+    async def recorded_invalidate(event_id):
+        calls.append("invalidate")
+        await invalidate(event_id)
+
+    monkeypatch.setattr(EventsRepository, "update", recorded_update)
+    monkeypatch.setattr(agenda_read_model, "invalidate", recorded_invalidate)
+    mdata = copy.deepcopy(SLOTS_MDATA)
+    mdata["rooms"].append({"name": "Aula 3"})
+    await update_slots_mdata(client, admin_data, create_event_with_slots, mdata)
+
+    assert calls[-2:] == ["commit", "invalidate"]
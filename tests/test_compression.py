@@ -0,0 +1,35 @@
+import pytest
+
+from app.middlewares.compression import accepted_encodings
+
+from .commontest import create_headers
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+async def test_large_responses_are_compressed(client, encoding):
+    plain = await client.get("/openapi.json", headers={"Accept-Encoding": "identity"})
+    response = await client.get("/openapi.json", headers={"Accept-Encoding": encoding})
+
+    assert response.status_code == 200
+    assert "content-encoding" not in plain.headers
+    assert response.headers["content-encoding"] == encoding
+    assert "accept-encoding" in response.headers["vary"].lower()
+    assert int(response.headers["content-length"]) < len(plain.content)
+    assert response.json() == plain.json()
+
+
+async def test_brotli_is_preferred_over_gzip(client):
+    response = await client.get("/openapi.json", headers={"Accept-Encoding": "gzip, deflate, br"})
+
+    assert response.headers["content-encoding"] == "br"
+
+
+async def test_small_responses_are_not_compressed(client, admin_data):
+    response = await client.get("/users/echo", headers={**create_headers(admin_data.id), "Accept-Encoding": "gzip, br"})
+
+    assert response.status_code == 200
+    assert "content-encoding" not in response.headers
+
+
+def test_refused_encodings_are_ignored():
+    assert accepted_encodings("gzip;q=0.5, br;q=0, identity") == {"gzip", "identity"}
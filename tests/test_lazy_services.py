@@ -0,0 +1,27 @@
+from app.services.lazy import lazy
+from app.settings.settings import MercadoPagoSettings, get_settings
+
+
+class Collaborator:
+    built = 0
+
+    def __init__(self):
+        Collaborator.built += 1
+        self.name = "collaborator"
+
+    def greet(self, who):
+        return f"{self.name} greets {who}"
+
+
+def test_lazy_collaborators_are_built_once_on_first_use():
+    Collaborator.built = 0
+    collaborator = lazy(Collaborator)
+    assert Collaborator.built == 0
+
+    assert collaborator.greet("you") == "collaborator greets you"
+    assert collaborator.name == "collaborator"
+    assert Collaborator.built == 1
+
+
+def test_settings_are_process_singletons():
+    assert get_settings(MercadoPagoSettings) is get_settings(MercadoPagoSettings)
@@ -0,0 +1,40 @@
+import asyncio
+import time
+
+import pytest
+
+from app.utils.loop_monitor import OUTSIDE_APP, EventLoopBlocked, LoopLagMonitor
+from app.utils.metrics import EVENT_LOOP_BLOCKS, EVENT_LOOP_LAG
+
+
+def blocking_handler():
+    time.sleep(0.3)
+
+
+async def test_blocking_call_is_reported_with_its_stack():
+    blocks_before = EVENT_LOOP_BLOCKS.value(location=OUTSIDE_APP)
+    monitor = LoopLagMonitor(interval=0.01, threshold=0.1)
+    await monitor.start()
+    await asyncio.sleep(0.05)
+    blocking_handler()
+    await asyncio.sleep(0.05)
+    await monitor.stop()
+
+    assert len(monitor.blocking_calls) == 1
+    blocking_call = monitor.blocking_calls[0]
+    assert blocking_call.duration >= 0.1
+    assert "blocking_handler" in blocking_call.stack[-1]
+    assert EVENT_LOOP_BLOCKS.value(location=OUTSIDE_APP) == blocks_before + 1
+    with pytest.raises(EventLoopBlocked, match="blocking_handler"):
+        monitor.assert_not_blocked()
+
+
+async def test_awaiting_does_not_block():
+    beats_before = EVENT_LOOP_LAG.count()
+    monitor = LoopLagMonitor(interval=0.01, threshold=0.1)
+    await monitor.start()
+    await asyncio.sleep(0.3)
+    await monitor.stop()
+
+    monitor.assert_not_blocked()
+    assert EVENT_LOOP_LAG.count() > beats_before
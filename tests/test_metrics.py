@@ -0,0 +1,52 @@
+from app.utils.metrics import DB_STATEMENTS_PER_REQUEST, HTTP_REQUEST_DURATION, SCHEDULER_SOLVE_DURATION, Histogram
+
+from .slots.test_agenda import assign_all_works
+
+AGENDA_ROUTE = "/events/{event_id}/agenda"
+
+
+def test_histogram_renders_cumulative_buckets():
+    histogram = Histogram("request_seconds", "Request time.", ("route",), buckets=(0.1, 1.0))
+    histogram.observe(0.05, route='/a"b')
+    histogram.observe(0.5, route='/a"b')
+    histogram.observe(3, route='/a"b')
+
+    assert histogram.render().splitlines() == [
+        "# HELP request_seconds Request time.",
+        "# TYPE request_seconds histogram",
+        'request_seconds_bucket{route="/a\\"b",le="0.1"} 1',
+        'request_seconds_bucket{route="/a\\"b",le="1"} 2',
+        'request_seconds_bucket{route="/a\\"b",le="+Inf"} 3',
+        'request_seconds_sum{route="/a\\"b"} 3.55',
+        'request_seconds_count{route="/a\\"b"} 3',
+    ]
+
+
+async def test_requests_are_observed_by_route_template(client, create_event_with_slots):
+    requests_before = HTTP_REQUEST_DURATION.count(method="GET", route=AGENDA_ROUTE, status="200")
+    with_statements_before = DB_STATEMENTS_PER_REQUEST.count(route=AGENDA_ROUTE)
+
+    await client.get(f"/events/{create_event_with_slots}/agenda")
+    await client.get("/this/route/does/not/exist")
+
+    assert HTTP_REQUEST_DURATION.count(method="GET", route=AGENDA_ROUTE, status="200") == requests_before + 1
+    assert HTTP_REQUEST_DURATION.count(method="GET", route="unmatched", status="404") >= 1
+    assert DB_STATEMENTS_PER_REQUEST.count(route=AGENDA_ROUTE) == with_statements_before + 1
+    assert DB_STATEMENTS_PER_REQUEST.sum(route=AGENDA_ROUTE) > 0
+
+
+async def test_metrics_endpoint_exposes_subsystems(client, admin_data, create_event_with_slots):
+    solves_before = SCHEDULER_SOLVE_DURATION.count(mode="full")
+    await assign_all_works(client, admin_data, create_event_with_slots)
+
+    response = await client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert SCHEDULER_SOLVE_DURATION.count(mode="full") == solves_before + 1
+    body = response.text
+    assert 'scheduler_nodes_explored_count{mode="full"}' in body
+    assert "db_statement_duration_seconds_count" in body
+    assert "db_pool_checkout_duration_seconds" in body
+    assert 'http_requests_in_progress{method="GET"} 1' in body
+    assert "email_queue_depth 0" in body
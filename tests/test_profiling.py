@@ -0,0 +1,93 @@
+import marshal
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.middlewares.profiling import (
+    PROFILE_FILE_HEADER,
+    PROFILE_HEADER,
+    PROFILE_OUTPUT_HEADER,
+    PROFILED_STATUS_HEADER,
+    ProfilingMiddleware,
+)
+
+from .commontest import create_headers
+
+
+@pytest.fixture
+def profiles_directory(tmp_path):
+    return tmp_path / "profiles"
+
+
+@pytest.fixture
+async def profiled_client(session_override, profiles_directory):
+    transport = ASGITransport(app=ProfilingMiddleware(app, directory=profiles_directory))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+async def test_admin_request_is_profiled_to_a_folded_stack_file(profiled_client, admin_data, profiles_directory):
+    response = await profiled_client.get(
+        f"/users/{admin_data.id}", headers={**create_headers(admin_data.id), PROFILE_HEADER: "sampling"}
+    )
+
+    assert response.status_code == 200
+    assert response.json()["id"] == admin_data.id
+    profile = profiles_directory / response.headers[PROFILE_FILE_HEADER]
+    assert profile.suffix == ".folded"
+    for line in profile.read_text().splitlines():
+        stack, samples = line.rsplit(" ", 1)
+        assert stack and int(samples) > 0
+
+
+async def test_profile_can_be_returned_instead_of_the_response(profiled_client, admin_data, profiles_directory):
+    response = await profiled_client.get(
+        f"/users/{admin_data.id}?profile=deterministic",
+        headers={**create_headers(admin_data.id), PROFILE_OUTPUT_HEADER: "response"},
+    )
+
+    assert response.status_code == 200
+    assert response.headers[PROFILED_STATUS_HEADER] == "200"
+    stats = marshal.loads(response.content)
+    assert any(function_name == "read_user" for _, _, function_name in stats)
+    assert not profiles_directory.exists()
+
+
+async def test_only_admins_can_profile(profiled_client, create_user, profiles_directory):
+    response = await profiled_client.get(
+        f"/users/{create_user['id']}", headers={**create_headers(create_user["id"]), PROFILE_HEADER: "sampling"}
+    )
+
+    assert response.status_code == 403
+    assert not profiles_directory.exists()
+
+
+async def test_requests_without_the_flag_are_not_profiled(profiled_client, admin_data, profiles_directory):
+    response = await profiled_client.get(f"/users/{admin_data.id}", headers=create_headers(admin_data.id))
+
+    assert response.status_code == 200
+    assert PROFILE_FILE_HEADER not in response.headers
+    assert not profiles_directory.exists()
+
+
+async def test_unknown_callers_are_answered_like_the_routes(profiled_client, profiles_directory):
+    response = await profiled_client.get(
+        "/events", headers={**create_headers("unknownuser" * 3), PROFILE_HEADER: "sampling"}
+    )
+
+    assert response.status_code == 404
+    assert response.json()["detail"]["errorcode"] == "USER_NOT_FOUND"
+    assert not profiles_directory.exists()
+
+
+async def test_requests_are_not_profiled_concurrently(session_override, admin_data, profiles_directory):
+    middleware = ProfilingMiddleware(app, directory=profiles_directory)
+    async with AsyncClient(transport=ASGITransport(app=middleware), base_url="http://test") as client:
+        async with middleware._profiling:
+            response = await client.get(
+                f"/users/{admin_data.id}", headers={**create_headers(admin_data.id), PROFILE_HEADER: "sampling"}
+            )
+
+    assert response.status_code == 429
+    assert not profiles_directory.exists()
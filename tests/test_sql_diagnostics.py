@@ -0,0 +1,87 @@
+import logging
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import text
+from sqlalchemy.exc import InvalidRequestError
+
+from app.database.database import SessionLocal
+from app.database.instrumentation import StatementStats, fingerprint, raise_on_lazy_loads, track_statements
+from app.database.models.work import WorkModel
+from app.middlewares.sql_diagnostics import SQL_STATS_HEADER, SqlDiagnosticsMiddleware
+
+
+@pytest.fixture
+async def session(connection, transaction):
+    async with SessionLocal(bind=connection, join_transaction_mode="create_savepoint") as session:
+        # Opens the savepoint up front, so the tests only see their own statements.
+        await session.execute(text("SELECT 1"))
+        yield session
+
+
+def test_fingerprint_ignores_parameters_and_list_lengths():
+    one = fingerprint("SELECT * FROM works WHERE works.id IN ($1::UUID, $2::UUID) AND track = 'math'")
+    other = fingerprint("SELECT *\n  FROM works WHERE works.id IN ($1::UUID) AND track = 'physics'")
+
+    assert one == other == "SELECT * FROM works WHERE works.id IN (?) AND track = ?"
+
+
+def test_statement_stats_reports_repeated_shapes():
+    stats = StatementStats()
+    for work_id in range(3):
+        stats.record(f"SELECT * FROM works WHERE id = {work_id}", 0.001)
+    stats.record("SELECT * FROM events", 0.001)
+
+    assert stats.statements == 4
+    assert stats.repeated(3) == [("SELECT * FROM works WHERE id = ?", 3)]
+
+
+async def test_nested_trackers_record_the_same_statements(session):
+    with track_statements() as outer:
+        await session.execute(text("SELECT 1"))
+        with track_statements() as inner:
+            await session.execute(text("SELECT 2"))
+
+    assert outer.statements == 2
+    assert inner.statements == 1
+
+
+def diagnosed_app(session, debug):
+    app = FastAPI()
+
+    @app.get("/works")
+    async def many_queries():
+        for work_id in range(5):
+            await session.execute(text(f"SELECT {work_id}"))
+        return {}
+
+    return SqlDiagnosticsMiddleware(app, max_statements=50, repeated_threshold=5, debug=debug)
+
+
+async def test_repeated_statements_are_warned_and_summarized(session, caplog):
+    transport = ASGITransport(app=diagnosed_app(session, debug=True))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        with caplog.at_level(logging.WARNING, logger="app.middlewares.sql_diagnostics"):
+            response = await client.get("/works")
+
+    assert response.headers[SQL_STATS_HEADER].startswith("statements=5; time_ms=")
+    assert response.headers[SQL_STATS_HEADER].endswith("max_repeats=5")
+    assert "GET /works ran 5 SQL statements" in caplog.text
+    assert "5x SELECT ?" in caplog.text
+
+
+async def test_stats_header_is_only_sent_in_debug_mode(session):
+    transport = ASGITransport(app=diagnosed_app(session, debug=False))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/works")
+
+    assert SQL_STATS_HEADER not in response.headers
+
+
+async def test_lazy_loads_raise_in_guarded_sessions(session, create_many_works):
+    raise_on_lazy_loads(session.sync_session)
+    work = await session.get(WorkModel, create_many_works[0]["id"])
+
+    with pytest.raises(InvalidRequestError):
+        _ = work.reviewers
@@ -0,0 +1,48 @@
+import subprocess
+import sys
+from contextlib import asynccontextmanager
+
+from app.main import app
+from app.utils.metrics import APP_STARTUP_SECONDS
+from app.utils.startup import run_startup
+
+
+async def test_lifespan_runs_the_startup_steps_and_reports_them():
+    async with app.router.lifespan_context(app):
+        report = app.state.startup
+
+    assert list(report.steps) == ["import", "settings", "loop_monitor", "tracing", "cache", "jobs_worker"]
+    assert report.steps["import"] > 0
+    assert 'app_startup_seconds{step="settings"}' in APP_STARTUP_SECONDS.render()
+
+
+async def test_startup_steps_start_in_order_and_stop_in_reverse():
+    calls = []
+
+    def step(name):
+        @asynccontextmanager
+        async def run():
+            calls.append(f"start {name}")
+            yield
+            calls.append(f"stop {name}")
+
+        return name, run
+
+    async with run_startup([step("first"), step("second")], imported=0):
+        calls.append("serving")
+
+    assert calls == ["start first", "start second", "serving", "stop second", "stop first"]
+
+
+def test_importing_the_app_does_not_load_clients_or_templates():
+    script = (
+        "import sys, app.main\n"
+        "from app.services.notifications.notifications_service import get_body_template, load_file\n"
+        "from app.services.storage.storage_service import get_storage_client\n"
+        "loaded = [name for name in ('mercadopago', 'requests', 'google.cloud.storage') if name in sys.modules]\n"
+        "cached = [f.__name__ for f in (get_body_template, load_file, get_storage_client) if f.cache_info().currsize]\n"
+        "print(loaded + cached)\n"
+    )
+    result = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+
+    assert result.stdout.strip() == "[]"
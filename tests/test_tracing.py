@@ -0,0 +1,89 @@
+import json
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+
+from app.main import app
+from app.middlewares.tracing import TRACE_ID_HEADER, TracingMiddleware
+from app.utils.tracing import InMemoryExporter, JsonFileExporter, Tracer, span
+
+from .commontest import create_headers
+
+
+@pytest.fixture
+def exporter():
+    return InMemoryExporter()
+
+
+async def get_user(session_override, tracer, user_id):
+    transport = ASGITransport(app=TracingMiddleware(app, tracer))
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        return await client.get(f"/users/{user_id}", headers=create_headers(user_id))
+
+
+def only(spans, name):
+    matching = [span for span in spans if span.name == name]
+    assert len(matching) == 1, [span.name for span in spans]
+    return matching[0]
+
+
+async def test_request_spans_nest_from_route_to_sql(session_override, admin_data, exporter):
+    response = await get_user(session_override, Tracer(exporter, sample_rate=1), admin_data.id)
+
+    assert response.status_code == 200
+    [spans] = exporter.traces
+    root = spans[-1]
+    assert root.name == "GET /users/{user_id}"
+    assert root.parent_id is None
+    assert root.attributes["status"] == 200
+    assert response.headers[TRACE_ID_HEADER] == root.trace_id
+    assert {span.trace_id for span in spans} == {root.trace_id}
+
+    service = only(spans, "UsersService.get")
+    repository = only(spans, "UsersRepository.get")
+    assert service.parent_id == root.span_id
+    assert repository.parent_id == service.span_id
+    [statement] = [span for span in spans if span.parent_id == repository.span_id]
+    assert statement.kind == "sql"
+    assert statement.attributes["statement"].startswith("SELECT users.")
+    assert "$1" not in statement.attributes["statement"]
+
+
+async def test_unsampled_requests_are_not_traced(session_override, admin_data, exporter):
+    response = await get_user(session_override, Tracer(exporter, sample_rate=0), admin_data.id)
+
+    assert response.status_code == 200
+    assert TRACE_ID_HEADER not in response.headers
+    assert exporter.traces == []
+
+
+def test_spans_record_errors_and_export_as_json_lines(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    exporter = JsonFileExporter(path)
+    tracer = Tracer(exporter)
+
+    with pytest.raises(ValueError), tracer.trace("job"), span("step", "service", item=3):
+        raise ValueError("bad item")
+    exporter.flush()
+
+    step, job = [json.loads(line) for line in path.read_text().splitlines()]
+    assert step["name"] == "step"
+    assert step["parent_id"] == job["span_id"]
+    assert step["attributes"] == {"item": 3}
+    assert step["error"] == job["error"] == "ValueError: bad item"
+    assert job["duration_ms"] >= step["duration_ms"]
+
+
+def test_json_exporter_writes_the_queued_traces_on_shutdown(tmp_path):
+    path = tmp_path / "traces.jsonl"
+    exporter = JsonFileExporter(path, max_pending=3)
+    tracer = Tracer(exporter)
+
+    for number in range(5):
+        with tracer.trace("job", number=number):
+            pass
+    exporter.shutdown()
+
+    written = [json.loads(line)["attributes"]["number"] for line in path.read_text().splitlines()]
+    assert len(written) + exporter.dropped == 5
+    assert written == sorted(written)
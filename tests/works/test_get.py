@@ -15,6 +15,7 @@ from app.schemas.works.talk import Talk
 from app.schemas.works.work import WorkUpdateAdministrationSchema
 
 from ..commontest import create_headers
+from ..slots.test_agenda import assign_all_works
 from .test_create_work import USER_WORK
 
 
@@ -462,3 +463,41 @@ async def test_get_works_with_talk_not_null(client, admin_data, create_user, cre
     assert work_with_talk_response.status_code == 200
     assert len(works_with_talks) == 1
     assert works_with_talks[0]["talk"] is not None
+
+
+async def test_get_work_answers_not_modified_until_updated(
+    client, admin_data, create_event_started, create_work_from_user
+):
+    headers = create_headers(admin_data.id)
+    url = f"/events/{create_event_started}/works/{create_work_from_user}"
+    response = await client.get(url, headers=headers)
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = await client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 304
+
+    administration = WorkUpdateAdministrationSchema(track="math", talk=None)
+    response = await client.put(
+        f"{url}/administration", json=jsonable_encoder(administration), headers=create_headers(admin_data.id)
+    )
+    assert response.status_code == 204
+
+    response = await client.get(url, headers={**headers, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["track"] == "math"
+
+
+async def test_get_works_includes_the_assigned_slot(client, admin_data, create_event_with_slots, create_many_works):
+    response = await client.get(f"/events/{create_event_with_slots}/works", headers=create_headers(admin_data.id))
+    assert response.status_code == 200
+    assert all(work["room_name"] is None and work["start_date"] is None for work in response.json())
+
+    await assign_all_works(client, admin_data, create_event_with_slots)
+
+    response = await client.get(f"/events/{create_event_with_slots}/works", headers=create_headers(admin_data.id))
+    works = response.json()
+    assert len(works) == len(create_many_works)
+    assert all(work["room_name"] in ("Aula 1", "Aula 2") for work in works)
+    assert all(work["start_date"] < work["end_date"] for work in works)
+    assert all(work["authors"] and work["state"] == WorkStates.APPROVED for work in works)